@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Build the precompiled executor contract bundle.
+
+Validates every contract under config/executor_contracts against its
+Draft 7 schema once and writes contracts.bundle plus its checksum
+manifest. Workers memory-map the bundle at start-up and only validate
+contracts whose source file changed since this build.
+
+Usage:
+    python scripts/build_contract_bundle.py [--output PATH]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from farfan_pipeline.core.orchestrator.contract_bundle import (
+    CONTRACTS_DIR,
+    ContractValidationError,
+    build_contract_bundle,
+    default_bundle_path,
+)
+
+
+def main() -> int:
+    """Build the bundle; exit code 1 if a schema is missing or any contract fails validation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contracts-dir", type=Path, default=CONTRACTS_DIR)
+    parser.add_argument("--output", type=Path, default=default_bundle_path())
+    args = parser.parse_args()
+
+    try:
+        manifest = build_contract_bundle(args.contracts_dir, args.output)
+    except FileNotFoundError as e:
+        print(f"✗ {e}")
+        return 1
+    except ContractValidationError as e:
+        for name, message in sorted(e.failures.items()):
+            print(f"✗ {name}: {message}")
+        print(f"\n{len(e.failures)} contract(s) failed validation; bundle not written")
+        return 1
+
+    print(f"✓ {len(manifest['contracts'])} contracts validated")
+    print(f"Bundle written: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,10 +17,12 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import multiprocessing
 import re
 import time
 import warnings
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +33,7 @@ from typing import (
 
 # from farfan_pipeline import get_parameter_loader  # CALIBRATION DISABLED
 from farfan_pipeline.core.calibration.decorators import calibrated_method
+from farfan_pipeline.core.parameters import ParameterLoaderV2
 
 if TYPE_CHECKING:
     from farfan_pipeline.utils.method_config_loader import MethodConfigLoader
@@ -51,6 +54,7 @@ try:
     import pandas as pd
     from nltk.corpus import stopwords
     from nltk.tokenize import sent_tokenize
+    from scipy import sparse
     from sklearn.ensemble import IsolationForest
     from sklearn.feature_extraction.text import TfidfVectorizer
 except ImportError as e:
@@ -62,6 +66,7 @@ except ImportError as e:
     pd = None
     sent_tokenize = None
     stopwords = None
+    sparse = None
 
 # ---------------------------------------------------------------------------
 # 1. CORE DATA STRUCTURES
@@ -134,6 +139,180 @@ class MunicipalOntology:
             "innovation": ["digital_transformation", "process_innovation"]
         }
 
+        self._keyword_index: OntologyKeywordIndex | None = None
+
+    def keyword_index(self) -> OntologyKeywordIndex:
+        """Keyword sets compiled for matrix classification (rebuilt if the ontology changes)."""
+        signature = OntologyKeywordIndex.signature_of(self)
+        index = getattr(self, "_keyword_index", None)
+        if index is None or index.signature != signature:
+            index = OntologyKeywordIndex.build(self, signature)
+            self._keyword_index = index
+        return index
+
+
+@dataclass(frozen=True)
+class OntologyKeywordIndex:
+    """
+    MunicipalOntology keyword sets compiled into a sparse keyword-category matrix.
+
+    Segment scores for every value chain link, policy domain and cross-cutting
+    theme come from one product ``S @ W``: ``S`` is the segment x keyword
+    indicator matrix (substring presence in the lowercased segment) and
+    ``W`` holds each keyword's normalized weight per category.
+
+    ``S`` is filled by a single scan per segment: a lookahead alternation of
+    all keywords, longest first, yields the longest keyword starting at each
+    position, and every keyword contained in it occurs there too.
+    """
+    signature: str
+    keywords: tuple[str, ...]
+    categories: tuple[tuple[str, str], ...]
+    dimension_slices: dict[str, slice]
+    weights: Any
+    offsets: Any
+    pattern: re.Pattern[str] | None
+    keyword_ids: dict[str, int]
+    contained: tuple[tuple[int, ...], ...]
+    always_matched: tuple[int, ...]
+
+    # (dimension, normalize underscores, ParameterLoaderV2 method key)
+    _DIMENSIONS = (
+        ("value_chain_links", True, "farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_value_chain_link"),
+        ("policy_domains", False, "farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_policy_domain"),
+        ("cross_cutting_themes", True, "farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_cross_cutting_themes"),
+    )
+    _PARAMETER_KEYS = {
+        "value_chain_links": ("auto_param_L361_29", "auto_param_L364_87"),
+        "policy_domains": ("auto_param_L378_29", "auto_param_L380_75"),
+        "cross_cutting_themes": ("auto_param_L394_29", "auto_param_L396_73"),
+    }
+
+    @staticmethod
+    def _category_keywords(ontology: MunicipalOntology) -> dict[str, dict[str, list[str]]]:
+        return {
+            "value_chain_links": {
+                name: link.instruments + link.mediators + link.outputs + link.outcomes
+                for name, link in ontology.value_chain_links.items()
+            },
+            "policy_domains": dict(ontology.policy_domains),
+            "cross_cutting_themes": dict(ontology.cross_cutting_themes),
+        }
+
+    @classmethod
+    def signature_of(cls, ontology: MunicipalOntology) -> str:
+        payload = json.dumps(cls._category_keywords(ontology), sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def build(cls, ontology: MunicipalOntology, signature: str | None = None) -> OntologyKeywordIndex:
+        """Compile the ontology; ParameterLoaderV2 constants are resolved once here."""
+        category_keywords = cls._category_keywords(ontology)
+        keyword_ids: dict[str, int] = {}
+        categories: list[tuple[str, str]] = []
+        dimension_slices: dict[str, slice] = {}
+        entries: dict[tuple[int, int], float] = {}
+        offsets: list[float] = []
+
+        for dimension, underscores, method_key in cls._DIMENSIONS:
+            increment_key, empty_key = cls._PARAMETER_KEYS[dimension]
+            base = ParameterLoaderV2.get(method_key, "score", 0.0)
+            increment = ParameterLoaderV2.get(method_key, increment_key, 1.0)
+            empty = ParameterLoaderV2.get(method_key, empty_key, 0.0)
+            start = len(categories)
+            for category, keywords in category_keywords[dimension].items():
+                column = len(categories)
+                categories.append((dimension, category))
+                if not keywords:
+                    offsets.append(empty)
+                    continue
+                offsets.append(base / len(keywords))
+                for keyword in keywords:
+                    normalized = keyword.lower().replace("_", " ") if underscores else keyword.lower()
+                    row = keyword_ids.setdefault(normalized, len(keyword_ids))
+                    entries[(row, column)] = entries.get((row, column), 0.0) + increment / len(keywords)
+            dimension_slices[dimension] = slice(start, len(categories))
+
+        keywords = tuple(keyword_ids)
+        if sparse is not None:
+            rows, cols = zip(*entries) if entries else ((), ())
+            weights = sparse.csr_matrix(
+                (list(entries.values()), (rows, cols)),
+                shape=(len(keywords), len(categories)),
+                dtype=np.float64,
+            )
+            offsets_array = np.asarray(offsets, dtype=np.float64)
+        else:
+            weights = defaultdict(list)
+            for (row, column), weight in entries.items():
+                weights[row].append((column, weight))
+            offsets_array = offsets
+
+        longest_first = sorted((k for k in keywords if k), key=len, reverse=True)
+        pattern = (
+            re.compile("(?=(" + "|".join(map(re.escape, longest_first)) + "))")
+            if longest_first else None
+        )
+
+        return cls(
+            signature=signature or cls.signature_of(ontology),
+            keywords=keywords,
+            categories=tuple(categories),
+            dimension_slices=dimension_slices,
+            weights=weights,
+            offsets=offsets_array,
+            pattern=pattern,
+            keyword_ids=keyword_ids,
+            contained=tuple(
+                tuple(i for i, other in enumerate(keywords) if other in keyword)
+                for keyword in keywords
+            ),
+            always_matched=tuple(i for i, keyword in enumerate(keywords) if not keyword),
+        )
+
+    def matched_keywords(self, segment: str) -> list[int]:
+        """Indices of keywords occurring as substrings of the lowercased segment."""
+        matched = set(self.always_matched)
+        if self.pattern is not None:
+            for match in self.pattern.finditer(segment.lower()):
+                matched.update(self.contained[self.keyword_ids[match.group(1)]])
+        return sorted(matched)
+
+    def indicator_matrix(self, segments: list[str]) -> Any:
+        """Sparse segment x keyword 0/1 matrix."""
+        indptr = [0]
+        indices: list[int] = []
+        for segment in segments:
+            indices.extend(self.matched_keywords(segment))
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), indices, indptr),
+            shape=(len(segments), len(self.keywords)),
+        )
+
+    def score(self, segments: list[str]) -> Any:
+        """Segment x category scores for all three dimensions (dense, one column per category)."""
+        if sparse is not None:
+            product = self.indicator_matrix(segments) @ self.weights
+            return product.toarray() + self.offsets
+
+        scores = []
+        for segment in segments:
+            row = list(self.offsets)
+            for keyword in self.matched_keywords(segment):
+                for column, weight in self.weights[keyword]:
+                    row[column] += weight
+            scores.append(row)
+        return scores
+
+    def dimension_scores(self, row: Any, dimension: str) -> dict[str, float]:
+        """Category -> score mapping of one dimension from a score row."""
+        block = self.dimension_slices[dimension]
+        return {
+            self.categories[column][1]: float(row[column])
+            for column in range(block.start, block.stop)
+        }
+
 # ---------------------------------------------------------------------------
 # 2. SEMANTIC ANALYSIS ENGINE
 # ---------------------------------------------------------------------------
@@ -222,27 +401,22 @@ class SemanticAnalyzer:
             }
         }
 
+        # Classify every segment along the three dimensions in one sparse product;
+        # configurable threshold for inclusion, columns follow ontology order
+        index = self.ontology.keyword_index()
+        scores = index.score(document_segments)
+        if np is not None:
+            included = [np.flatnonzero(row).tolist() for row in np.asarray(scores) > self.similarity_threshold]
+        else:
+            included = [[c for c, score in enumerate(row) if score > self.similarity_threshold] for row in scores]
+
         # Process each segment
-        for idx, segment in enumerate(document_segments):
-            segment_data = self._process_segment(segment, idx, segment_vectors[idx])
-
-            # Classify by value chain links
-            link_scores = self._classify_value_chain_link(segment)
-            for link, score in link_scores.items():
-                if score > self.similarity_threshold:  # Configurable threshold for inclusion
-                    semantic_cube["dimensions"]["value_chain_links"][link].append(segment_data)
-
-            # Classify by policy domains
-            domain_scores = self._classify_policy_domain(segment)
-            for domain, score in domain_scores.items():
-                if score > self.similarity_threshold:
-                    semantic_cube["dimensions"]["policy_domains"][domain].append(segment_data)
-
-            # Extract cross-cutting themes
-            theme_scores = self._classify_cross_cutting_themes(segment)
-            for theme, score in theme_scores.items():
-                if score > self.similarity_threshold:
-                    semantic_cube["dimensions"]["cross_cutting_themes"][theme].append(segment_data)
+        for idx, (segment, vector) in enumerate(zip(document_segments, self._segment_vector_rows(segment_vectors))):
+            segment_data = self._process_segment(segment, idx, vector)
+
+            for column in included[idx]:
+                dimension, category = index.categories[column]
+                semantic_cube["dimensions"][dimension][category].append(segment_data)
 
             # Add measures
             semantic_cube["measures"]["semantic_density"].append(segment_data["semantic_density"])
@@ -289,21 +463,39 @@ class SemanticAnalyzer:
         }
 
     @calibrated_method("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._vectorize_segments")
-    def _vectorize_segments(self, segments: list[str]) -> np.ndarray:
-        """Vectorize document segments using TF-IDF."""
+    def _vectorize_segments(self, segments: list[str]) -> Any:
+        """Vectorize document segments using TF-IDF (sparse CSR matrix, one row per segment)."""
         if self.vectorizer is not None:
             try:
-                return self.vectorizer.fit_transform(segments).toarray()
+                return self.vectorizer.fit_transform(segments).tocsr()
             except Exception as e:
                 logger.warning(f"Vectorization failed: {e}")
 
         # Fallback
-        if np is not None:
+        if sparse is not None:
+            return sparse.csr_matrix((len(segments), 100))
+        elif np is not None:
             return np.zeros((len(segments), 100))
         else:
             # Return list of lists if numpy is not available
             return [[ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._vectorize_segments", "auto_param_L304_21", 0.0)] * 100 for _ in range(len(segments))]
 
+    @staticmethod
+    def _segment_vector_rows(vectors: Any) -> Any:
+        """Iterate segment vectors; sparse rows are read straight from the CSR buffers."""
+        if sparse is None or not sparse.issparse(vectors):
+            yield from vectors
+            return
+        vectors = vectors.tocsr()
+        indptr, indices, data = vectors.indptr, vectors.indices, vectors.data
+        for row in range(vectors.shape[0]):
+            start, end = indptr[row], indptr[row + 1]
+            yield {
+                "indices": indices[start:end].tolist(),
+                "values": data[start:end].tolist(),
+                "size": vectors.shape[1],
+            }
+
     @calibrated_method("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._process_segment")
     def _process_segment(self, segment: str, idx: int, vector) -> dict[str, Any]:
         """Process individual segment and extract features."""
@@ -328,8 +520,15 @@ class SemanticAnalyzer:
         # Calculate coherence score (simplified)
         coherence_score = min(ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._process_segment", "auto_param_L328_30", 1.0), len(sentences) / 10) if sentences else ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._process_segment", "auto_param_L328_74", 0.0)
 
-        # Convert vector to list if it's a numpy array
-        if np is not None and isinstance(vector, np.ndarray):
+        # Sparse rows are kept sparse: only the non-zero TF-IDF weights are stored
+        if sparse is not None and sparse.issparse(vector):
+            row = vector.tocsr()
+            vector = {
+                "indices": row.indices.tolist(),
+                "values": row.data.tolist(),
+                "size": row.shape[1],
+            }
+        elif np is not None and isinstance(vector, np.ndarray):
             vector = vector.tolist()
 
         return {
@@ -345,58 +544,20 @@ class SemanticAnalyzer:
     @calibrated_method("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_value_chain_link")
     def _classify_value_chain_link(self, segment: str) -> dict[str, float]:
         """Classify segment by value chain link using keyword matching."""
-        link_scores = {}
-        segment_lower = segment.lower()
-
-        for link_name, link_obj in self.ontology.value_chain_links.items():
-            score = ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_value_chain_link", "score", 0.0) # Refactored
-            total_keywords = 0
-
-            # Check all link components
-            all_keywords = (link_obj.instruments + link_obj.mediators +
-                            link_obj.outputs + link_obj.outcomes)
-
-            for keyword in all_keywords:
-                total_keywords += 1
-                if keyword.lower().replace("_", " ") in segment_lower:
-                    score += ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_value_chain_link", "auto_param_L361_29", 1.0)
-
-            # Normalize score
-            link_scores[link_name] = score / total_keywords if total_keywords > 0 else ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_value_chain_link", "auto_param_L364_87", 0.0)
-
-        return link_scores
+        index = self.ontology.keyword_index()
+        return index.dimension_scores(index.score([segment])[0], "value_chain_links")
 
     @calibrated_method("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_policy_domain")
     def _classify_policy_domain(self, segment: str) -> dict[str, float]:
         """Classify segment by policy domain using keyword matching."""
-        domain_scores = {}
-        segment_lower = segment.lower()
-
-        for domain, keywords in self.ontology.policy_domains.items():
-            score = ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_policy_domain", "score", 0.0) # Refactored
-            for keyword in keywords:
-                if keyword.lower() in segment_lower:
-                    score += ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_policy_domain", "auto_param_L378_29", 1.0)
-
-            domain_scores[domain] = score / len(keywords) if keywords else ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_policy_domain", "auto_param_L380_75", 0.0)
-
-        return domain_scores
+        index = self.ontology.keyword_index()
+        return index.dimension_scores(index.score([segment])[0], "policy_domains")
 
     @calibrated_method("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_cross_cutting_themes")
     def _classify_cross_cutting_themes(self, segment: str) -> dict[str, float]:
         """Classify segment by cross-cutting themes."""
-        theme_scores = {}
-        segment_lower = segment.lower()
-
-        for theme, keywords in self.ontology.cross_cutting_themes.items():
-            score = ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_cross_cutting_themes", "score", 0.0) # Refactored
-            for keyword in keywords:
-                if keyword.lower().replace("_", " ") in segment_lower:
-                    score += ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_cross_cutting_themes", "auto_param_L394_29", 1.0)
-
-            theme_scores[theme] = score / len(keywords) if keywords else ParameterLoaderV2.get("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._classify_cross_cutting_themes", "auto_param_L396_73", 0.0)
-
-        return theme_scores
+        index = self.ontology.keyword_index()
+        return index.dimension_scores(index.score([segment])[0], "cross_cutting_themes")
 
     @calibrated_method("farfan_core.analysis.Analyzer_one.SemanticAnalyzer._calculate_semantic_complexity")
     def _calculate_semantic_complexity(self, semantic_cube: dict[str, Any]) -> float:
@@ -1779,6 +1940,18 @@ class ConfigurationManager:
         except Exception as e:
             logger.error(f"Error saving config: {e}")
 
+# Analyzer inherited by forked batch workers (read-only after the fork)
+_BATCH_WORKER_ANALYZER: MunicipalAnalyzer | None = None
+
+
+def _analyze_in_batch_worker(file_path: str) -> dict[str, Any]:
+    """Analyze one document inside a forked BatchProcessor worker."""
+    try:
+        return _BATCH_WORKER_ANALYZER.analyze_document(file_path)
+    except Exception as e:
+        return {"error": str(e)}
+
+
 class BatchProcessor:
     """Process multiple documents in batch."""
 
@@ -1786,8 +1959,21 @@ class BatchProcessor:
         self.analyzer = analyzer
 
     @calibrated_method("farfan_core.analysis.Analyzer_one.BatchProcessor.process_directory")
-    def process_directory(self, directory_path: str, pattern: str = "*.txt") -> dict[str, Any]:
-        """Process all files matching pattern in directory."""
+    def process_directory(self, directory_path: str, pattern: str = "*.txt",
+                          workers: int | None = None) -> dict[str, Any]:
+        """
+        Process all files matching pattern in directory.
+
+        Args:
+            directory_path: Directory holding the documents.
+            pattern: Glob pattern of the files to process.
+            workers: Number of worker processes. ``None`` or 1 processes the
+                files sequentially; larger values fork workers that share the
+                analyzer and its compiled ontology read-only.
+
+        Returns:
+            Mapping of file name to analysis result (or ``{"error": ...}``).
+        """
 
         directory = Path(directory_path)
         if not directory.exists():
@@ -1798,6 +1984,9 @@ class BatchProcessor:
 
         logger.info(f"Processing {len(files)} files from {directory_path}")
 
+        if workers is not None and workers > 1 and len(files) > 1:
+            return self._process_files_parallel(files, workers)
+
         for file_path in files:
             try:
                 logger.info(f"Processing: {file_path.name}")
@@ -1809,6 +1998,26 @@ class BatchProcessor:
 
         return results
 
+    def _process_files_parallel(self, files: list[Path], workers: int) -> dict[str, Any]:
+        """Analyze files in forked worker processes, preserving file order."""
+        global _BATCH_WORKER_ANALYZER
+
+        # Compile the ontology before forking so workers inherit it instead of rebuilding it
+        self.analyzer.ontology.keyword_index()
+        _BATCH_WORKER_ANALYZER = self.analyzer
+        context = multiprocessing.get_context("fork")
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(files)), mp_context=context) as pool:
+                outcomes = pool.map(_analyze_in_batch_worker, [str(f) for f in files])
+                results = {}
+                for file_path, result in zip(files, outcomes):
+                    if "error" in result:
+                        logger.error(f"Error processing {file_path.name}: {result['error']}")
+                    results[file_path.name] = result
+                return results
+        finally:
+            _BATCH_WORKER_ANALYZER = None
+
     @calibrated_method("farfan_core.analysis.Analyzer_one.BatchProcessor.export_batch_results")
     def export_batch_results(self, batch_results: dict[str, Any], output_dir: str) -> None:
         """Export batch processing results."""
@@ -9,8 +9,12 @@ Production-Ready Utilities:
   fallback handling and observability integration
 - :func:`compute_basic_graph_stats`: Compute basic graph statistics without NetworkX
 - :func:`check_networkx_available`: Check if NetworkX is available for graph computation
+- :class:`CentralityEngine`: Time-budgeted, incremental betweenness (exact or
+  pivot-sampled with error bounds), PageRank and eigenvector centrality
 - :class:`RetryHandler`: Robust retry mechanism for transient dependency failures
 - :class:`SPCCausalBridge`: Convert SPC chunk graphs to causal DAG representations
+- :func:`break_cycles`: Make a directed graph acyclic by removing a low-weight
+  feedback arc set in a single pass over its strongly connected components
 
 Meso-Level Analytics:
 ---------------------
@@ -42,6 +46,16 @@ These experimental components may have unstable APIs, incomplete documentation,
 or require additional dependencies not enforced by the core system.
 """
 
+from farfan_pipeline.analysis.feedback_arc_set import (
+    FeedbackArcSetReport,
+    break_cycles,
+    feedback_arc_set,
+)
+from farfan_pipeline.analysis.graph_centrality import (
+    BetweennessEstimate,
+    CentralityEngine,
+    ClusteringEstimate,
+)
 from farfan_pipeline.analysis.graph_metrics_fallback import (
     check_networkx_available,
     compute_basic_graph_stats,
@@ -60,8 +74,14 @@ __all__ = [
     "compute_graph_metrics_with_fallback",
     "compute_basic_graph_stats",
     "check_networkx_available",
+    "BetweennessEstimate",
+    "CentralityEngine",
+    "ClusteringEstimate",
     "RetryHandler",
     "SPCCausalBridge",
+    "FeedbackArcSetReport",
+    "break_cycles",
+    "feedback_arc_set",
     "analyze_policy_dispersion",
     "reconcile_cross_metrics",
     "compose_cluster_posterior",
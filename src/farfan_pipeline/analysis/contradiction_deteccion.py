@@ -28,11 +28,12 @@ import torch
 from scipy import stats
 from scipy.spatial.distance import cosine
 from scipy.stats import beta
-from sentence_transformers import SentenceTransformer
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from transformers import AutoModelForSequenceClassification, DebertaV2Tokenizer, pipeline
 
+from farfan_pipeline.compat.model_pool import acquire_sentence_transformer, acquire_spacy
+
 # Check dependency lockdown
 from farfan_pipeline.core.dependency_lockdown import get_dependency_lockdown
 
@@ -333,6 +334,11 @@ class PolicyContradictionDetector:
     Implementa el estado del arte en NLP y razonamiento lógico.
     """
 
+    # Filas de la matriz de similaridad calculadas por bloque
+    SIMILARITY_BLOCK_ROWS = 1024
+    # Pares enviados al clasificador NLI por llamada
+    CLASSIFIER_BATCH_SIZE = 32
+
     def __init__(
             self,
             model_name: str = "hiiamsid/sentence_similarity_spanish_es",
@@ -340,7 +346,9 @@ class PolicyContradictionDetector:
             device: str = "cuda" if torch.cuda.is_available() else "cpu"
     ) -> None:
         # Modelos de transformers para análisis semántico
-        self.semantic_model = SentenceTransformer(model_name, device=device)
+        # Compartidos por todo el proceso (compat.model_pool)
+        self.semantic_model_handle = acquire_sentence_transformer(model_name, device=device)
+        self.semantic_model = self.semantic_model_handle.model
 
         # Modelo de clasificación de contradicciones
         model_name = "microsoft/deberta-v3-base"
@@ -355,9 +363,8 @@ class PolicyContradictionDetector:
         )
 
         # Procesamiento de lenguaje natural
-        # Delegate to factory for I/O operation
-        from farfan_pipeline.analysis.factory import load_spacy_model
-        self.nlp = load_spacy_model(spacy_model)
+        self.nlp_handle = acquire_spacy(spacy_model)
+        self.nlp = self.nlp_handle.model
 
         # Componentes especializados
         self.bayesian_calculator = BayesianConfidenceCalculator()
@@ -555,59 +562,102 @@ class PolicyContradictionDetector:
                 semantic_role=stmt.semantic_role
             )
 
-            # Conectar con declaraciones relacionadas
-            for j, other in enumerate(statements):
-                if i != j:
-                    similarity = self._calculate_similarity(stmt, other)
-                    if similarity > ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L562_36", 0.7):  # Umbral de relación
-                        self.knowledge_graph.add_edge(
-                            f"stmt_{i}",
-                            f"stmt_{j}",
-                            weight=similarity,
-                            relation_type=self._determine_relation_type(stmt, other)
-                        )
+        # Conectar con declaraciones relacionadas (umbral de relación)
+        relation_threshold = ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L562_36", 0.7)
+        for i, j, similarity in self._similar_statement_pairs(
+            statements, relation_threshold, upper_only=False
+        ):
+            self.knowledge_graph.add_edge(
+                f"stmt_{i}",
+                f"stmt_{j}",
+                weight=similarity,
+                relation_type=self._determine_relation_type(statements[i], statements[j])
+            )
+
+    def _similar_statement_pairs(
+            self,
+            statements: list[PolicyStatement],
+            threshold: float,
+            upper_only: bool = True
+    ) -> list[tuple[int, int, float]]:
+        """
+        Genera pares candidatos (i, j, similaridad) con similaridad coseno > threshold.
+
+        La matriz de similaridad se calcula por bloques de filas sobre embeddings
+        normalizados, en lugar de pares individuales. Con upper_only sólo se
+        devuelven pares i < j; en ambos casos el orden es (i, j) lexicográfico.
+        Las declaraciones sin embedding se omiten.
+        """
+        indexed = [
+            (idx, stmt.embedding) for idx, stmt in enumerate(statements)
+            if stmt.embedding is not None
+        ]
+        if len(indexed) < 2:
+            return []
+
+        positions = np.array([idx for idx, _ in indexed])
+        matrix = np.vstack([np.asarray(emb, dtype=np.float64).ravel() for _, emb in indexed])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms > 0, norms, 1.0)
+
+        pairs: list[tuple[int, int, float]] = []
+        n = matrix.shape[0]
+        for start in range(0, n, self.SIMILARITY_BLOCK_ROWS):
+            block = matrix[start:start + self.SIMILARITY_BLOCK_ROWS] @ matrix.T
+            rows = np.arange(start, start + block.shape[0])[:, None]
+            columns = np.arange(n)[None, :]
+            keep = (block > threshold) & ((columns > rows) if upper_only else (columns != rows))
+            for r, c in zip(*np.nonzero(keep)):
+                pairs.append((int(positions[start + r]), int(positions[c]), float(block[r, c])))
+        return pairs
 
     def _detect_semantic_contradictions(
             self,
             statements: list[PolicyStatement]
     ) -> list[ContradictionEvidence]:
-        """Detecta contradicciones semánticas usando transformers"""
+        """
+        Detecta contradicciones semánticas usando transformers.
+
+        Primero genera candidatos con la compuerta barata de similaridad coseno
+        y luego clasifica sólo los pares sobrevivientes, por lotes.
+        """
         contradictions = []
 
-        for i, stmt_a in enumerate(statements):
-            for stmt_b in statements[i + 1:]:
-                if stmt_a.embedding is not None and stmt_b.embedding is not None:
-                    # Calcular similaridad coseno
-                    similarity = 1 - cosine(stmt_a.embedding, stmt_b.embedding)
+        params = ParameterLoaderV2.bind("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph")
+        contradiction_threshold = params.get("auto_param_L587_45", 0.7)
+        similarity_threshold = params.get("auto_param_L587_66", 0.5)
 
-                    # Verificar contradicción usando clasificador
-                    combined_text = f"{stmt_a.text} [SEP] {stmt_b.text}"
-                    contradiction_score = self._classify_contradiction(combined_text)
+        candidates = self._similar_statement_pairs(statements, similarity_threshold)
+        scores = self._classify_contradictions(
+            [f"{statements[i].text} [SEP] {statements[j].text}" for i, j, _ in candidates]
+        )
 
-                    if contradiction_score > ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L587_45", 0.7) and similarity > ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L587_66", 0.5):
-                        # Calcular confianza Bayesiana
-                        confidence = self.bayesian_calculator.calculate_posterior(
-                            evidence_strength=contradiction_score,
-                            observations=len(stmt_a.entities) + len(stmt_b.entities),
-                            domain_weight=self._get_domain_weight(stmt_a.dimension)
-                        )
+        for (i, j, similarity), contradiction_score in zip(candidates, scores):
+            if contradiction_score > contradiction_threshold:
+                stmt_a, stmt_b = statements[i], statements[j]
+                # Calcular confianza Bayesiana
+                confidence = self.bayesian_calculator.calculate_posterior(
+                    evidence_strength=contradiction_score,
+                    observations=len(stmt_a.entities) + len(stmt_b.entities),
+                    domain_weight=self._get_domain_weight(stmt_a.dimension)
+                )
 
-                        evidence = ContradictionEvidence(
-                            statement_a=stmt_a,
-                            statement_b=stmt_b,
-                            contradiction_type=ContradictionType.SEMANTIC_OPPOSITION,
-                            confidence=confidence,
-                            severity=self._calculate_severity(stmt_a, stmt_b),
-                            semantic_similarity=similarity,
-                            logical_conflict_score=contradiction_score,
-                            temporal_consistency=True,
-                            numerical_divergence=None,
-                            affected_dimensions=[stmt_a.dimension, stmt_b.dimension],
-                            resolution_suggestions=self._suggest_resolutions(
-                                ContradictionType.SEMANTIC_OPPOSITION
-                            )
-                        )
-                        contradictions.append(evidence)
+                evidence = ContradictionEvidence(
+                    statement_a=stmt_a,
+                    statement_b=stmt_b,
+                    contradiction_type=ContradictionType.SEMANTIC_OPPOSITION,
+                    confidence=confidence,
+                    severity=self._calculate_severity(stmt_a, stmt_b),
+                    semantic_similarity=similarity,
+                    logical_conflict_score=contradiction_score,
+                    temporal_consistency=True,
+                    numerical_divergence=None,
+                    affected_dimensions=[stmt_a.dimension, stmt_b.dimension],
+                    resolution_suggestions=self._suggest_resolutions(
+                        ContradictionType.SEMANTIC_OPPOSITION
+                    )
+                )
+                contradictions.append(evidence)
 
         return contradictions
 
@@ -618,51 +668,82 @@ class PolicyContradictionDetector:
         """Detecta inconsistencias numéricas con análisis estadístico"""
         contradictions = []
 
-        for i, stmt_a in enumerate(statements):
-            for stmt_b in statements[i + 1:]:
-                if stmt_a.quantitative_claims and stmt_b.quantitative_claims:
-                    for claim_a in stmt_a.quantitative_claims:
-                        for claim_b in stmt_b.quantitative_claims:
-                            if self._are_comparable_claims(claim_a, claim_b):
-                                divergence = self._calculate_numerical_divergence(
-                                    claim_a,
-                                    claim_b
-                                )
-
-                                if divergence is not None and divergence > ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L632_75", 0.2):
-                                    # Test estadístico de significancia
-                                    p_value = self._statistical_significance_test(
-                                        claim_a,
-                                        claim_b
-                                    )
+        # Parámetros resueltos una sola vez fuera de los bucles anidados
+        params = ParameterLoaderV2.bind("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph")
+        divergence_threshold = params.get("auto_param_L632_75", 0.2)
+        significance_level = params.get("auto_param_L639_49", 0.05)
+        max_severity = params.get("auto_param_L651_57", 1.0)
+        base_similarity = params.get("auto_param_L652_64", 0.0)
+
+        for i, j, claim_a, claim_b in self._comparable_claim_pairs(statements):
+            stmt_a, stmt_b = statements[i], statements[j]
+            divergence = self._calculate_numerical_divergence(claim_a, claim_b)
+
+            if divergence is not None and divergence > divergence_threshold:
+                # Test estadístico de significancia
+                p_value = self._statistical_significance_test(claim_a, claim_b)
+
+                if p_value < significance_level:  # Significancia estadística
+                    confidence = self.bayesian_calculator.calculate_posterior(
+                        evidence_strength=1 - p_value,
+                        observations=2,
+                        domain_weight=1.5  # Mayor peso para evidencia numérica
+                    )
 
-                                    if p_value < ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L639_49", 0.05):  # Significancia estadística
-                                        confidence = self.bayesian_calculator.calculate_posterior(
-                                            evidence_strength=1 - p_value,
-                                            observations=2,
-                                            domain_weight=1.5  # Mayor peso para evidencia numérica
-                                        )
-
-                                        evidence = ContradictionEvidence(
-                                            statement_a=stmt_a,
-                                            statement_b=stmt_b,
-                                            contradiction_type=ContradictionType.NUMERICAL_INCONSISTENCY,
-                                            confidence=confidence,
-                                            severity=min(ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L651_57", 1.0), divergence),
-                                            semantic_similarity=ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._build_knowledge_graph", "auto_param_L652_64", 0.0),
-                                            logical_conflict_score=divergence,
-                                            temporal_consistency=True,
-                                            numerical_divergence=divergence,
-                                            affected_dimensions=[stmt_a.dimension],
-                                            resolution_suggestions=self._suggest_resolutions(
-                                                ContradictionType.NUMERICAL_INCONSISTENCY
-                                            ),
-                                            statistical_significance=p_value
-                                        )
-                                        contradictions.append(evidence)
+                    evidence = ContradictionEvidence(
+                        statement_a=stmt_a,
+                        statement_b=stmt_b,
+                        contradiction_type=ContradictionType.NUMERICAL_INCONSISTENCY,
+                        confidence=confidence,
+                        severity=min(max_severity, divergence),
+                        semantic_similarity=base_similarity,
+                        logical_conflict_score=divergence,
+                        temporal_consistency=True,
+                        numerical_divergence=divergence,
+                        affected_dimensions=[stmt_a.dimension],
+                        resolution_suggestions=self._suggest_resolutions(
+                            ContradictionType.NUMERICAL_INCONSISTENCY
+                        ),
+                        statistical_significance=p_value
+                    )
+                    contradictions.append(evidence)
 
         return contradictions
 
+    def _comparable_claim_pairs(
+            self,
+            statements: list[PolicyStatement]
+    ) -> list[tuple[int, int, dict, dict]]:
+        """
+        Pares (i, j, claim_a, claim_b) de afirmaciones comparables entre declaraciones i < j.
+
+        Agrupa las afirmaciones por tipo antes de emparejar, de modo que sólo se
+        comparan afirmaciones del mismo tipo, y tokeniza cada contexto una sola
+        vez. Equivale a aplicar _are_comparable_claims a todos los pares, en el
+        mismo orden.
+        """
+        min_context_similarity = ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._are_comparable_claims", "auto_param_L1384_36", 0.6)
+
+        buckets: dict[Any, list[tuple[int, int, dict, frozenset[str]]]] = {}
+        for i, stmt in enumerate(statements):
+            for k, claim in enumerate(stmt.quantitative_claims or []):
+                tokens = frozenset(claim.get('context', '').lower().split())
+                buckets.setdefault(claim['type'], []).append((i, k, claim, tokens))
+
+        ranked: list[tuple[tuple[int, int, int, int], dict, dict]] = []
+        for members in buckets.values():
+            for a, (i, k_a, claim_a, tokens_a) in enumerate(members):
+                for j, k_b, claim_b, tokens_b in members[a + 1:]:
+                    if j == i or not tokens_a or not tokens_b:
+                        continue
+                    # Coeficiente de Jaccard entre contextos
+                    overlap = len(tokens_a & tokens_b)
+                    if overlap / (len(tokens_a) + len(tokens_b) - overlap) > min_context_similarity:
+                        ranked.append(((i, j, k_a, k_b), claim_a, claim_b))
+
+        ranked.sort(key=lambda item: item[0])
+        return [(key[0], key[1], claim_a, claim_b) for key, claim_a, claim_b in ranked]
+
     def _detect_temporal_conflicts(
             self,
             statements: list[PolicyStatement]
@@ -1323,6 +1404,26 @@ class PolicyContradictionDetector:
             logger.warning(f"Error en clasificación de contradicción: {e}")
             return ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._classify_contradiction", "auto_param_L1324_19", 0.0)
 
+    def _classify_contradictions(self, texts: list[str]) -> list[float]:
+        """Clasifica probabilidades de contradicción por lotes (mismo criterio que _classify_contradiction)"""
+        scores: list[float] = []
+        for start in range(0, len(texts), self.CLASSIFIER_BATCH_SIZE):
+            batch = texts[start:start + self.CLASSIFIER_BATCH_SIZE]
+            try:
+                results = self.contradiction_classifier(batch, batch_size=len(batch))
+            except Exception as e:
+                logger.warning(f"Error en clasificación por lotes, se clasifica por par: {e}")
+                scores.extend(self._classify_contradiction(text) for text in batch)
+                continue
+            for result in results:
+                items = [result] if isinstance(result, dict) else result
+                score = next(
+                    (item['score'] for item in items if 'contradiction' in item['label'].lower()),
+                    ParameterLoaderV2.get("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._classify_contradiction", "auto_param_L1321_19", 0.0)
+                )
+                scores.append(score)
+        return scores
+
     @calibrated_method("farfan_core.analysis.contradiction_deteccion.PolicyContradictionDetector._get_domain_weight")
     def _get_domain_weight(self, dimension: PolicyDimension) -> float:
         """Obtiene peso específico del dominio"""
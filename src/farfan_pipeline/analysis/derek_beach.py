@@ -33,6 +33,7 @@ from typing import (
     cast,
 )
 from farfan_pipeline.core.parameters import ParameterLoaderV2
+from farfan_pipeline.compat.model_pool import acquire_spacy
 from farfan_pipeline.core.calibration.decorators import calibrated_method
 
 if TYPE_CHECKING:
@@ -4131,15 +4132,14 @@ class CDAFFramework:
             )
             def load_spacy_with_retry():
                 try:
-                    nlp = spacy.load("es_core_news_lg")
+                    handle = acquire_spacy("es_core_news_lg")
                     self.logger.info("Modelo spaCy cargado: es_core_news_lg")
-                    return nlp
+                    return handle
                 except OSError:
                     self.logger.warning("Modelo es_core_news_lg no encontrado. Intentando es_core_news_sm...")
-                    nlp = spacy.load("es_core_news_sm")
-                    return nlp
+                    return acquire_spacy("es_core_news_sm")
             try:
-                self.nlp = load_spacy_with_retry()
+                self.nlp_handle = load_spacy_with_retry()
             except OSError:
                 self.logger.error("No se encontró ningún modelo de spaCy en español. "
                                   "Ejecute: python -m spacy download es_core_news_lg")
@@ -4147,16 +4147,18 @@ class CDAFFramework:
         else:
             # Fallback to original logic without retry
             try:
-                self.nlp = spacy.load("es_core_news_lg")
+                self.nlp_handle = acquire_spacy("es_core_news_lg")
                 self.logger.info("Modelo spaCy cargado: es_core_news_lg")
             except OSError:
                 self.logger.warning("Modelo es_core_news_lg no encontrado. Intentando es_core_news_sm...")
                 try:
-                    self.nlp = spacy.load("es_core_news_sm")
+                    self.nlp_handle = acquire_spacy("es_core_news_sm")
                 except OSError:
                     self.logger.error("No se encontró ningún modelo de spaCy en español. "
                                       "Ejecute: python -m spacy download es_core_news_lg")
                     sys.exit(1)
+        # Shared across every producer in the process (compat.model_pool)
+        self.nlp = self.nlp_handle.model
 
         # Initialize modules (pass retry_handler to PDF processor)
         self.pdf_processor = PDFProcessor(self.config, retry_handler=self.retry_handler if retry_enabled else None)
@@ -5272,40 +5274,28 @@ class HierarchicalGenerativeModel:
             observations = observations or {}
             observations.setdefault('coherence', 0.5)
 
-        # Ejecutar múltiples cadenas para diagnóstico
-        chains = []
-        for chain_idx in range(n_chains):
-            chain_samples = self._run_mcmc_chain(
-                observations, n_iter, burn_in, seed=42 + chain_idx
-            )
-            chains.append(chain_samples)
-            self.logger.debug(f"Chain {chain_idx + 1}/{n_chains} completed: {len(chain_samples)} samples")
-
-        # Agregar samples de todas las cadenas
-        all_samples = []
-        for chain in chains:
-            all_samples.extend(chain)
+        # Ejecutar múltiples cadenas en paralelo (una fila por cadena)
+        type_indices, coherences = self._run_mcmc_chains(
+            observations, n_iter, burn_in, seeds=[42 + idx for idx in range(n_chains)]
+        )
+        self.logger.debug(f"{n_chains} chains completed: {coherences.shape[1]} samples each")
 
         # 1. Type posterior (frecuencias de mechanism_type)
-        type_counts = dict.fromkeys(self.mechanism_priors.keys(), 0)
-        for sample in all_samples:
-            mtype = sample.get('mechanism_type', 'mixto')
-            if mtype in type_counts:
-                type_counts[mtype] += 1
-
-        total_samples = len(all_samples)
+        mechanism_types = list(self.mechanism_priors.keys())
+        type_counts = np.bincount(type_indices.ravel(), minlength=len(mechanism_types))
+        total_samples = int(type_indices.size)
         type_posterior = {
-            mtype: count / max(total_samples, 1)
-            for mtype, count in type_counts.items()
+            mtype: int(count) / max(total_samples, 1)
+            for mtype, count in zip(mechanism_types, type_counts)
         }
 
         # 2. Sequence mode (secuencia más frecuente)
-        sequence_mode = self._get_mode_sequence(all_samples)
+        sequence_mode = mechanism_types[int(np.argmax(type_counts))] if total_samples else 'mixto'
 
         # 3. Coherence score (estadísticas)
-        coherence_scores = [s.get('coherence', 0.5) for s in all_samples]
-        coherence_mean = float(np.mean(coherence_scores))
-        coherence_std = float(np.std(coherence_scores))
+        coherence_scores = coherences.ravel()
+        coherence_mean = float(np.mean(coherence_scores)) if total_samples else 0.5
+        coherence_std = float(np.std(coherence_scores)) if total_samples else 0.0
 
         # 4. Entropy del posterior
         posterior_probs = list(type_posterior.values())
@@ -5314,14 +5304,16 @@ class HierarchicalGenerativeModel:
         normalized_entropy = entropy_posterior / max_entropy if max_entropy > 0 else 0.0
 
         # 5. CI95 para coherence
-        ci95_low = float(np.percentile(coherence_scores, 2.5))
-        ci95_high = float(np.percentile(coherence_scores, 97.5))
+        if total_samples:
+            ci95_low, ci95_high = (float(q) for q in np.percentile(coherence_scores, [2.5, 97.5]))
+        else:
+            ci95_low = ci95_high = coherence_mean
 
         # 6. R-hat aproximado (between-chain variance / within-chain variance)
-        r_hat = self._calculate_r_hat(chains)
+        r_hat = self._calculate_r_hat(coherences)
 
         # 7. ESS (Effective Sample Size)
-        ess = self._calculate_ess(all_samples)
+        ess = self._calculate_ess(coherence_scores)
 
         # 8. Verificar criterios de calidad
         is_uncertain = normalized_entropy > 0.7
@@ -5361,51 +5353,99 @@ class HierarchicalGenerativeModel:
         burn_in: int,
         seed: int
     ) -> list[dict[str, Any]]:
-        """Ejecuta una cadena MCMC con Metropolis-Hastings"""
-        np.random.seed(seed)
-        samples = []
-
-        # Estado inicial: sample desde prior
-        current_type = np.random.choice(
-            list(self.mechanism_priors.keys()),
-            p=list(self.mechanism_priors.values())
+        """Ejecuta una cadena MCMC con Metropolis-Hastings (samples como dicts)"""
+        type_indices, coherences = self._run_mcmc_chains(
+            observations, n_iter, burn_in, seeds=[seed]
         )
-        current_coherence = observations.get('coherence', 0.5)
-
-        for i in range(n_iter):
-            # Proponer nuevo mechanism_type
-            proposed_type = np.random.choice(list(self.mechanism_priors.keys()))
-
-            # Calcular likelihood ratio
-            current_likelihood = self._calculate_likelihood(current_type, observations)
-            proposed_likelihood = self._calculate_likelihood(proposed_type, observations)
+        mechanism_types = list(self.mechanism_priors.keys())
+        return [
+            {
+                'mechanism_type': mechanism_types[type_idx],
+                'coherence': float(coherence),
+                'iteration': i,
+                'chain_seed': seed
+            }
+            for i, (type_idx, coherence) in enumerate(
+                zip(type_indices[0].tolist(), coherences[0].tolist())
+            )
+        ]
 
-            # Prior ratio
-            prior_ratio = self.mechanism_priors[proposed_type] / max(self.mechanism_priors[current_type], 1e-10)
+    def _run_mcmc_chains(
+        self,
+        observations: dict[str, Any],
+        n_iter: int,
+        burn_in: int,
+        seeds: list[int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Ejecuta cadenas Metropolis-Hastings en paralelo sobre arreglos.
 
-            # Acceptance probability (Metropolis-Hastings)
-            likelihood_ratio = proposed_likelihood / max(current_likelihood, 1e-10)
-            acceptance_prob = min(1.0, likelihood_ratio * prior_ratio)
+        El espacio de estados es el conjunto de mechanism_types, así que la
+        matriz de aceptación se precalcula una sola vez. Cada cadena usa su
+        propio ``np.random.Generator`` (sin estado global) y todas las cadenas
+        se resuelven a la vez componiendo las transiciones por pasos.
 
-            # Accept/reject
-            if np.random.random() < acceptance_prob:
-                current_type = proposed_type
+        Returns:
+            (type_indices, coherences): arreglos (n_chains, n_iter - burn_in)
+            con el índice del mechanism_type y la coherence simulada.
+        """
+        acceptance = self._acceptance_matrix(observations)
+        priors = np.array(list(self.mechanism_priors.values()), dtype=float)
+        n_types = len(priors)
+        n_chains = len(seeds)
+        n_iter = max(int(n_iter), 0)
+        keep_from = min(max(int(burn_in), 0), n_iter)
+
+        # Pre-muestrear todos los aleatorios de cada cadena con su Generator
+        current = np.empty(n_chains, dtype=np.intp)
+        proposals = np.empty((n_chains, n_iter), dtype=np.intp)
+        uniforms = np.empty((n_chains, n_iter))
+        noise = np.empty((n_chains, n_iter))
+        for chain_idx, seed in enumerate(seeds):
+            rng = np.random.default_rng(seed)
+            current[chain_idx] = rng.choice(n_types, p=priors / priors.sum())
+            proposals[chain_idx] = rng.integers(0, n_types, size=n_iter)
+            uniforms[chain_idx] = rng.random(n_iter)
+            noise[chain_idx] = rng.normal(0.0, 0.05, size=n_iter)
+
+        # Cada paso es una función estado -> estado (tabla de n_types entradas):
+        # transitions[c, i, k] es el estado tras el paso i partiendo de k
+        state_dtype = np.min_scalar_type(max(n_types - 1, 0))
+        accept = uniforms[..., None] < acceptance.T[proposals]
+        transitions = np.where(
+            accept, proposals[..., None], np.arange(n_types)
+        ).astype(state_dtype)
+
+        # Composición prefija (Hillis-Steele) en log2(n_iter) rondas:
+        # tras el barrido transitions[c, i] = paso_i ∘ ... ∘ paso_0
+        offset = 1
+        while offset < n_iter:
+            transitions[:, offset:] = np.take_along_axis(
+                transitions[:, offset:], transitions[:, :-offset].astype(np.intp), axis=2
+            )
+            offset *= 2
 
-            # Simular coherence con ruido
-            simulated_coherence = current_coherence + np.random.normal(0, 0.05)
-            simulated_coherence = np.clip(simulated_coherence, 0.0, 1.0)
+        states = np.take_along_axis(
+            transitions[:, keep_from:], current[:, None, None], axis=2
+        )[..., 0]
+        type_indices = states.astype(np.intp)
 
-            # Almacenar sample (después de burn-in)
-            if i >= burn_in:
-                sample = {
-                    'mechanism_type': current_type,
-                    'coherence': float(simulated_coherence),
-                    'iteration': i - burn_in,
-                    'chain_seed': seed
-                }
-                samples.append(sample)
+        # La coherence simulada no depende del estado de la cadena
+        current_coherence = observations.get('coherence', 0.5)
+        coherences = np.clip(current_coherence + noise[:, keep_from:], 0.0, 1.0)
+        return type_indices, coherences
+
+    def _acceptance_matrix(self, observations: dict[str, Any]) -> np.ndarray:
+        """Matriz (actual, propuesto) de probabilidades de aceptación MH"""
+        mechanism_types = list(self.mechanism_priors.keys())
+        likelihoods = np.array(
+            [self._calculate_likelihood(mtype, observations) for mtype in mechanism_types]
+        )
+        priors = np.array([self.mechanism_priors[mtype] for mtype in mechanism_types])
 
-        return samples
+        likelihood_ratio = likelihoods[None, :] / np.maximum(likelihoods[:, None], 1e-10)
+        prior_ratio = priors[None, :] / np.maximum(priors[:, None], 1e-10)
+        return np.minimum(1.0, likelihood_ratio * prior_ratio)
 
     def _calculate_likelihood(
         self,
@@ -5447,25 +5487,28 @@ class HierarchicalGenerativeModel:
             return max(type_counts.items(), key=lambda x: x[1])[0]
         return 'mixto'
 
+    @staticmethod
+    def _coherence_array(samples: np.ndarray | list[dict[str, Any]]) -> np.ndarray:
+        """Convierte samples (arreglo o lista de dicts) en un arreglo de coherence"""
+        if isinstance(samples, np.ndarray):
+            return samples.astype(float, copy=False)
+        return np.array([s.get('coherence', 0.5) for s in samples], dtype=float)
+
     @calibrated_method("farfan_core.analysis.derek_beach.HierarchicalGenerativeModel._calculate_r_hat")
-    def _calculate_r_hat(self, chains: list[list[dict[str, Any]]]) -> float:
+    def _calculate_r_hat(self, chains: np.ndarray | list[list[dict[str, Any]]]) -> float:
         """Calcula Gelman-Rubin R-hat para diagnóstico de convergencia"""
         if len(chains) < 2:
             return 1.0
 
         # Extraer coherence de cada cadena
-        chain_means = []
-        chain_vars = []
-
-        for chain in chains:
-            coherences = [s.get('coherence', 0.5) for s in chain]
-            if len(coherences) > 0:
-                chain_means.append(np.mean(coherences))
-                chain_vars.append(np.var(coherences, ddof=1))
-
-        if len(chain_means) < 2:
+        coherences = [self._coherence_array(chain) for chain in chains]
+        coherences = [chain for chain in coherences if chain.size > 0]
+        if len(coherences) < 2:
             return 1.0
 
+        chain_means = np.array([chain.mean() for chain in coherences])
+        chain_vars = np.array([chain.var(ddof=1) for chain in coherences])
+
         # Between-chain variance (B)
         n = len(chains[0])  # samples per chain
         B = np.var(chain_means, ddof=1) * n
@@ -5483,14 +5526,13 @@ class HierarchicalGenerativeModel:
         return float(r_hat)
 
     @calibrated_method("farfan_core.analysis.derek_beach.HierarchicalGenerativeModel._calculate_ess")
-    def _calculate_ess(self, samples: list[dict[str, Any]]) -> float:
+    def _calculate_ess(self, samples: np.ndarray | list[dict[str, Any]]) -> float:
         """Calcula Effective Sample Size (simplificado)"""
-        n = len(samples)
-
         # Estimar autocorrelación
-        coherences = np.array([s.get('coherence', 0.5) for s in samples])
+        coherences = self._coherence_array(samples).ravel()
+        n = len(coherences)
 
-        if len(coherences) < 2:
+        if n < 2:
             return n
 
         # Lag-1 autocorrelation
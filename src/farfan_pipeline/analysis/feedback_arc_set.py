@@ -0,0 +1,260 @@
+"""
+Weighted Feedback Arc Set - Single-Pass Cycle Removal for Causal Graphs.
+
+Turns a directed graph into a DAG by removing a low-weight set of edges
+(a feedback arc set), instead of repeatedly searching for a cycle and
+dropping its weakest edge:
+
+1. Decompose the graph into strongly connected components once (Tarjan,
+   via NetworkX). Edges between components never lie on a cycle.
+2. Order the nodes of every cyclic component:
+   - components with at most ``exact_max_nodes`` nodes: exact minimum-weight
+     ordering by dynamic programming over node subsets, O(2^n · E_scc)
+   - larger components: weighted Eades–Lin–Smyth greedy. Sinks go to the
+     end, sources to the front, otherwise the node with the largest
+     ``out_weight - in_weight`` goes to the front. O(E log V) with a lazy heap
+3. Remove the edges pointing backwards in each ordering.
+
+Self-loops are always removed. The result is acyclic by construction, and
+the report lists every removed edge with its weight.
+
+Used by ``SPCCausalBridge`` and reusable by any NetworkX ``DiGraph``
+builder (TeoriaCambio, CDAF):
+
+    dag, report = break_cycles(graph, weight="weight")
+    report.removed_edges  # [(u, v, weight), ...]
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import networkx as nx
+
+    HAS_NETWORKX = True
+except ImportError:
+    HAS_NETWORKX = False
+    nx = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXACT_MAX_NODES = 10
+
+Edge = tuple[Hashable, Hashable, float]
+
+
+@dataclass
+class FeedbackArcSetReport:
+    """Edges removed to make a graph acyclic."""
+
+    removed_edges: list[Edge] = field(default_factory=list)
+    cyclic_components: int = 0
+    exact_components: int = 0
+
+    @property
+    def removed_weight(self) -> float:
+        return sum(w for _, _, w in self.removed_edges)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "removed_edges": [[u, v, w] for u, v, w in self.removed_edges],
+            "removed_weight": self.removed_weight,
+            "cyclic_components": self.cyclic_components,
+            "exact_components": self.exact_components,
+        }
+
+
+def feedback_arc_set(
+    G: Any,
+    weight: str = "weight",
+    default_weight: float = 1.0,
+    exact_max_nodes: int = DEFAULT_EXACT_MAX_NODES,
+) -> FeedbackArcSetReport:
+    """
+    Compute a low-weight feedback arc set of a directed graph.
+
+    Args:
+        G: NetworkX DiGraph (not modified)
+        weight: Edge attribute holding the cost of removing the edge
+        default_weight: Cost of edges without the attribute
+        exact_max_nodes: Largest component solved exactly (0 disables)
+
+    Returns:
+        FeedbackArcSetReport; removing its edges leaves G acyclic
+    """
+    report = FeedbackArcSetReport()
+    order = {node: i for i, node in enumerate(G.nodes)}
+
+    for node in nx.nodes_with_selfloops(G):
+        report.removed_edges.append((node, node, _weight(G, node, node, weight, default_weight)))
+
+    for component in nx.strongly_connected_components(G):
+        if len(component) < 2:
+            continue
+        report.cyclic_components += 1
+        nodes = sorted(component, key=order.__getitem__)
+        index = {node: i for i, node in enumerate(nodes)}
+        successors: list[dict[int, float]] = [{} for _ in nodes]
+        for u in nodes:
+            for v in G.successors(u):
+                if v in index and v != u:
+                    successors[index[u]][index[v]] = _weight(G, u, v, weight, default_weight)
+
+        if len(nodes) <= exact_max_nodes:
+            ranking = _exact_ordering(successors)
+            report.exact_components += 1
+        else:
+            ranking = _greedy_ordering(successors)
+
+        position = {node_index: rank for rank, node_index in enumerate(ranking)}
+        for u, targets in enumerate(successors):
+            for v, w in targets.items():
+                if position[u] > position[v]:
+                    report.removed_edges.append((nodes[u], nodes[v], w))
+
+    return report
+
+
+def break_cycles(
+    G: Any,
+    weight: str = "weight",
+    default_weight: float = 1.0,
+    exact_max_nodes: int = DEFAULT_EXACT_MAX_NODES,
+    copy: bool = True,
+) -> tuple[Any, FeedbackArcSetReport]:
+    """
+    Remove a low-weight feedback arc set from a directed graph.
+
+    Args:
+        G: NetworkX DiGraph
+        weight: Edge attribute holding the cost of removing the edge
+        default_weight: Cost of edges without the attribute
+        exact_max_nodes: Largest component solved exactly (0 disables)
+        copy: Work on a copy (default) instead of modifying G in place
+
+    Returns:
+        (DAG, report of the removed edges)
+    """
+    report = feedback_arc_set(G, weight, default_weight, exact_max_nodes)
+    dag = G.copy() if copy else G
+    dag.remove_edges_from((u, v) for u, v, _ in report.removed_edges)
+    if report.removed_edges:
+        logger.info(
+            f"Removed {len(report.removed_edges)} edges (weight={report.removed_weight:.4f}) "
+            f"from {report.cyclic_components} cyclic components "
+            f"({report.exact_components} solved exactly)"
+        )
+    return dag, report
+
+
+def _weight(G: Any, u: Hashable, v: Hashable, weight: str, default_weight: float) -> float:
+    return float(G[u][v].get(weight, default_weight))
+
+
+def _exact_ordering(successors: list[dict[int, float]]) -> list[int]:
+    """Ordering with minimum total backward-edge weight (subset DP)."""
+    n = len(successors)
+    full = (1 << n) - 1
+    cost = [float("inf")] * (1 << n)
+    choice = [0] * (1 << n)
+    cost[0] = 0.0
+    for mask in range(full):
+        base = cost[mask]
+        if base == float("inf"):
+            continue
+        for v in range(n):
+            bit = 1 << v
+            if mask & bit:
+                continue
+            # Placing v after ``mask``: its edges into ``mask`` point backwards
+            backward = sum(w for u, w in successors[v].items() if mask >> u & 1)
+            if base + backward < cost[mask | bit]:
+                cost[mask | bit] = base + backward
+                choice[mask | bit] = v
+    ranking = []
+    mask = full
+    while mask:
+        v = choice[mask]
+        ranking.append(v)
+        mask &= ~(1 << v)
+    ranking.reverse()
+    return ranking
+
+
+def _greedy_ordering(successors: list[dict[int, float]]) -> list[int]:
+    """Weighted Eades–Lin–Smyth ordering with a lazy max-heap on out - in weight."""
+    n = len(successors)
+    predecessors: list[dict[int, float]] = [{} for _ in range(n)]
+    for u, targets in enumerate(successors):
+        for v, w in targets.items():
+            predecessors[v][u] = w
+    out_weight = [sum(t.values()) for t in successors]
+    in_weight = [sum(p.values()) for p in predecessors]
+    out_degree = [len(t) for t in successors]
+    in_degree = [len(p) for p in predecessors]
+    alive = [True] * n
+
+    sinks = [v for v in range(n) if out_degree[v] == 0]
+    sources = [v for v in range(n) if in_degree[v] == 0 and out_degree[v] > 0]
+    heap = [(in_weight[v] - out_weight[v], v) for v in range(n)]
+    heapq.heapify(heap)
+
+    front: list[int] = []
+    back: list[int] = []
+
+    def remove(v: int) -> None:
+        alive[v] = False
+        for u, w in predecessors[v].items():
+            if alive[u]:
+                out_weight[u] -= w
+                out_degree[u] -= 1
+                if out_degree[u] == 0:
+                    sinks.append(u)
+                heapq.heappush(heap, (in_weight[u] - out_weight[u], u))
+        for u, w in successors[v].items():
+            if alive[u]:
+                in_weight[u] -= w
+                in_degree[u] -= 1
+                if in_degree[u] == 0:
+                    sources.append(u)
+                heapq.heappush(heap, (in_weight[u] - out_weight[u], u))
+
+    remaining = n
+    while remaining:
+        while sinks:
+            v = sinks.pop()
+            if alive[v]:
+                back.append(v)
+                remove(v)
+                remaining -= 1
+        while sources:
+            v = sources.pop()
+            if alive[v]:
+                front.append(v)
+                remove(v)
+                remaining -= 1
+        if not remaining or sinks:
+            continue
+        while heap:
+            key, v = heapq.heappop(heap)
+            if alive[v] and key == in_weight[v] - out_weight[v]:
+                front.append(v)
+                remove(v)
+                remaining -= 1
+                break
+
+    back.reverse()
+    return front + back
+
+
+__all__ = [
+    "DEFAULT_EXACT_MAX_NODES",
+    "FeedbackArcSetReport",
+    "break_cycles",
+    "feedback_arc_set",
+]
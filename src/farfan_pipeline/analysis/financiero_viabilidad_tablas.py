@@ -31,9 +31,6 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any, Literal
 
-# === EXTRACCIÓN AVANZADA DE PDF Y TABLAS ===
-import camelot
-
 # === NETWORKING Y GRAFOS CAUSALES ===
 import networkx as nx
 
@@ -44,19 +41,23 @@ import pandas as pd
 # === ESTADÍSTICA BAYESIANA Y CAUSAL INFERENCE ===
 import pymc as pm
 import spacy
-import tabula
 import torch
 from scipy import stats
 
 # === NLP Y TRANSFORMERS ===
 # Check dependency lockdown before importing transformers
 from farfan_pipeline.core.dependency_lockdown import get_dependency_lockdown
-from sentence_transformers import SentenceTransformer, util
 from sklearn.cluster import DBSCAN, AgglomerativeClustering
 
 # === MACHINE LEARNING Y SCORING ===
 from sklearn.feature_extraction.text import TfidfVectorizer
 from transformers import pipeline
+from farfan_pipeline.compat.model_pool import acquire_sentence_transformer, acquire_spacy
+from farfan_pipeline.processing.embedding_store import (
+    PersistentEmbeddingStore,
+    default_embedding_cache_dir,
+)
+from farfan_pipeline.processing.table_extraction import PageParallelTableExtractor
 from farfan_pipeline.core.parameters import ParameterLoaderV2
 from farfan_pipeline.core.calibration.decorators import calibrated_method
 
@@ -277,16 +278,21 @@ class PDETMunicipalPlanAnalyzer:
 
         print("🔧 Inicializando modelos de vanguardia...")
 
-        self.semantic_model = SentenceTransformer(
+        # Modelos compartidos por todo el proceso (compat.model_pool)
+        self.semantic_model_handle = acquire_sentence_transformer(
             'sentence-transformers/paraphrase-multilingual-mpnet-base-v2',
             device=self.device
         )
-
-        # Delegate to factory for I/O operation
-        from farfan_pipeline.analysis.factory import load_spacy_model
+        self.semantic_model = self.semantic_model_handle.model
+        # Pilares, resultados y oraciones repetidas no se vuelven a codificar
+        self.embedding_store = PersistentEmbeddingStore(
+            'sentence-transformers/paraphrase-multilingual-mpnet-base-v2',
+            directory=default_embedding_cache_dir(),
+        )
 
         try:
-            self.nlp = load_spacy_model("es_dep_news_trf")
+            self.nlp_handle = acquire_spacy("es_dep_news_trf")
+            self.nlp = self.nlp_handle.model
         except OSError:
             raise RuntimeError(
                 "Modelo SpaCy 'es_dep_news_trf' no instalado. "
@@ -307,13 +313,20 @@ class PDETMunicipalPlanAnalyzer:
             stop_words=self._get_spanish_stopwords()
         )
 
-        self.pdet_embeddings = {
-            pillar: self.semantic_model.encode(pillar, convert_to_tensor=False)
-            for pillar in self.context.PDET_PILLARS
-        }
+        # Extracción de tablas por página: triaje con PyMuPDF, pool de procesos y caché en disco
+        self.table_extractor = PageParallelTableExtractor()
+
+        pillars = list(self.context.PDET_PILLARS)
+        self.pdet_embeddings = dict(zip(pillars, self._encode_cached(pillars)))
 
         print("✅ Modelos inicializados correctamente\n")
 
+    def _encode_cached(self, texts: list[str]) -> np.ndarray:
+        """Codifica textos con el modelo semántico reutilizando la caché de embeddings"""
+        return self.embedding_store.encode(
+            texts, lambda missing: self.semantic_model.encode(missing, convert_to_tensor=False)
+        )
+
     @calibrated_method("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._get_spanish_stopwords")
     def _get_spanish_stopwords(self) -> list[str]:
         base_stopwords = spacy.lang.es.stop_words.STOP_WORDS
@@ -330,61 +343,35 @@ class PDETMunicipalPlanAnalyzer:
     async def extract_tables(self, pdf_path: str) -> list[ExtractedTable]:
         print("📊 Iniciando extracción avanzada de tablas...")
         all_tables: list[ExtractedTable] = []
-        pdf_path_str = str(pdf_path)
+        method_key = "farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._get_spanish_stopwords"
+        lattice_threshold = ParameterLoaderV2.get(method_key, "auto_param_L342_54", 0.7)
+        stream_threshold = ParameterLoaderV2.get(method_key, "auto_param_L360_54", 0.6)
+        tabula_confidence = ParameterLoaderV2.get(method_key, "confidence_score", 0.6)
 
-        # Camelot Lattice
+        # Triaje de páginas + extractores por página en paralelo (con caché), fuera del event loop
         try:
-            lattice_tables = camelot.read_pdf(
-                pdf_path_str, pages='all', flavor='lattice',
-                line_scale=40, joint_tol=10, edge_tol=50
-            )
-            for idx, table in enumerate(lattice_tables):
-                if table.parsing_report['accuracy'] > ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._get_spanish_stopwords", "auto_param_L342_54", 0.7):
-                    all_tables.append(ExtractedTable(
-                        df=self._clean_dataframe(table.df),
-                        page_number=table.page,
-                        table_type=None,
-                        extraction_method='camelot_lattice',
-                        confidence_score=table.parsing_report['accuracy']
-                    ))
-        except Exception as e:
-            print(f" ⚠️ Camelot Lattice: {str(e)[:50]}")
-
-        # Camelot Stream
-        try:
-            stream_tables = camelot.read_pdf(
-                pdf_path_str, pages='all', flavor='stream',
-                edge_tol=500, row_tol=15, column_tol=10
-            )
-            for idx, table in enumerate(stream_tables):
-                if table.parsing_report['accuracy'] > ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._get_spanish_stopwords", "auto_param_L360_54", 0.6):
-                    all_tables.append(ExtractedTable(
-                        df=self._clean_dataframe(table.df),
-                        page_number=table.page,
-                        table_type=None,
-                        extraction_method='camelot_stream',
-                        confidence_score=table.parsing_report['accuracy']
-                    ))
+            raw_tables = await asyncio.to_thread(self.table_extractor.extract, str(pdf_path))
         except Exception as e:
-            print(f" ⚠️ Camelot Stream: {str(e)[:50]}")
+            print(f" ⚠️ Extracción de tablas: {str(e)[:50]}")
+            raw_tables = []
 
-        # Tabula
-        try:
-            tabula_tables = tabula.read_pdf(
-                pdf_path_str, pages='all', multiple_tables=True,
-                stream=True, guess=True, silent=True
-            )
-            for idx, df in enumerate(tabula_tables):
-                if not df.empty and len(df) > 2:
-                    all_tables.append(ExtractedTable(
-                        df=self._clean_dataframe(df),
-                        page_number=idx + 1,
-                        table_type=None,
-                        extraction_method='tabula',
-                        confidence_score = ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._get_spanish_stopwords", "confidence_score", 0.6) # Refactored
-                    ))
-        except Exception as e:
-            print(f" ⚠️ Tabula: {str(e)[:50]}")
+        for raw in raw_tables:
+            if raw.extraction_method == 'tabula':
+                if raw.df.empty or len(raw.df) <= 2:
+                    continue
+                confidence = tabula_confidence
+            else:
+                threshold = lattice_threshold if raw.extraction_method == 'camelot_lattice' else stream_threshold
+                if raw.accuracy is None or raw.accuracy <= threshold:
+                    continue
+                confidence = raw.accuracy
+            all_tables.append(ExtractedTable(
+                df=self._clean_dataframe(raw.df),
+                page_number=raw.page_number,
+                table_type=None,
+                extraction_method=raw.extraction_method,
+                confidence_score=confidence
+            ))
 
         unique_tables = self._deduplicate_tables(all_tables)
         print(f"✅ {len(unique_tables)} tablas únicas extraídas\n")
@@ -450,20 +437,19 @@ class PDETMunicipalPlanAnalyzer:
         if len(tables) <= 1:
             return tables
 
-        embeddings = []
-        for table in tables:
-            table_text = table.df.to_string()[:1000]
-            emb = self.semantic_model.encode(table_text, convert_to_tensor=True)
-            embeddings.append(emb)
-
-        similarities = util.cos_sim(torch.stack(embeddings), torch.stack(embeddings))
+        # Una sola codificación por lotes; tablas idénticas (varios extractores) comparten embedding
+        embeddings = np.asarray(self._encode_cached([table.df.to_string()[:1000] for table in tables]), dtype=float)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.where(norms == 0, 1.0, norms)
+        similarities = embeddings @ embeddings.T
 
+        threshold = ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._deduplicate_tables", "auto_param_L466_44", 0.85)
         to_keep = []
         seen = set()
         for i, table in enumerate(tables):
             if i in seen:
                 continue
-            duplicates = (similarities[i] > ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._deduplicate_tables", "auto_param_L466_44", 0.85)).nonzero(as_tuple=True)[0].tolist()
+            duplicates = np.flatnonzero(similarities[i] > threshold).tolist()
             best_idx = max(duplicates, key=lambda idx: tables[idx].confidence_score)
             to_keep.append(tables[best_idx])
             seen.update(duplicates)
@@ -482,7 +468,7 @@ class PDETMunicipalPlanAnalyzer:
             combined = f"{col_structure} {dtypes} {content}"
             features.append(combined)
 
-        embeddings = self.semantic_model.encode(features, convert_to_tensor=False)
+        embeddings = self._encode_cached(features)
         clustering = DBSCAN(eps=ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._deduplicate_tables", "auto_param_L486_32", 0.3), min_samples=2, metric='cosine').fit(embeddings)
 
         reconstructed = []
@@ -1025,7 +1011,7 @@ class PDETMunicipalPlanAnalyzer:
                     nodes[outcome] = CausalNode(
                         name=outcome,
                         node_type='outcome',
-                        embedding=self.semantic_model.encode(outcome, convert_to_tensor=False),
+                        embedding=self._encode_cached([outcome])[0],
                         associated_budget=None,
                         temporal_lag=0,
                         evidence_strength=min(len(outcome_mentions) / 3, ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._identify_causal_nodes", "auto_param_L1031_73", 1.0))
@@ -1037,7 +1023,7 @@ class PDETMunicipalPlanAnalyzer:
                     nodes[mediator] = CausalNode(
                         name=mediator,
                         node_type='mediator',
-                        embedding=self.semantic_model.encode(mediator, convert_to_tensor=False),
+                        embedding=self._encode_cached([mediator])[0],
                         associated_budget=None,
                         temporal_lag=0,
                         evidence_strength=min(len(mediator_mentions) / 2, ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._identify_causal_nodes", "auto_param_L1043_74", 1.0))
@@ -1047,14 +1033,12 @@ class PDETMunicipalPlanAnalyzer:
 
     @calibrated_method("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._find_semantic_mentions")
     def _find_semantic_mentions(self, text: str, concept: str, concept_embedding: np.ndarray) -> list[str]:
-        sentences = [s.text for s in self.nlp(text[:50000]).sents]
+        sentences = [s.text for s in self.nlp(text[:50000]).sents if len(s.text.split()) >= 5]
+        if not sentences:
+            return []
 
         mentions = []
-        for sentence in sentences:
-            if len(sentence.split()) < 5:
-                continue
-
-            sent_embedding = self.semantic_model.encode(sentence, convert_to_tensor=False)
+        for sentence, sent_embedding in zip(sentences, self._encode_cached(sentences)):
             similarity = np.dot(concept_embedding, sent_embedding) / (
                     np.linalg.norm(concept_embedding) * np.linalg.norm(sent_embedding)
             )
@@ -1219,7 +1203,7 @@ class PDETMunicipalPlanAnalyzer:
         if len(text) < 5:
             return None
 
-        text_embedding = self.semantic_model.encode(text, convert_to_tensor=False)
+        text_embedding = self._encode_cached([text])[0]
 
         best_match = None
         best_similarity = ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._match_text_to_node", "best_similarity", 0.0) # Refactored
@@ -1492,6 +1476,14 @@ class PDETMunicipalPlanAnalyzer:
         G = dag.graph
         predicted_outcomes = {}
 
+        # Parámetros resueltos una sola vez fuera de los bucles
+        params = ParameterLoaderV2.bind("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._simulate_intervention")
+        base_expected_change = params.get("expected_change", 0.0)
+        base_variance_sum = params.get("variance_sum", 0.0)
+        default_budget = params.get("auto_param_L1512_54", 0.0)
+        default_multiplier = params.get("auto_param_L1515_91", 1.0)
+        log_reference = np.log1p(params.get("auto_param_L1518_75", 1.0))
+
         outcome_nodes = [n for n, data in G.nodes(data=True) if data.get('type') == 'outcome']
 
         for outcome in outcome_nodes:
@@ -1500,8 +1492,8 @@ class PDETMunicipalPlanAnalyzer:
             if not relevant_effects:
                 continue
 
-            expected_change = ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._simulate_intervention", "expected_change", 0.0) # Refactored
-            variance_sum = ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._simulate_intervention", "variance_sum", 0.0) # Refactored
+            expected_change = base_expected_change
+            variance_sum = base_variance_sum
 
             for effect in relevant_effects:
                 treatment = effect.treatment
@@ -1509,13 +1501,13 @@ class PDETMunicipalPlanAnalyzer:
                     continue
 
                 current_budget = float(dag.nodes[treatment].associated_budget) if dag.nodes[
-                    treatment].associated_budget else ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._simulate_intervention", "auto_param_L1512_54", 0.0)
+                    treatment].associated_budget else default_budget
                 new_budget = intervention[treatment]
 
-                budget_multiplier = new_budget / current_budget if current_budget > 0 else ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._simulate_intervention", "auto_param_L1515_91", 1.0)
+                budget_multiplier = new_budget / current_budget if current_budget > 0 else default_multiplier
 
                 # Rendimientos decrecientes: log transform
-                effect_multiplier = np.log1p(budget_multiplier) / np.log1p(ParameterLoaderV2.get("farfan_core.analysis.financiero_viabilidad_tablas.PDETMunicipalPlanAnalyzer._simulate_intervention", "auto_param_L1518_75", 1.0))
+                effect_multiplier = np.log1p(budget_multiplier) / log_reference
 
                 expected_change += effect.posterior_mean * effect_multiplier
 
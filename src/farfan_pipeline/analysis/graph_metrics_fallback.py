@@ -4,11 +4,26 @@ Graph metrics computation with NetworkX fallback handling.
 This module provides graph metrics computation with graceful degradation
 when NetworkX is unavailable. It integrates with the runtime configuration
 system to emit proper observability signals.
+
+Average clustering and centrality metrics are computed by ``CentralityEngine``
+within one ``RuntimeConfig.graph_metrics_time_budget_ms``
+(GRAPH_METRICS_TIME_BUDGET_MS), so large graphs get sampled estimates with an
+error bound instead of none. Clustering may use up to half of the budget and
+betweenness the rest. The engine for a NetworkX graph passed in is kept between
+calls and synced with the graph's edits, so later phases only recompute the
+betweenness pivots those edits affect.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
+from farfan_pipeline.analysis.graph_centrality import (
+    DEFAULT_TIME_BUDGET_MS,
+    CentralityEngine,
+)
 from farfan_pipeline.core.runtime_config import RuntimeConfig, get_runtime_config
 from farfan_pipeline.core.contracts.runtime_contracts import (
     GraphMetricsInfo,
@@ -19,6 +34,37 @@ from farfan_pipeline.core.observability.metrics import increment_graph_metrics_s
 
 logger = logging.getLogger(__name__)
 
+_ENGINE_CACHE_SIZE = 8
+_engines: "OrderedDict[int, CentralityEngine]" = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+def _checkout_engine(G: Any, time_budget_ms: float) -> CentralityEngine:
+    """Engine kept for ``G`` (synced with its edits), else a new one.
+
+    The engine is removed from the cache while in use, so concurrent calls
+    on the same graph never share one.
+    """
+    with _engines_lock:
+        engine = _engines.pop(id(G), None)
+    if engine is not None and engine.graph is G and engine.sync():
+        engine.time_budget_ms = time_budget_ms
+        return engine
+    return CentralityEngine(G, time_budget_ms=time_budget_ms)
+
+
+def _checkin_engine(engine: CentralityEngine) -> None:
+    with _engines_lock:
+        _engines[id(engine.graph)] = engine
+        while len(_engines) > _ENGINE_CACHE_SIZE:
+            _engines.popitem(last=False)
+
+
+def reset_centrality_engines() -> None:
+    """Drop the engines kept between calls (tests, or to release graphs)."""
+    with _engines_lock:
+        _engines.clear()
+
 
 def check_networkx_available() -> bool:
     """
@@ -43,7 +89,7 @@ def compute_graph_metrics_with_fallback(
     Compute graph metrics with NetworkX fallback handling.
     
     Args:
-        graph_data: Graph data structure (e.g., edge list, adjacency matrix)
+        graph_data: Graph data structure (edge list, adjacency dict or NetworkX graph)
         runtime_config: Optional runtime configuration (uses global if None)
         document_id: Optional document identifier for logging
         
@@ -68,7 +114,10 @@ def compute_graph_metrics_with_fallback(
             
             # Convert graph_data to NetworkX graph
             # This is a placeholder - actual implementation depends on graph_data format
-            if isinstance(graph_data, list):
+            if isinstance(graph_data, nx.Graph):
+                # Causal/knowledge graphs (e.g. SPCCausalBridge DiGraph) are used as-is
+                G = graph_data
+            elif isinstance(graph_data, list):
                 # Assume edge list format: [(source, target), ...]
                 G = nx.Graph()
                 G.add_edges_from(graph_data)
@@ -83,14 +132,42 @@ def compute_graph_metrics_with_fallback(
                 'num_nodes': G.number_of_nodes(),
                 'num_edges': G.number_of_edges(),
                 'density': nx.density(G),
-                'avg_clustering': nx.average_clustering(G) if G.number_of_nodes() > 0 else 0.0,
-                'num_components': nx.number_connected_components(G),
+                'avg_clustering': 0.0,
+                'num_components': (
+                    nx.number_weakly_connected_components(G)
+                    if G.is_directed()
+                    else nx.number_connected_components(G)
+                ),
             }
             
-            # Compute centrality if graph is not too large
-            if G.number_of_nodes() < 1000:
+            # Clustering and centrality share one time budget: exact when they
+            # fit, sampled with an error bound otherwise
+            if G.number_of_nodes() > 0:
+                budget_ms = getattr(
+                    runtime_config, 'graph_metrics_time_budget_ms', DEFAULT_TIME_BUDGET_MS
+                )
+                started = time.perf_counter()
+                # Graphs built here from edge lists/dicts are new on every call
+                keep_engine = G is graph_data
+                engine = (
+                    _checkout_engine(G, budget_ms)
+                    if keep_engine
+                    else CentralityEngine(G, time_budget_ms=budget_ms)
+                )
+                clustering = engine.average_clustering(time_budget_ms=budget_ms / 2)
+                metrics['avg_clustering'] = clustering.value
+                metrics['avg_clustering_approximation'] = clustering.summary()
+                elapsed_ms = (time.perf_counter() - started) * 1000.0
+                betweenness = engine.betweenness(time_budget_ms=max(0.0, budget_ms - elapsed_ms))
                 metrics['degree_centrality'] = nx.degree_centrality(G)
-                metrics['betweenness_centrality'] = nx.betweenness_centrality(G)
+                metrics['betweenness_centrality'] = betweenness.values
+                metrics['betweenness_approximation'] = betweenness.summary()
+                metrics['pagerank'] = engine.pagerank()
+                eigenvector = engine.eigenvector()
+                if eigenvector is not None:
+                    metrics['eigenvector_centrality'] = eigenvector
+                if keep_engine:
+                    _checkin_engine(engine)
             
             logger.info(f"Graph metrics computed: {metrics['num_nodes']} nodes, {metrics['num_edges']} edges")
             
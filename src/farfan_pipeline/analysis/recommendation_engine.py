@@ -9,6 +9,10 @@ This module implements a rule-based recommendation engine that:
 3. Generates actionable recommendations with specific interventions
 4. Renders templates with context-specific variable substitution
 
+Rules are compiled once at load time: MICRO rules are indexed by PA-DIM key
+with thresholds sorted for range lookup, MESO/MACRO conditions become
+predicate closures and templates are pre-parsed into segment lists.
+
 Supports three levels of recommendations:
 - MICRO: Question-level recommendations (PA-DIM combinations)
 - MESO: Cluster-level recommendations (CL01-CL04)
@@ -20,9 +24,13 @@ Python: 3.10+
 """
 
 import logging
+import math
 import re
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -107,6 +115,57 @@ class RecommendationSet:
             'metadata': self.metadata
         }
 
+# ============================================================================
+# COMPILED RULES
+# ============================================================================
+
+_PLACEHOLDER_RE = re.compile(r'\{\{(.*?)\}\}')
+
+TemplateRenderer = Callable[[dict[str, str]], Any]
+
+
+@lru_cache(maxsize=8192)
+def _parse_template_string(text: str) -> tuple[str, ...]:
+    """Split text into segments: even positions are literals, odd positions variable names."""
+    return tuple(_PLACEHOLDER_RE.split(text))
+
+
+def _render_segments(segments: tuple[str, ...], substitutions: dict[str, str]) -> str:
+    """Join pre-parsed segments; unknown variables are left as {{variable}}."""
+    if len(segments) == 1:
+        return segments[0]
+    parts = list(segments)
+    for i in range(1, len(parts), 2):
+        value = substitutions.get(parts[i])
+        parts[i] = value if value is not None else '{{' + parts[i] + '}}'
+    return ''.join(parts)
+
+
+def _compile_template(value: Any) -> TemplateRenderer:
+    """Compile a (nested) template into a renderer taking the substitutions."""
+    if isinstance(value, str):
+        segments = _parse_template_string(value)
+        if len(segments) == 1:
+            return lambda substitutions: value
+        return lambda substitutions: _render_segments(segments, substitutions)
+    if isinstance(value, list):
+        items = [_compile_template(item) for item in value]
+        return lambda substitutions: [render(substitutions) for render in items]
+    if isinstance(value, dict):
+        entries = [(key, _compile_template(item)) for key, item in value.items()]
+        return lambda substitutions: {key: render(substitutions) for key, render in entries}
+    return lambda substitutions: value
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    """Rule with its template renderer and condition predicate built at load time."""
+    ordinal: int
+    rule: dict[str, Any]
+    render: TemplateRenderer
+    predicate: Callable[..., bool] | None = None
+
+
 # ============================================================================
 # RECOMMENDATION ENGINE
 # ============================================================================
@@ -149,6 +208,11 @@ class RecommendationEngine:
             'MACRO': []
         }
 
+        # Compiled forms of rules_by_level (see _compile_rules)
+        self._micro_index: dict[str, tuple[list[float], list[_CompiledRule]]] = {}
+        self._compiled_meso: list[_CompiledRule] = []
+        self._compiled_macro: list[_CompiledRule] = []
+
         # Load canonical notation for validation
         self._load_canonical_notation()
 
@@ -212,6 +276,8 @@ class RecommendationEngine:
                 if level in self.rules_by_level:
                     self.rules_by_level[level].append(rule)
 
+            self._compile_rules()
+
             logger.info(f"Loaded and validated {len(self.rules.get('rules', []))} rules from {self.rules_path}")
         except jsonschema.ValidationError as e:
             logger.error(f"Rule validation failed: {e.message}")
@@ -220,6 +286,48 @@ class RecommendationEngine:
             logger.error(f"Failed to load rules: {e}")
             raise
 
+    def _compile_rules(self) -> None:
+        """Build the MICRO index, MESO/MACRO predicates and template renderers."""
+        micro_groups: dict[str, list[tuple[float, _CompiledRule]]] = {}
+        for ordinal, rule in enumerate(self.rules_by_level['MICRO']):
+            when = rule.get('when', {})
+            score_key = f"{when.get('pa_id')}-{when.get('dim_id')}"
+            compiled = _CompiledRule(ordinal, rule, _compile_template(rule.get('template', {})))
+            micro_groups.setdefault(score_key, []).append((float(when.get('score_lt')), compiled))
+
+        self._micro_index = {}
+        for score_key, group in micro_groups.items():
+            group.sort(key=lambda item: (item[0], item[1].ordinal))
+            self._micro_index[score_key] = (
+                [threshold for threshold, _ in group],
+                [compiled for _, compiled in group],
+            )
+
+        self._compiled_meso = []
+        for ordinal, rule in enumerate(self.rules_by_level['MESO']):
+            when = rule.get('when', {})
+            self._compiled_meso.append(_CompiledRule(
+                ordinal,
+                rule,
+                _compile_template(rule.get('template', {})),
+                self._compile_meso_predicate(
+                    when.get('score_band'),
+                    when.get('variance_level'),
+                    when.get('variance_threshold'),
+                    when.get('weak_pa_id'),
+                ),
+            ))
+
+        self._compiled_macro = [
+            _CompiledRule(
+                ordinal,
+                rule,
+                _compile_template(rule.get('template', {})),
+                self._compile_macro_predicate(rule.get('when', {})),
+            )
+            for ordinal, rule in enumerate(self.rules_by_level['MACRO'])
+        ]
+
     @calibrated_method("farfan_core.analysis.recommendation_engine.RecommendationEngine.reload_rules")
     def reload_rules(self) -> None:
         """Reload rules from disk (useful for hot-reloading)"""
@@ -283,56 +391,66 @@ class RecommendationEngine:
         Returns:
             RecommendationSet with matched recommendations
         """
-        recommendations = []
-        rules_evaluated = 0
+        return self._generate_micro(scores, context, datetime.now(timezone.utc).isoformat())
 
-        for rule in self.rules_by_level['MICRO']:
-            rules_evaluated += 1
+    def _generate_micro(
+        self,
+        scores: dict[str, float],
+        context: dict[str, Any] | None,
+        generated_at: str
+    ) -> RecommendationSet:
+        """Look up each scored PA-DIM key in the index; matches keep rule file order."""
+        matches: list[tuple[_CompiledRule, str, float]] = []
+        for score_key, score in scores.items():
+            entry = self._micro_index.get(score_key)
+            if entry is None:
+                continue
+            thresholds, compiled_rules = entry
+            # Rules fire when score < score_lt, i.e. every threshold above the score
+            for compiled in compiled_rules[bisect_right(thresholds, score):]:
+                matches.append((compiled, score_key, score))
+        matches.sort(key=lambda match: match[0].ordinal)
 
-            # Extract condition
-            when = rule.get('when', {})
-            pa_id = when.get('pa_id')
-            dim_id = when.get('dim_id')
-            score_lt = when.get('score_lt')
-
-            # Build score key
-            score_key = f"{pa_id}-{dim_id}"
-
-            # Check if condition matches
-            if score_key in scores and scores[score_key] < score_lt:
-                # Render template
-                template = rule.get('template', {})
-                rendered = self._render_micro_template(template, pa_id, dim_id, context)
-
-                # Create recommendation with enhanced fields (v2.0) if available
-                rec = Recommendation(
-                    rule_id=rule.get('rule_id'),
-                    level='MICRO',
-                    problem=rendered['problem'],
-                    intervention=rendered['intervention'],
-                    indicator=rendered['indicator'],
-                    responsible=rendered['responsible'],
-                    horizon=rendered['horizon'],
-                    verification=rendered['verification'],
-                    metadata={
-                        'score_key': score_key,
-                        'actual_score': scores[score_key],
-                        'threshold': score_lt,
-                        'gap': score_lt - scores[score_key]
-                    },
-                    # Enhanced fields (v2.0)
-                    execution=rule.get('execution'),
-                    budget=rule.get('budget'),
-                    template_id=rendered.get('template_id'),
-                    template_params=rendered.get('template_params')
-                )
-                recommendations.append(rec)
+        recommendations = []
+        for compiled, score_key, score in matches:
+            rule = compiled.rule
+            when = rule['when']
+            template = rule.get('template', {})
+            params = template.get('template_params', {}) if isinstance(template, dict) else {}
+            rendered = compiled.render(
+                self._micro_substitutions(when['pa_id'], when['dim_id'], params, context)
+            )
+            score_lt = when['score_lt']
+
+            # Create recommendation with enhanced fields (v2.0) if available
+            rec = Recommendation(
+                rule_id=rule.get('rule_id'),
+                level='MICRO',
+                problem=rendered['problem'],
+                intervention=rendered['intervention'],
+                indicator=rendered['indicator'],
+                responsible=rendered['responsible'],
+                horizon=rendered['horizon'],
+                verification=rendered['verification'],
+                metadata={
+                    'score_key': score_key,
+                    'actual_score': score,
+                    'threshold': score_lt,
+                    'gap': score_lt - score
+                },
+                # Enhanced fields (v2.0)
+                execution=rule.get('execution'),
+                budget=rule.get('budget'),
+                template_id=rendered.get('template_id'),
+                template_params=rendered.get('template_params')
+            )
+            recommendations.append(rec)
 
         return RecommendationSet(
             level='MICRO',
             recommendations=recommendations,
-            generated_at=datetime.now(timezone.utc).isoformat(),
-            total_rules_evaluated=rules_evaluated,
+            generated_at=generated_at,
+            total_rules_evaluated=len(self.rules_by_level['MICRO']),
             rules_matched=len(recommendations)
         )
 
@@ -351,6 +469,19 @@ class RecommendationEngine:
         - {{DIMxx}}: Dimension (e.g., DIM01)
         - {{Q###}}: Question number (from context)
         """
+        template_params = template.get('template_params', {}) if isinstance(template, dict) else {}
+        return self._render_template(
+            template, self._micro_substitutions(pa_id, dim_id, template_params, context)
+        )
+
+    @staticmethod
+    def _micro_substitutions(
+        pa_id: str,
+        dim_id: str,
+        template_params: Any,
+        context: dict[str, Any] | None
+    ) -> dict[str, str]:
+        """Variables for a MICRO template; earlier sources take precedence."""
         ctx = context or {}
 
         substitutions = {
@@ -361,7 +492,6 @@ class RecommendationEngine:
         }
 
         question_hint = ctx.get('question_id')
-        template_params = template.get('template_params', {}) if isinstance(template, dict) else {}
         if isinstance(template_params, dict):
             for key, value in template_params.items():
                 if isinstance(value, str):
@@ -379,7 +509,7 @@ class RecommendationEngine:
             if isinstance(value, str):
                 substitutions.setdefault(key, value)
 
-        return self._render_template(template, substitutions)
+        return substitutions
 
     # ========================================================================
     # MESO LEVEL RECOMMENDATIONS
@@ -405,19 +535,21 @@ class RecommendationEngine:
         Returns:
             RecommendationSet with matched recommendations
         """
-        recommendations = []
-        rules_evaluated = 0
+        return self._generate_meso(cluster_data, context, datetime.now(timezone.utc).isoformat())
 
-        for rule in self.rules_by_level['MESO']:
-            rules_evaluated += 1
+    def _generate_meso(
+        self,
+        cluster_data: dict[str, Any],
+        context: dict[str, Any] | None,
+        generated_at: str
+    ) -> RecommendationSet:
+        """Evaluate the compiled MESO predicates against each rule's cluster."""
+        recommendations = []
 
-            # Extract condition
+        for compiled in self._compiled_meso:
+            rule = compiled.rule
             when = rule.get('when', {})
             cluster_id = when.get('cluster_id')
-            score_band = when.get('score_band')
-            variance_level = when.get('variance_level')
-            variance_threshold = when.get('variance_threshold')
-            weak_pa_id = when.get('weak_pa_id')
 
             # Get cluster data
             cluster = cluster_data.get(cluster_id, {})
@@ -426,15 +558,12 @@ class RecommendationEngine:
             cluster_weak_pa = cluster.get('weak_pa')
 
             # Check conditions
-            if not self._check_meso_conditions(
-                cluster_score, cluster_variance, cluster_weak_pa,
-                score_band, variance_level, variance_threshold, weak_pa_id
-            ):
+            if not compiled.predicate(cluster_score, cluster_variance, cluster_weak_pa):
                 continue
 
             # Render template
             template = rule.get('template', {})
-            rendered = self._render_meso_template(template, cluster_id, context)
+            rendered = compiled.render(self._meso_substitutions(template, cluster_id, context))
 
             # Create recommendation with enhanced fields (v2.0) if available
             rec = Recommendation(
@@ -449,9 +578,9 @@ class RecommendationEngine:
                 metadata={
                     'cluster_id': cluster_id,
                     'score': cluster_score,
-                    'score_band': score_band,
+                    'score_band': when.get('score_band'),
                     'variance': cluster_variance,
-                    'variance_level': variance_level,
+                    'variance_level': when.get('variance_level'),
                     'weak_pa': cluster_weak_pa
                 },
                 # Enhanced fields (v2.0)
@@ -465,8 +594,8 @@ class RecommendationEngine:
         return RecommendationSet(
             level='MESO',
             recommendations=recommendations,
-            generated_at=datetime.now(timezone.utc).isoformat(),
-            total_rules_evaluated=rules_evaluated,
+            generated_at=generated_at,
+            total_rules_evaluated=len(self._compiled_meso),
             rules_matched=len(recommendations)
         )
 
@@ -481,19 +610,48 @@ class RecommendationEngine:
         weak_pa_id: str | None
     ) -> bool:
         """Check if MESO conditions are met"""
-        # Check score band
-        if score_band == 'BAJO' and score >= 55 or score_band == 'MEDIO' and (score < 55 or score >= 75) or score_band == 'ALTO' and score < 75:
-            return False
+        predicate = self._compile_meso_predicate(score_band, variance_level, variance_threshold, weak_pa_id)
+        return predicate(score, variance, weak_pa)
 
-        # Check variance level
-        if variance_level == 'BAJA' and variance >= ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L488_52", 0.08) or variance_level == 'MEDIA' and (variance < ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L488_102", 0.08) or variance >= ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L488_122", 0.18)):
-            return False
+    @staticmethod
+    def _compile_meso_predicate(
+        score_band: str | None,
+        variance_level: str | None,
+        variance_threshold: float | None,
+        weak_pa_id: str | None
+    ) -> Callable[[float, float, str | None], bool]:
+        """Reduce MESO conditions to half-open score/variance ranges and a weak-PA check."""
+        score_low, score_high = {
+            'BAJO': (-math.inf, 55),
+            'MEDIO': (55, 75),
+            'ALTO': (75, math.inf),
+        }.get(score_band, (-math.inf, math.inf))
+
+        if variance_level == 'BAJA':
+            variance_low = -math.inf
+            variance_high = ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L488_52", 0.08)
+        elif variance_level == 'MEDIA':
+            variance_low = ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L488_102", 0.08)
+            variance_high = ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L488_122", 0.18)
         elif variance_level == 'ALTA':
-            if variance_threshold and variance < variance_threshold / 100 or not variance_threshold and variance < ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L491_115", 0.18):
-                return False
+            variance_low = (
+                variance_threshold / 100 if variance_threshold
+                else ParameterLoaderV2.get("farfan_core.analysis.recommendation_engine.RecommendationEngine.get_thresholds_from_monolith", "auto_param_L491_115", 0.18)
+            )
+            variance_high = math.inf
+        else:
+            variance_low, variance_high = -math.inf, math.inf
 
-        # Check weak PA if specified
-        return not (weak_pa_id and weak_pa != weak_pa_id)
+        required_weak_pa = weak_pa_id or None
+
+        def predicate(score: float, variance: float, weak_pa: str | None) -> bool:
+            return (
+                score_low <= score < score_high
+                and variance_low <= variance < variance_high
+                and (required_weak_pa is None or weak_pa == required_weak_pa)
+            )
+
+        return predicate
 
     def _render_meso_template(
         self,
@@ -502,7 +660,15 @@ class RecommendationEngine:
         context: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Render MESO template with variable substitution"""
+        return self._render_template(template, self._meso_substitutions(template, cluster_id, context))
 
+    @staticmethod
+    def _meso_substitutions(
+        template: dict[str, Any],
+        cluster_id: str,
+        context: dict[str, Any] | None
+    ) -> dict[str, str]:
+        """Variables for a MESO template; earlier sources take precedence."""
         substitutions = {
             'cluster_id': cluster_id,
         }
@@ -520,7 +686,7 @@ class RecommendationEngine:
                 if isinstance(value, str):
                     substitutions.setdefault(key, value)
 
-        return self._render_template(template, substitutions)
+        return substitutions
 
     # ========================================================================
     # MACRO LEVEL RECOMMENDATIONS
@@ -547,44 +713,31 @@ class RecommendationEngine:
         Returns:
             RecommendationSet with matched recommendations
         """
-        recommendations = []
-        rules_evaluated = 0
-
-        for rule in self.rules_by_level['MACRO']:
-            rules_evaluated += 1
+        return self._generate_macro(macro_data, context, datetime.now(timezone.utc).isoformat())
 
-            # Extract condition
-            when = rule.get('when', {})
-            macro_band = when.get('macro_band')
-            clusters_below = set(when.get('clusters_below_target', []))
-            variance_alert = when.get('variance_alert')
-            priority_gaps = set(when.get('priority_micro_gaps', []))
-
-            # Get macro data
-            actual_band = macro_data.get('macro_band')
-            actual_clusters = set(macro_data.get('clusters_below_target', []))
-            actual_variance = macro_data.get('variance_alert')
-            actual_gaps = set(macro_data.get('priority_micro_gaps', []))
-
-            # Check conditions
-            if macro_band and macro_band != actual_band:
-                continue
-            if variance_alert and variance_alert != actual_variance:
-                continue
+    def _generate_macro(
+        self,
+        macro_data: dict[str, Any],
+        context: dict[str, Any] | None,
+        generated_at: str
+    ) -> RecommendationSet:
+        """Evaluate the compiled MACRO predicates against the plan-level metrics."""
+        recommendations = []
 
-            # Check if clusters match (subset or exact match)
-            if clusters_below and not clusters_below.issubset(actual_clusters):
-                # For MACRO, we want exact match or the rule's clusters to be present
-                if clusters_below != actual_clusters and not actual_clusters.issubset(clusters_below):
-                    continue
+        # Get macro data
+        actual_band = macro_data.get('macro_band')
+        actual_clusters = set(macro_data.get('clusters_below_target', []))
+        actual_variance = macro_data.get('variance_alert')
+        actual_gaps = set(macro_data.get('priority_micro_gaps', []))
 
-            # Check if priority gaps match (subset)
-            if priority_gaps and not priority_gaps.issubset(actual_gaps):
+        for compiled in self._compiled_macro:
+            if not compiled.predicate(actual_band, actual_clusters, actual_variance, actual_gaps):
                 continue
 
             # Render template
+            rule = compiled.rule
             template = rule.get('template', {})
-            rendered = self._render_macro_template(template, context)
+            rendered = compiled.render(self._macro_substitutions(template, context))
 
             # Create recommendation with enhanced fields (v2.0) if available
             rec = Recommendation(
@@ -613,18 +766,59 @@ class RecommendationEngine:
         return RecommendationSet(
             level='MACRO',
             recommendations=recommendations,
-            generated_at=datetime.now(timezone.utc).isoformat(),
-            total_rules_evaluated=rules_evaluated,
+            generated_at=generated_at,
+            total_rules_evaluated=len(self._compiled_macro),
             rules_matched=len(recommendations)
         )
 
+    @staticmethod
+    def _compile_macro_predicate(
+        when: dict[str, Any]
+    ) -> Callable[[str | None, set[str], str | None, set[str]], bool]:
+        """Compile MACRO conditions into a predicate over the plan-level metrics."""
+        macro_band = when.get('macro_band')
+        clusters_below = frozenset(when.get('clusters_below_target', []))
+        variance_alert = when.get('variance_alert')
+        priority_gaps = frozenset(when.get('priority_micro_gaps', []))
+
+        def predicate(
+            actual_band: str | None,
+            actual_clusters: set[str],
+            actual_variance: str | None,
+            actual_gaps: set[str]
+        ) -> bool:
+            if macro_band and macro_band != actual_band:
+                return False
+            if variance_alert and variance_alert != actual_variance:
+                return False
+            # Clusters match when the rule's clusters are all below target, or
+            # (for MACRO) when the actual clusters are a subset of the rule's
+            if (
+                clusters_below
+                and not clusters_below.issubset(actual_clusters)
+                and clusters_below != actual_clusters
+                and not actual_clusters.issubset(clusters_below)
+            ):
+                return False
+            # Check if priority gaps match (subset)
+            return not (priority_gaps and not priority_gaps.issubset(actual_gaps))
+
+        return predicate
+
     def _render_macro_template(
         self,
         template: dict[str, Any],
         context: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Render MACRO template with variable substitution"""
+        return self._render_template(template, self._macro_substitutions(template, context))
 
+    @staticmethod
+    def _macro_substitutions(
+        template: dict[str, Any],
+        context: dict[str, Any] | None
+    ) -> dict[str, str]:
+        """Variables for a MACRO template; context takes precedence over template params."""
         substitutions = {}
 
         if context:
@@ -640,7 +834,7 @@ class RecommendationEngine:
                         substitutions.setdefault(key, value)
                         substitutions.setdefault(key.upper(), value)
 
-        return self._render_template(template, substitutions)
+        return substitutions
 
     # ========================================================================
     # UTILITY METHODS
@@ -658,26 +852,12 @@ class RecommendationEngine:
         Returns:
             Text with variables substituted
         """
-        result = text
-        for var, value in substitutions.items():
-            pattern = r'\{\{' + re.escape(var) + r'\}\}'
-            result = re.sub(pattern, value, result)
-        return result
+        return _render_segments(_parse_template_string(text), substitutions)
 
     @calibrated_method("farfan_core.analysis.recommendation_engine.RecommendationEngine._render_template")
     def _render_template(self, template: dict[str, Any], substitutions: dict[str, str]) -> dict[str, Any]:
         """Recursively render a template applying substitutions to nested structures."""
-
-        def render_value(value: Any) -> Any:
-            if isinstance(value, str):
-                return self._substitute_variables(value, substitutions)
-            if isinstance(value, list):
-                return [render_value(item) for item in value]
-            if isinstance(value, dict):
-                return {k: render_value(v) for k, v in value.items()}
-            return value
-
-        return render_value(template)
+        return _compile_template(template)(substitutions)
 
     # ========================================================================
     # VALIDATION UTILITIES
@@ -1061,12 +1241,71 @@ class RecommendationEngine:
         Returns:
             Dictionary with 'MICRO', 'MESO', and 'MACRO' recommendation sets
         """
+        generated_at = datetime.now(timezone.utc).isoformat()
         return {
-            'MICRO': self.generate_micro_recommendations(micro_scores, context),
-            'MESO': self.generate_meso_recommendations(cluster_data, context),
-            'MACRO': self.generate_macro_recommendations(macro_data, context)
+            'MICRO': self._generate_micro(micro_scores, context, generated_at),
+            'MESO': self._generate_meso(cluster_data, context, generated_at),
+            'MACRO': self._generate_macro(macro_data, context, generated_at)
         }
 
+    def generate_micro_recommendations_batch(
+        self,
+        score_sets: Sequence[dict[str, float]],
+        context: dict[str, Any] | Sequence[dict[str, Any] | None] | None = None
+    ) -> list[RecommendationSet]:
+        """
+        Generate MICRO-level recommendations for many score dictionaries at once
+
+        Args:
+            score_sets: One "PA##-DIM##" -> score dictionary per plan
+            context: Context shared by all plans, or one context per plan
+
+        Returns:
+            One RecommendationSet per score dictionary, in input order
+        """
+        contexts = self._batch_contexts(context, len(score_sets))
+        generated_at = datetime.now(timezone.utc).isoformat()
+        return [
+            self._generate_micro(scores, ctx, generated_at)
+            for scores, ctx in zip(score_sets, contexts, strict=True)
+        ]
+
+    def generate_all_recommendations_batch(
+        self,
+        plans: Sequence[dict[str, Any]]
+    ) -> list[dict[str, RecommendationSet]]:
+        """
+        Generate recommendations at all three levels for many plans at once
+
+        Args:
+            plans: Dictionaries with optional 'micro_scores', 'cluster_data',
+                'macro_data' and 'context' entries (see generate_all_recommendations)
+
+        Returns:
+            One {'MICRO', 'MESO', 'MACRO'} dictionary per plan, in input order
+        """
+        generated_at = datetime.now(timezone.utc).isoformat()
+        results = []
+        for plan in plans:
+            context = plan.get('context')
+            results.append({
+                'MICRO': self._generate_micro(plan.get('micro_scores') or {}, context, generated_at),
+                'MESO': self._generate_meso(plan.get('cluster_data') or {}, context, generated_at),
+                'MACRO': self._generate_macro(plan.get('macro_data') or {}, context, generated_at)
+            })
+        return results
+
+    @staticmethod
+    def _batch_contexts(
+        context: dict[str, Any] | Sequence[dict[str, Any] | None] | None,
+        count: int
+    ) -> Sequence[dict[str, Any] | None]:
+        if context is None or isinstance(context, dict):
+            return [context] * count
+        if len(context) != count:
+            raise ValueError(f"Expected {count} contexts, got {len(context)}")
+        return context
+
     def export_recommendations(
         self,
         recommendations: dict[str, RecommendationSet],
@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from farfan_pipeline.analysis.feedback_arc_set import break_cycles
 from farfan_pipeline.core.calibration.decorators import calibrated_method
 from farfan_pipeline.core.parameters import ParameterLoaderV2
 
@@ -408,7 +409,10 @@ class SPCCausalBridge:
         """
         Remove cycles from graph to create a DAG.
 
-        Uses a simple strategy: remove edges with lowest weight until acyclic.
+        Removes a low-weight feedback arc set in a single pass over the
+        strongly connected components (exact for small components, weighted
+        Eades-Lin-Smyth greedy otherwise). The removed edges are reported in
+        ``G_dag.graph["removed_cycle_edges"]``.
 
         Args:
             G: NetworkX DiGraph
@@ -419,47 +423,19 @@ class SPCCausalBridge:
         if not HAS_NETWORKX:
             return G
 
-        # Make a copy to avoid modifying original
-        G_dag = G.copy()
-
-        # Find cycles and remove lowest-weight edges
-        while not nx.is_directed_acyclic_graph(G_dag):
-            try:
-                # Find a cycle
-                cycle = nx.find_cycle(G_dag, orientation="original")
-
-                # Find edge in cycle with minimum weight
-                min_weight = float("inf")
-                min_edge = None
-
-                for u, v, direction in cycle:
-                    if direction == "forward":
-                        weight = G_dag[u][v].get(
-                            "weight",
-                            ParameterLoaderV2.get(
-                                "farfan_core.analysis.spc_causal_bridge.SPCCausalBridge._remove_cycles",
-                                "auto_param_L184_59",
-                                0.0,
-                            ),
-                        )
-                        if weight < min_weight:
-                            min_weight = weight
-                            min_edge = (u, v)
-
-                # Remove the edge
-                if min_edge:
-                    logger.info(
-                        f"Removing edge {min_edge} (weight={min_weight}) to break cycle"
-                    )
-                    G_dag.remove_edge(*min_edge)
-                else:
-                    # Shouldn't happen, but break to avoid infinite loop
-                    logger.error("Could not find edge to remove from cycle")
-                    break
-
-            except nx.NetworkXNoCycle:
-                # No more cycles
-                break
+        default_weight = ParameterLoaderV2.get(
+            "farfan_core.analysis.spc_causal_bridge.SPCCausalBridge._remove_cycles",
+            "auto_param_L184_59",
+            0.0,
+        )
+        G_dag, report = break_cycles(G, weight="weight", default_weight=default_weight)
+
+        for u, v, weight in report.removed_edges:
+            logger.debug(f"Removed edge {(u, v)} (weight={weight}) to break cycle")
+        G_dag.graph["removed_cycle_edges"] = [
+            {"source": u, "target": v, "weight": weight}
+            for u, v, weight in report.removed_edges
+        ]
 
         return G_dag
 
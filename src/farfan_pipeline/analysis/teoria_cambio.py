@@ -603,6 +603,125 @@ def _create_advanced_seed(plan_name: str, salt: str = "") -> int:
     return seed
 
 
+class BitsetDAGEngine:
+    """
+    Motor vectorizado de aciclicidad para simulaciones Monte Carlo.
+
+    Representa el grafo como una matriz booleana de adyacencia
+    (``adjacency[u, v]`` indica la arista ``u -> v``) y cada subgrafo como una
+    máscara booleana de nodos. La aciclicidad de miles de máscaras se evalúa
+    por lotes pelando, ronda a ronda, los nodos sin predecesores vivos; una
+    máscara es acíclica si y solo si no quedan nodos vivos (Kahn por lotes).
+
+    Sólo las componentes fuertemente conexas no triviales del grafo pueden
+    contener ciclos, por lo que el pelado se restringe a ellas. Por la misma
+    razón, remover una arista sólo altera el resultado de las máscaras cíclicas
+    que contienen ambos extremos cuando éstos comparten componente.
+    """
+
+    CHUNK_SIZE: ClassVar[int] = 4096
+
+    def __init__(self, node_names: tuple[str, ...], adjacency: np.ndarray) -> None:
+        self.node_names = node_names
+        self.index: dict[str, int] = {name: i for i, name in enumerate(node_names)}
+        self.adjacency = np.asarray(adjacency, dtype=bool)
+        self._components = self._cyclic_components(self.adjacency)
+
+    @classmethod
+    def from_nodes(cls, nodes: dict[str, AdvancedGraphNode]) -> "BitsetDAGEngine":
+        """Construye el motor a partir de nodos; ignora dependencias desconocidas."""
+        names = tuple(nodes)
+        index = {name: i for i, name in enumerate(names)}
+        adjacency = np.zeros((len(names), len(names)), dtype=bool)
+        for name, node in nodes.items():
+            for dep in node.dependencies:
+                if dep in index:
+                    adjacency[index[dep], index[name]] = True
+        return cls(names, adjacency)
+
+    @staticmethod
+    def _cyclic_components(adjacency: np.ndarray) -> list[np.ndarray]:
+        """Componentes fuertemente conexas capaces de contener un ciclo."""
+        sources, targets = np.nonzero(adjacency)
+        graph = nx.DiGraph()
+        graph.add_edges_from(zip(sources.tolist(), targets.tolist()))
+        components = []
+        for component in nx.strongly_connected_components(graph):
+            members = sorted(component)
+            if len(members) > 1 or adjacency[members[0], members[0]]:
+                components.append(np.array(members, dtype=np.intp))
+        return components
+
+    def acyclic(
+        self, masks: np.ndarray, adjacency: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Evalúa la aciclicidad del subgrafo inducido por cada máscara (fila)."""
+        masks = np.asarray(masks, dtype=bool)
+        if adjacency is None:
+            adjacency, components = self.adjacency, self._components
+        else:
+            components = self._cyclic_components(adjacency)
+
+        result = np.ones(masks.shape[0], dtype=bool)
+        for component in components:
+            sub_adjacency = adjacency[np.ix_(component, component)].astype(np.float32)
+            sub_masks = masks[:, component]
+            rows = np.flatnonzero(result & sub_masks.any(axis=1))
+            for start in range(0, rows.size, self.CHUNK_SIZE):
+                chunk = rows[start : start + self.CHUNK_SIZE]
+                result[chunk] = self._peel(sub_masks[chunk], sub_adjacency)
+        return result
+
+    @staticmethod
+    def _peel(alive: np.ndarray, adjacency: np.ndarray) -> np.ndarray:
+        """Remueve por rondas los nodos sin predecesores vivos."""
+        alive = alive.copy()
+        active = np.arange(alive.shape[0])
+        while active.size:
+            current = alive[active]
+            in_degree = current.astype(np.float32) @ adjacency
+            removable = current & (in_degree == 0)
+            current &= ~removable
+            alive[active] = current
+            active = active[removable.any(axis=1) & current.any(axis=1)]
+        return ~alive.any(axis=1)
+
+    def edge_removal_acyclic_counts(
+        self, masks: np.ndarray, base: np.ndarray | None = None
+    ) -> dict[tuple[str, str], int]:
+        """
+        Cuenta las máscaras acíclicas tras remover cada arista del grafo.
+
+        Remover una arista no puede crear ciclos, de modo que sólo se
+        reevalúan las máscaras cíclicas que contienen ambos extremos de una
+        arista interna a una componente fuertemente conexa.
+        """
+        masks = np.asarray(masks, dtype=bool)
+        if base is None:
+            base = self.acyclic(masks)
+        base_count = int(base.sum())
+
+        component_of = np.full(len(self.node_names), -1, dtype=np.intp)
+        for label, component in enumerate(self._components):
+            component_of[component] = label
+
+        counts: dict[tuple[str, str], int] = {}
+        cyclic_rows = np.flatnonzero(~base)
+        for u, v in zip(*np.nonzero(self.adjacency)):
+            edge = (self.node_names[u], self.node_names[v])
+            if component_of[u] < 0 or component_of[u] != component_of[v]:
+                counts[edge] = base_count
+                continue
+            rows = cyclic_rows[masks[cyclic_rows, u] & masks[cyclic_rows, v]]
+            if rows.size == 0:
+                counts[edge] = base_count
+                continue
+            perturbed = self.adjacency.copy()
+            perturbed[u, v] = False
+            counts[edge] = base_count + int(self.acyclic(masks[rows], perturbed).sum())
+        return counts
+
+
 class AdvancedDAGValidator:
     """
     Motor para la validación estocástica y análisis de sensibilidad de DAGs.
@@ -625,6 +744,7 @@ class AdvancedDAGValidator:
         self._rng: random.Random | None = None
         self.config: dict[str, Any] = {
             "default_iterations": 10000,
+            "sensitivity_iterations": 200,
             "confidence_level": ParameterLoaderV2.get(
                 "farfan_core.analysis.teoria_cambio.AdvancedDAGValidator.__init__",
                 "auto_param_L517_32",
@@ -739,6 +859,25 @@ class AdvancedDAGValidator:
             )
         return subgraph
 
+    def _sample_node_masks(
+        self, engine: BitsetDAGEngine, iterations: int
+    ) -> np.ndarray:
+        """
+        Genera subgrafos aleatorios como máscaras de nodos.
+
+        Consume el RNG exactamente como ``_generate_subgraph``, por lo que una
+        misma semilla produce los mismos subgrafos en ambas representaciones.
+        """
+        node_count = len(engine.node_names)
+        masks = np.zeros((max(iterations, 0), node_count), dtype=bool)
+        if node_count == 0 or self._rng is None:
+            return masks
+        positions = range(node_count)
+        for row in range(iterations):
+            subgraph_size = self._rng.randint(min(3, node_count), node_count)
+            masks[row, self._rng.sample(positions, subgraph_size)] = True
+        return masks
+
     def calculate_acyclicity_pvalue(
         self, plan_name: str, iterations: int
     ) -> MonteCarloAdvancedResult:
@@ -751,8 +890,9 @@ class AdvancedDAGValidator:
                 plan_name, seed, datetime.now().isoformat()
             )
 
-        acyclic_count = sum(
-            1 for _ in range(iterations) if self._is_acyclic(self._generate_subgraph())
+        engine = BitsetDAGEngine.from_nodes(self.graph_nodes)
+        acyclic_count = int(
+            engine.acyclic(self._sample_node_masks(engine, iterations)).sum()
         )
 
         p_value = (
@@ -770,7 +910,10 @@ class AdvancedDAGValidator:
 
         # Análisis de Sensibilidad (simplificado para el flujo principal)
         sensitivity = self._perform_sensitivity_analysis_internal(
-            plan_name, p_value, min(iterations, 200)
+            plan_name,
+            p_value,
+            min(iterations, self.config["sensitivity_iterations"]),
+            engine=engine,
         )
 
         self.export_nodes(validate=True)
@@ -883,41 +1026,38 @@ class AdvancedDAGValidator:
         return validator
 
     def _perform_sensitivity_analysis_internal(
-        self, plan_name: str, base_p_value: float, iterations: int
+        self,
+        plan_name: str,
+        base_p_value: float,
+        iterations: int,
+        engine: BitsetDAGEngine | None = None,
     ) -> dict[str, Any]:
-        """Análisis de sensibilidad interno optimizado para evitar cálculos redundantes."""
+        """
+        Análisis de sensibilidad por remoción de aristas.
+
+        Los subgrafos se generan una sola vez como máscaras de nodos y cada
+        arista se perturba enmascarándola en la matriz de adyacencia, sin
+        copiar nodos.
+        """
+        if engine is None:
+            engine = BitsetDAGEngine.from_nodes(self.graph_nodes)
+        masks = self._sample_node_masks(engine, iterations)
+        base = engine.acyclic(masks)
+        removal_counts = engine.edge_removal_acyclic_counts(masks, base)
+        base_count = int(base.sum())
+
         edge_sensitivity: dict[str, float] = {}
-        # 1. Genera los subgrafos una sola vez
-        subgraphs = []
-        for _ in range(iterations):
-            subgraph = self._generate_subgraph()
-            subgraphs.append(subgraph)
-        # 2. Lista de todas las aristas
-        edges = {
-            f"{dep}->{name}"
-            for name, node in self.graph_nodes.items()
-            for dep in node.dependencies
-        }
-        # 3. Para cada arista, calcula el p-value perturbado usando los mismos subgrafos
-        for edge in edges:
-            from_node, to_node = edge.split("->")
-            acyclic_count = 0
-            for subgraph in subgraphs:
-                # Perturba el subgrafo removiendo la arista
-                if to_node in subgraph and from_node in subgraph[to_node].dependencies:
-                    subgraph_copy = {
-                        k: AdvancedGraphNode(
-                            v.name, set(v.dependencies), dict(v.metadata), v.role
-                        )
-                        for k, v in subgraph.items()
-                    }
-                    subgraph_copy[to_node].dependencies.discard(from_node)
-                else:
-                    subgraph_copy = subgraph
-                if AdvancedDAGValidator._is_acyclic(subgraph_copy):
-                    acyclic_count += 1
-            perturbed_p = acyclic_count / iterations
-            edge_sensitivity[edge] = abs(base_p_value - perturbed_p)
+        if iterations > 0:
+            edges = sorted(
+                (dep, name)
+                for name, node in self.graph_nodes.items()
+                for dep in node.dependencies
+            )
+            for edge in edges:
+                perturbed_p = removal_counts.get(edge, base_count) / iterations
+                edge_sensitivity[f"{edge[0]}->{edge[1]}"] = abs(
+                    base_p_value - perturbed_p
+                )
         sens_values = list(edge_sensitivity.values())
         return {
             "edge_sensitivity": edge_sensitivity,
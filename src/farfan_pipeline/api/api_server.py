@@ -1,6 +1,18 @@
 #!/usr/bin/env python3
 """AtroZ Dashboard API server with live pipeline integration."""
 
+from farfan_pipeline.api.pipeline_worker_pool import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PROGRESS,
+    JOB_QUEUED,
+    JOB_STARTED,
+    JobTicket,
+    PipelineQueueFullError,
+    PipelineWorkerPool,
+    get_pipeline_worker_pool,
+)
+
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
         self.dashboard_transformer = DashboardDataService(self.jobs_dir)
         
@@ -336,56 +348,55 @@
     # Pipeline Execution
     # =====================================================================
 
+    def get_worker_pool(self) -> PipelineWorkerPool:
+        """Resident worker pool running pipeline jobs for this server."""
+        return get_pipeline_worker_pool(
+            self.pipeline_connector,
+            event_handler=self._handle_pipeline_event,
+        )
+
     def start_pipeline_job(
         self,
         pdf_path: Path,
         municipality: str,
         settings: dict[str, Any] | None = None,
-    ) -> str:
-        """Kick off background pipeline execution for a PDF."""
-        job_id = f"job-{uuid.uuid4().hex[:12]}"
-        socketio.start_background_task(
-            self._run_pipeline_job,
-            job_id,
-            Path(pdf_path),
-            municipality,
-            settings or {},
-        )
-        return job_id
+    ) -> JobTicket:
+        """Queue a PDF on the warm worker pool; returns at once with its queue position.
 
-    def _run_pipeline_job(
-        self,
-        job_id: str,
-        pdf_path: Path,
-        municipality: str,
-        settings: dict[str, Any],
-    ) -> None:
-        """Execute pipeline in background thread and emit progress events."""
+        Raises:
+            PipelineQueueFullError: If the job queue is at capacity
+        """
+        return self.get_worker_pool().submit(
+            pdf_path=Path(pdf_path),
+            municipality=municipality,
+            settings=settings or {},
+        )
 
-        def progress_callback(phase: int, phase_name: str) -> None:
-            status = self.pipeline_connector.get_job_status(job_id) or {}
+    def _handle_pipeline_event(self, event: str, job_id: str, payload: dict[str, Any]) -> None:
+        """Forward worker pool events to Socket.IO clients."""
+        if event == JOB_QUEUED:
+            socketio.emit('analysis_queued', {'job_id': job_id, 'position': payload['position']})
+        elif event == JOB_STARTED:
+            socketio.emit('analysis_started', {'job_id': job_id})
+        elif event == JOB_PROGRESS:
             socketio.emit(
                 'analysis_progress',
                 {
                     'job_id': job_id,
-                    'phase': phase_name,
-                    'phase_num': phase,
-                    'progress': status.get('progress', 0),
+                    'phase': payload['phase'],
+                    'phase_num': payload['phase_num'],
+                    'progress': payload['progress'],
                 },
             )
-
-        loop = asyncio.new_event_loop()
+        elif event == JOB_COMPLETED:
+            self._complete_pipeline_job(job_id, payload['result'])
+        elif event == JOB_FAILED:
+            logger.error(f"Pipeline job {job_id} failed: {payload['error']}")
+            socketio.emit('analysis_error', {'job_id': job_id, 'error': payload['error']})
+
+    def _complete_pipeline_job(self, job_id: str, result: PipelineResult) -> None:
+        """Store artifacts, refresh dashboard state and notify clients."""
         try:
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(
-                self.pipeline_connector.execute_pipeline(
-                    pdf_path=str(pdf_path),
-                    job_id=job_id,
-                    municipality=municipality,
-                    progress_callback=progress_callback,
-                    settings=settings,
-                )
-            )
             report = {}
             output_path = result.metadata.get('output_path')
             if output_path and Path(output_path).exists():
@@ -420,13 +431,10 @@
                     'error': str(exc),
                 },
             )
-        finally:
-            asyncio.set_event_loop(None)
-            loop.close()
 
     def get_job_status(self, job_id: str) -> dict[str, Any] | None:
-        """Expose connector job status."""
-        return self.pipeline_connector.get_job_status(job_id)
+        """Expose worker pool job status (queue position, progress, result)."""
+        return self.get_worker_pool().get_job_status(job_id)
 
     def get_metrics_snapshot(self) -> dict[str, Any]:
         """Return cached metrics for admin dashboard."""
@@ -1046,6 +1054,7 @@ def get_admin_metrics():
             'perf_report': metrics.get('perf_report', 0.5),
             'estimated_time': 22,
             'pipeline_runs_count': len(pipeline_runs),
+            'worker_pool': data_service.get_worker_pool().get_stats(),
         }
         
         return jsonify(response_payload)
@@ -1157,7 +1166,8 @@ def trigger_pipeline_analysis():
             }
         }
     
-    Returns job_id for WebSocket progress tracking.
+    Returns job_id and queue position for WebSocket progress tracking,
+    or 503 when the job queue is full.
     """
     try:
         payload = request.get_json()
@@ -1175,17 +1185,26 @@ def trigger_pipeline_analysis():
         municipality = payload.get('municipality', document_id)
         settings = payload.get('settings', {})
         
-        job_id = data_service.start_pipeline_job(
-            pdf_path=pdf_path,
-            municipality=municipality,
-            settings=settings,
-        )
+        try:
+            ticket = data_service.start_pipeline_job(
+                pdf_path=pdf_path,
+                municipality=municipality,
+                settings=settings,
+            )
+        except PipelineQueueFullError as exc:
+            logger.warning(f"Pipeline analysis rejected for doc={document_id}: {exc}")
+            return jsonify({'error': str(exc)}), 503, {'Retry-After': '60'}
         
-        logger.info(f"Pipeline analysis started: job_id={job_id}, doc={document_id}")
+        logger.info(
+            f"Pipeline analysis queued: job_id={ticket.job_id}, doc={document_id}, "
+            f"position={ticket.position}"
+        )
         
         return jsonify({
-            'status': 'success',
-            'job_id': job_id,
+            'status': 'queued',
+            'job_id': ticket.job_id,
+            'queue_position': ticket.position,
+            'queued_jobs': ticket.queued_jobs,
             'document_id': document_id,
             'municipality': municipality,
             'timestamp': datetime.now().isoformat(),
@@ -1504,6 +1523,9 @@ def main() -> None:
     logger.info(f"Caching: {APIConfig.CACHE_ENABLED}")
     logger.info("=" * 80)
 
+    # Warm the pipeline and pre-fork workers before accepting uploads
+    data_service.get_worker_pool().start()
+
     # Run server
     socketio.run(
         app,
@@ -0,0 +1,529 @@
+"""
+AtroZ Pipeline Worker Pool
+Resident, pre-forked worker processes for API pipeline jobs
+
+The parent process warms the PipelineConnector once (questionnaire, signal
+registry, method catalogue, ingestion pipeline and NLP models) and then forks
+a single-threaded fork server, which forks the workers, so every job starts
+from the warm state instead of paying the bootstrap cost. Jobs wait in a
+bounded queue: when it is full, submission fails fast with
+PipelineQueueFullError instead of piling up uploads in memory.
+
+Workers report job events (started, progress, completed, failed) over a
+multiprocessing queue; a dispatcher thread in the parent forwards them to the
+event handler, which the API server maps onto Socket.IO events.
+
+Fork safety: forking a process that runs other threads copies locks those
+threads may hold (logging, allocators, queue feeders) into a child that can
+never release them. The parent therefore forks exactly once, in ``start()``,
+before the dispatcher thread or any queue feeder thread exists; the fork
+server never starts a thread, so initial and replacement workers alike are
+forked from a single-threaded process. ``start()`` must be called from the
+main thread during start-up, before the web server spawns its threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from farfan_pipeline.api.pipeline_connector import PipelineConnector
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV = "ATROZ_PIPELINE_WORKERS"
+QUEUE_SIZE_ENV = "ATROZ_PIPELINE_QUEUE_SIZE"
+
+# Events forwarded to the handler as (event, job_id, payload)
+JOB_QUEUED = "job_queued"
+JOB_STARTED = "job_started"
+JOB_PROGRESS = "job_progress"
+JOB_COMPLETED = "job_completed"
+JOB_FAILED = "job_failed"
+
+EventHandler = Callable[[str, str, dict[str, Any]], None]
+
+# Shared-memory slot holding each worker's current job ID, so a job is
+# attributed to its worker even when the process dies before its queued
+# events are flushed
+_JOB_SLOT_BYTES = 128
+
+
+class PipelineQueueFullError(RuntimeError):
+    """Raised when the job queue is at capacity (back-pressure)."""
+
+
+@dataclass(frozen=True)
+class JobTicket:
+    """Receipt returned immediately on job submission."""
+    job_id: str
+    position: int
+    queued_jobs: int
+    workers: int
+
+
+def default_worker_count() -> int:
+    """Worker processes per host, from ATROZ_PIPELINE_WORKERS (default 1)."""
+    return max(1, int(os.getenv(WORKERS_ENV, "1")))
+
+
+def default_queue_size() -> int:
+    """Jobs allowed to wait for a worker, from ATROZ_PIPELINE_QUEUE_SIZE (default 8)."""
+    return max(1, int(os.getenv(QUEUE_SIZE_ENV, "8")))
+
+
+def _worker_main(
+    worker_id: int,
+    connector: PipelineConnector,
+    jobs: Any,
+    events: Any,
+    job_slot: Any,
+) -> None:
+    """Worker process loop: run queued jobs on the inherited warm connector."""
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+
+        job_id = job["job_id"]
+        job_slot.value = job_id.encode()
+        events.put((JOB_STARTED, job_id, {"worker_id": worker_id, "pid": os.getpid()}))
+
+        def progress_callback(phase: int, phase_name: str, job_id: str = job_id) -> None:
+            status = connector.get_job_status(job_id) or {}
+            events.put((
+                JOB_PROGRESS,
+                job_id,
+                {"phase_num": phase, "phase": phase_name, "progress": status.get("progress", 0)},
+            ))
+
+        try:
+            result = asyncio.run(
+                connector.execute_pipeline(
+                    pdf_path=job["pdf_path"],
+                    job_id=job_id,
+                    municipality=job["municipality"],
+                    progress_callback=progress_callback,
+                    settings=job["settings"],
+                )
+            )
+            events.put((JOB_COMPLETED, job_id, {"result": result}))
+        except Exception as exc:
+            logger.error(f"Worker {worker_id} failed job {job_id}: {exc}", exc_info=True)
+            events.put((JOB_FAILED, job_id, {"error": str(exc)}))
+        finally:
+            # Results live in the parent; keep the worker's memory flat
+            connector.completed_jobs.pop(job_id, None)
+            job_slot.value = b""
+
+
+def _fork_server_main(
+    connector: PipelineConnector,
+    jobs: Any,
+    events: Any,
+    job_slots: dict[int, Any],
+    control: Any,
+    parent_control: Any,
+) -> None:
+    """
+    Fork server loop: fork, reap and report the pool's workers.
+
+    Requests arrive on ``control`` as ("spawn", worker_id) or
+    ("stop", timeout); the server answers ("spawned", worker_id, pid) and
+    reports ("exited", worker_id, exitcode) for every reaped worker. It
+    never starts a thread, so forking from it is safe.
+    """
+    parent_control.close()
+    children: dict[int, int] = {}
+
+    def terminate_children(signum: int = signal.SIGTERM, frame: Any = None) -> None:
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        os._exit(0)
+
+    signal.signal(signal.SIGTERM, terminate_children)
+    stop_deadline: float | None = None
+
+    while True:
+        while children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            worker_id = children.pop(pid, None)
+            if worker_id is not None and stop_deadline is None:
+                control.send(("exited", worker_id, os.waitstatus_to_exitcode(status)))
+        if stop_deadline is not None and (not children or time.time() >= stop_deadline):
+            terminate_children()
+
+        try:
+            if not control.poll(0.1):
+                continue
+            request = control.recv()
+        except (EOFError, OSError):
+            # The parent is gone; do not leave orphaned workers behind
+            terminate_children()
+
+        if request[0] == "stop":
+            stop_deadline = time.time() + request[1]
+            continue
+
+        worker_id = request[1]
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            control.close()
+            exitcode = 0
+            try:
+                _worker_main(worker_id, connector, jobs, events, job_slots[worker_id])
+            except BaseException as exc:
+                logger.error(f"Pipeline worker {worker_id} crashed: {exc}", exc_info=True)
+                exitcode = 1
+            finally:
+                # Let the queue feeder thread deliver buffered events
+                events.close()
+                events.join_thread()
+                os._exit(exitcode)
+        children[pid] = worker_id
+        control.send(("spawned", worker_id, pid))
+
+
+class PipelineWorkerPool:
+    """
+    Pool of pre-forked processes executing pipeline jobs.
+
+    Args:
+        connector: PipelineConnector to warm up and run jobs with
+        event_handler: Called in the parent as handler(event, job_id, payload)
+        max_workers: Concurrent jobs on this host (default from environment)
+        max_queue_size: Jobs allowed to wait for a worker (default from environment)
+        warm_up: Warm the connector before forking the workers
+        max_finished_jobs: Finished job results kept for status queries
+
+    Workers are forked by a single-threaded fork server (see the module
+    docstring); call ``start()`` from the main thread before other threads
+    are running.
+    """
+
+    def __init__(
+        self,
+        connector: PipelineConnector,
+        event_handler: EventHandler | None = None,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        warm_up: bool = True,
+        max_finished_jobs: int = 256,
+    ) -> None:
+        self.connector = connector
+        self.event_handler = event_handler
+        self.max_workers = max_workers or default_worker_count()
+        self.max_queue_size = max_queue_size or default_queue_size()
+        self.warm_up = warm_up
+        self.max_finished_jobs = max_finished_jobs
+
+        self._context = multiprocessing.get_context("fork")
+        self._jobs: Any = None
+        self._events: Any = None
+        self._fork_server: Any = None
+        self._control: Any = None
+        self._workers: dict[int, int] = {}
+        self._job_slots: dict[int, Any] = {}
+        self._running: dict[int, str] = {}
+        self._pending: deque[str] = deque()
+        self._status: dict[str, dict[str, Any]] = {}
+        self._finished: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dispatcher: threading.Thread | None = None
+        self._started = False
+        self._stopping = False
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.worker_restarts = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Warm the connector, fork the fork server and the workers (idempotent)."""
+        with self._lock:
+            if self._started:
+                return
+            if threading.active_count() > 1:
+                logger.warning(
+                    f"Pipeline worker pool forking with {threading.active_count()} threads "
+                    f"running; start it from the main thread before serving requests"
+                )
+            if self.warm_up:
+                warm_start = time.time()
+                self.connector.warm_up()
+                logger.info(f"Pipeline connector warmed in {time.time() - warm_start:.2f}s")
+
+            # Nothing may start a thread before the fork server is forked
+            self._jobs = self._context.Queue()
+            self._events = self._context.Queue()
+            self._job_slots = {
+                worker_id: self._context.Array("c", _JOB_SLOT_BYTES, lock=False)
+                for worker_id in range(self.max_workers)
+            }
+            self._control, server_control = self._context.Pipe()
+            self._fork_server = self._context.Process(
+                target=_fork_server_main,
+                args=(self.connector, self._jobs, self._events, self._job_slots,
+                      server_control, self._control),
+                name="atroz-pipeline-fork-server",
+                daemon=True,
+            )
+            self._fork_server.start()
+            server_control.close()
+
+            for worker_id in range(self.max_workers):
+                self._control.send(("spawn", worker_id))
+            while len(self._workers) < self.max_workers:
+                self._handle_control(self._control.recv())
+
+            self._started = True
+            self._stopping = False
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, name="atroz-pipeline-dispatcher", daemon=True
+            )
+            self._dispatcher.start()
+
+        logger.info(
+            f"Pipeline worker pool started: workers={self.max_workers}, "
+            f"queue_size={self.max_queue_size}"
+        )
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """Stop the workers once they finish their current job."""
+        with self._lock:
+            if not self._started:
+                return
+            self._stopping = True
+            # One sentinel per worker slot: a replacement may not be reported yet
+            for _ in range(self.max_workers):
+                self._jobs.put(None)
+            # The fork server terminates workers still busy at the deadline
+            self._control.send(("stop", timeout))
+
+        self._fork_server.join(timeout + 5.0)
+        if self._fork_server.is_alive():
+            logger.warning("Terminating pipeline fork server")
+            self._fork_server.terminate()
+            self._fork_server.join()
+
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout=5.0)
+        with self._lock:
+            self._workers.clear()
+            self._control.close()
+            self._started = False
+
+    # ------------------------------------------------------------------
+    # Submission and status
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        pdf_path: str | Path,
+        municipality: str = "general",
+        settings: dict[str, Any] | None = None,
+        job_id: str | None = None,
+    ) -> JobTicket:
+        """
+        Queue a job and return at once with its queue position.
+
+        Raises:
+            PipelineQueueFullError: If max_queue_size jobs are already waiting
+        """
+        if not self._started:
+            self.start()
+
+        job_id = job_id or f"job-{uuid.uuid4().hex[:12]}"
+        if len(job_id.encode()) >= _JOB_SLOT_BYTES:
+            raise ValueError(f"job_id longer than {_JOB_SLOT_BYTES - 1} bytes: {job_id!r}")
+        with self._lock:
+            if len(self._pending) >= self.max_queue_size:
+                self.rejected += 1
+                raise PipelineQueueFullError(
+                    f"Pipeline queue is full ({self.max_queue_size} jobs waiting)"
+                )
+            self._pending.append(job_id)
+            position = len(self._pending)
+            self._status[job_id] = {
+                "status": "queued",
+                "progress": 0,
+                "current_phase": None,
+                "queued_at": datetime.now().isoformat(),
+            }
+            self._jobs.put({
+                "job_id": job_id,
+                "pdf_path": str(pdf_path),
+                "municipality": municipality,
+                "settings": settings or {},
+            })
+            ticket = JobTicket(
+                job_id=job_id,
+                position=position,
+                queued_jobs=len(self._pending),
+                workers=len(self._workers),
+            )
+
+        self._notify(JOB_QUEUED, job_id, {"position": ticket.position})
+        return ticket
+
+    def get_job_status(self, job_id: str) -> dict[str, Any] | None:
+        """Status of a queued, running or recently finished job."""
+        with self._lock:
+            if job_id in self._status:
+                status = dict(self._status[job_id])
+                if status["status"] == "queued" and job_id in self._pending:
+                    status["position"] = self._pending.index(job_id) + 1
+                return status
+            return self._finished.get(job_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Pool counters for the admin dashboard."""
+        with self._lock:
+            return {
+                "workers": len(self._workers),
+                "busy_workers": len(self._running),
+                "queued_jobs": len(self._pending),
+                "max_queue_size": self.max_queue_size,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "worker_restarts": self.worker_restarts,
+            }
+
+    # ------------------------------------------------------------------
+    # Event dispatch (parent process)
+    # ------------------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        last_check = time.monotonic()
+        while True:
+            try:
+                event, job_id, payload = self._events.get(timeout=0.5)
+            except queue.Empty:
+                if self._stopping and not self._fork_server.is_alive():
+                    return
+            else:
+                self._record(event, job_id, payload)
+                self._notify(event, job_id, payload)
+
+            if time.monotonic() - last_check >= 1.0:
+                last_check = time.monotonic()
+                self._check_workers()
+
+    def _record(self, event: str, job_id: str, payload: dict[str, Any]) -> None:
+        with self._lock:
+            status = self._status.get(job_id)
+            if status is None:
+                return
+            if event == JOB_STARTED:
+                if job_id in self._pending:
+                    self._pending.remove(job_id)
+                self._running[payload["worker_id"]] = job_id
+                status.update(status="running", started_at=datetime.now().isoformat())
+            elif event == JOB_PROGRESS:
+                status.update(progress=payload["progress"], current_phase=payload["phase"])
+            elif event in (JOB_COMPLETED, JOB_FAILED):
+                if job_id in self._pending:
+                    self._pending.remove(job_id)
+                for worker_id, running_job in list(self._running.items()):
+                    if running_job == job_id:
+                        del self._running[worker_id]
+                result = payload.get("result")
+                success = event == JOB_COMPLETED and getattr(result, "success", True)
+                if success:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+                del self._status[job_id]
+                self._finished[job_id] = {
+                    "status": "completed" if success else "failed",
+                    "progress": 100 if success else 0,
+                    "result": asdict(result) if is_dataclass(result) else result,
+                    "error": payload.get("error"),
+                }
+                while len(self._finished) > self.max_finished_jobs:
+                    self._finished.popitem(last=False)
+
+    def _check_workers(self) -> None:
+        """Fail the job of a crashed worker and have the fork server replace it."""
+        crashed: list[tuple[str, int | None]] = []
+        with self._lock:
+            if self._stopping:
+                return
+            while self._control.poll():
+                crash = self._handle_control(self._control.recv())
+                if crash is not None:
+                    crashed.append(crash)
+
+        for job_id, exitcode in crashed:
+            payload = {"error": f"Pipeline worker exited with code {exitcode}"}
+            self._record(JOB_FAILED, job_id, payload)
+            self._notify(JOB_FAILED, job_id, payload)
+
+    def _handle_control(self, message: tuple[Any, ...]) -> tuple[str, int] | None:
+        """Apply a fork server message; returns (job_id, exitcode) for a crashed job."""
+        if message[0] == "spawned":
+            _, worker_id, pid = message
+            self._workers[worker_id] = pid
+            return None
+
+        _, worker_id, exitcode = message
+        logger.error(f"Pipeline worker {worker_id} exited with code {exitcode}")
+        self._workers.pop(worker_id, None)
+        job_id = self._running.pop(worker_id, None)
+        job_id = job_id or self._job_slots[worker_id].value.decode() or None
+        self._job_slots[worker_id].value = b""
+        self.worker_restarts += 1
+        self._control.send(("spawn", worker_id))
+        return (job_id, exitcode) if job_id is not None else None
+
+    def _notify(self, event: str, job_id: str, payload: dict[str, Any]) -> None:
+        if self.event_handler is None:
+            return
+        try:
+            self.event_handler(event, job_id, payload)
+        except Exception as exc:
+            logger.error(f"Pipeline event handler failed for {event} ({job_id}): {exc}", exc_info=True)
+
+
+# Global worker pool instance
+_worker_pool: PipelineWorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_pipeline_worker_pool(
+    connector: PipelineConnector | None = None,
+    event_handler: EventHandler | None = None,
+) -> PipelineWorkerPool:
+    """Get or create the global worker pool (arguments apply on creation only)."""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            if connector is None:
+                from farfan_pipeline.api.pipeline_connector import get_pipeline_connector
+                connector = get_pipeline_connector()
+            _worker_pool = PipelineWorkerPool(connector, event_handler=event_handler)
+        return _worker_pool
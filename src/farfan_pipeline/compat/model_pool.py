@@ -0,0 +1,448 @@
+"""
+Process-wide NLP Model Pool
+
+This module loads heavy NLP models (spaCy pipelines, sentence-transformers
+encoders and cross-encoders, Hugging Face ``AutoModel`` checkpoints) at most
+once per process and hands out shared handles to every producer that asks
+for the same model.
+
+Models are keyed by ``(kind, name, device, config)``. The first ``acquire``
+for a key loads the model; later calls return a handle to the same object.
+Concurrent first acquisitions of one key wait on a per-key lock, so the
+model is loaded once, while different keys load in parallel.
+
+Handles are reference counted. Releasing the last handle keeps the model
+cached; it is dropped only when the pool has an ``idle_ttl`` and the model
+stayed unreferenced for longer than that, or on ``clear()``.
+
+Heavy libraries are imported through ``compat.lazy_deps`` only when the
+corresponding loader runs.
+
+Usage:
+    from farfan_pipeline.compat.model_pool import acquire_spacy
+
+    handle = acquire_spacy("es_core_news_lg")
+    doc = handle.model(text)
+    handle.release()
+
+    with acquire_spacy("es_core_news_lg") as nlp:
+        doc = nlp(text)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from farfan_pipeline.compat.lazy_deps import get_spacy, get_torch, get_transformers
+from farfan_pipeline.compat.safe_imports import lazy_import
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[str, "str | None", Mapping[str, Any]], Any]
+
+
+class ModelPoolError(RuntimeError):
+    """Raised for invalid model pool usage (unknown kind, released handle)."""
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    """Identity of a pooled model."""
+
+    kind: str
+    name: str
+    device: str | None = None
+    config: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def build(
+        cls, kind: str, name: str, device: str | None, config: Mapping[str, Any]
+    ) -> ModelKey:
+        return cls(kind, name, device, tuple(sorted((k, _freeze(v)) for k, v in config.items())))
+
+    def __str__(self) -> str:
+        device = f"@{self.device}" if self.device else ""
+        return f"{self.kind}:{self.name}{device}"
+
+
+def _freeze(value: Any) -> Any:
+    """Convert config values into hashable equivalents."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    return value
+
+
+def _current_rss_bytes() -> int | None:
+    """Resident set size of this process, if it can be measured."""
+    try:
+        import psutil
+
+        return int(psutil.Process(os.getpid()).memory_info().rss)
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+@dataclass
+class ModelMetrics:
+    """Load and usage metrics of one pooled model."""
+
+    load_seconds: float = 0.0
+    rss_before_bytes: int | None = None
+    rss_after_bytes: int | None = None
+    loaded_at: float = 0.0
+    acquisitions: int = 0
+
+    @property
+    def rss_delta_bytes(self) -> int | None:
+        if self.rss_before_bytes is None or self.rss_after_bytes is None:
+            return None
+        return self.rss_after_bytes - self.rss_before_bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "load_seconds": self.load_seconds,
+            "rss_before_bytes": self.rss_before_bytes,
+            "rss_after_bytes": self.rss_after_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+            "acquisitions": self.acquisitions,
+        }
+
+
+@dataclass
+class _Entry:
+    key: ModelKey
+    load_lock: threading.Lock = field(default_factory=threading.Lock)
+    usage_lock: threading.RLock = field(default_factory=threading.RLock)
+    model: Any = None
+    loaded: bool = False
+    refcount: int = 0
+    last_released: float = 0.0
+    metrics: ModelMetrics = field(default_factory=ModelMetrics)
+
+
+class ModelHandle:
+    """
+    Shared reference to a pooled model.
+
+    ``model`` is the same object for every handle of a key. Use ``lock`` to
+    serialize calls into models that are not safe for concurrent inference.
+    A handle is released explicitly, on context-manager exit, or when it is
+    garbage collected.
+    """
+
+    def __init__(self, pool: ModelPool, entry: _Entry) -> None:
+        self._pool = pool
+        self._entry = entry
+        self._released = False
+
+    @property
+    def key(self) -> ModelKey:
+        return self._entry.key
+
+    @property
+    def model(self) -> Any:
+        if self._released:
+            raise ModelPoolError(f"Handle for {self._entry.key} was already released")
+        return self._entry.model
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._entry.usage_lock
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def release(self) -> None:
+        """Drop this reference; idempotent."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self._entry)
+
+    def __enter__(self) -> Any:
+        return self.model
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        try:
+            self.release()
+        except Exception:
+            pass
+
+    def __repr__(self) -> str:
+        state = "released" if self._released else "active"
+        return f"ModelHandle({self._entry.key}, {state})"
+
+
+class ModelPool:
+    """
+    Loads each (kind, name, device, config) once and shares it.
+
+    Parameters
+    ----------
+    idle_ttl : float, optional
+        Seconds an unreferenced model may stay cached. ``None`` keeps models
+        for the lifetime of the process.
+    clock : callable, optional
+        Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        idle_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.idle_ttl = idle_ttl
+        self._clock = clock
+        self._loaders: dict[str, Loader] = dict(_DEFAULT_LOADERS)
+        self._entries: dict[ModelKey, _Entry] = {}
+        self._lock = threading.Lock()
+        self._loads = 0
+        self._hits = 0
+        self._evictions = 0
+
+    def register_loader(self, kind: str, loader: Loader) -> None:
+        """Register or replace the loader used for ``kind``."""
+        with self._lock:
+            self._loaders[kind] = loader
+
+    def acquire(
+        self, kind: str, name: str, *, device: str | None = None, **config: Any
+    ) -> ModelHandle:
+        """
+        Return a handle to the model, loading it on first use.
+
+        Raises
+        ------
+        ModelPoolError
+            If no loader is registered for ``kind``
+        Exception
+            Whatever the loader raises (e.g. ``OSError`` for a missing spaCy
+            model); failed loads are not cached.
+        """
+        key = ModelKey.build(kind, name, device, config)
+        with self._lock:
+            loader = self._loaders.get(kind)
+            if loader is None:
+                raise ModelPoolError(
+                    f"No loader registered for model kind '{kind}'. "
+                    f"Available: {', '.join(sorted(self._loaders))}"
+                )
+            self._evict_idle_locked()
+            entry = self._entries.setdefault(key, _Entry(key))
+            entry.refcount += 1
+
+        try:
+            if not entry.loaded:
+                with entry.load_lock:
+                    if not entry.loaded:
+                        self._load(entry, loader)
+                    else:
+                        self._record_hit()
+            else:
+                self._record_hit()
+        except BaseException:
+            with self._lock:
+                entry.refcount -= 1
+                if not entry.loaded and entry.refcount == 0:
+                    self._entries.pop(key, None)
+            raise
+
+        with self._lock:
+            entry.metrics.acquisitions += 1
+        return ModelHandle(self, entry)
+
+    def _record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def _load(self, entry: _Entry, loader: Loader) -> None:
+        key = entry.key
+        logger.info(f"Loading model {key}")
+        rss_before = _current_rss_bytes()
+        started = time.perf_counter()
+        model = loader(key.name, key.device, dict(key.config))
+        elapsed = time.perf_counter() - started
+
+        entry.metrics = ModelMetrics(
+            load_seconds=elapsed,
+            rss_before_bytes=rss_before,
+            rss_after_bytes=_current_rss_bytes(),
+            loaded_at=self._clock(),
+        )
+        entry.model = model
+        entry.loaded = True
+        with self._lock:
+            self._loads += 1
+        delta = entry.metrics.rss_delta_bytes
+        rss_note = f", rss +{delta / 2**20:.1f} MiB" if delta is not None else ""
+        logger.info(f"Loaded model {key} in {elapsed:.2f}s{rss_note}")
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.refcount = max(0, entry.refcount - 1)
+            if entry.refcount == 0:
+                entry.last_released = self._clock()
+            self._evict_idle_locked()
+
+    def evict_idle(self) -> list[ModelKey]:
+        """Drop unreferenced models idle for longer than ``idle_ttl``."""
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def _evict_idle_locked(self) -> list[ModelKey]:
+        if self.idle_ttl is None:
+            return []
+        now = self._clock()
+        evicted = [
+            key
+            for key, entry in self._entries.items()
+            if entry.loaded and entry.refcount == 0 and now - entry.last_released >= self.idle_ttl
+        ]
+        for key in evicted:
+            self._entries.pop(key)
+            self._evictions += 1
+            logger.info(f"Evicted idle model {key}")
+        return evicted
+
+    def clear(self) -> None:
+        """Drop every cached model; outstanding handles keep their objects alive."""
+        with self._lock:
+            self._entries.clear()
+
+    def is_loaded(self, kind: str, name: str, *, device: str | None = None, **config: Any) -> bool:
+        key = ModelKey.build(kind, name, device, config)
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.loaded
+
+    def get_stats(self) -> dict[str, Any]:
+        """Pool counters plus per-model refcounts and load metrics."""
+        with self._lock:
+            models = {
+                str(key): {"refcount": entry.refcount, **entry.metrics.to_dict()}
+                for key, entry in self._entries.items()
+                if entry.loaded
+            }
+            return {
+                "loads": self._loads,
+                "hits": self._hits,
+                "evictions": self._evictions,
+                "idle_ttl": self.idle_ttl,
+                "total_load_seconds": sum(m["load_seconds"] for m in models.values()),
+                "models": models,
+            }
+
+
+# ============================================================================
+# Default loaders
+# ============================================================================
+
+
+def _load_spacy(name: str, device: str | None, config: Mapping[str, Any]) -> Any:
+    return get_spacy().load(name, **config)
+
+
+def _load_sentence_transformer(name: str, device: str | None, config: Mapping[str, Any]) -> Any:
+    sentence_transformers = lazy_import(
+        "sentence_transformers", hint="Install with: pip install sentence-transformers"
+    )
+    return sentence_transformers.SentenceTransformer(name, device=device, **config)
+
+
+def _load_cross_encoder(name: str, device: str | None, config: Mapping[str, Any]) -> Any:
+    sentence_transformers = lazy_import(
+        "sentence_transformers", hint="Install with: pip install sentence-transformers"
+    )
+    return sentence_transformers.CrossEncoder(name, device=device, **config)
+
+
+def _load_transformer(name: str, device: str | None, config: Mapping[str, Any]) -> Any:
+    """Load ``(tokenizer, model)`` with ``AutoTokenizer``/``AutoModel`` in eval mode."""
+    transformers = get_transformers()
+    options = dict(config)
+    dtype = options.pop("torch_dtype", None)
+    if isinstance(dtype, str):
+        options["torch_dtype"] = getattr(get_torch(), dtype)
+    tokenizer = transformers.AutoTokenizer.from_pretrained(name)
+    model = transformers.AutoModel.from_pretrained(name, **options)
+    if device is not None:
+        model = model.to(device)
+    model.eval()
+    return tokenizer, model
+
+
+_DEFAULT_LOADERS: dict[str, Loader] = {
+    "spacy": _load_spacy,
+    "sentence_transformer": _load_sentence_transformer,
+    "cross_encoder": _load_cross_encoder,
+    "transformer": _load_transformer,
+}
+
+
+# ============================================================================
+# Process-wide pool
+# ============================================================================
+
+_POOL: ModelPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_model_pool() -> ModelPool:
+    """Return the process-wide model pool."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ModelPool()
+    return _POOL
+
+
+def acquire_spacy(name: str, **config: Any) -> ModelHandle:
+    """Shared ``spacy.Language`` (config is passed to ``spacy.load``)."""
+    return get_model_pool().acquire("spacy", name, **config)
+
+
+def acquire_sentence_transformer(name: str, device: str | None = None, **config: Any) -> ModelHandle:
+    """Shared ``SentenceTransformer`` encoder."""
+    return get_model_pool().acquire("sentence_transformer", name, device=device, **config)
+
+
+def acquire_cross_encoder(name: str, device: str | None = None, **config: Any) -> ModelHandle:
+    """Shared ``CrossEncoder`` (e.g. ``max_length=512``)."""
+    return get_model_pool().acquire("cross_encoder", name, device=device, **config)
+
+
+def acquire_transformer(name: str, device: str | None = None, **config: Any) -> ModelHandle:
+    """Shared ``(tokenizer, model)`` pair; ``torch_dtype`` may be given by name."""
+    return get_model_pool().acquire("transformer", name, device=device, **config)
+
+
+__all__ = [
+    "ModelHandle",
+    "ModelKey",
+    "ModelMetrics",
+    "ModelPool",
+    "ModelPoolError",
+    "acquire_cross_encoder",
+    "acquire_sentence_transformer",
+    "acquire_spacy",
+    "acquire_transformer",
+    "get_model_pool",
+]
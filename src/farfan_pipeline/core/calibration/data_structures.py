@@ -114,22 +114,23 @@ class ComputationGraph:
     
     def validate_dag(self) -> bool:
         """Axiom 1.1: Graph must be acyclic"""
-        # Simple cycle detection via DFS
+        # Simple cycle detection via DFS over a successor index
         visited = set()
         rec_stack = set()
+        successors: Dict[str, List[str]] = {}
+        for source, target in self.edges:
+            successors.setdefault(source, []).append(target)
         
         def has_cycle(node: str) -> bool:
             visited.add(node)
             rec_stack.add(node)
             
-            for edge in self.edges:
-                if edge[0] == node:
-                    neighbor = edge[1]
-                    if neighbor not in visited:
-                        if has_cycle(neighbor):
-                            return True
-                    elif neighbor in rec_stack:
+            for neighbor in successors.get(node, ()):
+                if neighbor not in visited:
+                    if has_cycle(neighbor):
                         return True
+                elif neighbor in rec_stack:
+                    return True
             
             rec_stack.remove(node)
             return False
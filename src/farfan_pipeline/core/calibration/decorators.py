@@ -14,6 +14,11 @@ def calibrated_method(method_id: str) -> Callable:
     """
     Decorator to apply calibration to a method using centralized ParameterLoaderV2.
 
+    In static binding mode (the default) the method's parameters are bound
+    once at decoration time and exposed as ``__calibration_parameters__``;
+    the original function is returned unchanged, so calls carry no overhead.
+    In dynamic mode every call re-resolves the parameters from the catalogue.
+
     Future: Will invoke CalibrationOrchestrator.calibrate(method_id, context) when available.
 
     Args:
@@ -24,13 +29,20 @@ def calibrated_method(method_id: str) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
+        if ParameterLoaderV2.is_static():
+            func.__calibration_parameters__ = ParameterLoaderV2.bind(method_id)
+            return func
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             calibration_params = ParameterLoaderV2.get_all(method_id)
 
-            logger.debug(
-                f"Calling calibrated method '{method_id}' with {len(calibration_params)} parameters"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Calling calibrated method '%s' with %d parameters",
+                    method_id,
+                    len(calibration_params),
+                )
 
             # Future: CalibrationOrchestrator.calibrate(method_id, context={
             #     "args": args,
@@ -10,16 +10,19 @@ SIN_CARRETA Compliance: Pure fusion operator, fail-loudly on misconfiguration
 
 import json
 import hashlib
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from farfan_pipeline.core.calibration.data_structures import (
     CalibrationCertificate, CalibrationSubject, Context, 
     ComputationGraph, EvidenceStore, LayerType, MethodRole, REQUIRED_LAYERS,
     CalibrationConfigError
 )
 from farfan_pipeline.core.calibration.layer_computers import (
-    compute_base_layer, compute_chain_layer, compute_unit_layer,
+    compute_base_layer, compute_chain_layer, compute_chain_layers, compute_unit_layer,
     compute_question_layer, compute_dimension_layer, compute_policy_layer,
     compute_interplay_layer, compute_meta_layer
 )
@@ -522,6 +525,28 @@ class CalibrationEngine:
                 f"{[layer.value for layer in missing_layers]}"
             )
         
+        return self._build_certificate(
+            method_id, node_id, role, layer_scores, context, evidence_store,
+            graph_hash=self._compute_graph_hash(graph),
+            timestamp=datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        )
+    
+    def _build_certificate(
+        self,
+        method_id: str,
+        node_id: str,
+        role: MethodRole,
+        layer_scores: Dict[str, float],
+        context: Context,
+        evidence_store: EvidenceStore,
+        graph_hash: str,
+        timestamp: str
+    ) -> CalibrationCertificate:
+        """
+        Fuse layer scores and assemble the certificate.
+        
+        Spec compliance: Section 7 (Definition 7.1)
+        """
         # Apply fusion
         calibrated_score, fusion_details = self._apply_fusion(role, layer_scores)
         
@@ -564,14 +589,255 @@ class CalibrationEngine:
             parameter_provenance=parameter_provenance,
             evidence_trail=evidence_trail,
             config_hash=self.config_hash,
-            graph_hash=self._compute_graph_hash(graph),
-            timestamp=datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            graph_hash=graph_hash,
+            timestamp=timestamp,
             validator_version="1.0.0"
         )
         
         return certificate
 
 
+@dataclass(frozen=True)
+class PreparedGraph:
+    """
+    Computation graph validated and hashed once for a calibration session.
+    
+    Spec compliance: Section 7 (audit_trail.graph_hash)
+    """
+    graph: ComputationGraph
+    graph_hash: str
+    chain_scores: Dict[str, float]
+
+
+class CalibrationSession:
+    """
+    Long-lived calibration session over one loaded CalibrationEngine.
+    
+    Configs, the method index and the config hash are loaded once by the
+    engine. ``prepare_graph`` validates the DAG, hashes the graph and computes
+    the @chain layer of every node once; ``calibrate_graph`` then produces
+    the certificates of all nodes in one pass. Layer scores are cached by the
+    inputs each layer actually depends on (@b per method, @u per role and
+    unit quality, @d per dimension, @p per policy area, ...), so layers shared
+    between nodes are computed once per session.
+    
+    Certificates are identical to CalibrationEngine.calibrate, except that all
+    certificates of one calibrate_graph call share a timestamp.
+    
+    Layer functions are pure given the loaded configs; create a new session
+    (or call reset_calibration_sessions) after editing the config files.
+    """
+    
+    def __init__(
+        self,
+        engine: Optional[CalibrationEngine] = None,
+        config_dir: Optional[str] = None,
+        monolith_path: Optional[str] = None
+    ):
+        self.engine = engine or CalibrationEngine(config_dir=config_dir, monolith_path=monolith_path)
+        self._roles: Dict[str, MethodRole] = {}
+        self._layer_cache: Dict[Tuple[str, Any], float] = {}
+        
+        # Declared interplays indexed by participant (first declaration wins,
+        # as in CalibrationEngine._detect_interplay)
+        self._interplays: Dict[str, Dict[str, Any]] = {}
+        interplay_defs = self.engine.contextual_config.get("interplay_definitions", {})
+        for interplay_id, interplay_spec in interplay_defs.items():
+            participants = interplay_spec.get("participants", [])
+            for participant in participants:
+                self._interplays.setdefault(participant, {
+                    "interplay_id": interplay_id,
+                    "participants": participants,
+                    "target_output": interplay_spec.get("target_output"),
+                    "fusion_rule": interplay_spec.get("fusion_rule"),
+                    "declared": True
+                })
+    
+    @property
+    def config_hash(self) -> str:
+        return self.engine.config_hash
+    
+    def prepare_graph(self, graph: ComputationGraph) -> PreparedGraph:
+        """
+        Validate and hash a computation graph once.
+        
+        Raises:
+            ValueError: If the graph contains cycles
+        """
+        if not graph.validate_dag():
+            raise ValueError("Graph contains cycles - must be DAG")
+        return PreparedGraph(
+            graph=graph,
+            graph_hash=self.engine._compute_graph_hash(graph),
+            chain_scores=compute_chain_layers(graph, self.engine.contextual_config),
+        )
+    
+    def _role(self, method_id: str) -> MethodRole:
+        role = self._roles.get(method_id)
+        if role is None:
+            role = self.engine._determine_role(method_id)
+            self._roles[method_id] = role
+        return role
+    
+    def _cached(self, key: Tuple[str, Any], compute: Callable[[], float]) -> float:
+        score = self._layer_cache.get(key)
+        if score is None:
+            score = compute()
+            self._layer_cache[key] = score
+        return score
+    
+    def _layer_scores(
+        self,
+        method_id: str,
+        node_id: str,
+        role: MethodRole,
+        prepared: PreparedGraph,
+        context: Context,
+        evidence_store: EvidenceStore
+    ) -> Dict[str, float]:
+        """Same layers, in the same order, as CalibrationEngine._compute_layer_scores."""
+        engine = self.engine
+        if node_id not in prepared.chain_scores:
+            raise ValueError(f"Node {node_id} not in graph")
+        interplay = self._interplays.get(node_id)
+        runtime_ms = evidence_store.runtime_metrics.get("runtime_ms", 100)
+        
+        scores = {}
+        scores[LayerType.BASE.value] = self._cached(
+            ("@b", method_id),
+            lambda: compute_base_layer(method_id, engine.intrinsic_config)
+        )
+        scores[LayerType.CHAIN.value] = prepared.chain_scores[node_id]
+        scores[LayerType.UNIT.value] = self._cached(
+            ("@u", (role, context.unit_quality)),
+            lambda: compute_unit_layer(method_id, role, context.unit_quality, engine.contextual_config)
+        )
+        scores[LayerType.QUESTION.value] = self._cached(
+            ("@q", (method_id, context.question_id)),
+            lambda: compute_question_layer(
+                method_id, context.question_id, engine.monolith, engine.contextual_config
+            )
+        )
+        scores[LayerType.DIMENSION.value] = self._cached(
+            ("@d", context.dimension_id),
+            lambda: compute_dimension_layer(method_id, context.dimension_id, engine.contextual_config)
+        )
+        scores[LayerType.POLICY.value] = self._cached(
+            ("@p", context.policy_id),
+            lambda: compute_policy_layer(method_id, context.policy_id, engine.contextual_config)
+        )
+        scores[LayerType.INTERPLAY.value] = self._cached(
+            ("@C", interplay is None),
+            lambda: compute_interplay_layer(interplay, engine.contextual_config)
+        )
+        scores[LayerType.META.value] = self._cached(
+            ("@m", runtime_ms),
+            lambda: compute_meta_layer({
+                "formula_export_valid": True,
+                "trace_complete": True,
+                "logs_conform_schema": True,
+                "version_tagged": True,
+                "config_hash_matches": True,
+                "signature_valid": True,
+                "runtime_ms": runtime_ms
+            }, engine.contextual_config)
+        )
+        return scores
+    
+    def calibrate_graph(
+        self,
+        graph: ComputationGraph | PreparedGraph,
+        node_methods: Mapping[str, str],
+        context: Context | Mapping[str, Context],
+        evidence_store: EvidenceStore
+    ) -> Dict[str, CalibrationCertificate]:
+        """
+        Calibrate every node of a computation graph in one pass.
+        
+        Args:
+            graph: Computation graph (or the result of prepare_graph)
+            node_methods: Canonical method ID per node ID
+            context: Execution context, shared or per node ID
+            evidence_store: Evidence for calibration
+        
+        Returns:
+            Certificate per node ID, in node_methods order
+        
+        Raises:
+            ValueError: If the graph has cycles, a node is not in the graph
+                or a required layer is missing
+            CalibrationConfigError: If a method is not catalogued or fusion
+                weights are misconfigured
+        """
+        prepared = graph if isinstance(graph, PreparedGraph) else self.prepare_graph(graph)
+        timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        
+        certificates = {}
+        for node_id, method_id in node_methods.items():
+            node_context = context if isinstance(context, Context) else context[node_id]
+            role = self._role(method_id)
+            layer_scores = self._layer_scores(
+                method_id, node_id, role, prepared, node_context, evidence_store
+            )
+            
+            missing_layers = [
+                layer for layer in REQUIRED_LAYERS.get(role, set())
+                if layer.value not in layer_scores
+            ]
+            if missing_layers:
+                raise ValueError(
+                    f"Missing required layers for role {role.value}: "
+                    f"{[layer.value for layer in missing_layers]}"
+                )
+            
+            certificates[node_id] = self.engine._build_certificate(
+                method_id, node_id, role, layer_scores, node_context, evidence_store,
+                graph_hash=prepared.graph_hash,
+                timestamp=timestamp,
+            )
+        return certificates
+    
+    def calibrate(
+        self,
+        method_id: str,
+        node_id: str,
+        graph: ComputationGraph | PreparedGraph,
+        context: Context,
+        evidence_store: EvidenceStore
+    ) -> CalibrationCertificate:
+        """Calibrate one method instance (see calibrate_graph)."""
+        return self.calibrate_graph(graph, {node_id: method_id}, context, evidence_store)[node_id]
+
+
+_sessions: Dict[Tuple[Optional[str], Optional[str]], CalibrationSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_calibration_session(
+    config_dir: Optional[str] = None,
+    monolith_path: Optional[str] = None
+) -> CalibrationSession:
+    """Process-wide session per (config_dir, monolith_path), loaded on first use."""
+    key = (
+        str(config_dir) if config_dir is not None else None,
+        str(monolith_path) if monolith_path is not None else None,
+    )
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = CalibrationSession(config_dir=config_dir, monolith_path=monolith_path)
+                _sessions[key] = session
+    return session
+
+
+def reset_calibration_sessions() -> None:
+    """Forget process-wide sessions (tests, or after editing calibration configs)."""
+    with _sessions_lock:
+        _sessions.clear()
+
+
 # Convenience function
 def calibrate(
     method_id: str,
@@ -587,7 +853,9 @@ def calibrate(
     
     Spec compliance: Section 7
     
-    This is the single authoritative calibration entry point.
+    This is the single authoritative calibration entry point. Configs are
+    loaded once per process (see get_calibration_session); use
+    CalibrationSession.calibrate_graph to calibrate many nodes of one graph.
     """
-    engine = CalibrationEngine(config_dir=config_dir, monolith_path=monolith_path)
-    return engine.calibrate(method_id, node_id, graph, context, evidence_store)
+    session = get_calibration_session(config_dir=config_dir, monolith_path=monolith_path)
+    return session.calibrate(method_id, node_id, graph, context, evidence_store)
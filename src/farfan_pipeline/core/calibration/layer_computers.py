@@ -120,6 +120,41 @@ def compute_chain_layer(node_id: str, graph: ComputationGraph,
         return mappings.get("all_contracts_pass_no_warnings", 1.0)
 
 
+def compute_chain_layers(graph: ComputationGraph,
+                         contextual_config: dict[str, Any]) -> dict[str, float]:
+    """
+    Compute the chain compatibility layer (@chain) for every node of a graph
+
+    Same scores as compute_chain_layer, with one pass over the edges instead
+    of one per node.
+
+    Args:
+        graph: Computation graph
+        contextual_config: Loaded contextual_parametrization.json (deprecated, use unit_transforms.json)
+
+    Returns:
+        Score in [0,1] per node ID
+    """
+    config = _load_unit_transforms_config()
+    mappings = config.get("chain_layer", {}).get("discrete_mappings", {})
+
+    if not mappings:
+        mappings = contextual_config.get("layer_chain", {}).get("discrete_mappings", {})
+
+    hard_mismatch = mappings.get("hard_mismatch", 0.0)
+    all_pass = mappings.get("all_contracts_pass_no_warnings", 1.0)
+    nodes_with_inputs = {target for _, target in graph.edges}
+
+    scores = {}
+    for node_id in graph.nodes:
+        required_inputs = graph.node_signatures.get(node_id, {}).get("required_inputs", [])
+        if node_id not in nodes_with_inputs and required_inputs:
+            scores[node_id] = hard_mismatch
+        else:
+            scores[node_id] = all_pass
+    return scores
+
+
 def compute_unit_layer(method_id: str, role: MethodRole, unit_quality: float,
                       contextual_config: dict[str, Any]) -> float:
     """
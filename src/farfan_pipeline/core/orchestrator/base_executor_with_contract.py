@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 from jsonschema import Draft7Validator
 
-from farfan_pipeline.config.paths import PROJECT_ROOT
+from farfan_pipeline.core.orchestrator.contract_bundle import (
+    CONTRACTS_DIR,
+    SCHEMA_PATHS,
+    get_contract_bundle,
+)
 from farfan_pipeline.core.orchestrator.evidence_assembler import EvidenceAssembler
 from farfan_pipeline.core.orchestrator.evidence_registry import get_global_registry
 from farfan_pipeline.core.orchestrator.evidence_validator import EvidenceValidator
@@ -80,16 +85,7 @@ class BaseExecutorWithContract(ABC):
             Draft7Validator for the specified version
         """
         if version not in cls._schema_validators:
-            if version == "v3":
-                schema_path = (
-                    PROJECT_ROOT
-                    / "config"
-                    / "schemas"
-                    / "executor_contract.v3.schema.json"
-                )
-            else:
-                schema_path = PROJECT_ROOT / "config" / "executor_contract.schema.json"
-
+            schema_path = SCHEMA_PATHS.get(version, SCHEMA_PATHS["v2"])
             if not schema_path.exists():
                 raise FileNotFoundError(f"Contract schema not found: {schema_path}")
             schema = json.loads(schema_path.read_text(encoding="utf-8"))
@@ -117,41 +113,23 @@ class BaseExecutorWithContract(ABC):
         return "v2"
 
     @classmethod
-    def _load_contract(cls) -> dict[str, Any]:
-        base_slot = cls.get_base_slot()
-        if base_slot in cls._contract_cache:
-            return cls._contract_cache[base_slot]
-
-        # Try v3 contract first, then fall back to v2
-        v3_path = (
-            PROJECT_ROOT / "config" / "executor_contracts" / f"{base_slot}.v3.json"
-        )
-        v2_path = PROJECT_ROOT / "config" / "executor_contracts" / f"{base_slot}.json"
-
-        if v3_path.exists():
-            contract_path = v3_path
-            expected_version = "v3"
-        elif v2_path.exists():
-            contract_path = v2_path
-            expected_version = "v2"
-        else:
-            raise FileNotFoundError(
-                f"Contract not found for {base_slot}. " f"Tried: {v3_path}, {v2_path}"
-            )
-
-        contract = json.loads(contract_path.read_text(encoding="utf-8"))
-
-        # Detect actual version from structure
+    def _validate_contract(
+        cls,
+        contract: dict[str, Any],
+        base_slot: str,
+        file_name: str,
+        expected_version: str,
+    ) -> str:
+        """Validate a contract against its schema and return its detected version."""
         detected_version = cls._detect_contract_version(contract)
         if detected_version != expected_version:
             import logging
 
             logging.warning(
-                f"Contract {contract_path.name} has structure of {detected_version} "
+                f"Contract {file_name} has structure of {detected_version} "
                 f"but file naming suggests {expected_version}"
             )
 
-        # Validate with appropriate schema
         validator = cls._get_schema_validator(detected_version)
         errors = sorted(validator.iter_errors(contract), key=lambda e: e.path)
         if errors:
@@ -159,6 +137,44 @@ class BaseExecutorWithContract(ABC):
             raise ValueError(
                 f"Contract validation failed for {base_slot} ({detected_version}): {messages}"
             )
+        return detected_version
+
+    @classmethod
+    def _load_contract(cls, question_id: str | None = None) -> dict[str, Any]:
+        """Load the contract for this base slot, specialized per question when available.
+
+        Resolution order: ``specialized/<question_id>.v3.json``, then
+        ``<base_slot>.v3.json``, then the v2 ``<base_slot>.json``.
+        """
+        base_slot = cls.get_base_slot()
+        cache_key = f"{base_slot}:{question_id}" if question_id else base_slot
+        if cache_key in cls._contract_cache:
+            return cls._contract_cache[cache_key]
+
+        candidates = [
+            (CONTRACTS_DIR / f"{base_slot}.v3.json", "v3"),
+            (CONTRACTS_DIR / f"{base_slot}.json", "v2"),
+        ]
+        if question_id:
+            candidates.insert(0, (CONTRACTS_DIR / "specialized" / f"{question_id}.v3.json", "v3"))
+
+        for contract_path, expected_version in candidates:
+            if contract_path.exists():
+                break
+        else:
+            tried = ", ".join(str(path) for path, _ in candidates)
+            raise FileNotFoundError(f"Contract not found for {base_slot}. Tried: {tried}")
+
+        # Contracts validated by the bundle build are taken from the mapped bundle;
+        # only missing or changed contracts are parsed and validated here
+        bundle = get_contract_bundle()
+        bundle_name = contract_path.relative_to(CONTRACTS_DIR).as_posix()
+        bundled = bundle.get(bundle_name) if bundle is not None else None
+        if bundled is not None:
+            contract, detected_version = bundled
+        else:
+            contract = json.loads(contract_path.read_text(encoding="utf-8"))
+            detected_version = cls._validate_contract(contract, base_slot, bundle_name, expected_version)
 
         # Tag contract with version for later use
         contract["_contract_version"] = detected_version
@@ -175,7 +191,7 @@ class BaseExecutorWithContract(ABC):
                 f"Contract base_slot mismatch: expected {base_slot}, found {identity_base_slot}"
             )
 
-        cls._contract_cache[base_slot] = contract
+        cls._contract_cache[cache_key] = contract
         return contract
 
     def _validate_signal_requirements(
@@ -223,6 +239,42 @@ class BaseExecutorWithContract(ABC):
                         "Signal quality is insufficient for execution."
                     )
 
+    @staticmethod
+    def _scope_to_candidate_passages(
+        document: PreprocessedDocument,
+        question_context: dict[str, Any],
+        method_binding: dict[str, Any],
+        common_kwargs: dict[str, Any],
+    ) -> None:
+        """Replace text/raw_text with the question's top-ranked passages.
+
+        The query is built from the contract patterns and question text and
+        answered by the document's DocumentIndex (built once per document).
+        Passages are joined in document order; when nothing matches the
+        full text is kept.
+
+        Args:
+            document: Preprocessed document exposing ensure_index()
+            question_context: v3 question_context (patterns, question_text)
+            method_binding: v3 method_binding (optional passage_limit)
+            common_kwargs: Method kwargs, updated in place
+        """
+        from farfan_pipeline.processing.document_index import (
+            get_document_index,
+            question_query,
+        )
+
+        if not hasattr(document, "ensure_index"):
+            return
+        limit = int(method_binding.get("passage_limit", 12))
+        passages = get_document_index(document).search(question_query(question_context), k=limit)
+        common_kwargs["candidate_passages"] = passages
+        if passages:
+            ordered = sorted(passages, key=lambda p: p.start)
+            scoped_text = "\n\n".join(p.text for p in ordered)
+            common_kwargs["text"] = scoped_text
+            common_kwargs["raw_text"] = scoped_text
+
     @staticmethod
     def _set_nested_value(
         target_dict: dict[str, Any], key_path: str, value: Any
@@ -255,6 +307,20 @@ class BaseExecutorWithContract(ABC):
         # Set the final key
         current[keys[-1]] = value
 
+    def _compiled_patterns_for(self, policy_area_id: str | None) -> Any:
+        """Policy-area matcher from a QuestionnaireSignalRegistry, if injected.
+
+        Returns None when the registry does not compile patterns, in which case
+        the enriched pack's own compiled set is used.
+        """
+        get_compiled = getattr(self.signal_registry, "get_compiled_patterns", None)
+        if get_compiled is None or not policy_area_id:
+            return None
+        try:
+            return get_compiled(policy_area_id)
+        except Exception:  # registry already logged the failure
+            return None
+
     def _check_failure_contract(
         self, evidence: dict[str, Any], error_handling: dict[str, Any]
     ):
@@ -300,7 +366,7 @@ class BaseExecutorWithContract(ABC):
                 f"Question base_slot {question_context.get('base_slot')} does not match executor {base_slot}"
             )
 
-        contract = self._load_contract()
+        contract = self._load_contract(question_context.get("question_id"))
         contract_version = contract.get("_contract_version", "v2")
 
         if contract_version == "v3":
@@ -327,6 +393,7 @@ class BaseExecutorWithContract(ABC):
         signal_pack = None
         enriched_pack = None
         applicable_patterns = patterns  # Default to contract patterns
+        pattern_specs = patterns
         document_context = {}
 
         if self._use_enriched_signals and policy_area_id in self.enriched_packs:
@@ -347,6 +414,7 @@ class BaseExecutorWithContract(ABC):
 
             # Get context-filtered patterns (REFACTORING #6: context scoping)
             applicable_patterns = enriched_pack.get_patterns_for_context(document_context)
+            pattern_specs = applicable_patterns
 
             # Expand patterns semantically (REFACTORING #2: semantic expansion)
             if applicable_patterns and isinstance(applicable_patterns[0], dict):
@@ -426,19 +494,22 @@ class BaseExecutorWithContract(ABC):
         patterns_used = []
 
         if enriched_pack is not None and expected_elements:
-            # Build signal node for evidence extraction
+            # Build signal node for evidence extraction; the context-filtered
+            # specs keep pattern ids and confidence weights for lineage
             signal_node = {
                 "id": question_id,
                 "expected_elements": expected_elements,
-                "patterns": applicable_patterns,
+                "patterns": pattern_specs,
                 "validations": contract.get("validation_rules", [])
             }
 
             # Extract structured evidence (REFACTORING #5: evidence structure)
+            # with the policy area's single-pass matcher, shared by all questions
             evidence_result = enriched_pack.extract_evidence(
                 text=getattr(document, "raw_text", ""),
                 signal_node=signal_node,
-                document_context=document_context
+                document_context=document_context,
+                compiled_patterns=self._compiled_patterns_for(policy_area_id)
             )
 
             # Merge structured evidence into result
@@ -455,6 +526,7 @@ class BaseExecutorWithContract(ABC):
                                for p in applicable_patterns[:10]]  # Top 10
 
         validation_rules = contract.get("validation_rules", [])
+        error_handling = contract.get("error_handling", {})
         na_policy = contract.get("na_policy", "abort")
         validation_rules_object = {"rules": validation_rules, "na_policy": na_policy}
         validation = EvidenceValidator.validate(evidence, validation_rules_object)
@@ -485,7 +557,6 @@ class BaseExecutorWithContract(ABC):
                 })
                 validation["contract_failed"] = True
 
-        error_handling = contract.get("error_handling", {})
         if error_handling:
             evidence_with_validation = {**evidence, "validation": validation}
             self._check_failure_contract(evidence_with_validation, error_handling)
@@ -600,9 +671,18 @@ class BaseExecutorWithContract(ABC):
             "question_context": question_context,
         }
 
+        # PASSAGE SCOPE: methods opting in read ranked candidate passages
+        # from the document index instead of the full raw_text
+        if method_binding.get("text_scope") == "candidate_passages":
+            self._scope_to_candidate_passages(
+                document, question_context, method_binding, common_kwargs
+            )
+
         # Execute methods based on orchestration mode
         method_outputs: dict[str, Any] = {}
         signal_usage_list: list[dict[str, Any]] = []
+        method_selection = None
+        method_timings: dict[str, tuple[bool, float, str]] = {}
 
         if orchestration_mode == "multi_method_pipeline":
             # Multi-method execution: process all methods in priority order
@@ -615,18 +695,41 @@ class BaseExecutorWithContract(ABC):
             # Sort by priority (lower priority number = execute first)
             sorted_methods = sorted(methods, key=lambda m: m.get("priority", 99))
 
+            # METHOD SELECTION: bandit picks interchangeable/optional methods
+            # within the contract's latency budget
+            selection_config = method_binding.get("method_selection")
+            if selection_config:
+                from farfan_pipeline.optimization.method_selection import (
+                    get_method_selector,
+                )
+
+                method_selection = get_method_selector().select(
+                    base_slot,
+                    methods,
+                    selection_config,
+                    question_id=question_id,
+                    document_id=getattr(document, "document_id", None),
+                )
+                sorted_methods = method_selection.selected
+
             for method_spec in sorted_methods:
                 class_name = method_spec["class_name"]
                 method_name = method_spec["method_name"]
                 provides = method_spec.get("provides", f"{class_name}.{method_name}")
                 priority = method_spec.get("priority", 99)
 
+                started = time.perf_counter()
                 try:
                     result = self.method_executor.execute(
                         class_name=class_name,
                         method_name=method_name,
                         **common_kwargs,
                     )
+                    method_timings[f"{class_name}.{method_name}"] = (
+                        True,
+                        (time.perf_counter() - started) * 1000.0,
+                        provides,
+                    )
 
                     # Store result using nested key structure (e.g., "text_mining.critical_links")
                     self._set_nested_value(method_outputs, provides, result)
@@ -645,6 +748,11 @@ class BaseExecutorWithContract(ABC):
                 except Exception as exc:
                     import logging
 
+                    method_timings[f"{class_name}.{method_name}"] = (
+                        False,
+                        (time.perf_counter() - started) * 1000.0,
+                        provides,
+                    )
                     logging.error(
                         f"Method execution failed in multi-method pipeline: {class_name}.{method_name}",
                         exc_info=True,
@@ -735,6 +843,28 @@ class BaseExecutorWithContract(ABC):
                 validation["na_policy_applied"] = "propagate"
                 validation["validation_failed"] = True
 
+        # Reward selected methods with duration and evidence quality
+        if method_selection is not None:
+            from farfan_pipeline.optimization.method_selection import (
+                evidence_quality,
+                get_method_selector,
+            )
+
+            get_method_selector().record(
+                method_selection,
+                {
+                    key: (
+                        success,
+                        duration_ms,
+                        evidence_quality(
+                            provides, method_outputs, assembly_rules, validation_passed
+                        ),
+                    )
+                    for key, (success, duration_ms, provides) in method_timings.items()
+                },
+            )
+            trace["method_selection"] = method_selection.to_trace()
+
         # Error handling
         error_handling = contract["error_handling"]
         if error_handling:
@@ -0,0 +1,318 @@
+"""
+Precompiled Executor Contract Bundle
+
+``build_contract_bundle`` validates every contract under
+``config/executor_contracts`` (including ``specialized/``) against its
+Draft 7 schema once, and writes:
+
+- ``contracts.bundle``: concatenated pickled contracts, memory-mapped by workers
+- ``contracts.bundle.manifest.json``: per contract the byte range in the
+  bundle, the detected version and the size / mtime / sha256 of the source
+  file, plus the sha256 of the bundle and of each schema
+
+At runtime ``ContractBundle.get`` unpickles a contract straight from the
+mapped bundle when its source file is unchanged: size and mtime are compared
+first, and the file is only hashed when they differ. Contracts whose
+checksum changed (or that are not in the bundle) return ``None`` and are
+parsed and validated by the caller as before. A bundle whose own checksum
+does not match its manifest, or that was built against different schemas,
+is ignored entirely.
+
+Bundle entries are keyed by the contract path relative to the contracts
+directory (``specialized/Q001.v3.json``), the same key
+``BaseExecutorWithContract._load_contract`` looks up. A contract whose
+schema file is missing is an error at build time, not a skipped entry.
+
+Build it with ``python scripts/build_contract_bundle.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from farfan_pipeline.config.paths import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+CONTRACT_BUNDLE_ENV = "FARFAN_CONTRACT_BUNDLE"
+
+CONTRACTS_DIR = PROJECT_ROOT / "config" / "executor_contracts"
+SCHEMA_PATHS = {
+    "v2": PROJECT_ROOT / "config" / "executor_contract.schema.json",
+    "v3": PROJECT_ROOT / "config" / "schemas" / "executor_contract.v3.schema.json",
+}
+
+_BUNDLE_FORMAT_VERSION = 1
+_V3_INDICATORS = ("identity", "executor_binding", "method_binding", "question_context")
+
+
+def default_bundle_path() -> Path:
+    """Bundle path from ``FARFAN_CONTRACT_BUNDLE``, else next to the contracts."""
+    value = os.environ.get(CONTRACT_BUNDLE_ENV)
+    return Path(value) if value else CONTRACTS_DIR / "contracts.bundle"
+
+
+def manifest_path_for(bundle_path: Path) -> Path:
+    return bundle_path.with_name(bundle_path.name + ".manifest.json")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def detect_contract_version(contract: dict[str, Any]) -> str:
+    """``"v3"`` if the contract has the v3 top-level sections, else ``"v2"``."""
+    return "v3" if all(key in contract for key in _V3_INDICATORS) else "v2"
+
+
+def _schema_digests(schema_paths: dict[str, Path]) -> dict[str, str | None]:
+    return {
+        version: file_sha256(path) if path.exists() else None
+        for version, path in sorted(schema_paths.items())
+    }
+
+
+def _load_validator(schema_paths: dict[str, Path], version: str) -> Any:
+    from jsonschema import Draft7Validator
+
+    path = schema_paths.get(version)
+    if path is None or not path.exists():
+        raise FileNotFoundError(f"Contract schema not found for {version}: {path}")
+    return Draft7Validator(json.loads(path.read_text(encoding="utf-8")))
+
+
+@dataclass(frozen=True)
+class BundleEntry:
+    """Location of one contract in the bundle and the state of its source."""
+
+    offset: int
+    length: int
+    version: str
+    source_size: int
+    source_mtime_ns: int
+    source_sha256: str
+
+
+class ContractValidationError(ValueError):
+    """Raised by the bundle build when contracts fail schema validation."""
+
+    def __init__(self, failures: dict[str, str]) -> None:
+        self.failures = failures
+        details = "; ".join(f"{name}: {message}" for name, message in sorted(failures.items()))
+        super().__init__(f"{len(failures)} contract(s) failed validation: {details}")
+
+
+def build_contract_bundle(
+    contracts_dir: Path = CONTRACTS_DIR,
+    bundle_path: Path | None = None,
+    schema_paths: dict[str, Path] | None = None,
+) -> dict[str, Any]:
+    """Validate all contracts once and write the bundle plus its manifest.
+
+    Returns:
+        The manifest that was written.
+
+    Raises:
+        FileNotFoundError: If a contract's schema file does not exist.
+        ContractValidationError: If any contract fails schema validation
+            (nothing is written in that case).
+    """
+    bundle_path = bundle_path or default_bundle_path()
+    schema_paths = schema_paths or SCHEMA_PATHS
+    validators: dict[str, Any] = {}
+
+    blobs: list[bytes] = []
+    entries: dict[str, dict[str, Any]] = {}
+    failures: dict[str, str] = {}
+    offset = 0
+    sources = sorted(
+        p for p in contracts_dir.rglob("*.json")
+        if not p.name.endswith(".manifest.json")
+    )
+    for source in sources:
+        name = source.relative_to(contracts_dir).as_posix()
+        try:
+            contract = json.loads(source.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            failures[name] = f"unreadable: {e}"
+            continue
+        if not isinstance(contract, dict):
+            continue
+
+        version = detect_contract_version(contract)
+        if version not in validators:
+            validators[version] = _load_validator(schema_paths, version)
+        validator = validators[version]
+        errors = sorted(validator.iter_errors(contract), key=lambda e: e.path)
+        if errors:
+            failures[name] = "; ".join(err.message for err in errors)
+            continue
+
+        blob = pickle.dumps(contract, protocol=pickle.HIGHEST_PROTOCOL)
+        stat = source.stat()
+        entries[name] = {
+            "offset": offset,
+            "length": len(blob),
+            "version": version,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_sha256": file_sha256(source),
+        }
+        blobs.append(blob)
+        offset += len(blob)
+
+    if failures:
+        raise ContractValidationError(failures)
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = b"".join(blobs)
+    _atomic_write(bundle_path, payload)
+    manifest = {
+        "format_version": _BUNDLE_FORMAT_VERSION,
+        "bundle_sha256": hashlib.sha256(payload).hexdigest(),
+        "schemas": _schema_digests(schema_paths),
+        "contracts": entries,
+    }
+    _atomic_write(manifest_path_for(bundle_path), json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8"))
+    logger.info(f"Contract bundle written: {len(entries)} contracts, {len(payload)} bytes -> {bundle_path}")
+    return manifest
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class ContractBundle:
+    """Read-only, memory-mapped view of a built contract bundle."""
+
+    def __init__(self, contracts_dir: Path, entries: dict[str, BundleEntry], buffer: mmap.mmap | bytes) -> None:
+        self.contracts_dir = contracts_dir
+        self._entries = entries
+        self._buffer = buffer
+        self._fresh: dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(
+        cls,
+        bundle_path: Path | None = None,
+        contracts_dir: Path = CONTRACTS_DIR,
+        schema_paths: dict[str, Path] | None = None,
+    ) -> ContractBundle | None:
+        """Map the bundle; ``None`` if it is missing, corrupt or built against other schemas."""
+        bundle_path = bundle_path or default_bundle_path()
+        manifest_path = manifest_path_for(bundle_path)
+        if not bundle_path.exists() or not manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("format_version") != _BUNDLE_FORMAT_VERSION:
+                logger.warning(f"Ignoring contract bundle {bundle_path.name}: unsupported format")
+                return None
+            if manifest.get("schemas") != _schema_digests(schema_paths or SCHEMA_PATHS):
+                logger.warning(f"Ignoring contract bundle {bundle_path.name}: schemas changed since build")
+                return None
+
+            with open(bundle_path, "rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                buffer: mmap.mmap | bytes = (
+                    mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+                )
+            if hashlib.sha256(buffer).hexdigest() != manifest.get("bundle_sha256"):
+                logger.warning(f"Ignoring contract bundle {bundle_path.name}: checksum mismatch")
+                return None
+            entries = {name: BundleEntry(**entry) for name, entry in manifest["contracts"].items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable contract bundle {bundle_path}: {e}")
+            return None
+        return cls(contracts_dir, entries, buffer)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _source_unchanged(self, name: str, entry: BundleEntry) -> bool:
+        with self._lock:
+            if name in self._fresh:
+                return self._fresh[name]
+        source = self.contracts_dir / name
+        try:
+            stat = source.stat()
+            fresh = (
+                (stat.st_size == entry.source_size and stat.st_mtime_ns == entry.source_mtime_ns)
+                or (stat.st_size == entry.source_size and file_sha256(source) == entry.source_sha256)
+            )
+        except OSError:
+            fresh = False
+        with self._lock:
+            self._fresh[name] = fresh
+        return fresh
+
+    def get(self, name: str) -> tuple[dict[str, Any], str] | None:
+        """``(contract, version)`` for a path relative to the contracts dir.
+
+        Returns ``None`` when the contract is not bundled or its source file
+        changed since the build; the caller then validates it at runtime.
+        Every call returns a fresh copy, so callers may mutate it.
+        """
+        entry = self._entries.get(name)
+        if entry is None or not self._source_unchanged(name, entry):
+            return None
+        view = memoryview(self._buffer)[entry.offset:entry.offset + entry.length]
+        try:
+            return pickle.loads(view), entry.version
+        finally:
+            view.release()
+
+
+_bundle_lock = threading.Lock()
+_bundle: ContractBundle | None = None
+_bundle_loaded = False
+
+
+def get_contract_bundle() -> ContractBundle | None:
+    """Process-wide bundle, opened on first use (inherited by forked workers)."""
+    global _bundle, _bundle_loaded
+    if _bundle_loaded:
+        return _bundle
+    with _bundle_lock:
+        if not _bundle_loaded:
+            _bundle = ContractBundle.open()
+            _bundle_loaded = True
+            if _bundle is not None:
+                logger.info(f"Executor contract bundle loaded ({len(_bundle)} contracts)")
+    return _bundle
+
+
+def reset_contract_bundle() -> None:
+    """Forget the process-wide bundle (tests, or after rebuilding it)."""
+    global _bundle, _bundle_loaded
+    with _bundle_lock:
+        _bundle = None
+        _bundle_loaded = False
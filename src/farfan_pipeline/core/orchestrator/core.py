@@ -16,6 +16,8 @@ import statistics
 import threading
 import time
 from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict, is_dataclass, replace
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +26,7 @@ from typing import TYPE_CHECKING, Any, Callable, TypeVar, ParamSpec, TypedDict
 
 if TYPE_CHECKING:
     from farfan_pipeline.core.orchestrator.factory import CanonicalQuestionnaire
+    from farfan_pipeline.core.orchestrator.resource_manager import AdaptiveResourceManager
 
 from farfan_pipeline.core.analysis_port import RecommendationEnginePort
 from farfan_pipeline.config.paths import PROJECT_ROOT, RULES_DIR, CONFIG_DIR
@@ -55,7 +58,9 @@ from farfan_pipeline.core.orchestrator.executor_config import ExecutorConfig
 from farfan_pipeline.core.orchestrator.irrigation_synchronizer import (
     IrrigationSynchronizer,
     ExecutionPlan,
+    Task,
 )
+from farfan_pipeline.core.orchestrator.phase2_scheduler import Phase2Scheduler, TaskStatus
 
 logger = logging.getLogger(__name__)
 _CORE_MODULE_DIR = Path(__file__).resolve().parent
@@ -692,11 +697,14 @@ class MethodExecutor:
         dispatcher: Any | None = None,
         signal_registry: Any | None = None,
         method_registry: Any | None = None,
+        result_cache: bool = True,
+        strict_cache: bool = False,
     ) -> None:
         from farfan_pipeline.core.orchestrator.method_registry import (
             MethodRegistry,
             setup_default_instantiation_rules,
         )
+        from farfan_pipeline.core.orchestrator.method_result_cache import MethodResultCache
         
         self.degraded_mode = False
         self.degraded_reasons: list[str] = []
@@ -728,6 +736,7 @@ class MethodExecutor:
         
         self._router = ExtendedArgRouter(registry)
         self.instances = _LazyInstanceDict(self._method_registry)
+        self._result_cache = MethodResultCache(enabled=result_cache, strict=strict_cache)
     
     @staticmethod
     def _supports_parameter(callable_obj: Any, parameter_name: str) -> bool:
@@ -752,7 +761,7 @@ class MethodExecutor:
         
         try:
             args, routed_kwargs = self._router.route(class_name, method_name, dict(kwargs))
-            return method(*args, **routed_kwargs)
+            return self._result_cache.call(class_name, method_name, method, args, routed_kwargs)
         except (ArgRouterError, ArgumentValidationError):
             logger.exception(f"Argument routing failed for {class_name}.{method_name}")
             raise
@@ -760,6 +769,32 @@ class MethodExecutor:
             logger.exception(f"Method execution failed for {class_name}.{method_name}")
             raise
     
+    @contextmanager
+    def document_scope(self, document_id: str) -> Iterator[None]:
+        """Memoize pure method results while processing one document.
+
+        Results are shared across questions of the same document run and
+        dropped when the scope exits.
+        """
+        self._result_cache.begin_scope(document_id)
+        try:
+            yield
+        finally:
+            stats = self._result_cache.get_stats()
+            self._result_cache.end_scope()
+            logger.info(
+                f"method_result_cache: document={document_id} hits={stats['hits']} "
+                f"misses={stats['misses']} bypassed={stats['bypassed']}"
+            )
+    
+    def clear_result_cache(self) -> None:
+        """Drop all memoized method results."""
+        self._result_cache.clear()
+    
+    def get_result_cache_stats(self) -> dict[str, Any]:
+        """Get hit/miss statistics of the document-scoped result cache."""
+        return self._result_cache.get_stats()
+    
     def inject_method(self, class_name: str, method_name: str, method: Callable[..., Any]) -> None:
         """Inject a method directly without requiring a class."""
         self._method_registry.inject_method(class_name, method_name, method)
@@ -883,6 +918,7 @@ class Orchestrator:
         resource_snapshot_interval: int = 10,
         recommendation_engine_port: RecommendationEnginePort | None = None,
         processor_bundle: Any | None = None,
+        resource_manager: AdaptiveResourceManager | None = None,
     ) -> None:
         """Initialize the orchestrator with all dependencies injected.
         
@@ -891,10 +927,16 @@ class Orchestrator:
             questionnaire: Loaded and validated CanonicalQuestionnaire
             executor_config: Executor configuration object
             calibration_orchestrator: Calibration orchestrator instance
-            resource_limits: Resource limit configuration
+            resource_limits: Resource limit configuration (defaults to the
+                resource manager's limits when one is given)
             resource_snapshot_interval: Interval for resource snapshots
             recommendation_engine_port: Optional recommendation engine port
             processor_bundle: ProcessorBundle with enriched_signal_packs (WIRING REQUIRED)
+            resource_manager: Optional AdaptiveResourceManager whose circuit
+                breakers and pressure-based allocation gate phase 2 tasks
+        
+        Raises:
+            ValueError: If resource_manager tracks different ResourceLimits
         """
         from farfan_pipeline.core.orchestrator.factory import (
             _validate_questionnaire_structure,
@@ -908,7 +950,15 @@ class Orchestrator:
         self._monolith_data = dict(questionnaire.data)
         self.executor_config = executor_config
         self.calibration_orchestrator = calibration_orchestrator
+        if resource_manager is not None:
+            if resource_limits is None:
+                resource_limits = resource_manager.resource_limits
+            elif resource_limits is not resource_manager.resource_limits:
+                raise ValueError(
+                    "resource_manager must share the orchestrator's ResourceLimits"
+                )
         self.resource_limits = resource_limits or ResourceLimits()
+        self.resource_manager = resource_manager
         self.resource_snapshot_interval = max(1, resource_snapshot_interval)
         self.questionnaire_provider = get_questionnaire_provider()
         
@@ -1016,6 +1066,84 @@ class Orchestrator:
         resolved = resolve_workspace_path(path)
         return str(resolved)
     
+    async def _execute_micro_questions_async(
+        self, document: PreprocessedDocument, config: Any
+    ) -> list[MicroQuestionRun]:
+        """FASE 2: Execute the micro-questions of the execution plan concurrently.
+        
+        Tasks are dispatched by Phase2Scheduler within the ResourceLimits worker
+        budget; results are returned in plan order.
+        """
+        if self._execution_plan is None:
+            raise RuntimeError("Execution plan not built - Phase 1 must complete before Phase 2")
+        
+        index = self._canonical_questionnaire.index
+        
+        def question_for(task: Task) -> dict[str, Any]:
+            question = index.get_question(task.question_id)
+            if question is None:
+                raise ValueError(f"Question {task.question_id} not found in questionnaire")
+            return question
+        
+        def run_task(task: Task) -> dict[str, Any]:
+            question_context = dict(question_for(task))
+            question_context["policy_area_id"] = task.policy_area
+            executor_class = self.executors[question_context["base_slot"]]
+            executor_instance = executor_class(
+                method_executor=self.executor,
+                signal_registry=self.executor.signal_registry,
+                config=self.executor_config,
+                questionnaire_provider=self.questionnaire_provider,
+                calibration_orchestrator=self.calibration_orchestrator,
+                enriched_packs=self._enriched_packs,
+            )
+            return executor_instance.execute(
+                document, self.executor, question_context=question_context
+            )
+        
+        scheduler = Phase2Scheduler(
+            self.resource_limits,
+            resource_manager=self.resource_manager,
+            abort_signal=self.abort_signal,
+        )
+        report = await scheduler.run(
+            self._execution_plan,
+            run_task,
+            executor_id_for=lambda task: question_for(task).get("base_slot", task.question_id),
+        )
+        
+        instrumentation = self._phase_instrumentation.get(2)
+        micro_results: list[MicroQuestionRun] = []
+        for outcome in report.outcomes:
+            question = index.get_question(outcome.question_id) or {}
+            completed = outcome.status == TaskStatus.COMPLETED
+            if instrumentation is not None:
+                instrumentation.increment(latency=outcome.duration_ms if completed else None)
+                if outcome.status == TaskStatus.FAILED:
+                    instrumentation.record_error("task", outcome.error or "", task_id=outcome.task_id)
+            micro_results.append(
+                MicroQuestionRun(
+                    question_id=outcome.question_id,
+                    question_global=question.get("question_global", 0),
+                    base_slot=outcome.executor_id,
+                    metadata={
+                        "task_id": outcome.task_id,
+                        "plan_index": outcome.plan_index,
+                        "status": outcome.status.value,
+                    },
+                    evidence=Evidence(
+                        modality=question.get("scoring_modality", ""),
+                        raw_results=outcome.result,
+                    ) if completed else None,
+                    error=None if completed else outcome.error,
+                    duration_ms=outcome.duration_ms,
+                    aborted=outcome.status == TaskStatus.ABORTED,
+                )
+            )
+        
+        self._ensure_not_aborted()
+        return micro_results
+    
     async def process_development_plan_async(
         self, pdf_path: str, preprocessed_document: Any | None = None
     ) -> list[PhaseResult]:
@@ -1032,111 +1160,113 @@ class Orchestrator:
         self._phase_status = {phase_id: "not_started" for phase_id, *_ in self.FASES}
         self._start_time = time.perf_counter()
         
-        for phase_id, mode, handler_name, phase_label in self.FASES:
-            self._ensure_not_aborted()
+        # Pure method results are shared by all questions of this document
+        with self.executor.document_scope(pdf_path):
+            for phase_id, mode, handler_name, phase_label in self.FASES:
+                self._ensure_not_aborted()
             
-            handler = getattr(self, handler_name)
-            instrumentation = PhaseInstrumentation(
-                phase_id=phase_id,
-                name=phase_label,
-                items_total=self.PHASE_ITEM_TARGETS.get(phase_id),
-                snapshot_interval=self.resource_snapshot_interval,
-                resource_limits=self.resource_limits,
-            )
+                handler = getattr(self, handler_name)
+                instrumentation = PhaseInstrumentation(
+                    phase_id=phase_id,
+                    name=phase_label,
+                    items_total=self.PHASE_ITEM_TARGETS.get(phase_id),
+                    snapshot_interval=self.resource_snapshot_interval,
+                    resource_limits=self.resource_limits,
+                )
             
-            instrumentation.start(items_total=self.PHASE_ITEM_TARGETS.get(phase_id))
-            self._phase_instrumentation[phase_id] = instrumentation
-            self._phase_status[phase_id] = "running"
+                instrumentation.start(items_total=self.PHASE_ITEM_TARGETS.get(phase_id))
+                self._phase_instrumentation[phase_id] = instrumentation
+                self._phase_status[phase_id] = "running"
             
-            args = [self._context[key] for key in self.PHASE_ARGUMENT_KEYS.get(phase_id, [])]
+                args = [self._context[key] for key in self.PHASE_ARGUMENT_KEYS.get(phase_id, [])]
             
-            success = False
-            data: Any = None
-            error: Exception | None = None
+                success = False
+                data: Any = None
+                error: Exception | None = None
             
-            try:
-                if mode == "sync":
-                    if phase_id in TIMEOUT_SYNC_PHASES:
+                try:
+                    if mode == "sync":
+                        if phase_id in TIMEOUT_SYNC_PHASES:
+                            data = await execute_phase_with_timeout(
+                                phase_id, phase_label,
+                                asyncio.to_thread, handler, *args,
+                                timeout_s=self._get_phase_timeout(phase_id),
+                            )
+                        else:
+                            data = handler(*args)
+                    else:
                         data = await execute_phase_with_timeout(
                             phase_id, phase_label,
-                            asyncio.to_thread, handler, *args,
+                            handler, *args,
                             timeout_s=self._get_phase_timeout(phase_id),
                         )
-                    else:
-                        data = handler(*args)
-                else:
-                    data = await execute_phase_with_timeout(
-                        phase_id, phase_label,
-                        handler, *args,
-                        timeout_s=self._get_phase_timeout(phase_id),
-                    )
-                success = True
+                    success = True
                 
-            except PhaseTimeoutError as exc:
-                error = exc
-                instrumentation.record_error("timeout", str(exc))
-                self.request_abort(f"Fase {phase_id} timed out: {exc}")
+                except PhaseTimeoutError as exc:
+                    error = exc
+                    instrumentation.record_error("timeout", str(exc))
+                    self.request_abort(f"Fase {phase_id} timed out: {exc}")
                 
-            except AbortRequested as exc:
-                error = exc
-                instrumentation.record_warning("abort", str(exc))
+                except AbortRequested as exc:
+                    error = exc
+                    instrumentation.record_warning("abort", str(exc))
                 
-            except Exception as exc:
-                logger.exception(f"Fase {phase_label} falló")
-                error = exc
-                instrumentation.record_error("exception", str(exc))
-                self.request_abort(f"Fase {phase_id} falló: {exc}")
+                except Exception as exc:
+                    logger.exception(f"Fase {phase_label} falló")
+                    error = exc
+                    instrumentation.record_error("exception", str(exc))
+                    self.request_abort(f"Fase {phase_id} falló: {exc}")
             
-            finally:
-                instrumentation.complete()
+                finally:
+                    instrumentation.complete()
             
-            aborted = self.abort_signal.is_aborted()
-            duration_ms = instrumentation.duration_ms() or 0.0
+                aborted = self.abort_signal.is_aborted()
+                duration_ms = instrumentation.duration_ms() or 0.0
             
-            phase_result = PhaseResult(
-                success=success and not aborted,
-                phase_id=str(phase_id),
-                data=data,
-                error=error,
-                duration_ms=duration_ms,
-                mode=mode,
-                aborted=aborted,
-            )
-            self.phase_results.append(phase_result)
+                phase_result = PhaseResult(
+                    success=success and not aborted,
+                    phase_id=str(phase_id),
+                    data=data,
+                    error=error,
+                    duration_ms=duration_ms,
+                    mode=mode,
+                    aborted=aborted,
+                )
+                self.phase_results.append(phase_result)
             
-            if success and not aborted:
-                self._phase_outputs[phase_id] = data
-                out_key = self.PHASE_OUTPUT_KEYS.get(phase_id)
-                if out_key:
-                    self._context[out_key] = data
-                self._phase_status[phase_id] = "completed"
+                if success and not aborted:
+                    self._phase_outputs[phase_id] = data
+                    out_key = self.PHASE_OUTPUT_KEYS.get(phase_id)
+                    if out_key:
+                        self._context[out_key] = data
+                    self._phase_status[phase_id] = "completed"
                 
-                # Build execution plan after Phase 1
-                if phase_id == 1:
-                    try:
-                        logger.info("Building execution plan after Phase 1 completion")
-                        document = self._context.get("document")
-                        chunks = getattr(document, "chunks", []) if document else []
+                    # Build execution plan after Phase 1
+                    if phase_id == 1:
+                        try:
+                            logger.info("Building execution plan after Phase 1 completion")
+                            document = self._context.get("document")
+                            chunks = getattr(document, "chunks", []) if document else []
                         
-                        synchronizer = IrrigationSynchronizer(
-                            questionnaire=self._monolith_data, document_chunks=chunks
-                        )
-                        self._execution_plan = synchronizer.build_execution_plan()
+                            synchronizer = IrrigationSynchronizer(
+                                questionnaire=self._monolith_data, document_chunks=chunks
+                            )
+                            self._execution_plan = synchronizer.build_execution_plan()
                         
-                        logger.info(
-                            f"Execution plan built: {len(self._execution_plan.tasks)} tasks, "
-                            f"plan_id={self._execution_plan.plan_id}"
-                        )
-                    except ValueError as e:
-                        logger.error(f"Failed to build execution plan: {e}")
-                        self.request_abort(f"Synchronization failed: {e}")
-                        raise
-            elif aborted:
-                self._phase_status[phase_id] = "aborted"
-                break
-            else:
-                self._phase_status[phase_id] = "failed"
-                break
+                            logger.info(
+                                f"Execution plan built: {len(self._execution_plan.tasks)} tasks, "
+                                f"plan_id={self._execution_plan.plan_id}"
+                            )
+                        except ValueError as e:
+                            logger.error(f"Failed to build execution plan: {e}")
+                            self.request_abort(f"Synchronization failed: {e}")
+                            raise
+                elif aborted:
+                    self._phase_status[phase_id] = "aborted"
+                    break
+                else:
+                    self._phase_status[phase_id] = "failed"
+                    break
         
         return self.phase_results
     
@@ -0,0 +1,610 @@
+"""
+Segmented Evidence Ledger: Group-Commit Storage Engine for EvidenceRegistry
+
+Storage layout for a ledger rooted at ``evidence_registry.jsonl``:
+- ``evidence_registry.jsonl``: segment 0 (also the legacy single-file ledger)
+- ``evidence_registry.000001.jsonl``, ...: following segments
+- ``<segment>.idx``: written when a segment is sealed. The first line is the
+  chain checkpoint; each following line is the offset index entry of one
+  record, in ledger order.
+
+Segments hold the same one-JSON-object-per-line records as before, so the
+hash chain (``previous_hash`` / ``entry_hash``) runs unchanged across
+segment boundaries.
+
+Write path:
+- Records are buffered and written in batches: one write and one fsync per
+  batch (``commit_batch_size`` records, or a background timer
+  ``commit_interval_s`` seconds after the first buffered record)
+- Buffered records are committed on ``close`` and, through a weakref
+  finalizer, when the ledger is collected or the interpreter exits
+- A segment is sealed after ``segment_max_records`` records. Its checkpoint
+  stores record count, byte size, SHA-256 of the segment file and the
+  first ``previous_hash`` / last ``entry_hash`` of the chain
+
+Read path:
+- Start-up trusts sealed segments whose checkpoint matches the file size and
+  SHA-256 and only checks that checkpoints link up; records of the active
+  segment, and of sealed segments that fail the check, are parsed and
+  chain-checked
+- Only offset index entries stay resident; records are read on demand
+  through a bounded LRU
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    """
+    Offset index entry for one record.
+
+    Carries the fields needed for the registry's secondary indexes and the
+    provenance DAG, so those can be rebuilt without reading payloads.
+    """
+
+    evidence_id: str
+    segment: int
+    offset: int
+    length: int
+    evidence_type: str
+    entry_hash: str | None
+    previous_hash: str | None = None
+    source_method: str | None = None
+    question_id: str | None = None
+    timestamp: float = 0.0
+    parent_evidence_ids: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_record_dict(
+        cls, data: dict[str, Any], segment: int, offset: int, length: int
+    ) -> LedgerEntry:
+        return cls(
+            evidence_id=data["evidence_id"],
+            segment=segment,
+            offset=offset,
+            length=length,
+            evidence_type=data["evidence_type"],
+            entry_hash=data.get("entry_hash"),
+            previous_hash=data.get("previous_hash"),
+            source_method=data.get("source_method"),
+            question_id=data.get("question_id"),
+            timestamp=data.get("timestamp", 0.0),
+            parent_evidence_ids=list(data.get("parent_evidence_ids") or []),
+        )
+
+    def to_index_line(self) -> str:
+        return json.dumps(
+            [
+                self.evidence_id,
+                self.offset,
+                self.length,
+                self.evidence_type,
+                self.entry_hash,
+                self.previous_hash,
+                self.source_method,
+                self.question_id,
+                self.timestamp,
+                self.parent_evidence_ids,
+            ],
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_index_line(cls, line: str, segment: int) -> LedgerEntry:
+        (evidence_id, offset, length, evidence_type, entry_hash, previous_hash,
+         source_method, question_id, timestamp, parents) = json.loads(line)
+        return cls(evidence_id, segment, offset, length, evidence_type, entry_hash,
+                   previous_hash, source_method, question_id, timestamp, parents)
+
+
+@dataclass(frozen=True)
+class SegmentCheckpoint:
+    """Chain checkpoint of a sealed segment."""
+
+    segment: int
+    records: int
+    bytes: int
+    sha256: str
+    first_previous_hash: str | None
+    last_entry_hash: str | None
+    version: int = CHECKPOINT_VERSION
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "segment": self.segment,
+            "records": self.records,
+            "bytes": self.bytes,
+            "sha256": self.sha256,
+            "first_previous_hash": self.first_previous_hash,
+            "last_entry_hash": self.last_entry_hash,
+            "version": self.version,
+        }
+
+
+class _CommitBuffer:
+    """
+    Records awaiting the next group commit and the segment they belong to.
+
+    Kept apart from the ledger so the ledger's finalizer can commit it
+    without holding a reference to the ledger.
+    """
+
+    __slots__ = ("items", "nbytes", "path", "fsync", "lock")
+
+    def __init__(self, path: Path, fsync: bool, lock: threading.RLock) -> None:
+        self.items: list[tuple[LedgerEntry, Any, bytes]] = []
+        self.nbytes = 0
+        self.path = path
+        self.fsync = fsync
+        self.lock = lock
+
+    def write(self) -> bytes:
+        """Append buffered lines with one write/fsync; returns the bytes written."""
+        with self.lock:
+            if not self.items:
+                return b""
+            data = b"".join(line for _, _, line in self.items)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as segment_file:
+                segment_file.write(data)
+                segment_file.flush()
+                if self.fsync:
+                    os.fsync(segment_file.fileno())
+            self.items.clear()
+            self.nbytes = 0
+            return data
+
+
+def _commit_orphaned(buffer: _CommitBuffer) -> None:
+    """Finalizer: commit records still buffered when the ledger goes away."""
+    try:
+        buffer.write()
+    except Exception as e:
+        logger.error(f"Failed to flush evidence ledger on finalization: {e}")
+
+
+def _flush_due(ledger_ref: weakref.ReferenceType[SegmentedEvidenceLedger]) -> None:
+    """Commit timer callback; a no-op once the ledger has been collected."""
+    ledger = ledger_ref()
+    if ledger is None:
+        return
+    try:
+        ledger.flush()
+    except Exception as e:
+        logger.error(f"Timed evidence ledger commit failed: {e}")
+
+
+class SegmentedEvidenceLedger:
+    """
+    Append-only, segmented JSONL ledger with group commit and offset index.
+
+    Args:
+        base_path: Path of segment 0 (the registry's ``storage_path``)
+        record_factory: Builds a record object from its JSON dict
+        segment_max_records: Records per segment before it is sealed
+        commit_batch_size: Buffered records that trigger a commit
+        commit_interval_s: Age of the oldest buffered record at which a
+            background timer commits the batch (<= 0 commits every append)
+        fsync: Call ``os.fsync`` once per commit
+        cache_size: Records kept in the read LRU
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        record_factory: Callable[[dict[str, Any]], Any],
+        segment_max_records: int = 10_000,
+        commit_batch_size: int = 64,
+        commit_interval_s: float = 1.0,
+        fsync: bool = True,
+        cache_size: int = 1024,
+    ) -> None:
+        if segment_max_records < 1 or commit_batch_size < 1:
+            raise ValueError("segment_max_records and commit_batch_size must be >= 1")
+        self.base_path = Path(base_path)
+        self.record_factory = record_factory
+        self.segment_max_records = segment_max_records
+        self.commit_batch_size = commit_batch_size
+        self.commit_interval_s = commit_interval_s
+        self.fsync = fsync
+        self.cache_size = cache_size
+
+        self._lock = threading.RLock()
+        self._entries: dict[str, LedgerEntry] = {}
+        self._by_entry_hash: dict[str, str] = {}
+        self._checkpoints: list[SegmentCheckpoint] = []
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+
+        self._active_segment = 0
+        self._active_records = 0
+        self._active_bytes = 0
+        self._active_digest = hashlib.sha256()
+        self._active_first_previous: str | None = None
+
+        self._pending = _CommitBuffer(self.segment_path(0), fsync, self._lock)
+        self._commit_timer: threading.Timer | None = None
+
+        self.last_entry_hash: str | None = None
+        self.last_evidence_id: str | None = None
+
+        self.load_errors: list[str] = []
+        self.commits = 0
+        self.scanned_records = 0
+        self.trusted_records = 0
+
+        self._finalizer = weakref.finalize(self, _commit_orphaned, self._pending)
+
+    # ------------------------------------------------------------------
+    # Segment naming
+    # ------------------------------------------------------------------
+
+    def segment_path(self, segment: int) -> Path:
+        if segment == 0:
+            return self.base_path
+        return self.base_path.with_name(
+            f"{self.base_path.stem}.{segment:06d}{self.base_path.suffix}"
+        )
+
+    def index_path(self, segment: int) -> Path:
+        path = self.segment_path(segment)
+        return path.with_name(path.name + ".idx")
+
+    def segment_paths(self) -> list[Path]:
+        """Existing segment files in ledger order."""
+        paths = []
+        segment = 0
+        while self.segment_path(segment).exists():
+            paths.append(self.segment_path(segment))
+            segment += 1
+        return paths
+
+    # ------------------------------------------------------------------
+    # Start-up
+    # ------------------------------------------------------------------
+
+    def load(self) -> list[LedgerEntry]:
+        """
+        Open the ledger and return its index entries in ledger order.
+
+        Chain breaks do not stop loading; they are collected in
+        ``load_errors`` so the ledger stays appendable.
+        """
+        with self._lock:
+            segments = len(self.segment_paths())
+            loaded: list[LedgerEntry] = []
+            previous_hash: str | None = None
+            for segment in range(segments):
+                is_last = segment == segments - 1
+                checkpoint = None if is_last else self._read_checkpoint(segment)
+                if checkpoint is not None and not self._matches_checkpoint(segment, checkpoint):
+                    # Keep the sealed checkpoint so integrity checks still
+                    # report the mismatch; do not re-seal tampered content.
+                    self.load_errors.append(
+                        f"{self.segment_path(segment).name}: Segment content does "
+                        f"not match its checkpoint"
+                    )
+                    entries = self._scan_segment(segment, previous_hash, truncate=False)
+                    self._checkpoints.append(checkpoint)
+                    self.scanned_records += len(entries)
+                elif checkpoint is not None:
+                    if segment > 0 and checkpoint.first_previous_hash != previous_hash:
+                        self.load_errors.append(
+                            f"Chain broken at segment {segment}: expected "
+                            f"previous_hash={previous_hash}, checkpoint has "
+                            f"{checkpoint.first_previous_hash}"
+                        )
+                    entries = self._read_index_entries(segment)
+                    self._checkpoints.append(checkpoint)
+                    self.trusted_records += len(entries)
+                else:
+                    entries = self._scan_segment(segment, previous_hash)
+                    self.scanned_records += len(entries)
+                    if not is_last:
+                        self._checkpoints.append(self._write_index(segment, entries))
+
+                for entry in entries:
+                    self._register(entry)
+                loaded.extend(entries)
+                if entries:
+                    previous_hash = entries[-1].entry_hash
+
+            self._active_segment = max(segments - 1, 0)
+            self._pending.path = self.segment_path(self._active_segment)
+            if self._active_records >= self.segment_max_records:
+                self._seal_active()
+            return loaded
+
+    def _read_checkpoint(self, segment: int) -> SegmentCheckpoint | None:
+        """Checkpoint of a sealed segment, if present and consistent with the file."""
+        try:
+            with open(self.index_path(segment), encoding="utf-8") as index_file:
+                header = json.loads(index_file.readline())
+            checkpoint = SegmentCheckpoint(**header)
+        except (OSError, ValueError, TypeError):
+            return None
+        if (
+            checkpoint.version != CHECKPOINT_VERSION
+            or checkpoint.segment != segment
+            or checkpoint.bytes != self.segment_path(segment).stat().st_size
+        ):
+            logger.warning(f"Stale checkpoint for segment {segment}, rescanning")
+            return None
+        return checkpoint
+
+    def _matches_checkpoint(self, segment: int, checkpoint: SegmentCheckpoint) -> bool:
+        """Whether the segment file's SHA-256 equals the sealed one."""
+        digest = hashlib.sha256()
+        with open(self.segment_path(segment), "rb") as segment_file:
+            for block in iter(lambda: segment_file.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(block)
+        return digest.hexdigest() == checkpoint.sha256
+
+    def _read_index_entries(self, segment: int) -> list[LedgerEntry]:
+        with open(self.index_path(segment), encoding="utf-8") as index_file:
+            next(index_file)
+            return [LedgerEntry.from_index_line(line, segment) for line in index_file]
+
+    def _scan_segment(
+        self, segment: int, previous_hash: str | None, truncate: bool = True
+    ) -> list[LedgerEntry]:
+        """Parse a segment, checking chain linkage and recording offsets."""
+        path = self.segment_path(segment)
+        entries: list[LedgerEntry] = []
+        digest = hashlib.sha256()
+        first_previous: str | None = None
+        offset = 0
+        first_record = previous_hash is None
+
+        with open(path, "rb") as segment_file:
+            for line_num, raw in enumerate(segment_file, 1):
+                if not raw.endswith(b"\n"):
+                    logger.warning(
+                        f"{path.name}: discarding incomplete trailing record at byte {offset}"
+                    )
+                    break
+                digest.update(raw)
+                length = len(raw)
+                try:
+                    data = json.loads(raw)
+                    entry = LedgerEntry.from_record_dict(data, segment, offset, length)
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"{path.name}: failed to parse line {line_num}: {e}")
+                    offset += length
+                    continue
+
+                if first_record:
+                    if entry.previous_hash:
+                        logger.warning(
+                            f"{path.name} line {line_num}: First record has "
+                            f"previous_hash={entry.previous_hash}, expected None or empty "
+                            f"string. Chain may have been corrupted or truncated."
+                        )
+                    first_record = False
+                elif entry.previous_hash != previous_hash:
+                    self.load_errors.append(
+                        f"Chain broken at {path.name} line {line_num}: "
+                        f"expected previous_hash={previous_hash}, "
+                        f"got previous_hash={entry.previous_hash}. "
+                        f"Evidence ordering may be corrupted."
+                    )
+                if not entries:
+                    first_previous = entry.previous_hash
+                previous_hash = entry.entry_hash
+                entries.append(entry)
+                offset += length
+
+        if truncate and offset < path.stat().st_size:
+            with open(path, "r+b") as segment_file:
+                segment_file.truncate(offset)
+
+        self._active_records = len(entries)
+        self._active_bytes = offset
+        self._active_digest = digest
+        self._active_first_previous = first_previous
+        return entries
+
+    def _register(self, entry: LedgerEntry) -> None:
+        self._entries[entry.evidence_id] = entry
+        if entry.entry_hash:
+            self._by_entry_hash[entry.entry_hash] = entry.evidence_id
+        self.last_entry_hash = entry.entry_hash
+        self.last_evidence_id = entry.evidence_id
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def append(self, record: Any) -> LedgerEntry:
+        """Buffer a record for the next group commit and return its entry."""
+        with self._lock:
+            if self._active_records >= self.segment_max_records:
+                self.flush()
+                self._seal_active()
+
+            data = record.to_dict()
+            line = (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+            entry = LedgerEntry.from_record_dict(
+                data,
+                self._active_segment,
+                self._active_bytes + self._pending.nbytes,
+                len(line),
+            )
+            if self._active_records == 0 and not self._pending.items:
+                self._active_first_previous = entry.previous_hash
+
+            self._pending.items.append((entry, record, line))
+            self._pending.nbytes += len(line)
+            self._active_records += 1
+            self._register(entry)
+            self._remember(entry.evidence_id, record)
+
+            if (
+                len(self._pending.items) >= self.commit_batch_size
+                or self.commit_interval_s <= 0
+            ):
+                self.flush()
+            elif self._commit_timer is None:
+                self._commit_timer = threading.Timer(
+                    self.commit_interval_s, _flush_due, args=(weakref.ref(self),)
+                )
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+            return entry
+
+    def flush(self) -> int:
+        """Write buffered records with a single write/fsync; returns the count."""
+        with self._lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            count = len(self._pending.items)
+            if not count:
+                return 0
+            data = self._pending.write()
+            self._active_digest.update(data)
+            self._active_bytes += len(data)
+            self.commits += 1
+            return count
+
+    def _seal_active(self) -> None:
+        """Write the active segment's checkpoint and index, then start a new one."""
+        segment = self._active_segment
+        entries = [entry for entry in self._entries.values() if entry.segment == segment]
+        checkpoint = SegmentCheckpoint(
+            segment=segment,
+            records=len(entries),
+            bytes=self._active_bytes,
+            sha256=self._active_digest.hexdigest(),
+            first_previous_hash=self._active_first_previous,
+            last_entry_hash=entries[-1].entry_hash if entries else None,
+        )
+        self._write_index(segment, entries, checkpoint)
+        self._checkpoints.append(checkpoint)
+
+        self._active_segment = segment + 1
+        self._pending.path = self.segment_path(self._active_segment)
+        self._active_records = 0
+        self._active_bytes = 0
+        self._active_digest = hashlib.sha256()
+        self._active_first_previous = None
+        logger.info(f"Sealed evidence segment {segment} ({len(entries)} records)")
+
+    def _write_index(
+        self,
+        segment: int,
+        entries: list[LedgerEntry],
+        checkpoint: SegmentCheckpoint | None = None,
+    ) -> SegmentCheckpoint:
+        if checkpoint is None:
+            checkpoint = SegmentCheckpoint(
+                segment=segment,
+                records=len(entries),
+                bytes=self._active_bytes,
+                sha256=self._active_digest.hexdigest(),
+                first_previous_hash=self._active_first_previous,
+                last_entry_hash=entries[-1].entry_hash if entries else None,
+            )
+        path = self.index_path(segment)
+        tmp = path.with_name(path.name + ".tmp")
+        lines = [json.dumps(checkpoint.to_dict(), separators=(",", ":"))]
+        lines.extend(entry.to_index_line() for entry in entries)
+        tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+        return checkpoint
+
+    def close(self) -> None:
+        """Commit buffered records; the ledger remains usable."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush evidence ledger on close: {e}")
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def __contains__(self, evidence_id: object) -> bool:
+        return evidence_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def entry(self, evidence_id: str) -> LedgerEntry | None:
+        return self._entries.get(evidence_id)
+
+    def read(self, evidence_id: str) -> Any | None:
+        """Load a record by evidence ID (LRU cached)."""
+        with self._lock:
+            record = self._cache.get(evidence_id)
+            if record is not None:
+                self._cache.move_to_end(evidence_id)
+                return record
+            entry = self._entries.get(evidence_id)
+            if entry is None:
+                return None
+            for pending_entry, pending_record, _ in self._pending.items:
+                if pending_entry.evidence_id == evidence_id:
+                    return pending_record
+            with open(self.segment_path(entry.segment), "rb") as segment_file:
+                segment_file.seek(entry.offset)
+                raw = segment_file.read(entry.length)
+            record = self.record_factory(json.loads(raw))
+            self._remember(evidence_id, record)
+            return record
+
+    def find_by_entry_hash(self, entry_hash: str) -> Any | None:
+        evidence_id = self._by_entry_hash.get(entry_hash)
+        return self.read(evidence_id) if evidence_id else None
+
+    def _remember(self, evidence_id: str, record: Any) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[evidence_id] = record
+        self._cache.move_to_end(evidence_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @property
+    def checkpoints(self) -> list[SegmentCheckpoint]:
+        return list(self._checkpoints)
+
+    def get_statistics(self) -> dict[str, Any]:
+        return {
+            "segments": self._active_segment + 1,
+            "sealed_segments": len(self._checkpoints),
+            "records": len(self._entries),
+            "pending_records": len(self._pending.items),
+            "commits": self.commits,
+            "cached_records": len(self._cache),
+            "trusted_records_at_load": self.trusted_records,
+            "scanned_records_at_load": self.scanned_records,
+        }
+
+
+__all__ = [
+    "LedgerEntry",
+    "SegmentCheckpoint",
+    "SegmentedEvidenceLedger",
+]
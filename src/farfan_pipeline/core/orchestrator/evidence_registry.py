@@ -2,14 +2,15 @@
 Evidence Registry: Append-Only JSONL Store with Hash Chain and Provenance DAG Export
 
 This module implements a comprehensive evidence tracking system that:
-1. Stores all evidence in append-only JSONL format for immutability
+1. Stores all evidence in append-only, segmented JSONL format for immutability
 2. Maintains hash-based indexing for fast evidence lookup
 3. Implements blockchain-style hash chaining for ledger integrity
 4. Exports provenance DAG showing evidence lineage and dependencies
 5. Provides cryptographic verification of evidence integrity
 
 Architecture:
-- JSONL Storage: One JSON object per line, append-only for audit trail
+- JSONL Storage: One JSON object per line, append-only for audit trail, written
+  in group commits to rolling segments (see evidence_ledger)
 - Hash Index: SHA-256 hashes for content-addressable storage
 - Hash Chain: Each entry links to previous via previous_hash and entry_hash
 - Provenance DAG: Directed acyclic graph of evidence dependencies
@@ -35,11 +36,14 @@ import json
 import logging
 import time
 from collections import defaultdict
+from collections.abc import Iterator, Mapping
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from farfan_pipeline.core.orchestrator.evidence_ledger import LedgerEntry, SegmentedEvidenceLedger
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -469,17 +473,22 @@ class EvidenceRegistry:
     Append-only evidence registry with hash indexing and provenance tracking.
 
     Features:
-    - JSONL append-only storage for immutability
-    - Content-addressable hash indexing
+    - Segmented JSONL append-only storage with group commit
+    - Content-addressable hash indexing backed by an on-disk offset index
     - Provenance DAG for lineage tracking
-    - Cryptographic verification
-    - Fast queries by hash, type, method, question
+    - Cryptographic verification with per-segment chain checkpoints
+    - Fast queries by hash, type, method, question; records load lazily
     """
 
     def __init__(
         self,
         storage_path: Path | None = None,
         enable_dag: bool = True,
+        segment_max_records: int = 10_000,
+        commit_batch_size: int = 64,
+        commit_interval_s: float = 1.0,
+        fsync: bool = True,
+        record_cache_size: int = 1024,
     ) -> None:
         """
         Initialize evidence registry.
@@ -487,12 +496,25 @@ class EvidenceRegistry:
         Args:
             storage_path: Path to JSONL storage file (default: evidence_registry.jsonl)
             enable_dag: Enable provenance DAG tracking
+            segment_max_records: Records per ledger segment before it is sealed
+            commit_batch_size: Records buffered per group commit (one fsync each)
+            commit_interval_s: Maximum age of buffered records before a commit
+            fsync: Force commits to stable storage
+            record_cache_size: Evidence records kept in memory after loading
         """
         self.storage_path = storage_path or Path("evidence_registry.jsonl")
         self.enable_dag = enable_dag
 
-        # Hash index: hash -> evidence record
-        self.hash_index: dict[str, EvidenceRecord] = {}
+        # Ledger: segmented storage, offset index and lazy record loading
+        self._ledger = SegmentedEvidenceLedger(
+            self.storage_path,
+            record_factory=EvidenceRecord.from_dict,
+            segment_max_records=segment_max_records,
+            commit_batch_size=commit_batch_size,
+            commit_interval_s=commit_interval_s,
+            fsync=fsync,
+            cache_size=record_cache_size,
+        )
 
         # Type index: type -> list of hashes
         self.type_index: dict[str, list[str]] = defaultdict(list)
@@ -506,122 +528,69 @@ class EvidenceRegistry:
         # Provenance DAG
         self.dag = ProvenanceDAG() if enable_dag else None
 
-        # Track the last entry in the ledger chain for hash chaining
-        self.last_entry: EvidenceRecord | None = None
-
         # Load existing evidence
         self._load_from_storage()
 
         logger.info(
-            f"EvidenceRegistry initialized with {len(self.hash_index)} records, "
+            f"EvidenceRegistry initialized with {len(self._ledger)} records, "
             f"storage={self.storage_path}, dag={'enabled' if enable_dag else 'disabled'}"
         )
 
+    @property
+    def hash_index(self) -> Mapping[str, EvidenceRecord]:
+        """Hash index: hash -> evidence record (records are read on access)."""
+        return _LedgerRecordView(self._ledger)
+
+    @property
+    def last_entry(self) -> EvidenceRecord | None:
+        """Last entry in the ledger chain."""
+        if self._ledger.last_evidence_id is None:
+            return None
+        return self._ledger.read(self._ledger.last_evidence_id)
+
     def _load_from_storage(self) -> None:
         """
-        Load evidence from JSONL storage with chain verification.
+        Load the offset index from storage with chain verification.
 
         Ensures:
-        - Evidence is loaded in the order it was written
-        - Chain linkage is validated during load
+        - Evidence is indexed in the order it was written
+        - Chain linkage is validated from the last sealed checkpoint on
         - Index ordering is preserved
         """
         if not self.storage_path.exists():
             logger.info(f"No existing evidence storage found at {self.storage_path}")
             return
 
-        loaded_count = 0
-        BATCH_SIZE = 1000
-        batch_records = []
-
         try:
-            with open(self.storage_path, encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        data = json.loads(line.strip())
-                        evidence = EvidenceRecord.from_dict(data)
-                        batch_records.append((line_num, evidence))
-                        loaded_count += 1
-
-                        if len(batch_records) >= BATCH_SIZE:
-                            self._assert_chain(batch_records)
-                            for _, ev in batch_records:
-                                self._index_evidence(ev, persist=False)
-                            batch_records.clear()
-
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse line {line_num}: {e}")
-                    except Exception as e:
-                        logger.warning(f"Failed to load evidence on line {line_num}: {e}")
-
-            if batch_records:
-                self._assert_chain(batch_records)
-                for _, ev in batch_records:
-                    self._index_evidence(ev, persist=False)
-                batch_records.clear()
-
-            logger.info(f"Loaded {loaded_count} evidence records from storage")
+            for entry in self._ledger.load():
+                self._index_evidence(entry, persist=False)
+            for error in self._ledger.load_errors:
+                logger.error(f"Failed to load evidence storage: {error}")
+
+            logger.info(
+                f"Loaded {len(self._ledger)} evidence records from storage "
+                f"({self._ledger.trusted_records} from checkpoints, "
+                f"{self._ledger.scanned_records} verified)"
+            )
 
         except Exception as e:
             logger.error(f"Failed to load evidence storage: {e}")
 
-    def _assert_chain(self, records: list[tuple[int, EvidenceRecord]]) -> None:
-        """
-        Assert that the chain of evidence records is valid.
-
-        Validates:
-        - First record has no previous_hash or previous_hash is None
-        - Each subsequent record's previous_hash matches the prior record's entry_hash
-        - Records are in the correct sequential order
-
-        Args:
-            records: List of (line_number, EvidenceRecord) tuples in load order
-
-        Raises:
-            ValueError: If chain validation fails
-        """
-        if not records:
-            return
-
-        previous_record = None
-
-        for idx, (line_num, record) in enumerate(records):
-            if idx == 0:
-                # First record should have no previous_hash or None
-                if record.previous_hash and record.previous_hash != '':
-                    logger.warning(
-                        f"Line {line_num}: First record has previous_hash={record.previous_hash}, "
-                        f"expected None or empty string. Chain may have been corrupted or truncated."
-                    )
-            # Subsequent records should link to the previous record
-            elif previous_record is not None:
-                expected_previous_hash = previous_record.entry_hash
-                actual_previous_hash = record.previous_hash
-
-                if actual_previous_hash != expected_previous_hash:
-                    raise ValueError(
-                        f"Chain broken at line {line_num}: "
-                        f"expected previous_hash={expected_previous_hash}, "
-                        f"got previous_hash={actual_previous_hash}. "
-                        f"Evidence ordering may be corrupted."
-                    )
-
-            previous_record = record
-
     def _index_evidence(
         self,
-        evidence: EvidenceRecord,
+        evidence: EvidenceRecord | LedgerEntry,
         persist: bool = True
     ) -> None:
         """
         Index evidence record in all indices.
 
         Args:
-            evidence: Evidence to index
+            evidence: Evidence (or its ledger index entry) to index
             persist: If True, append to JSONL storage
         """
-        # Hash index
-        self.hash_index[evidence.evidence_id] = evidence
+        # Persist first so the hash index and chain head include the record
+        if persist:
+            self._append_to_storage(evidence)
 
         # Type index
         self.type_index[evidence.evidence_type].append(evidence.evidence_id)
@@ -638,33 +607,27 @@ class EvidenceRegistry:
         if self.enable_dag and self.dag:
             self.dag.add_evidence(evidence)
 
-        # Update last entry for hash chaining
-        self.last_entry = evidence
-
-        # Persist to storage
-        if persist:
-            self._append_to_storage(evidence)
-
     def _append_to_storage(self, evidence: EvidenceRecord) -> None:
         """
-        Append evidence to JSONL storage.
+        Append evidence to the ledger; it is written with the next group commit.
 
         Args:
             evidence: Evidence to append
         """
         try:
-            # Ensure parent directory exists
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Append to JSONL
-            with open(self.storage_path, 'a', encoding='utf-8') as f:
-                json_line = json.dumps(evidence.to_dict(), separators=(',', ':'))
-                f.write(json_line + '\n')
-
+            self._ledger.append(evidence)
         except Exception as e:
             logger.error(f"Failed to append evidence to storage: {e}")
             raise
 
+    def flush(self) -> None:
+        """Commit buffered evidence to storage."""
+        self._ledger.flush()
+
+    def close(self) -> None:
+        """Commit buffered evidence; the registry remains usable."""
+        self._ledger.close()
+
     def record_evidence(
         self,
         evidence_type: str,
@@ -693,7 +656,7 @@ class EvidenceRegistry:
             Evidence ID (hash)
         """
         # Determine previous_hash from last entry in the chain
-        previous_hash = self.last_entry.entry_hash if self.last_entry else None
+        previous_hash = self._ledger.last_entry_hash
 
         # Normalize metadata and ensure recorded_at timestamp
         metadata_dict: dict[str, Any] = dict(metadata) if metadata else {}
@@ -716,7 +679,7 @@ class EvidenceRegistry:
         )
 
         # Check for duplicate
-        if evidence.evidence_id in self.hash_index:
+        if evidence.evidence_id in self._ledger:
             logger.debug(f"Evidence {evidence.evidence_id} already exists, skipping")
             return evidence.evidence_id
 
@@ -737,22 +700,23 @@ class EvidenceRegistry:
         Returns:
             EvidenceRecord or None
         """
-        return self.hash_index.get(evidence_id)
+        return self._ledger.read(evidence_id)
+
+    def _read_all(self, evidence_ids: list[str]) -> list[EvidenceRecord]:
+        records = (self._ledger.read(eid) for eid in evidence_ids)
+        return [record for record in records if record is not None]
 
     def query_by_type(self, evidence_type: str) -> list[EvidenceRecord]:
         """Query evidence by type."""
-        evidence_ids = self.type_index.get(evidence_type, [])
-        return [self.hash_index[eid] for eid in evidence_ids if eid in self.hash_index]
+        return self._read_all(self.type_index.get(evidence_type, []))
 
     def query_by_method(self, method_fqn: str) -> list[EvidenceRecord]:
         """Query evidence by source method."""
-        evidence_ids = self.method_index.get(method_fqn, [])
-        return [self.hash_index[eid] for eid in evidence_ids if eid in self.hash_index]
+        return self._read_all(self.method_index.get(method_fqn, []))
 
     def query_by_question(self, question_id: str) -> list[EvidenceRecord]:
         """Query evidence by question ID."""
-        evidence_ids = self.question_index.get(question_id, [])
-        return [self.hash_index[eid] for eid in evidence_ids if eid in self.hash_index]
+        return self._read_all(self.question_index.get(question_id, []))
 
     def verify_evidence(self, evidence_id: str, verify_chain: bool = True) -> bool:
         """
@@ -773,10 +737,7 @@ class EvidenceRegistry:
         previous_record = None
         if verify_chain and evidence.previous_hash:
             # Find the record with entry_hash matching our previous_hash
-            for record in self.hash_index.values():
-                if record.entry_hash == evidence.previous_hash:
-                    previous_record = record
-                    break
+            previous_record = self._ledger.find_by_entry_hash(evidence.previous_hash)
 
         return evidence.verify_integrity(previous_record=previous_record)
 
@@ -784,41 +745,54 @@ class EvidenceRegistry:
         """
         Verify the integrity of the entire evidence chain.
 
+        Every record of every segment is re-hashed, and sealed segments are
+        checked against their checkpoints.
+
         Returns:
             Tuple of (is_valid, list of errors)
         """
         errors = []
 
         # Build the chain by reading from storage in order
+        self.flush()
         if not self.storage_path.exists():
             return True, []  # Empty chain is valid
 
+        checkpoints = {cp.segment: cp for cp in self._ledger.checkpoints}
         try:
             previous_record = None
-            with open(self.storage_path, encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        data = json.loads(line.strip())
-                        evidence = EvidenceRecord.from_dict(data)
-
-                        # Verify the record's integrity
-                        if not evidence.verify_integrity(previous_record=previous_record):
-                            if previous_record and evidence.previous_hash != previous_record.entry_hash:
-                                errors.append(
-                                    f"Line {line_num}: Chain broken - previous_hash mismatch. "
-                                    f"Expected {previous_record.entry_hash}, got {evidence.previous_hash}"
-                                )
-                            else:
-                                errors.append(
-                                    f"Line {line_num}: Hash integrity check failed for evidence {evidence.evidence_id}"
-                                )
-
-                        previous_record = evidence
-
-                    except json.JSONDecodeError as e:
-                        errors.append(f"Line {line_num}: JSON parsing error - {e}")
-                    except Exception as e:
-                        errors.append(f"Line {line_num}: Verification error - {e}")
+            for segment, path in enumerate(self._ledger.segment_paths()):
+                digest = hashlib.sha256()
+                with open(path, 'rb') as f:
+                    for line_num, raw in enumerate(f, 1):
+                        digest.update(raw)
+                        label = f"Line {line_num}" if segment == 0 else f"{path.name} line {line_num}"
+                        try:
+                            data = json.loads(raw)
+                            evidence = EvidenceRecord.from_dict(data)
+
+                            # Verify the record's integrity
+                            if not evidence.verify_integrity(previous_record=previous_record):
+                                if previous_record and evidence.previous_hash != previous_record.entry_hash:
+                                    errors.append(
+                                        f"{label}: Chain broken - previous_hash mismatch. "
+                                        f"Expected {previous_record.entry_hash}, got {evidence.previous_hash}"
+                                    )
+                                else:
+                                    errors.append(
+                                        f"{label}: Hash integrity check failed for evidence {evidence.evidence_id}"
+                                    )
+
+                            previous_record = evidence
+
+                        except json.JSONDecodeError as e:
+                            errors.append(f"{label}: JSON parsing error - {e}")
+                        except Exception as e:
+                            errors.append(f"{label}: Verification error - {e}")
+
+                checkpoint = checkpoints.get(segment)
+                if checkpoint is not None and checkpoint.sha256 != digest.hexdigest():
+                    errors.append(f"{path.name}: Segment content does not match its checkpoint")
 
             return len(errors) == 0, errors
 
@@ -886,12 +860,13 @@ class EvidenceRegistry:
             Statistics dictionary
         """
         stats = {
-            "total_evidence": len(self.hash_index),
+            "total_evidence": len(self._ledger),
             "by_type": {k: len(v) for k, v in self.type_index.items()},
             "by_method": {k: len(v) for k, v in self.method_index.items()},
             "by_question": {k: len(v) for k, v in self.question_index.items()},
             "storage_path": str(self.storage_path),
             "dag_enabled": self.enable_dag,
+            "ledger": self._ledger.get_statistics(),
         }
 
         if self.enable_dag and self.dag:
@@ -906,12 +881,33 @@ class EvidenceRegistry:
             Dict with counts for records, types, methods, and questions.
         """
         return {
-            "records": len(self.hash_index),
+            "records": len(self._ledger),
             "types": len(self.type_index),
             "methods": len(self.method_index),
             "questions": len(self.question_index),
         }
 
+class _LedgerRecordView(Mapping[str, EvidenceRecord]):
+    """Read-only mapping of evidence ID to record, loaded from the ledger on access."""
+
+    def __init__(self, ledger: SegmentedEvidenceLedger) -> None:
+        self._ledger = ledger
+
+    def __getitem__(self, evidence_id: str) -> EvidenceRecord:
+        record = self._ledger.read(evidence_id)
+        if record is None:
+            raise KeyError(evidence_id)
+        return record
+
+    def __contains__(self, evidence_id: object) -> bool:
+        return evidence_id in self._ledger
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ledger)
+
+    def __len__(self) -> int:
+        return len(self._ledger)
+
 # Global registry instance
 _global_registry: EvidenceRegistry | None = None
 
@@ -0,0 +1,412 @@
+"""Document-scoped memoization of catalog method results.
+
+Phase 2 runs 300 contracts against the same document, and many of them bind
+the same class/method pairs with document-level inputs. This module lets
+``MethodExecutor`` compute such results once per document run.
+
+Only methods declared pure in the method catalogue are cached
+(``execution_metadata`` section of canonical_method_catalogue_v2.json)::
+
+    "execution_metadata": {
+        "TeoriaCambio.validacion_completa": {"pure": true},
+        "SemanticAnalyzer.extract_semantic_cube": {
+            "pure": true, "relevant_args": ["document_segments"]
+        }
+    }
+
+Cache keys are ``(class, method, content hash)``. The content hash covers
+the routed arguments, or only ``relevant_args`` when declared. Values that
+cannot be fingerprinted bypass the cache instead of risking a wrong hit.
+Strict mode recomputes on every hit and raises
+``CacheConsistencyError`` if the fresh result differs from the cached one.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import inspect
+import logging
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+from farfan_pipeline.core.parameters import ParameterLoaderV2
+
+logger = logging.getLogger(__name__)
+
+# Strings/bytes of at least this length are fingerprinted once per scope (by
+# identity). Arrays are hashed in place on every call because they are mutable.
+_LARGE_VALUE_BYTES = 4096
+
+
+class CacheConsistencyError(RuntimeError):
+    """Raised in strict mode when a cached result differs from a recomputation."""
+
+    def __init__(self, class_name: str, method_name: str) -> None:
+        self.class_name = class_name
+        self.method_name = method_name
+        super().__init__(
+            f"Cached result for {class_name}.{method_name} differs from recomputation; "
+            "the method is not pure for its declared relevant arguments"
+        )
+
+
+class _Unfingerprintable(Exception):
+    """Internal: value has no stable content hash."""
+
+
+@dataclass(frozen=True)
+class MethodPurity:
+    """Catalogue metadata controlling memoization of one method."""
+
+    pure: bool = False
+    relevant_args: tuple[str, ...] | None = None
+
+    @classmethod
+    def from_catalogue(cls, entry: Mapping[str, Any] | None) -> MethodPurity:
+        if not entry:
+            return cls()
+        relevant = entry.get("relevant_args")
+        return cls(
+            pure=bool(entry.get("pure", False)),
+            relevant_args=tuple(relevant) if relevant is not None else None,
+        )
+
+
+@dataclass
+class ResultCacheStats:
+    """Hit/miss counters for the document-scoped result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    strict_checks: int = 0
+    strict_mismatches: int = 0
+    scopes: int = 0
+    per_method: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def record(self, method_key: str, outcome: str) -> None:
+        counters = self.per_method.setdefault(method_key, {"hits": 0, "misses": 0})
+        counters[outcome] = counters.get(outcome, 0) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": self.hit_rate,
+            "strict_checks": self.strict_checks,
+            "strict_mismatches": self.strict_mismatches,
+            "scopes": self.scopes,
+            "per_method": {k: dict(v) for k, v in self.per_method.items()},
+        }
+
+
+class _Fingerprinter:
+    """Streams a canonical encoding of a value into a hash."""
+
+    def __init__(self, identity_memo: dict[int, tuple[Any, bytes]]) -> None:
+        # id -> (caller's immutable str/bytes object, digest); never a copy
+        self._memo = identity_memo
+
+    @staticmethod
+    def _new_hasher() -> Any:
+        if BLAKE3_AVAILABLE:
+            return blake3.blake3()
+        return hashlib.sha256()
+
+    def digest(self, value: Any) -> str:
+        hasher = self._new_hasher()
+        self._feed(hasher, value, set())
+        return hasher.hexdigest()
+
+    def _feed(self, hasher: Any, value: Any, active: set[int]) -> None:
+        if value is None or isinstance(value, (bool, int, float, complex)):
+            hasher.update(f"{type(value).__name__}:{value!r};".encode())
+            return
+        if isinstance(value, (str, bytes, bytearray)):
+            self._feed_buffer(hasher, value)
+            return
+
+        marker = id(value)
+        if marker in active:
+            raise _Unfingerprintable("cyclic structure")
+        active.add(marker)
+        try:
+            self._feed_container(hasher, value, active)
+        finally:
+            active.discard(marker)
+
+    @staticmethod
+    def _encode(value: str | bytes | bytearray) -> bytes | bytearray:
+        return value.encode("utf-8", "surrogatepass") if isinstance(value, str) else value
+
+    def _feed_buffer(self, hasher: Any, value: str | bytes | bytearray) -> None:
+        if len(value) >= _LARGE_VALUE_BYTES and not isinstance(value, bytearray):
+            cached = self._memo.get(id(value))
+            if cached is None or cached[0] is not value:
+                inner = self._new_hasher()
+                inner.update(self._encode(value))
+                cached = (value, inner.digest())
+                self._memo[id(value)] = cached
+            hasher.update(b"L:" + cached[1] + b";")
+            return
+        raw = self._encode(value)
+        hasher.update(f"{type(value).__name__}[{len(raw)}]:".encode())
+        hasher.update(raw)
+
+    @staticmethod
+    def _feed_array(hasher: Any, value: Any) -> None:
+        """Hash an array buffer in place; arrays are mutable, so never memoised."""
+        if getattr(getattr(value, "dtype", None), "hasobject", False):
+            raise _Unfingerprintable("object array")
+        try:
+            view = memoryview(value).cast("B")
+        except (TypeError, ValueError):
+            # Non-contiguous: one transient copy, released after hashing
+            view = memoryview(value.tobytes())
+        hasher.update(f"array[{view.nbytes}]:".encode())
+        hasher.update(view)
+
+    def _feed_container(self, hasher: Any, value: Any, active: set[int]) -> None:
+        type_tag = f"{type(value).__module__}.{type(value).__qualname__}("
+        hasher.update(type_tag.encode())
+        if isinstance(value, Mapping):
+            try:
+                items = sorted(value.items(), key=lambda kv: repr(kv[0]))
+            except Exception as exc:
+                raise _Unfingerprintable("unsortable mapping") from exc
+            for key, item in items:
+                self._feed(hasher, key, active)
+                self._feed(hasher, item, active)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._feed(hasher, item, active)
+        elif isinstance(value, (set, frozenset)):
+            for digest in sorted(self.digest(item) for item in value):
+                hasher.update(digest.encode())
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            for f in dataclasses.fields(value):
+                self._feed(hasher, f.name, active)
+                self._feed(hasher, getattr(value, f.name), active)
+        elif hasattr(value, "model_dump") and callable(value.model_dump):
+            self._feed(hasher, value.model_dump(), active)
+        elif hasattr(value, "tobytes") and hasattr(value, "shape"):
+            self._feed(hasher, (str(getattr(value, "dtype", "")), tuple(value.shape)), active)
+            self._feed_array(hasher, value)
+        elif hasattr(value, "__dict__") and not callable(value):
+            self._feed(hasher, vars(value), active)
+        else:
+            raise _Unfingerprintable(type(value).__name__)
+        hasher.update(b")")
+
+
+class MethodResultCache:
+    """Document-scoped result cache used by MethodExecutor.
+
+    Thread Safety: all state changes are lock-protected; concurrent misses
+    for the same key may both compute, and the first stored result wins.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        strict: bool = False,
+        purity_lookup: Callable[[str, str], MethodPurity] | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.strict = strict
+        self._purity_lookup = purity_lookup or self._catalogue_purity
+        self._purity: dict[tuple[str, str], MethodPurity] = {}
+        self._signatures: dict[tuple[str, str], inspect.Signature | None] = {}
+        self._results: dict[tuple[str, str, str], Any] = {}
+        self._identity_memo: dict[int, tuple[Any, bytes]] = {}
+        self._scope: str | None = None
+        self._lock = threading.RLock()
+        self.stats = ResultCacheStats()
+
+    @staticmethod
+    def _catalogue_purity(class_name: str, method_name: str) -> MethodPurity:
+        return MethodPurity.from_catalogue(
+            ParameterLoaderV2.get_execution_metadata(f"{class_name}.{method_name}")
+        )
+
+    # ------------------------------------------------------------------
+    # Scope management
+    # ------------------------------------------------------------------
+
+    def begin_scope(self, scope_id: str) -> None:
+        """Start caching for a new document run, dropping the previous one."""
+        with self._lock:
+            if scope_id == self._scope:
+                return
+            self._results.clear()
+            self._identity_memo.clear()
+            self._scope = scope_id
+            self.stats.scopes += 1
+        logger.debug("method_result_cache_scope_started scope=%s", scope_id)
+
+    def end_scope(self) -> None:
+        """Release cached results of the current document run."""
+        with self._lock:
+            self._results.clear()
+            self._identity_memo.clear()
+            self._scope = None
+
+    def clear(self) -> None:
+        """Drop cached results but keep the current scope open."""
+        with self._lock:
+            self._results.clear()
+            self._identity_memo.clear()
+
+    @property
+    def scope(self) -> str | None:
+        return self._scope
+
+    @property
+    def size(self) -> int:
+        return len(self._results)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def purity_for(self, class_name: str, method_name: str) -> MethodPurity:
+        key = (class_name, method_name)
+        purity = self._purity.get(key)
+        if purity is None:
+            purity = self._purity_lookup(class_name, method_name)
+            self._purity[key] = purity
+        return purity
+
+    def call(
+        self,
+        class_name: str,
+        method_name: str,
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Invoke ``method`` or return the cached result for its arguments."""
+        if not self.enabled or self._scope is None:
+            return method(*args, **kwargs)
+
+        purity = self.purity_for(class_name, method_name)
+        if not purity.pure:
+            return method(*args, **kwargs)
+
+        method_key = f"{class_name}.{method_name}"
+        try:
+            relevant = self._relevant_arguments(class_name, method_name, method, purity, args, kwargs)
+            with self._lock:
+                digest = _Fingerprinter(self._identity_memo).digest(relevant)
+        except _Unfingerprintable as exc:
+            with self._lock:
+                self.stats.bypassed += 1
+            logger.debug("method_result_cache_bypass %s: %s", method_key, exc)
+            return method(*args, **kwargs)
+
+        key = (class_name, method_name, digest)
+        with self._lock:
+            found = key in self._results
+            cached = self._results.get(key)
+            if found:
+                self.stats.hits += 1
+                self.stats.record(method_key, "hits")
+            else:
+                self.stats.misses += 1
+                self.stats.record(method_key, "misses")
+
+        if found:
+            if self.strict:
+                self._verify(class_name, method_name, cached, method(*args, **kwargs))
+            return copy.deepcopy(cached)
+
+        result = method(*args, **kwargs)
+        try:
+            snapshot = copy.deepcopy(result)
+        except Exception as exc:
+            with self._lock:
+                self.stats.bypassed += 1
+            logger.debug("method_result_cache_uncopyable %s: %s", method_key, exc)
+            return result
+        with self._lock:
+            self._results.setdefault(key, snapshot)
+        return result
+
+    def _relevant_arguments(
+        self,
+        class_name: str,
+        method_name: str,
+        method: Callable[..., Any],
+        purity: MethodPurity,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        if purity.relevant_args is None:
+            return (args, kwargs)
+
+        key = (class_name, method_name)
+        if key not in self._signatures:
+            try:
+                self._signatures[key] = inspect.signature(method)
+            except (TypeError, ValueError):
+                self._signatures[key] = None
+        signature = self._signatures[key]
+        if signature is None:
+            return (args, kwargs)
+        try:
+            bound = signature.bind_partial(*args, **kwargs).arguments
+        except TypeError as exc:
+            raise _Unfingerprintable("arguments do not bind") from exc
+        return {name: bound.get(name) for name in purity.relevant_args}
+
+    def _verify(self, class_name: str, method_name: str, cached: Any, fresh: Any) -> None:
+        with self._lock:
+            self.stats.strict_checks += 1
+            fingerprinter = _Fingerprinter(self._identity_memo)
+        try:
+            identical = fingerprinter.digest(cached) == fingerprinter.digest(fresh)
+        except _Unfingerprintable:
+            identical = bool(cached == fresh)
+        if not identical:
+            with self._lock:
+                self.stats.strict_mismatches += 1
+            logger.error("method_result_cache_mismatch %s.%s", class_name, method_name)
+            raise CacheConsistencyError(class_name, method_name)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = self.stats.to_dict()
+        stats.update(
+            {
+                "enabled": self.enabled,
+                "strict": self.strict,
+                "scope": self._scope,
+                "entries": len(self._results),
+            }
+        )
+        return stats
+
+
+__all__ = [
+    "CacheConsistencyError",
+    "MethodPurity",
+    "MethodResultCache",
+    "ResultCacheStats",
+]
@@ -0,0 +1,355 @@
+"""Concurrent, dependency-aware scheduler for phase 2 micro-questions.
+
+Dispatches the tasks of an ExecutionPlan (built by IrrigationSynchronizer)
+across a bounded worker pool instead of executing them one at a time:
+
+- Concurrency is bounded by ResourceLimits.max_workers through an asyncio
+  semaphore attached to the limits, and the budget is re-applied with
+  ResourceLimits.apply_worker_budget() as tasks complete.
+- When an AdaptiveResourceManager is given, its circuit breakers are
+  consulted before each task and execution metrics are reported back.
+- Optional task dependencies delay a task until its prerequisites have
+  completed; tasks whose prerequisites did not complete are skipped.
+- Results are always returned in plan order, regardless of completion
+  order, so downstream phases stay deterministic.
+
+Tasks run in a ThreadPoolExecutor by default. A ProcessPoolExecutor may be
+passed instead when the task callable and its results are picklable.
+
+Example:
+    >>> scheduler = Phase2Scheduler(resource_limits, resource_manager=manager)
+    >>> report = await scheduler.run(plan, run_task, executor_id_for=slot_of)
+    >>> for outcome in report.outcomes:
+    ...     print(outcome.task_id, outcome.status.value)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from farfan_pipeline.core.orchestrator.core import AbortSignal, ResourceLimits
+    from farfan_pipeline.core.orchestrator.irrigation_synchronizer import (
+        ExecutionPlan,
+        Task,
+    )
+    from farfan_pipeline.core.orchestrator.resource_manager import (
+        AdaptiveResourceManager,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class TaskStatus(Enum):
+    """Final status of a scheduled task."""
+
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    ABORTED = "aborted"
+
+
+@dataclass
+class TaskOutcome:
+    """Outcome of one plan task.
+
+    Attributes:
+        task_id: Task identifier from the execution plan
+        plan_index: Position of the task in the execution plan
+        question_id: Micro-question identifier
+        executor_id: Executor identifier used for circuit breakers (e.g. "D1-Q1")
+        status: Final task status
+        result: Value returned by the task callable (None unless completed)
+        error: Error or skip reason (None if completed)
+        duration_ms: Execution time in milliseconds (0.0 if not executed)
+    """
+
+    task_id: str
+    plan_index: int
+    question_id: str
+    executor_id: str
+    status: TaskStatus
+    result: Any = None
+    error: str | None = None
+    duration_ms: float = 0.0
+
+
+@dataclass
+class Phase2ScheduleReport:
+    """Plan-ordered outcomes of a scheduler run.
+
+    Attributes:
+        plan_id: Identifier of the executed plan
+        outcomes: Task outcomes in plan order
+        execution_time_ms: Wall-clock time of the run in milliseconds
+        peak_concurrency: Maximum number of tasks observed running at once
+        worker_budget: Worker budget at the end of the run
+    """
+
+    plan_id: str
+    outcomes: list[TaskOutcome]
+    execution_time_ms: float
+    peak_concurrency: int
+    worker_budget: int
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = {status.value: 0 for status in TaskStatus}
+            for outcome in self.outcomes:
+                self.counts[outcome.status.value] += 1
+
+    def results(self) -> list[Any]:
+        """Return results of completed tasks in plan order."""
+        return [o.result for o in self.outcomes if o.status == TaskStatus.COMPLETED]
+
+    def failed(self) -> list[TaskOutcome]:
+        """Return outcomes of failed tasks in plan order."""
+        return [o for o in self.outcomes if o.status == TaskStatus.FAILED]
+
+
+def _default_executor_id(task: Task) -> str:
+    return task.question_id
+
+
+def _validate_dependencies(
+    task_ids: list[str], dependencies: Mapping[str, Iterable[str]]
+) -> dict[str, tuple[str, ...]]:
+    """Normalize dependencies and reject unknown IDs or cycles."""
+    known = set(task_ids)
+    normalized: dict[str, tuple[str, ...]] = {}
+    for task_id, prerequisites in dependencies.items():
+        if task_id not in known:
+            raise ValueError(f"Dependency declared for unknown task '{task_id}'")
+        prereqs = tuple(dict.fromkeys(prerequisites))
+        unknown = [p for p in prereqs if p not in known]
+        if unknown:
+            raise ValueError(f"Task '{task_id}' depends on unknown tasks {unknown}")
+        normalized[task_id] = prereqs
+
+    # Kahn's algorithm: every task must be reachable without a cycle
+    indegree = {task_id: len(normalized.get(task_id, ())) for task_id in task_ids}
+    dependents: dict[str, list[str]] = {}
+    for task_id, prereqs in normalized.items():
+        for prereq in prereqs:
+            dependents.setdefault(prereq, []).append(task_id)
+    ready = [task_id for task_id, degree in indegree.items() if degree == 0]
+    visited = 0
+    while ready:
+        current = ready.pop()
+        visited += 1
+        for dependent in dependents.get(current, ()):
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+    if visited != len(task_ids):
+        raise ValueError("Task dependencies contain a cycle")
+    return normalized
+
+
+class Phase2Scheduler:
+    """Bounded, resource-aware scheduler for phase 2 execution plans."""
+
+    def __init__(
+        self,
+        resource_limits: ResourceLimits,
+        resource_manager: AdaptiveResourceManager | None = None,
+        abort_signal: AbortSignal | None = None,
+        pool: Executor | None = None,
+        budget_refresh_interval: int = 10,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            resource_limits: Worker budget source (max_workers / apply_worker_budget)
+            resource_manager: Optional manager providing circuit breakers and metrics
+            abort_signal: Optional abort signal checked before each dispatch
+            pool: Worker pool; a ThreadPoolExecutor sized to
+                resource_limits.hard_max_workers is created per run if None
+            budget_refresh_interval: Completed tasks between worker budget updates
+        """
+        self.resource_limits = resource_limits
+        self.resource_manager = resource_manager
+        self.abort_signal = abort_signal
+        self.pool = pool
+        self.budget_refresh_interval = max(1, budget_refresh_interval)
+
+    def _is_aborted(self) -> bool:
+        return self.abort_signal is not None and self.abort_signal.is_aborted()
+
+    async def run(
+        self,
+        plan: ExecutionPlan,
+        run_task: Callable[[Task], Any],
+        *,
+        executor_id_for: Callable[[Task], str] | None = None,
+        dependencies: Mapping[str, Iterable[str]] | None = None,
+    ) -> Phase2ScheduleReport:
+        """Execute all plan tasks concurrently.
+
+        Args:
+            plan: Execution plan from IrrigationSynchronizer
+            run_task: Blocking callable executed in the pool for each task
+            executor_id_for: Maps a task to its executor ID for circuit breakers
+                (defaults to the task's question_id)
+            dependencies: Optional mapping task_id -> prerequisite task_ids
+
+        Returns:
+            Phase2ScheduleReport with outcomes in plan order
+
+        Raises:
+            ValueError: If dependencies reference unknown tasks or form a cycle
+        """
+        tasks = list(plan.tasks)
+        task_ids = [task.task_id for task in tasks]
+        if len(set(task_ids)) != len(task_ids):
+            raise ValueError(f"Execution plan {plan.plan_id} contains duplicate task IDs")
+        prerequisites = _validate_dependencies(task_ids, dependencies or {})
+        executor_id_for = executor_id_for or _default_executor_id
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.resource_limits.max_workers)
+        self.resource_limits.attach_semaphore(semaphore)
+
+        owned_pool = self.pool is None
+        pool = self.pool or ThreadPoolExecutor(
+            max_workers=self.resource_limits.hard_max_workers,
+            thread_name_prefix="phase2",
+        )
+
+        outcomes: list[TaskOutcome | None] = [None] * len(tasks)
+        done_events = {task_id: asyncio.Event() for task_id in task_ids}
+        status_by_id: dict[str, TaskStatus] = {}
+        state = {"running": 0, "peak": 0, "finished": 0}
+
+        async def refresh_budget() -> None:
+            state["finished"] += 1
+            if state["finished"] % self.budget_refresh_interval == 0:
+                self.resource_limits.get_resource_usage()
+                await self.resource_limits.apply_worker_budget()
+
+        async def execute(index: int, task: Task) -> TaskOutcome:
+            executor_id = executor_id_for(task)
+
+            def outcome(status: TaskStatus, **kwargs: Any) -> TaskOutcome:
+                return TaskOutcome(
+                    task_id=task.task_id,
+                    plan_index=index,
+                    question_id=task.question_id,
+                    executor_id=executor_id,
+                    status=status,
+                    **kwargs,
+                )
+
+            for prereq in prerequisites.get(task.task_id, ()):
+                await done_events[prereq].wait()
+                if status_by_id[prereq] != TaskStatus.COMPLETED:
+                    return outcome(
+                        TaskStatus.SKIPPED,
+                        error=f"Prerequisite {prereq} {status_by_id[prereq].value}",
+                    )
+
+            if self._is_aborted():
+                return outcome(TaskStatus.ABORTED, error="Orchestration aborted")
+
+            async with semaphore:
+                if self._is_aborted():
+                    return outcome(TaskStatus.ABORTED, error="Orchestration aborted")
+
+                if self.resource_manager is not None:
+                    can_execute, reason = self.resource_manager.can_execute(executor_id)
+                    if not can_execute:
+                        logger.warning(f"Task {task.task_id} skipped for {executor_id}: {reason}")
+                        return outcome(TaskStatus.SKIPPED, error=reason)
+                    await self.resource_manager.start_executor_execution(executor_id)
+
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+                start = time.perf_counter()
+                success = False
+                try:
+                    result = await loop.run_in_executor(pool, run_task, task)
+                    success = True
+                    return outcome(
+                        TaskStatus.COMPLETED,
+                        result=result,
+                        duration_ms=(time.perf_counter() - start) * 1000.0,
+                    )
+                except Exception as exc:
+                    logger.warning(f"Task {task.task_id} ({executor_id}) failed: {exc}")
+                    return outcome(
+                        TaskStatus.FAILED,
+                        error=f"{type(exc).__name__}: {exc}",
+                        duration_ms=(time.perf_counter() - start) * 1000.0,
+                    )
+                finally:
+                    state["running"] -= 1
+                    if self.resource_manager is not None:
+                        await self.resource_manager.end_executor_execution(
+                            executor_id=executor_id,
+                            success=success,
+                            duration_ms=(time.perf_counter() - start) * 1000.0,
+                        )
+
+        async def schedule(index: int, task: Task) -> None:
+            try:
+                result = await execute(index, task)
+            except Exception as exc:
+                # Scheduling errors (e.g. resource manager failures) must not
+                # leave dependents waiting forever
+                logger.error(f"Task {task.task_id} could not be scheduled: {exc}")
+                result = TaskOutcome(
+                    task_id=task.task_id,
+                    plan_index=index,
+                    question_id=task.question_id,
+                    executor_id="",
+                    status=TaskStatus.FAILED,
+                    error=f"{type(exc).__name__}: {exc}",
+                )
+            outcomes[index] = result
+            status_by_id[task.task_id] = result.status
+            done_events[task.task_id].set()
+            if result.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+                await refresh_budget()
+
+        start_time = time.perf_counter()
+        logger.info(
+            f"Phase 2 scheduler: plan={plan.plan_id} tasks={len(tasks)} "
+            f"worker_budget={self.resource_limits.max_workers}"
+        )
+        try:
+            await asyncio.gather(
+                *(schedule(index, task) for index, task in enumerate(tasks))
+            )
+        finally:
+            if owned_pool:
+                pool.shutdown(wait=True)
+
+        report = Phase2ScheduleReport(
+            plan_id=plan.plan_id,
+            outcomes=[o for o in outcomes if o is not None],
+            execution_time_ms=(time.perf_counter() - start_time) * 1000.0,
+            peak_concurrency=state["peak"],
+            worker_budget=self.resource_limits.max_workers,
+        )
+        logger.info(
+            f"Phase 2 scheduler finished: plan={plan.plan_id} counts={report.counts} "
+            f"peak_concurrency={report.peak_concurrency} "
+            f"time={report.execution_time_ms:.2f}ms"
+        )
+        return report
+
+
+__all__ = [
+    "Phase2ScheduleReport",
+    "Phase2Scheduler",
+    "TaskOutcome",
+    "TaskStatus",
+]
@@ -33,6 +33,10 @@ from pathlib import Path
 from typing import Any, Dict, Final
 
 from farfan_pipeline.config.paths import PROJECT_ROOT
+from farfan_pipeline.core.orchestrator.questionnaire_index import (
+    QuestionnaireIndex,
+    build_questionnaire_index,
+)
 
 # Canonical path to questionnaire monolith
 QUESTIONNAIRE_FILE: Final[Path] = (
@@ -100,6 +104,9 @@ class CanonicalQuestionnaire:
         
         # Extract blocks for fast access
         self._blocks = data.get('blocks', {})
+        
+        # Immutable lookup index (shared with the signal registry)
+        self._index = build_questionnaire_index(self._blocks.get('micro_questions', []))
     
     @property
     def data(self) -> Dict[str, Any]:
@@ -111,6 +118,11 @@ class CanonicalQuestionnaire:
         """Get questionnaire metadata."""
         return self._metadata
     
+    @property
+    def index(self) -> QuestionnaireIndex:
+        """Get the immutable question/pattern index built at load time."""
+        return self._index
+    
     @property
     def schema_version(self) -> str:
         """Get schema version."""
@@ -172,10 +184,7 @@ class CanonicalQuestionnaire:
         Returns:
             Question data or None if not found
         """
-        for q in self.get_micro_questions():
-            if q.get('question_id') == question_id:
-                return q
-        return None
+        return self._index.get_question(question_id)
     
     def get_questions_by_cluster(self, cluster_id: str) -> list[Dict[str, Any]]:
         """
@@ -187,10 +196,7 @@ class CanonicalQuestionnaire:
         Returns:
             List of questions in that cluster
         """
-        return [
-            q for q in self.get_micro_questions()
-            if q.get('cluster_id') == cluster_id
-        ]
+        return list(self._index.questions_by_cluster(cluster_id))
     
     def get_questions_by_policy_area(self, policy_area_id: str) -> list[Dict[str, Any]]:
         """
@@ -202,10 +208,19 @@ class CanonicalQuestionnaire:
         Returns:
             List of questions for that policy area
         """
-        return [
-            q for q in self.get_micro_questions()
-            if q.get('policy_area_id') == policy_area_id
-        ]
+        return list(self._index.questions_by_policy_area(policy_area_id))
+    
+    def get_questions_by_dimension(self, dimension_id: str) -> list[Dict[str, Any]]:
+        """
+        Get all micro questions for a dimension.
+        
+        Args:
+            dimension_id: Dimension identifier
+        
+        Returns:
+            List of questions for that dimension
+        """
+        return list(self._index.questions_by_dimension(dimension_id))
     
     def verify_integrity(self) -> bool:
         """
@@ -0,0 +1,188 @@
+"""
+Questionnaire Index - Constant-Time Question and Pattern Lookup.
+
+Immutable index over the micro questions of the questionnaire monolith,
+built once when the questionnaire is loaded and shared by
+CanonicalQuestionnaire and QuestionnaireSignalRegistry.
+
+INDEXED KEYS:
+-------------
+- question_id                  → question
+- policy_area_id               → questions (monolith order)
+- dimension_id                 → questions (monolith order)
+- cluster_id                   → questions (monolith order)
+- (pattern category, policy_area_id) → distinct pattern strings
+
+The index containers are read-only (MappingProxyType / tuples). Question
+dicts are the monolith objects themselves and must be treated as read-only,
+as everywhere else in the pipeline.
+
+Author: F.A.R.F.A.N Pipeline
+Date: 2025-12-02
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict
+
+# Pattern categories with dedicated lookups
+INDICATOR_CATEGORY = "INDICADOR"
+OFFICIAL_SOURCE_CATEGORY = "FUENTE_OFICIAL"
+
+_EMPTY: tuple = ()
+
+
+def _freeze(groups: Dict[str, list]) -> Mapping[str, tuple]:
+    return MappingProxyType({key: tuple(values) for key, values in groups.items()})
+
+
+def _unique(values: Iterable[str]) -> list[str]:
+    """Deduplicate while preserving first-seen order."""
+    return list(dict.fromkeys(values))
+
+
+@dataclass(frozen=True)
+class QuestionnaireIndex:
+    """Immutable lookup tables over micro questions.
+
+    Use build_questionnaire_index() to construct.
+
+    Query API:
+        get_question(question_id)          → question or None
+        questions_by_policy_area(pa_id)    → tuple of questions
+        questions_by_dimension(dim_id)     → tuple of questions
+        questions_by_cluster(cluster_id)   → tuple of questions
+        patterns_by_category(cat, pa_id)   → distinct pattern strings
+        indicator_patterns(pa_id)          → INDICADOR patterns of the area
+        official_sources()                 → FUENTE_OFICIAL alternatives
+        question_ids / policy_areas        → keys in monolith order
+    """
+
+    by_question_id: Mapping[str, Mapping[str, Any]]
+    by_policy_area: Mapping[str, tuple[Mapping[str, Any], ...]]
+    by_dimension: Mapping[str, tuple[Mapping[str, Any], ...]]
+    by_cluster: Mapping[str, tuple[Mapping[str, Any], ...]]
+    patterns_by_category_area: Mapping[tuple[str, str], tuple[str, ...]]
+    patterns_by_category_all: Mapping[str, tuple[str, ...]]
+    official_source_alternatives: tuple[str, ...]
+
+    def get_question(self, question_id: str) -> Mapping[str, Any] | None:
+        """Return the question with ``question_id`` or None."""
+        return self.by_question_id.get(question_id)
+
+    def questions_by_policy_area(self, policy_area_id: str) -> tuple[Mapping[str, Any], ...]:
+        """Return all questions of a policy area."""
+        return self.by_policy_area.get(policy_area_id, _EMPTY)
+
+    def questions_by_dimension(self, dimension_id: str) -> tuple[Mapping[str, Any], ...]:
+        """Return all questions of a dimension."""
+        return self.by_dimension.get(dimension_id, _EMPTY)
+
+    def questions_by_cluster(self, cluster_id: str) -> tuple[Mapping[str, Any], ...]:
+        """Return all questions of a cluster."""
+        return self.by_cluster.get(cluster_id, _EMPTY)
+
+    def patterns_by_category(
+        self, category: str, policy_area_id: str | None = None
+    ) -> tuple[str, ...]:
+        """Return distinct pattern strings of a category.
+
+        Args:
+            category: Pattern category (e.g. "INDICADOR")
+            policy_area_id: Restrict to one policy area; None for all areas
+        """
+        if policy_area_id is None:
+            return self.patterns_by_category_all.get(category, _EMPTY)
+        return self.patterns_by_category_area.get((category, policy_area_id), _EMPTY)
+
+    def indicator_patterns(self, policy_area_id: str) -> tuple[str, ...]:
+        """Return INDICADOR patterns of a policy area."""
+        return self.patterns_by_category(INDICATOR_CATEGORY, policy_area_id)
+
+    def official_sources(self) -> tuple[str, ...]:
+        """Return FUENTE_OFICIAL alternatives (patterns split on '|')."""
+        return self.official_source_alternatives
+
+    @property
+    def question_ids(self) -> tuple[str, ...]:
+        """All question IDs in monolith order."""
+        return tuple(self.by_question_id)
+
+    @property
+    def policy_areas(self) -> tuple[str, ...]:
+        """All policy area IDs in monolith order."""
+        return tuple(self.by_policy_area)
+
+    def __len__(self) -> int:
+        return len(self.by_question_id)
+
+
+def build_questionnaire_index(
+    micro_questions: Iterable[Mapping[str, Any]],
+) -> QuestionnaireIndex:
+    """
+    Build the immutable index in a single pass over the micro questions.
+
+    The first question wins if an ID is duplicated, matching the previous
+    linear-scan lookups.
+
+    Args:
+        micro_questions: Micro questions from the monolith ``blocks``
+
+    Returns:
+        QuestionnaireIndex
+    """
+    by_id: Dict[str, Mapping[str, Any]] = {}
+    by_pa: Dict[str, list] = {}
+    by_dim: Dict[str, list] = {}
+    by_cluster: Dict[str, list] = {}
+    by_category_area: Dict[tuple[str, str], list] = {}
+    by_category_all: Dict[str, list] = {}
+    sources: list[str] = []
+
+    for q in micro_questions:
+        question_id = q.get("question_id")
+        if question_id is not None:
+            by_id.setdefault(question_id, q)
+
+        policy_area = q.get("policy_area_id")
+        if policy_area is not None:
+            by_pa.setdefault(policy_area, []).append(q)
+        dimension = q.get("dimension_id")
+        if dimension is not None:
+            by_dim.setdefault(dimension, []).append(q)
+        cluster = q.get("cluster_id")
+        if cluster is not None:
+            by_cluster.setdefault(cluster, []).append(q)
+
+        for pattern_obj in q.get("patterns", []) or []:
+            category = pattern_obj.get("category", "GENERAL")
+            pattern = pattern_obj.get("pattern", "")
+            by_category_all.setdefault(category, []).append(pattern)
+            if policy_area is not None:
+                by_category_area.setdefault((category, policy_area), []).append(pattern)
+            if category == OFFICIAL_SOURCE_CATEGORY and pattern:
+                sources.extend(p.strip() for p in pattern.split("|") if p.strip())
+
+    return QuestionnaireIndex(
+        by_question_id=MappingProxyType(by_id),
+        by_policy_area=_freeze(by_pa),
+        by_dimension=_freeze(by_dim),
+        by_cluster=_freeze(by_cluster),
+        patterns_by_category_area=MappingProxyType(
+            {key: tuple(_unique(values)) for key, values in by_category_area.items()}
+        ),
+        patterns_by_category_all=MappingProxyType(
+            {key: tuple(_unique(values)) for key, values in by_category_all.items()}
+        ),
+        official_source_alternatives=tuple(_unique(sources)),
+    )
+
+
+__all__ = [
+    'QuestionnaireIndex',
+    'build_questionnaire_index',
+    'INDICATOR_CATEGORY',
+    'OFFICIAL_SOURCE_CATEGORY',
+]
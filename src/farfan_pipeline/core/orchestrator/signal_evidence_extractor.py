@@ -26,6 +26,14 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
+from farfan_pipeline.core.orchestrator.signal_pattern_automaton import (
+    CompiledPatternSet,
+    as_pattern_spec,
+    compile_pattern_set,
+    is_regex_match_type,
+    split_alternatives,
+)
+
 try:
     import structlog
     logger = structlog.get_logger(__name__)
@@ -48,7 +56,8 @@ class EvidenceExtractionResult:
 def extract_structured_evidence(
     text: str,
     signal_node: dict[str, Any],
-    document_context: dict[str, Any] | None = None
+    document_context: dict[str, Any] | None = None,
+    compiled_patterns: CompiledPatternSet | None = None
 ) -> EvidenceExtractionResult:
     """
     Extract structured evidence using monolith patterns.
@@ -64,6 +73,9 @@ def extract_structured_evidence(
         text: Source text to extract from
         signal_node: Signal node from questionnaire_monolith.json
         document_context: Optional document-level context
+        compiled_patterns: Optional precompiled pattern set (e.g. from
+            QuestionnaireSignalRegistry.get_compiled_patterns). When omitted,
+            the node patterns are compiled once for this call.
     
     Returns:
         EvidenceExtractionResult with structured evidence
@@ -88,6 +100,9 @@ def extract_structured_evidence(
     missing_required = []
     under_minimum = []
     
+    if compiled_patterns is None:
+        compiled_patterns = compile_pattern_set(all_patterns)
+    
     logger.debug(
         "structured_extraction_start",
         expected_count=len(expected_elements),
@@ -119,7 +134,8 @@ def extract_structured_evidence(
             element_type=element_type,
             text=text,
             all_patterns=all_patterns,
-            validations=validations
+            validations=validations,
+            compiled_patterns=compiled_patterns
         )
         
         evidence[element_type] = matches
@@ -173,32 +189,42 @@ def extract_structured_evidence(
 def extract_evidence_for_element_type(
     element_type: str,
     text: str,
-    all_patterns: list[dict[str, Any]],
-    validations: dict[str, Any]
+    all_patterns: list[dict[str, Any] | str],
+    validations: dict[str, Any],
+    compiled_patterns: CompiledPatternSet | None = None
 ) -> list[dict[str, Any]]:
     """
     Extract evidence for a specific element type using monolith patterns.
     
     Strategy:
     1. Filter patterns by category/flags that match element type
-    2. Apply each pattern with its confidence_weight
+    2. Look up each alternative's spans in the compiled single-pass scan
     3. Return all matches with metadata
     
     Args:
         element_type: Type from expected_elements (e.g., 'fuentes_oficiales')
         text: Source text
-        all_patterns: All patterns from signal node
+        all_patterns: All patterns from signal node (spec dicts, or bare
+            SignalPack pattern strings matched literally)
         validations: Validation rules
+        compiled_patterns: Precompiled pattern set shared across elements and
+            questions; compiled from all_patterns when omitted
     
     Returns:
         List of evidence matches with confidence scores
     """
     matches = []
     
+    if compiled_patterns is None:
+        compiled_patterns = compile_pattern_set(all_patterns)
+    
     # Category heuristics (can be improved with explicit mapping in monolith)
     category_hints = _infer_pattern_categories_for_element(element_type)
     
-    for pattern_spec in all_patterns:
+    for pattern in all_patterns:
+        pattern_spec = as_pattern_spec(pattern)
+        if pattern_spec is None:
+            continue
         pattern_str = pattern_spec.get('pattern', '')
         confidence_weight = pattern_spec.get('confidence_weight', 0.5)
         category = pattern_spec.get('category', 'GENERAL')
@@ -213,35 +239,13 @@ def extract_evidence_for_element_type(
             continue
         
         # Apply pattern (handle pipe-separated alternatives)
-        alternatives = [p.strip() for p in pattern_str.split('|') if p.strip()]
+        alternatives = split_alternatives(pattern_str)
+        match_type = pattern_spec.get('match_type', 'substring')
+        as_regex = is_regex_match_type(match_type)
         
         for alt in alternatives:
-            # Escape regex special chars if match_type is not 'regex'
-            match_type = pattern_spec.get('match_type', 'substring')
-            if match_type == 'regex':
-                regex_pattern = alt
-            else:
-                regex_pattern = re.escape(alt)
-            
             try:
-                for match in re.finditer(regex_pattern, text, re.IGNORECASE):
-                    matches.append({
-                        'value': match.group(0),
-                        'raw_text': match.group(0),
-                        'confidence': confidence_weight,
-                        'pattern_id': pattern_id,
-                        'category': category,
-                        'span': match.span(),
-                        # Signal lineage tracking
-                        'lineage': {
-                            'pattern_id': pattern_id,
-                            'pattern_text': pattern_str[:50] + '...' if len(pattern_str) > 50 else pattern_str,
-                            'match_type': match_type,
-                            'confidence_weight': confidence_weight,
-                            'element_type': element_type,
-                            'extraction_phase': 'microanswering',
-                        }
-                    })
+                spans = compiled_patterns.find_spans(text, alt, as_regex)
             except re.error as e:
                 logger.warning(
                     "pattern_regex_error",
@@ -249,6 +253,26 @@ def extract_evidence_for_element_type(
                     error=str(e)
                 )
                 continue
+            
+            for start, end in spans:
+                value = text[start:end]
+                matches.append({
+                    'value': value,
+                    'raw_text': value,
+                    'confidence': confidence_weight,
+                    'pattern_id': pattern_id,
+                    'category': category,
+                    'span': (start, end),
+                    # Signal lineage tracking
+                    'lineage': {
+                        'pattern_id': pattern_id,
+                        'pattern_text': pattern_str[:50] + '...' if len(pattern_str) > 50 else pattern_str,
+                        'match_type': match_type,
+                        'confidence_weight': confidence_weight,
+                        'element_type': element_type,
+                        'extraction_phase': 'microanswering',
+                    }
+                })
     
     # Deduplicate overlapping matches, keeping highest confidence
     return _deduplicate_matches(matches)
@@ -37,6 +37,11 @@ from farfan_pipeline.core.orchestrator.signal_evidence_extractor import (
     extract_structured_evidence,
     EvidenceExtractionResult
 )
+from farfan_pipeline.core.orchestrator.signal_pattern_automaton import (
+    CompiledPatternSet,
+    as_pattern_spec,
+    compile_pattern_set
+)
 
 try:
     import structlog
@@ -66,9 +71,14 @@ class EnrichedSignalPack:
             enable_semantic_expansion: If True, expand patterns semantically
         """
         self.base_pack = base_signal_pack
-        self.patterns = base_signal_pack.patterns
+        # SignalPack.patterns are bare strings; monolith nodes carry spec dicts
+        self.patterns = [
+            spec for spec in map(as_pattern_spec, base_signal_pack.patterns)
+            if spec is not None
+        ]
         self._semantic_expansion_enabled = enable_semantic_expansion
         self._original_pattern_count = len(base_signal_pack.patterns)
+        self._compiled_patterns: CompiledPatternSet | None = None
 
         # Apply semantic expansion
         if enable_semantic_expansion:
@@ -80,6 +90,18 @@ class EnrichedSignalPack:
                 multiplier=len(self.patterns) / self._original_pattern_count
             )
     
+    @property
+    def compiled_patterns(self) -> CompiledPatternSet:
+        """
+        Single-pass matcher over this pack's (expanded) patterns.
+
+        Compiled on first use and shared by every question of the policy
+        area, so each chunk is scanned once instead of once per question.
+        """
+        if self._compiled_patterns is None:
+            self._compiled_patterns = compile_pattern_set(self.patterns)
+        return self._compiled_patterns
+
     def get_patterns_for_context(
         self,
         document_context: dict[str, Any]
@@ -106,7 +128,8 @@ class EnrichedSignalPack:
         self,
         text: str,
         signal_node: dict[str, Any],
-        document_context: dict[str, Any] | None = None
+        document_context: dict[str, Any] | None = None,
+        compiled_patterns: CompiledPatternSet | None = None
     ) -> EvidenceExtractionResult:
         """
         Extract structured evidence from text.
@@ -115,11 +138,20 @@ class EnrichedSignalPack:
             text: Source text
             signal_node: Signal node with expected_elements
             document_context: Optional document context
+            compiled_patterns: Matcher to scan with (e.g. the registry's
+                policy-area set); defaults to this pack's compiled patterns
         
         Returns:
             Structured evidence extraction result
         """
-        return extract_structured_evidence(text, signal_node, document_context)
+        if compiled_patterns is None:
+            compiled_patterns = self.compiled_patterns
+        return extract_structured_evidence(
+            text,
+            signal_node,
+            document_context,
+            compiled_patterns=compiled_patterns
+        )
     
     def validate_result(
         self,
@@ -284,7 +316,8 @@ def analyze_with_intelligence_layer(
         text: Text to analyze
         signal_node: Signal node with full spec
         document_context: Document context (section, chapter, etc.)
-        enriched_pack: Optional enriched signal pack (will create if None)
+        enriched_pack: Optional enriched signal pack whose compiled patterns
+            are reused across calls (patterns are compiled per call if None)
     
     Returns:
         Complete analysis result with:
@@ -305,8 +338,11 @@ def analyze_with_intelligence_layer(
     if document_context is None:
         document_context = {}
     
-    # Extract structured evidence
-    evidence_result = extract_structured_evidence(text, signal_node, document_context)
+    # Extract structured evidence (single-pass scan shared with the pack)
+    if enriched_pack is not None:
+        evidence_result = enriched_pack.extract_evidence(text, signal_node, document_context)
+    else:
+        evidence_result = extract_structured_evidence(text, signal_node, document_context)
     
     # Prepare result for validation
     analysis_result = {
@@ -0,0 +1,334 @@
+"""
+Compiled Pattern Automaton - Single-Pass Signal Scanning
+=========================================================
+
+Compiles the monolith patterns of a policy area once and scans each chunk
+a single time, instead of calling ``re.finditer`` with an uncompiled string
+for every pattern alternative, every expected element and every one of the
+300 micro-questions.
+
+ARCHITECTURE:
+- Literal alternatives → Aho-Corasick trie automaton (one pass per chunk)
+- True regex alternatives → compiled once; a combined alternation with one
+  named group per pattern acts as a presence gate so chunks with no regex
+  hit are never rescanned per pattern
+- Per-chunk scan results are memoised (small LRU keyed by chunk text), so
+  every question of the policy area reuses the same scan
+
+Match semantics are identical to the legacy extractor: each alternative
+yields the same non-overlapping, case-insensitive spans that
+``re.finditer(alternative, text, re.IGNORECASE)`` would, so the output can
+be fed unchanged to ``_deduplicate_matches`` and lineage metadata.
+
+Author: F.A.R.F.A.N Pipeline
+Date: 2025-12-02
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import structlog
+    logger = structlog.get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+Span = tuple[int, int]
+
+# Backreferences cannot be merged into a combined alternation safely
+_BACKREFERENCE_RE = re.compile(r"\\\d|\(\?P=")
+
+DEFAULT_SCAN_CACHE_SIZE = 8
+
+
+def is_regex_match_type(match_type: str | None) -> bool:
+    """Return True when a pattern spec must be applied as a raw regex.
+
+    Mirrors the legacy extractor: only ``match_type == 'regex'`` is treated
+    as a regular expression, everything else is matched literally.
+    """
+    return match_type == 'regex'
+
+
+def as_pattern_spec(pattern: dict[str, Any] | str) -> dict[str, Any] | None:
+    """Normalise a pattern to a spec dict.
+
+    ``SignalPack.patterns`` holds bare pattern strings while monolith nodes
+    hold spec dicts; a bare string becomes ``{'pattern': pattern}`` and is
+    matched literally, like a spec without ``match_type``.
+    """
+    if isinstance(pattern, dict):
+        return pattern
+    if isinstance(pattern, str):
+        return {'pattern': pattern}
+    return None
+
+
+def split_alternatives(pattern_str: str) -> list[str]:
+    """Split a pipe-separated monolith pattern into stripped alternatives."""
+    return [p.strip() for p in pattern_str.split('|') if p.strip()]
+
+
+class _LiteralAutomaton:
+    """Aho-Corasick automaton over lowercased literals."""
+
+    def __init__(self, literals: list[str]) -> None:
+        self.literals = literals
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for index, literal in enumerate(literals):
+            node = 0
+            for char in literal:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] = self._out[node] + (index,)
+
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def scan(self, text: str) -> list[list[Span]]:
+        """Return non-overlapping leftmost spans for every literal.
+
+        Spans are produced in a single pass over ``text``; per literal the
+        result equals ``re.finditer(re.escape(literal), text)``.
+        """
+        spans: list[list[Span]] = [[] for _ in self.literals]
+        last_end = [0] * len(self.literals)
+        lengths = [len(lit) for lit in self.literals]
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                end = position + 1
+                for index in out[node]:
+                    start = end - lengths[index]
+                    if start >= last_end[index]:
+                        spans[index].append((start, end))
+                        last_end[index] = end
+        return spans
+
+
+class CompiledPatternSet:
+    """Immutable, precompiled view over a collection of monolith patterns.
+
+    Built once (typically per policy area by ``QuestionnaireSignalRegistry``)
+    and shared by every question that scans the same chunk text.
+
+    Thread Safety: scan cache is lock-protected; compiled state is read-only.
+    """
+
+    def __init__(
+        self,
+        pattern_specs: Iterable[dict[str, Any] | str],
+        *,
+        scan_cache_size: int = DEFAULT_SCAN_CACHE_SIZE,
+    ) -> None:
+        literals: dict[str, int] = {}
+        regexes: dict[str, re.Pattern[str]] = {}
+        self._regex_errors: dict[str, str] = {}
+        pattern_count = 0
+
+        for pattern in pattern_specs:
+            spec = as_pattern_spec(pattern)
+            if spec is None:
+                continue
+            pattern_str = spec.get('pattern', '') or ''
+            if not isinstance(pattern_str, str):
+                continue
+            pattern_count += 1
+            as_regex = is_regex_match_type(spec.get('match_type', 'substring'))
+            for alt in split_alternatives(pattern_str):
+                if as_regex:
+                    self._compile_regex(alt, regexes)
+                else:
+                    literals.setdefault(alt.lower(), len(literals))
+
+        self._literal_index = literals
+        self._automaton = _LiteralAutomaton(list(literals))
+        self._regexes = regexes
+        self._regex_gate = self._build_regex_gate(regexes)
+        self._escaped: dict[str, re.Pattern[str]] = {}
+        # Regex alternatives outside the compiled set (e.g. semantic variants)
+        self._extra_regexes: dict[str, re.Pattern[str]] = {}
+        self._scan_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._scan_cache_size = max(1, scan_cache_size)
+        self._lock = threading.Lock()
+        self.pattern_count = pattern_count
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _compile_regex(self, alt: str, regexes: dict[str, re.Pattern[str]]) -> None:
+        if alt in regexes or alt in self._regex_errors:
+            return
+        try:
+            regexes[alt] = re.compile(alt, re.IGNORECASE)
+        except re.error as e:
+            self._regex_errors[alt] = str(e)
+
+    @staticmethod
+    def _build_regex_gate(regexes: dict[str, re.Pattern[str]]) -> re.Pattern[str] | None:
+        """Combine gate-safe regexes into one alternation with named groups."""
+        if not regexes:
+            return None
+        if any(_BACKREFERENCE_RE.search(alt) for alt in regexes):
+            return None
+        combined = '|'.join(
+            f'(?P<p{idx}>{alt})' for idx, alt in enumerate(regexes)
+        )
+        try:
+            return re.compile(combined, re.IGNORECASE)
+        except re.error:
+            # Inline flags or duplicate group names inside a pattern
+            return None
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _scan(self, text: str) -> dict[str, Any]:
+        """Return (and memoise) the single-pass scan state for ``text``."""
+        with self._lock:
+            cached = self._scan_cache.get(text)
+            if cached is not None:
+                self._scan_cache.move_to_end(text)
+                return cached
+
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            literal_spans: list[list[Span]] | None = self._automaton.scan(lowered)
+        else:
+            # Case folding changed offsets; fall back to per-literal regex
+            literal_spans = None
+
+        regex_possible = True
+        if self._regex_gate is not None:
+            regex_possible = self._regex_gate.search(text) is not None
+
+        state: dict[str, Any] = {
+            'literal_spans': literal_spans,
+            'regex_possible': regex_possible,
+            'regex_spans': {},
+        }
+        with self._lock:
+            self._scan_cache[text] = state
+            while len(self._scan_cache) > self._scan_cache_size:
+                self._scan_cache.popitem(last=False)
+        return state
+
+    def find_spans(self, text: str, alternative: str, as_regex: bool) -> list[Span]:
+        """Spans of one pattern alternative in ``text``.
+
+        Alternatives that were not part of the compiled set (e.g. semantic
+        expansions added later) are compiled on first use and kept in a
+        per-set dictionary; their spans are memoised with the chunk scan.
+
+        Raises:
+            re.error: If ``alternative`` is an invalid regular expression.
+        """
+        state = self._scan(text)
+
+        if as_regex:
+            error = self._regex_errors.get(alternative)
+            if error is not None:
+                raise re.error(error)
+            compiled = self._regexes.get(alternative)
+            if compiled is None:
+                compiled = self._extra_regexes.get(alternative)
+                if compiled is None:
+                    try:
+                        compiled = re.compile(alternative, re.IGNORECASE)
+                    except re.error as e:
+                        self._regex_errors[alternative] = str(e)
+                        raise
+                    self._extra_regexes[alternative] = compiled
+            elif not state['regex_possible']:
+                return []
+            regex_spans: dict[str, list[Span]] = state['regex_spans']
+            spans = regex_spans.get(alternative)
+            if spans is None:
+                spans = [m.span() for m in compiled.finditer(text)]
+                regex_spans[alternative] = spans
+            return spans
+
+        index = self._literal_index.get(alternative.lower())
+        literal_spans = state['literal_spans']
+        if index is not None and literal_spans is not None:
+            return literal_spans[index]
+
+        escaped = self._escaped.get(alternative)
+        if escaped is None:
+            escaped = re.compile(re.escape(alternative), re.IGNORECASE)
+            self._escaped[alternative] = escaped
+        return [m.span() for m in escaped.finditer(text)]
+
+    @property
+    def literal_count(self) -> int:
+        """Number of distinct literal alternatives in the automaton."""
+        return len(self._literal_index)
+
+    @property
+    def regex_count(self) -> int:
+        """Number of distinct compiled regex alternatives."""
+        return len(self._regexes)
+
+    def clear_scan_cache(self) -> None:
+        """Drop memoised chunk scans."""
+        with self._lock:
+            self._scan_cache.clear()
+
+
+def compile_pattern_set(
+    pattern_specs: Iterable[dict[str, Any] | str],
+    *,
+    scan_cache_size: int = DEFAULT_SCAN_CACHE_SIZE,
+) -> CompiledPatternSet:
+    """Compile monolith pattern specs (or bare pattern strings) into a single-pass matcher."""
+    compiled = CompiledPatternSet(pattern_specs, scan_cache_size=scan_cache_size)
+    logger.debug(
+        "pattern_set_compiled",
+        pattern_count=compiled.pattern_count,
+        literal_count=compiled.literal_count,
+        regex_count=compiled.regex_count,
+    )
+    return compiled
+
+
+__all__ = [
+    'CompiledPatternSet',
+    'as_pattern_spec',
+    'compile_pattern_set',
+    'is_regex_match_type',
+    'split_alternatives',
+]
@@ -73,6 +73,15 @@ except ImportError:
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from farfan_pipeline.core.orchestrator.questionnaire_index import (
+    QuestionnaireIndex,
+    build_questionnaire_index,
+)
+from farfan_pipeline.core.orchestrator.signal_pattern_automaton import (
+    CompiledPatternSet,
+    compile_pattern_set,
+)
+
 if TYPE_CHECKING:
     from farfan_pipeline.core.orchestrator.questionnaire import CanonicalQuestionnaire
 
@@ -475,6 +484,7 @@ class QuestionnaireSignalRegistry:
         """
         self._questionnaire = questionnaire
         self._source_hash = self._compute_source_hash()
+        self._index = self._resolve_index()
         
         # Lazy-loaded caches
         self._chunking_signals: ChunkingSignalPack | None = None
@@ -482,6 +492,7 @@ class QuestionnaireSignalRegistry:
         self._validation_cache: dict[str, ValidationSignalPack] = {}
         self._assembly_cache: dict[str, AssemblySignalPack] = {}
         self._scoring_cache: dict[str, ScoringSignalPack] = {}
+        self._compiled_pattern_cache: dict[str, CompiledPatternSet] = {}
         
         # Metrics
         self._metrics = RegistryMetrics()
@@ -504,6 +515,14 @@ class QuestionnaireSignalRegistry:
         else:
             return hashlib.sha256(content.encode()).hexdigest()
 
+    def _resolve_index(self) -> QuestionnaireIndex:
+        """Reuse the questionnaire's load-time index, or build one."""
+        index = getattr(self._questionnaire, "index", None)
+        if isinstance(index, QuestionnaireIndex):
+            return index
+        blocks = dict(self._questionnaire.data.get("blocks", {}))
+        return build_questionnaire_index(blocks.get("micro_questions", []))
+
     def _extract_valid_assembly_levels(self) -> list[str]:
         """Extract valid assembly levels from questionnaire."""
         levels = ["MACRO_1"]  # Always valid
@@ -720,7 +739,7 @@ class QuestionnaireSignalRegistry:
                     "assembly_signals_loaded",
                     level=level,
                     cluster_count=len(pack.cluster_policy_areas),
-                
+                )
                 
                 return pack
 
@@ -790,6 +809,69 @@ class QuestionnaireSignalRegistry:
                 )
                 raise SignalExtractionError("scoring", str(e)) from e
 
+    def get_compiled_patterns(self, policy_area: str) -> CompiledPatternSet:
+        """Get the single-pass pattern matcher for a policy area.
+        
+        All micro-question patterns of the policy area are merged once:
+        literal alternatives into an Aho-Corasick automaton, regex
+        alternatives into compiled patterns behind a combined gate. The
+        matcher memoises chunk scans, so every question of the area scans a
+        given chunk only once.
+        
+        Args:
+            policy_area: Policy area ID (PA01-PA10)
+        
+        Returns:
+            CompiledPatternSet shared by all questions of the policy area
+        
+        Raises:
+            SignalExtractionError: If pattern compilation fails
+        """
+        with tracer.start_as_current_span(
+            "signal_registry.get_compiled_patterns",
+            attributes={"signal_type": "compiled_patterns", "policy_area": policy_area},
+        ) as span:
+            try:
+                if policy_area in self._compiled_pattern_cache:
+                    self._metrics.cache_hits += 1
+                    span.set_attribute("cache_hit", True)
+                    return self._compiled_pattern_cache[policy_area]
+
+                self._metrics.signal_loads += 1
+                self._metrics.cache_misses += 1
+                span.set_attribute("cache_hit", False)
+
+                pattern_specs = [
+                    pattern_obj
+                    for q in self._index.questions_by_policy_area(policy_area)
+                    for pattern_obj in q.get("patterns", [])
+                ]
+                compiled = compile_pattern_set(pattern_specs)
+                self._compiled_pattern_cache[policy_area] = compiled
+
+                span.set_attribute("pattern_count", compiled.pattern_count)
+
+                logger.info(
+                    "compiled_patterns_loaded",
+                    policy_area=policy_area,
+                    pattern_count=compiled.pattern_count,
+                    literal_count=compiled.literal_count,
+                    regex_count=compiled.regex_count,
+                )
+
+                return compiled
+
+            except Exception as e:
+                self._metrics.errors += 1
+                span.record_exception(e)
+                logger.error(
+                    "compiled_patterns_failed",
+                    policy_area=policy_area,
+                    error=str(e),
+                    exc_info=True
+                )
+                raise SignalExtractionError("compiled_patterns", str(e)) from e
+
     # ========================================================================
     # PRIVATE: Signal Pack Builders
     # ========================================================================
@@ -1126,39 +1208,18 @@ class QuestionnaireSignalRegistry:
         Raises:
             QuestionNotFoundError: If question not found
         """
-        for q in self._questionnaire.micro_questions:
-            if dict(q).get("question_id") == question_id:
-                return dict(q)
-        raise QuestionNotFoundError(question_id)
+        question = self._index.get_question(question_id)
+        if question is None:
+            raise QuestionNotFoundError(question_id)
+        return dict(question)
 
     def _extract_indicators_for_pa(self, policy_area: str) -> list[str]:
         """Extract indicator patterns for policy area."""
-        indicators = []
-        blocks = dict(self._questionnaire.data.get("blocks", {}))
-        micro_questions = blocks.get("micro_questions", [])
-
-        for q in micro_questions:
-            if q.get("policy_area_id") == policy_area:
-                for pattern_obj in q.get("patterns", []):
-                    if pattern_obj.get("category") == "INDICADOR":
-                        indicators.append(pattern_obj.get("pattern", ""))
-
-        return list(set(indicators))
+        return list(self._index.indicator_patterns(policy_area))
 
     def _extract_official_sources(self) -> list[str]:
         """Extract official source patterns from all questions."""
-        sources = []
-        blocks = dict(self._questionnaire.data.get("blocks", {}))
-        micro_questions = blocks.get("micro_questions", [])
-
-        for q in micro_questions:
-            for pattern_obj in q.get("patterns", []):
-                if pattern_obj.get("category") == "FUENTE_OFICIAL":
-                    pattern = pattern_obj.get("pattern", "")
-                    # Split on | for multiple sources in one pattern
-                    sources.extend(p.strip() for p in pattern.split("|") if p.strip())
-
-        return list(set(sources))
+        return list(self._index.official_sources())
 
     # ========================================================================
     # OBSERVABILITY & MANAGEMENT
@@ -1181,6 +1242,7 @@ class QuestionnaireSignalRegistry:
             "cached_validation": len(self._validation_cache),
             "cached_assembly": len(self._assembly_cache),
             "cached_scoring": len(self._scoring_cache),
+            "cached_compiled_patterns": len(self._compiled_pattern_cache),
             "source_hash": self._source_hash[:16],
             "questionnaire_version": self._questionnaire.version,
             "last_cache_clear": self._metrics.last_cache_clear,
@@ -1193,6 +1255,7 @@ class QuestionnaireSignalRegistry:
         self._validation_cache.clear()
         self._assembly_cache.clear()
         self._scoring_cache.clear()
+        self._compiled_pattern_cache.clear()
         self._metrics.last_cache_clear = time.time()
 
         logger.info(
@@ -1215,9 +1278,7 @@ class QuestionnaireSignalRegistry:
         # Warmup specified questions
         if question_ids is None:
             # Get all question IDs
-            blocks = dict(self._questionnaire.data.get("blocks", {}))
-            micro_questions = blocks.get("micro_questions", [])
-            question_ids = [q.get("question_id", "") for q in micro_questions]
+            question_ids = list(self._index.question_ids)
         
         for q_id in question_ids:
             if not q_id:
@@ -1254,6 +1315,11 @@ class QuestionnaireSignalRegistry:
         """Get source content hash."""
         return self._source_hash
 
+    @property
+    def index(self) -> QuestionnaireIndex:
+        """Get the immutable questionnaire index used for lookups."""
+        return self._index
+
     @property
     def valid_assembly_levels(self) -> list[str]:
         """Get valid assembly levels."""
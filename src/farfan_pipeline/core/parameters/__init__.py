@@ -1,5 +1,8 @@
 """Centralized parameter loading system."""
 
-from farfan_pipeline.core.parameters.parameter_loader_v2 import ParameterLoaderV2
+from farfan_pipeline.core.parameters.parameter_loader_v2 import (
+    MethodParameters,
+    ParameterLoaderV2,
+)
 
-__all__ = ["ParameterLoaderV2"]
+__all__ = ["MethodParameters", "ParameterLoaderV2"]
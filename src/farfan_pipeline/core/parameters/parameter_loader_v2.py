@@ -2,21 +2,100 @@
 
 import json
 import logging
+import os
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+BINDING_MODE_STATIC = "static"
+BINDING_MODE_DYNAMIC = "dynamic"
+_VALID_BINDING_MODES = (BINDING_MODE_STATIC, BINDING_MODE_DYNAMIC)
+BINDING_MODE_ENV = "FARFAN_PARAMETER_BINDING"
+
+
+def _validate_binding_mode(mode: str, source: str) -> str:
+    """Normalize a binding mode, rejecting anything but static/dynamic."""
+    normalized = mode.strip().lower()
+    if normalized not in _VALID_BINDING_MODES:
+        raise ValueError(
+            f"Invalid parameter binding mode '{mode}' from {source}. "
+            f"Valid modes: {', '.join(_VALID_BINDING_MODES)}"
+        )
+    return normalized
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MethodParameters(Mapping[str, Any]):
+    """
+    Frozen, pre-resolved parameter constants for a single method.
+
+    Produced once by ParameterLoaderV2.bind() so hot loops can read
+    parameters without going through the catalogue on every access.
+    """
+
+    method_id: str
+    values: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    def __getitem__(self, param_name: str) -> Any:
+        return self.values[param_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, param_name: str, default: Any = None) -> Any:
+        return self.values.get(param_name, default)
+
+
+@dataclass
+class ParameterResolutionProfile:
+    """Accumulated time spent resolving parameters (profiling switch)."""
+
+    lookups: int = 0
+    lookup_seconds: float = 0.0
+    bindings: int = 0
+    binding_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "lookup_seconds": self.lookup_seconds,
+            "bindings": self.bindings,
+            "binding_seconds": self.binding_seconds,
+            "total_seconds": self.lookup_seconds + self.binding_seconds,
+        }
+
 
 class ParameterLoaderV2:
     """
     Centralized parameter loader that reads from canonical_method_catalogue_v2.json.
     Replaces scattered parameter_loader calls with single source of truth.
+
+    Binding modes (FARFAN_PARAMETER_BINDING, default "static"):
+        static: parameters are bound once per method into frozen
+            MethodParameters objects and calibrated_method is a passthrough.
+        dynamic: parameters are looked up in the catalogue on every call.
+
+    Profiling (FARFAN_PARAMETER_PROFILING=1 or enable_profiling()) records
+    the time spent in catalogue lookups and bindings, so both modes can be
+    compared with profile_report().
     """
 
     _instance: "ParameterLoaderV2 | None" = None
     _catalogue: dict[str, dict[str, Any]] | None = None
     _catalogue_path: Path | None = None
+    _execution_metadata: dict[str, dict[str, Any]] = {}
+    _bindings: dict[str, MethodParameters] = {}
+    _binding_mode: str | None = None  # resolved from BINDING_MODE_ENV on first use
+    _profiling: bool = os.getenv("FARFAN_PARAMETER_PROFILING", "0") == "1"
+    _profile: ParameterResolutionProfile = ParameterResolutionProfile()
 
     def __new__(cls) -> "ParameterLoaderV2":
         if cls._instance is None:
@@ -29,24 +108,38 @@ class ParameterLoaderV2:
 
     def _load_catalogue(self) -> None:
         """Load canonical method catalogue from JSON file."""
-        if self._catalogue_path is None:
-            self._catalogue_path = (
+        cls = type(self)
+        if cls._catalogue_path is None:
+            cls._catalogue_path = (
                 Path(__file__).parent / "canonical_method_catalogue_v2.json"
             )
 
+        cls._bindings = {}
         try:
-            with open(self._catalogue_path, encoding="utf-8") as f:
+            with open(cls._catalogue_path, encoding="utf-8") as f:
                 data = json.load(f)
-                self._catalogue = data.get("methods", {})
+                cls._catalogue = data.get("methods", {})
+                cls._execution_metadata = data.get("execution_metadata", {})
                 logger.info(
-                    f"Loaded {len(self._catalogue)} methods from canonical catalogue v{data['metadata']['version']}"
+                    f"Loaded {len(cls._catalogue)} methods from canonical catalogue v{data['metadata']['version']}"
                 )
         except FileNotFoundError:
-            logger.error(f"Canonical catalogue not found at {self._catalogue_path}")
-            self._catalogue = {}
+            logger.error(f"Canonical catalogue not found at {cls._catalogue_path}")
+            cls._catalogue = {}
+            cls._execution_metadata = {}
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse canonical catalogue: {e}")
-            self._catalogue = {}
+            cls._catalogue = {}
+            cls._execution_metadata = {}
+
+    @classmethod
+    def _methods(cls) -> dict[str, dict[str, Any]]:
+        """Return the loaded catalogue, loading it on first access."""
+        catalogue = cls._catalogue
+        if catalogue is None:
+            cls()
+            catalogue = cls._catalogue
+        return catalogue if catalogue is not None else {}
 
     @classmethod
     def get(cls, method_id: str, param_name: str, default: Any = None) -> Any:
@@ -61,12 +154,14 @@ class ParameterLoaderV2:
         Returns:
             Parameter value or default
         """
-        instance = cls()
-        if instance._catalogue is None:
-            return default
+        if cls._profiling:
+            start = time.perf_counter()
+            value = cls._methods().get(method_id, {}).get(param_name, default)
+            cls._profile.lookups += 1
+            cls._profile.lookup_seconds += time.perf_counter() - start
+            return value
 
-        method_params = instance._catalogue.get(method_id, {})
-        return method_params.get(param_name, default)
+        return cls._methods().get(method_id, {}).get(param_name, default)
 
     @classmethod
     def get_all(cls, method_id: str) -> dict[str, Any]:
@@ -79,14 +174,133 @@ class ParameterLoaderV2:
         Returns:
             Dictionary of all parameters for the method
         """
-        instance = cls()
-        if instance._catalogue is None:
-            return {}
+        if cls._profiling:
+            start = time.perf_counter()
+            params = cls._methods().get(method_id, {})
+            cls._profile.lookups += 1
+            cls._profile.lookup_seconds += time.perf_counter() - start
+            return params
+
+        return cls._methods().get(method_id, {})
+
+    @classmethod
+    def get_execution_metadata(cls, method_key: str) -> dict[str, Any]:
+        """
+        Get execution metadata (e.g. purity) declared for a catalog method.
+
+        Args:
+            method_key: "ClassName.method_name" as used by MethodExecutor
+
+        Returns:
+            Metadata dictionary, empty if nothing is declared
+        """
+        cls._methods()
+        return cls._execution_metadata.get(method_key, {})
+
+    @classmethod
+    def bind(cls, method_id: str) -> MethodParameters:
+        """
+        Resolve all parameters of a method once into a frozen constant object.
+
+        Bindings are cached per method and invalidated by reload().
+
+        Args:
+            method_id: Fully qualified method identifier
 
-        return instance._catalogue.get(method_id, {})
+        Returns:
+            MethodParameters with the method's catalogue values
+
+        Raises:
+            ValueError: If FARFAN_PARAMETER_BINDING holds an invalid mode
+        """
+        bound = cls._bindings.get(method_id)
+        if bound is not None:
+            return bound
+
+        cls.binding_mode()
+
+        start = time.perf_counter() if cls._profiling else 0.0
+        bound = MethodParameters(
+            method_id=method_id,
+            values=MappingProxyType(dict(cls._methods().get(method_id, {}))),
+        )
+        cls._bindings[method_id] = bound
+        if cls._profiling:
+            cls._profile.bindings += 1
+            cls._profile.binding_seconds += time.perf_counter() - start
+        return bound
+
+    @classmethod
+    def bind_all(cls) -> dict[str, MethodParameters]:
+        """
+        Bind every method in the catalogue (bootstrap warm-up).
+
+        Returns:
+            Mapping of method_id to its MethodParameters
+        """
+        return {method_id: cls.bind(method_id) for method_id in cls._methods()}
+
+    @classmethod
+    def binding_mode(cls) -> str:
+        """
+        Current binding mode ("static" or "dynamic").
+
+        Raises:
+            ValueError: If FARFAN_PARAMETER_BINDING holds an invalid mode
+        """
+        if cls._binding_mode is None:
+            cls._binding_mode = _validate_binding_mode(
+                os.getenv(BINDING_MODE_ENV, BINDING_MODE_STATIC), BINDING_MODE_ENV
+            )
+        return cls._binding_mode
+
+    @classmethod
+    def is_static(cls) -> bool:
+        """True when parameters are bound once and decorators are passthroughs."""
+        return cls.binding_mode() == BINDING_MODE_STATIC
+
+    @classmethod
+    def set_binding_mode(cls, mode: str) -> None:
+        """
+        Select the binding mode for methods decorated after this call.
+
+        Args:
+            mode: "static" or "dynamic"
+
+        Raises:
+            ValueError: If mode is not a valid binding mode
+        """
+        cls._binding_mode = _validate_binding_mode(mode, "set_binding_mode()")
+
+    @classmethod
+    def enable_profiling(cls, enabled: bool = True) -> None:
+        """Turn parameter-resolution profiling on or off."""
+        cls._profiling = enabled
+
+    @classmethod
+    def reset_profile(cls) -> None:
+        """Discard accumulated profiling data."""
+        cls._profile = ParameterResolutionProfile()
+
+    @classmethod
+    def profile_report(cls) -> dict[str, Any]:
+        """
+        Report time spent in parameter resolution.
+
+        Returns:
+            Dictionary with binding mode, lookup/binding counts and seconds
+        """
+        return {
+            "binding_mode": cls.binding_mode(),
+            "profiling_enabled": cls._profiling,
+            "bound_methods": len(cls._bindings),
+            **cls._profile.to_dict(),
+        }
 
     @classmethod
     def reload(cls) -> None:
         """Force reload of the catalogue from disk."""
         if cls._instance is not None:
             cls._instance._load_catalogue()
+        else:
+            cls._bindings = {}
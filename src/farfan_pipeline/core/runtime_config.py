@@ -172,6 +172,7 @@ class RuntimeConfig:
         phase_timeout_seconds: Phase timeout in seconds
         max_workers: Maximum worker threads
         batch_size: Batch size for processing
+        graph_metrics_time_budget_ms: Time budget for graph centrality sampling
     """
     
     mode: RuntimeMode
@@ -217,6 +218,7 @@ class RuntimeConfig:
     phase_timeout_seconds: int
     max_workers: int
     batch_size: int
+    graph_metrics_time_budget_ms: int = 2000
     
     # Illegal combinations in PROD mode
     _PROD_ILLEGAL_COMBOS: ClassVar[dict[str, tuple[str, FallbackCategory]]] = {
@@ -308,6 +310,7 @@ class RuntimeConfig:
         phase_timeout_seconds = _parse_int_env("PHASE_TIMEOUT_SECONDS", 300)
         max_workers = _parse_int_env("MAX_WORKERS", 4)
         batch_size = _parse_int_env("BATCH_SIZE", 100)
+        graph_metrics_time_budget_ms = _parse_int_env("GRAPH_METRICS_TIME_BUDGET_MS", 2000)
         
         # Create config instance
         config = cls(
@@ -336,6 +339,7 @@ class RuntimeConfig:
             phase_timeout_seconds=phase_timeout_seconds,
             max_workers=max_workers,
             batch_size=batch_size,
+            graph_metrics_time_budget_ms=graph_metrics_time_budget_ms,
         )
         
         # Validate configuration
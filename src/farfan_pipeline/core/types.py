@@ -8,6 +8,8 @@ layers without creating circular dependencies.
 from __future__ import annotations
 
 import re
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -297,6 +299,44 @@ class PreprocessedDocument:
             return asdict(value)
         return value
 
+    def get_index(self) -> Any:
+        """Return the attached DocumentIndex, or None if none was built yet.
+
+        The index is built by
+        ``farfan_pipeline.processing.document_index.get_document_index``
+        through ``ensure_index``; this layer only stores it.
+
+        Returns:
+            farfan_pipeline.processing.document_index.DocumentIndex or None
+        """
+        return self.__dict__.get("_document_index")
+
+    def ensure_index(self, build: Callable[[PreprocessedDocument], Any]) -> Any:
+        """Return the attached index, building it once with ``build(self)``.
+
+        The index is cached on the instance outside the dataclass fields, so
+        it is shared by all executors without affecting equality, asdict()
+        or method-result fingerprints. Concurrent first calls build it once:
+        the build runs under a per-instance lock (also kept out of the fields).
+        """
+        index = self.__dict__.get("_document_index")
+        if index is not None:
+            return index
+        # dict.setdefault is atomic, so racing callers share one lock
+        lock = self.__dict__.setdefault("_index_lock", threading.Lock())
+        with lock:
+            index = self.__dict__.get("_document_index")
+            if index is None:
+                index = build(self)
+                self.__dict__["_document_index"] = index
+        return index
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be pickled or deep-copied; ensure_index() recreates it
+        state = self.__dict__.copy()
+        state.pop("_index_lock", None)
+        return state
+
     @classmethod
     def ensure(
         cls,
@@ -267,12 +267,13 @@ def run_normalize(
         downgraded_from = None
         
         try:
-            import spacy
+            from farfan_pipeline.compat.model_pool import acquire_spacy
             
-            # Try each model in the chain
+            # Try each model in the chain (loaded once per process, shared)
             for i, model_name in enumerate(model_chain):
                 try:
-                    nlp = spacy.load(model_name)
+                    nlp_handle = acquire_spacy(model_name)
+                    nlp = nlp_handle.model
                     actual_model = model_name
                     
                     # Track if we downgraded
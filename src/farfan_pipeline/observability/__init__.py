@@ -10,8 +10,10 @@ Version: 1.0.0
 """
 
 from farfan_pipeline.observability.opentelemetry_integration import (
+    BatchSpanExporter,
     ExecutorSpanDecorator,
     OpenTelemetryObservability,
+    SamplingPolicy,
     Span,
     SpanContext,
     SpanKind,
@@ -23,8 +25,10 @@ from farfan_pipeline.observability.opentelemetry_integration import (
 )
 
 __all__ = [
+    "BatchSpanExporter",
     "ExecutorSpanDecorator",
     "OpenTelemetryObservability",
+    "SamplingPolicy",
     "Span",
     "SpanContext",
     "SpanKind",
@@ -10,6 +10,13 @@ Date: 2025-11-13
 Version: 1.0.0
 """
 
+from farfan_pipeline.optimization.method_selection import (
+    MethodSelection,
+    MethodSelector,
+    evidence_quality,
+    get_method_selector,
+    reset_method_selector,
+)
 from farfan_pipeline.optimization.rl_strategy import (
     BanditAlgorithm,
     BanditArm,
@@ -26,8 +33,13 @@ __all__ = [
     "BanditArm",
     "EpsilonGreedyAlgorithm",
     "ExecutorMetrics",
+    "MethodSelection",
+    "MethodSelector",
     "OptimizationStrategy",
     "RLStrategyOptimizer",
     "ThompsonSamplingAlgorithm",
     "UCB1Algorithm",
+    "evidence_quality",
+    "get_method_selector",
+    "reset_method_selector",
 ]
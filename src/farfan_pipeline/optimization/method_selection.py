@@ -0,0 +1,579 @@
+"""
+FARFAN Mechanistic Policy Pipeline - Bandit-Driven Method Selection
+===================================================================
+
+Runtime integration of ``RLStrategyOptimizer`` arms with multi-method v3
+contracts. A contract opts in through ``method_binding.method_selection``:
+
+    "method_binding": {
+        "orchestration_mode": "multi_method_pipeline",
+        "method_selection": {"strategy": "thompson_sampling", "latency_budget_ms": 1500},
+        "methods": [
+            {"class_name": "A", "method_name": "extract", "priority": 1},
+            {"class_name": "B", "method_name": "fast", "interchangeable_group": "similarity"},
+            {"class_name": "C", "method_name": "deep", "interchangeable_group": "similarity"},
+            {"class_name": "D", "method_name": "audit", "optional": true,
+             "expected_duration_ms": 400}
+        ]
+    }
+
+Per question (``MethodSelector.select``):
+
+- methods that are neither optional nor in a group always run
+- each interchangeable group runs exactly one method, chosen by the bandit
+- optional methods are ranked by the bandit and added while the expected
+  latency (arm mean duration, else ``expected_duration_ms``) fits the budget
+
+Arms are shared by all questions of a base slot (``D3-Q2`` over the ten
+policy areas). After execution, ``MethodSelector.record`` rewards each method
+that ran with ``ExecutorMetrics`` built from the measured duration and the
+quality of the evidence it produced (``evidence_quality``).
+
+State (arms and per-question decisions) is written atomically to a JSON file
+(``FARFAN_METHOD_SELECTION_STATE``, default ``CACHE_DIR``) every
+``save_every`` recorded outcomes and at interpreter exit. Saves hold an
+exclusive ``flock`` on ``<state>.lock`` and merge with the file: each arm
+adds the outcomes this process recorded since its last save to the stored
+totals, so concurrent workers do not overwrite each other's learning.
+Decisions are grouped per document and only the ``max_documents`` most
+recently touched documents are kept. In replay mode
+(``FARFAN_METHOD_SELECTION_REPLAY=1``) recorded decisions are reused verbatim
+and the state is never updated, so an audit re-run executes exactly the
+methods of the audited run. Without a recorded decision, replay runs every
+method.
+
+Author: FARFAN Team
+Date: 2025-11-13
+Version: 1.0.0
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from farfan_pipeline.optimization.rl_strategy import (
+    BanditArm,
+    ExecutorMetrics,
+    OptimizationStrategy,
+    RLStrategyOptimizer,
+)
+
+logger = logging.getLogger(__name__)
+
+METHOD_SELECTION_STATE_ENV = "FARFAN_METHOD_SELECTION_STATE"
+METHOD_SELECTION_REPLAY_ENV = "FARFAN_METHOD_SELECTION_REPLAY"
+
+_STATE_FORMAT_VERSION = 2
+VALIDATION_FAILED_QUALITY_FACTOR = 0.5
+
+# BanditArm fields that accumulate one term per recorded outcome
+_ADDITIVE_ARM_FIELDS = (
+    "alpha",
+    "beta",
+    "pulls",
+    "successes",
+    "failures",
+    "total_reward",
+    "total_duration_ms",
+    "total_tokens",
+    "total_cost_usd",
+)
+
+
+def method_key(spec: Mapping[str, Any]) -> str:
+    """Arm name of a method spec (``Class.method``)."""
+    return f"{spec['class_name']}.{spec['method_name']}"
+
+
+def default_state_path() -> Path:
+    """State path from ``FARFAN_METHOD_SELECTION_STATE``, else under ``CACHE_DIR``."""
+    value = os.environ.get(METHOD_SELECTION_STATE_ENV)
+    if value:
+        return Path(value)
+    from farfan_pipeline.config.paths import CACHE_DIR
+
+    return CACHE_DIR / "method_selection_state.json"
+
+
+class _FileLock:
+    """Exclusive inter-process lock on a file (no-op without ``fcntl``)."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._fd: int | None = None
+
+    def __enter__(self) -> "_FileLock":
+        if fcntl is not None:
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+def _merge_arm(stored: Mapping[str, Any] | None, arm: BanditArm, baseline: Mapping[str, Any] | None) -> BanditArm:
+    """Stored totals plus what ``arm`` gained since ``baseline`` (its last save)."""
+    if stored is None:
+        return arm
+    merged = BanditArm.from_dict(dict(stored))
+    baseline = baseline or BanditArm(arm_id=arm.arm_id, name=arm.name).to_dict()
+    for name in _ADDITIVE_ARM_FIELDS:
+        setattr(merged, name, getattr(merged, name) + getattr(arm, name) - baseline[name])
+    merged.recent_rewards = arm.recent_rewards
+    return merged
+
+
+def _resolve(path: str, outputs: Mapping[str, Any]) -> Any:
+    current: Any = outputs
+    for part in path.split("."):
+        if isinstance(current, Mapping) and part in current:
+            current = current[part]
+        else:
+            return None
+    return current
+
+
+def _has_content(value: Any) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, (str, bytes, Mapping, Sequence, set, frozenset)):
+        return len(value) > 0
+    return True
+
+
+def evidence_quality(
+    provides: str,
+    method_outputs: Mapping[str, Any],
+    assembly_rules: Sequence[Mapping[str, Any]],
+    validation_passed: bool = True,
+) -> float:
+    """Quality in [0, 1] of the evidence a method contributed.
+
+    For outputs referenced by assembly rules, the fraction of referencing
+    sources that resolved to non-empty values; otherwise 1.0 for a non-empty
+    output and 0.0 for an empty one. Halved when evidence validation failed.
+    """
+    sources = [
+        source
+        for rule in assembly_rules
+        for source in rule.get("sources", [])
+        if source == provides or source.startswith(provides + ".")
+    ]
+    if sources:
+        quality = sum(_has_content(_resolve(s, method_outputs)) for s in sources) / len(sources)
+    else:
+        quality = 1.0 if _has_content(_resolve(provides, method_outputs)) else 0.0
+    if not validation_passed:
+        quality *= VALIDATION_FAILED_QUALITY_FACTOR
+    return quality
+
+
+@dataclass(frozen=True)
+class MethodSelection:
+    """Methods to run for one question, in priority order."""
+
+    base_slot: str
+    decision_key: str
+    selected: list[dict[str, Any]]
+    skipped: dict[str, str] = field(default_factory=dict)  # method key → reason
+    expected_ms: float = 0.0
+    latency_budget_ms: float | None = None
+    replayed: bool = False
+
+    @property
+    def selected_keys(self) -> list[str]:
+        return [method_key(spec) for spec in self.selected]
+
+    def to_trace(self) -> dict[str, Any]:
+        return {
+            "selected": self.selected_keys,
+            "skipped": dict(self.skipped),
+            "expected_ms": self.expected_ms,
+            "latency_budget_ms": self.latency_budget_ms,
+            "replayed": self.replayed,
+        }
+
+
+class MethodSelector:
+    """Chooses method subsets per question and learns from their outcomes.
+
+    Usage:
+        >>> selector = MethodSelector(Path("state.json"))
+        >>> selection = selector.select("D3-Q2", methods, config, question_id="Q252", document_id="plan")
+        >>> # ... run selection.selected, measuring duration and evidence quality ...
+        >>> selector.record(selection, {"A.extract": (True, 120.0, 0.9)})
+        >>> selector.save()  # also every ``save_every`` outcomes and at exit
+    """
+
+    def __init__(
+        self,
+        state_path: Path | None = None,
+        *,
+        replay: bool = False,
+        seed: int = 42,
+        autosave: bool = True,
+        save_every: int = 100,
+        max_documents: int = 32,
+    ) -> None:
+        """
+        Initialize the selector, loading persisted state if present.
+
+        Args:
+            state_path: JSON state file (None keeps state in memory only)
+            replay: Reuse recorded decisions and never update state
+            seed: Base seed; each decision draws from a generator seeded with
+                (seed, decision key, arm pulls), so a run is reproducible
+            autosave: Save after every ``save_every`` recorded outcomes
+            save_every: Recorded outcomes per batched save
+            max_documents: Documents whose decisions are kept (least
+                recently touched are pruned first)
+        """
+        self.state_path = state_path
+        self.replay = replay
+        self.seed = seed
+        self.autosave = autosave
+        self.save_every = max(1, save_every)
+        self.max_documents = max_documents
+        self._lock = threading.Lock()
+        self._optimizers: dict[str, RLStrategyOptimizer] = {}
+        # document id → {"<base_slot>|<question_id>": selected method keys}
+        self._decisions: OrderedDict[str, dict[str, list[str]]] = OrderedDict()
+        # Arm snapshots as of the last load/save, to merge only new outcomes
+        self._baseline: dict[str, dict[str, dict[str, Any]]] = {}
+        self._dirty_documents: set[str] = set()
+        self._pending = 0
+        if state_path is not None and state_path.exists():
+            self._load(state_path)
+
+    # ------------------------------------------------------------------ #
+    # Selection
+    # ------------------------------------------------------------------ #
+
+    def _optimizer(self, base_slot: str, strategy: str) -> RLStrategyOptimizer:
+        optimizer = self._optimizers.get(base_slot)
+        requested = OptimizationStrategy(strategy)
+        if optimizer is None:
+            optimizer = RLStrategyOptimizer(strategy=requested, seed=self.seed)
+            self._optimizers[base_slot] = optimizer
+        elif optimizer.strategy != requested:
+            # Arm statistics are algorithm-agnostic; only the policy changes
+            optimizer.strategy = requested
+            optimizer.algorithm = optimizer._create_algorithm(requested)
+        return optimizer
+
+    def _arms(self, optimizer: RLStrategyOptimizer, specs: Sequence[Mapping[str, Any]]) -> list[BanditArm]:
+        arms = []
+        for spec in specs:
+            key = method_key(spec)
+            arms.append(optimizer.arms.get(key) or optimizer.add_arm(key))
+        return arms
+
+    def _rng(self, decision_key: str, optimizer: RLStrategyOptimizer) -> np.random.Generator:
+        pulls = sum(arm.pulls for arm in optimizer.arms.values())
+        digest = hashlib.sha256(f"{self.seed}|{decision_key}|{pulls}".encode()).digest()
+        return np.random.default_rng(int.from_bytes(digest[:8], "big"))
+
+    @staticmethod
+    def _expected_ms(arm: BanditArm, spec: Mapping[str, Any]) -> float:
+        if arm.pulls:
+            return arm.mean_duration_ms
+        return float(spec.get("expected_duration_ms", 0.0))
+
+    def select(
+        self,
+        base_slot: str,
+        methods: Sequence[dict[str, Any]],
+        config: Mapping[str, Any],
+        *,
+        question_id: str | None = None,
+        document_id: str | None = None,
+    ) -> MethodSelection:
+        """
+        Choose the methods to run for one question.
+
+        Args:
+            base_slot: Contract base slot (arms are shared per slot)
+            methods: ``method_binding.methods`` specs
+            config: ``method_binding.method_selection``
+            question_id: Question identifier (decision key)
+            document_id: Document identifier (decision key)
+
+        Returns:
+            MethodSelection with the selected specs in priority order
+        """
+        ordered = sorted(methods, key=lambda m: m.get("priority", 99))
+        decision_key = f"{document_id}|{base_slot}|{question_id}"
+        document_key = str(document_id)
+        question_key = f"{base_slot}|{question_id}"
+        budget = config.get("latency_budget_ms")
+        budget = float(budget) if budget is not None else None
+
+        with self._lock:
+            if self.replay:
+                recorded = self._decisions.get(document_key, {}).get(question_key)
+                if recorded is None:
+                    logger.warning(f"No recorded method selection for {decision_key}; replay runs all methods")
+                    recorded = [method_key(spec) for spec in ordered]
+                chosen = set(recorded)
+                return MethodSelection(
+                    base_slot=base_slot,
+                    decision_key=decision_key,
+                    selected=[spec for spec in ordered if method_key(spec) in chosen],
+                    skipped={method_key(s): "replay" for s in ordered if method_key(s) not in chosen},
+                    latency_budget_ms=budget,
+                    replayed=True,
+                )
+
+            optimizer = self._optimizer(base_slot, config.get("strategy", OptimizationStrategy.THOMPSON_SAMPLING.value))
+            rng = self._rng(decision_key, optimizer)
+
+            chosen_keys: set[str] = set()
+            skipped: dict[str, str] = {}
+            expected = 0.0
+            groups: dict[str, list[dict[str, Any]]] = {}
+            optional: list[dict[str, Any]] = []
+            for spec in ordered:
+                if spec.get("interchangeable_group"):
+                    groups.setdefault(spec["interchangeable_group"], []).append(spec)
+                elif spec.get("optional"):
+                    optional.append(spec)
+                else:
+                    chosen_keys.add(method_key(spec))
+                    expected += self._expected_ms(self._arms(optimizer, [spec])[0], spec)
+
+            for group, specs in groups.items():
+                arms = self._arms(optimizer, specs)
+                winner = optimizer.algorithm.select_arm(arms, rng)
+                for spec, arm in zip(specs, arms):
+                    if arm is winner:
+                        chosen_keys.add(arm.name)
+                        expected += self._expected_ms(arm, spec)
+                    else:
+                        skipped[arm.name] = f"interchangeable:{group}"
+
+            remaining = dict(zip((method_key(s) for s in optional), zip(optional, self._arms(optimizer, optional))))
+            while remaining:
+                arm = optimizer.algorithm.select_arm([arm for _, arm in remaining.values()], rng)
+                spec, _ = remaining.pop(arm.name)
+                cost = self._expected_ms(arm, spec)
+                if budget is None or expected + cost <= budget:
+                    chosen_keys.add(arm.name)
+                    expected += cost
+                else:
+                    skipped[arm.name] = "latency_budget"
+
+            selection = MethodSelection(
+                base_slot=base_slot,
+                decision_key=decision_key,
+                selected=[spec for spec in ordered if method_key(spec) in chosen_keys],
+                skipped=skipped,
+                expected_ms=expected,
+                latency_budget_ms=budget,
+            )
+            self._decisions.setdefault(document_key, {})[question_key] = selection.selected_keys
+            self._decisions.move_to_end(document_key)
+            self._dirty_documents.add(document_key)
+            self._prune_decisions()
+
+        if skipped:
+            logger.info(f"Method selection {decision_key}: skipped {sorted(skipped)} (expected {expected:.0f}ms)")
+        return selection
+
+    # ------------------------------------------------------------------ #
+    # Learning and persistence
+    # ------------------------------------------------------------------ #
+
+    def record(
+        self,
+        selection: MethodSelection,
+        outcomes: Mapping[str, tuple[bool, float, float]],
+    ) -> None:
+        """
+        Reward the methods that ran.
+
+        Args:
+            selection: Selection returned by ``select``
+            outcomes: method key → (success, duration_ms, evidence quality)
+        """
+        if selection.replayed or self.replay:
+            return
+        with self._lock:
+            optimizer = self._optimizers[selection.base_slot]
+            for key, (success, duration_ms, quality) in outcomes.items():
+                if key not in optimizer.arms:
+                    continue
+                optimizer.arms[key].update(ExecutorMetrics(
+                    executor_name=key,
+                    success=success,
+                    duration_ms=duration_ms,
+                    quality_score=quality,
+                    metadata={"decision_key": selection.decision_key},
+                ))
+            self._pending += 1
+            if self.autosave and self.state_path is not None and self._pending >= self.save_every:
+                self._save_locked(self.state_path)
+
+    def save(self, path: Path | None = None) -> None:
+        """Merge arms and decisions into the state file (no-op in replay mode)."""
+        path = path or self.state_path
+        if path is None or self.replay:
+            return
+        with self._lock:
+            self._save_locked(path)
+
+    def _prune_decisions(self) -> None:
+        while len(self._decisions) > self.max_documents:
+            document_key, _ = self._decisions.popitem(last=False)
+            self._dirty_documents.discard(document_key)
+
+    def _save_locked(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _FileLock(path.with_name(path.name + ".lock")):
+            stored = self._read_state(path) if path.exists() else None
+            stored_slots = stored.get("slots", {}) if stored else {}
+            for slot, optimizer in self._optimizers.items():
+                stored_arms = stored_slots.get(slot, {}).get("arms", {})
+                baseline = self._baseline.get(slot, {})
+                for name, arm in list(optimizer.arms.items()):
+                    optimizer.arms[name] = _merge_arm(stored_arms.get(name), arm, baseline.get(name))
+                for name, arm_data in stored_arms.items():
+                    if name not in optimizer.arms:
+                        optimizer.arms[name] = BanditArm.from_dict(arm_data)
+            for slot, slot_state in stored_slots.items():
+                if slot not in self._optimizers:
+                    self._optimizers[slot] = self._restore_optimizer(slot_state)
+
+            decisions: OrderedDict[str, dict[str, list[str]]] = OrderedDict(
+                (stored or {}).get("decisions", [])
+            )
+            for document_key, questions in self._decisions.items():
+                if document_key in self._dirty_documents:
+                    decisions[document_key] = {**decisions.get(document_key, {}), **questions}
+                    decisions.move_to_end(document_key)
+            self._decisions = decisions
+            self._prune_decisions()
+
+            state = {
+                "format_version": _STATE_FORMAT_VERSION,
+                "seed": self.seed,
+                "slots": {
+                    slot: {
+                        "strategy": optimizer.strategy.value,
+                        "arms": {name: arm.to_dict() for name, arm in optimizer.arms.items()},
+                    }
+                    for slot, optimizer in sorted(self._optimizers.items())
+                },
+                # [document id, decisions] pairs, least recently touched first
+                "decisions": [[document_key, questions] for document_key, questions in self._decisions.items()],
+            }
+            self._write_state(path, state)
+        self._baseline = {slot: slot_state["arms"] for slot, slot_state in state["slots"].items()}
+        self._dirty_documents.clear()
+        self._pending = 0
+
+    @staticmethod
+    def _write_state(path: Path, state: dict[str, Any]) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(state, handle, indent=1, sort_keys=True)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _read_state(path: Path) -> dict[str, Any] | None:
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable method selection state {path}: {exc}")
+            return None
+        if state.get("format_version") != _STATE_FORMAT_VERSION:
+            logger.warning(f"Ignoring method selection state {path} with format {state.get('format_version')}")
+            return None
+        return state
+
+    def _restore_optimizer(self, slot_state: Mapping[str, Any]) -> RLStrategyOptimizer:
+        optimizer = RLStrategyOptimizer(strategy=OptimizationStrategy(slot_state["strategy"]), seed=self.seed)
+        for name, arm_data in slot_state["arms"].items():
+            optimizer.arms[name] = BanditArm.from_dict(arm_data)
+        return optimizer
+
+    def _load(self, path: Path) -> None:
+        state = self._read_state(path)
+        if state is None:
+            return
+        for slot, slot_state in state.get("slots", {}).items():
+            self._optimizers[slot] = self._restore_optimizer(slot_state)
+            self._baseline[slot] = dict(slot_state["arms"])
+        self._decisions = OrderedDict(state.get("decisions", []))
+        self._prune_decisions()
+        logger.info(f"Loaded method selection state for {len(self._optimizers)} slots from {path}")
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Per-slot optimizer statistics."""
+        with self._lock:
+            return {slot: optimizer.get_statistics() for slot, optimizer in self._optimizers.items()}
+
+
+_selector_lock = threading.Lock()
+_selector: MethodSelector | None = None
+
+
+def get_method_selector() -> MethodSelector:
+    """Process-wide selector over ``default_state_path()``."""
+    global _selector
+    if _selector is None:
+        with _selector_lock:
+            if _selector is None:
+                replay = os.environ.get(METHOD_SELECTION_REPLAY_ENV, "0") == "1"
+                _selector = MethodSelector(default_state_path(), replay=replay)
+                atexit.register(_selector.save)
+    return _selector
+
+
+def reset_method_selector() -> None:
+    """Save and forget the process-wide selector (tests, or after changing the env)."""
+    global _selector
+    with _selector_lock:
+        if _selector is not None:
+            atexit.unregister(_selector.save)
+            _selector.save()
+        _selector = None
+
+
+__all__ = [
+    "METHOD_SELECTION_REPLAY_ENV",
+    "METHOD_SELECTION_STATE_ENV",
+    "MethodSelection",
+    "MethodSelector",
+    "default_state_path",
+    "evidence_quality",
+    "get_method_selector",
+    "method_key",
+    "reset_method_selector",
+]
@@ -23,7 +23,6 @@ Version: 1.0.0
 import json
 import logging
 import math
-import random
 from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass, field
@@ -237,9 +236,33 @@ class BanditArm:
             "success_rate": self.success_rate,
             "mean_duration_ms": self.mean_duration_ms,
             "mean_cost_usd": self.mean_cost_usd,
-            "total_tokens": self.total_tokens
+            "total_tokens": self.total_tokens,
+            "successes": self.successes,
+            "failures": self.failures,
+            "total_reward": self.total_reward,
+            "total_duration_ms": self.total_duration_ms,
+            "total_cost_usd": self.total_cost_usd,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BanditArm":
+        """Restore an arm from ``to_dict`` output (exact totals when present)."""
+        pulls = data["pulls"]
+        successes = data.get("successes", int(data["success_rate"] * pulls))
+        return cls(
+            arm_id=data["arm_id"],
+            name=data["name"],
+            alpha=data["alpha"],
+            beta=data["beta"],
+            pulls=pulls,
+            total_reward=data.get("total_reward", data["mean_reward"] * pulls),
+            successes=successes,
+            failures=data.get("failures", pulls - successes),
+            total_duration_ms=data.get("total_duration_ms", data["mean_duration_ms"] * pulls),
+            total_tokens=data["total_tokens"],
+            total_cost_usd=data.get("total_cost_usd", data["mean_cost_usd"] * pulls),
+        )
+
 
 class BanditAlgorithm(ABC):
     """Base class for bandit algorithms."""
@@ -315,7 +338,7 @@ class UCB1Algorithm(BanditAlgorithm):
         # Force exploration of unplayed arms first
         unplayed = [arm for arm in arms if arm.pulls == 0]
         if unplayed:
-            selected = random.choice(unplayed)
+            selected = unplayed[int(rng.integers(len(unplayed)))]
             logger.debug(f"UCB1: Exploring unplayed arm {selected.name}")
             return selected
 
@@ -368,7 +391,7 @@ class EpsilonGreedyAlgorithm(BanditAlgorithm):
 
         # Explore with probability epsilon
         if rng.random() < self.epsilon:
-            selected = random.choice(arms)
+            selected = arms[int(rng.integers(len(arms)))]
             logger.debug(f"Epsilon-Greedy: Exploring {selected.name} (ε={self.epsilon:.4f})")
             return selected
 
@@ -561,20 +584,7 @@ class RLStrategyOptimizer:
         # Restore arms
         self.arms.clear()
         for name, arm_data in state["arms"].items():
-            arm = BanditArm(
-                arm_id=arm_data["arm_id"],
-                name=arm_data["name"],
-                alpha=arm_data["alpha"],
-                beta=arm_data["beta"],
-                pulls=arm_data["pulls"],
-                total_reward=arm_data["mean_reward"] * arm_data["pulls"],
-                successes=int(arm_data["success_rate"] * arm_data["pulls"]),
-                failures=arm_data["pulls"] - int(arm_data["success_rate"] * arm_data["pulls"]),
-                total_duration_ms=arm_data["mean_duration_ms"] * arm_data["pulls"],
-                total_tokens=arm_data["total_tokens"],
-                total_cost_usd=arm_data["mean_cost_usd"] * arm_data["pulls"]
-            )
-            self.arms[name] = arm
+            self.arms[name] = BanditArm.from_dict(arm_data)
 
         logger.info(f"Loaded optimizer state from {input_path}")
 
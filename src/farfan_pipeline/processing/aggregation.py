@@ -40,6 +40,7 @@ from farfan_pipeline.processing.uncertainty_quantification import (
     BootstrapAggregator,
     UncertaintyMetrics,
     aggregate_with_uncertainty,
+    aggregate_with_uncertainty_batch,
 )
 from farfan_pipeline.processing.choquet_adapter import (
     ChoquetProcessingAdapter,
@@ -672,16 +673,17 @@ class DimensionAggregator:
 
         weight_sum = sum(weights)
         tolerance = 1e-6
+        params = ParameterLoaderV2.bind("farfan_core.processing.aggregation.DimensionAggregator.validate_weights")
 
-        if abs(weight_sum - ParameterLoaderV2.get("farfan_core.processing.aggregation.DimensionAggregator.validate_weights", "auto_param_L603_28", 1.0)) > tolerance:
-            expected_weight = ParameterLoaderV2.get("farfan_core.processing.aggregation.DimensionAggregator.validate_weights", "auto_param_L604_81", 1.0)
+        if abs(weight_sum - params.get("auto_param_L603_28", 1.0)) > tolerance:
+            expected_weight = params.get("auto_param_L604_81", 1.0)
             msg = f"Weight sum validation failed: sum={weight_sum:.6f}, expected={expected_weight}"
             logger.error(msg)
             if self.abort_on_insufficient:
                 raise WeightValidationError(msg)
             return False, msg
 
-        logger.debug(f"Weight validation passed: sum={weight_sum:.6f}")
+        logger.debug("Weight validation passed: sum=%.6f", weight_sum)
         return True, "Weights valid"
 
     def validate_coverage(
@@ -735,12 +737,14 @@ class DimensionAggregator:
         Raises:
             WeightValidationError: If the weights are invalid (e.g., mismatched length).
         """
+        params = ParameterLoaderV2.bind("farfan_core.processing.aggregation.DimensionAggregator.validate_weights")
+
         if not scores:
-            return ParameterLoaderV2.get("farfan_core.processing.aggregation.DimensionAggregator.validate_weights", "auto_param_L665_19", 0.0)
+            return params.get("auto_param_L665_19", 0.0)
 
         if weights is None:
             # Equal weights
-            weights = [ParameterLoaderV2.get("farfan_core.processing.aggregation.DimensionAggregator.validate_weights", "auto_param_L669_23", 1.0) / len(scores)] * len(scores)
+            weights = [params.get("auto_param_L669_23", 1.0) / len(scores)] * len(scores)
 
         # Validate weights length matches scores length
         if len(weights) != len(scores):
@@ -761,10 +765,13 @@ class DimensionAggregator:
         # Calculate weighted sum
         weighted_sum = sum(s * w for s, w in zip(scores, weights, strict=False))
 
-        logger.debug(
-            f"Weighted average calculated: "
-            f"scores={scores}, weights={weights}, result={weighted_sum:.4f}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Weighted average calculated: scores=%s, weights=%s, result=%.4f",
+                scores,
+                weights,
+                weighted_sum,
+            )
 
         return weighted_sum
 
@@ -774,6 +781,7 @@ class DimensionAggregator:
         weights: list[float] | None = None,
         method: str = "choquet",
         compute_uncertainty: bool = True,
+        uncertainty: UncertaintyMetrics | None = None,
     ) -> tuple[float, UncertaintyMetrics | None]:
         """
         SOTA aggregation with Choquet integral and uncertainty quantification.
@@ -788,6 +796,8 @@ class DimensionAggregator:
             weights: Optional weights (default: uniform)
             method: Aggregation method ("choquet" or "weighted_average")
             compute_uncertainty: Whether to compute uncertainty metrics
+            uncertainty: Precomputed uncertainty metrics (from
+                aggregate_uncertainty_batch); skips the bootstrap if given
         
         Returns:
             Tuple of (aggregated_score, uncertainty_metrics)
@@ -811,8 +821,9 @@ class DimensionAggregator:
             raise ValueError(f"Unknown aggregation method: {method}")
         
         # Compute uncertainty if requested
-        uncertainty = None
-        if compute_uncertainty and self.bootstrap_aggregator:
+        if not compute_uncertainty:
+            uncertainty = None
+        elif uncertainty is None and self.bootstrap_aggregator:
             _, uncertainty = aggregate_with_uncertainty(
                 scores, weights, n_bootstrap=1000, random_seed=42
             )
@@ -824,6 +835,31 @@ class DimensionAggregator:
         
         return score, uncertainty
 
+    def aggregate_uncertainty_batch(
+        self,
+        groups: list[tuple[list[float], list[float] | None]],
+    ) -> list[UncertaintyMetrics]:
+        """
+        Bootstrap uncertainty for all groups of a level in one call.
+
+        Results are identical to computing each group in aggregate_with_sota.
+
+        Args:
+            groups: (scores, weights) per aggregation group
+
+        Returns:
+            UncertaintyMetrics per group, in input order
+
+        Raises:
+            ValueError: If any group is empty or has mismatched weights
+        """
+        return [
+            uncertainty
+            for _, uncertainty in aggregate_with_uncertainty_batch(
+                groups, n_bootstrap=1000, random_seed=42
+            )
+        ]
+
     def apply_rubric_thresholds(
         self,
         score: float,
@@ -878,6 +914,7 @@ class DimensionAggregator:
         scored_results: list[ScoredResult],
         group_by_values: dict[str, Any],
         weights: list[float] | None = None,
+        uncertainty: UncertaintyMetrics | None = None,
     ) -> DimensionScore:
         """
         Aggregate a single dimension from micro question results.
@@ -886,6 +923,7 @@ class DimensionAggregator:
             scored_results: List of scored results for this dimension/area.
             group_by_values: Dictionary of grouping keys and their values.
             weights: Optional weights for questions (defaults to equal weights).
+            uncertainty: Precomputed uncertainty for this group (see run()).
 
         Returns:
             DimensionScore with aggregated score and quality level.
@@ -956,6 +994,7 @@ class DimensionAggregator:
                     resolved_weights,
                     method="choquet",
                     compute_uncertainty=True,
+                    uncertainty=uncertainty,
                 )
                 validation_details["aggregation"] = {
                     "method": "choquet",
@@ -1069,14 +1108,49 @@ class DimensionAggregator:
             return tuple(getattr(r, key) for key in group_by_keys)
         grouped_results = group_by(scored_results, key_func)
 
+        uncertainties = self._batch_uncertainties(grouped_results, group_by_keys)
+
         dimension_scores = []
         for group_key, results in grouped_results.items():
             group_by_values = dict(zip(group_by_keys, group_key, strict=False))
-            score = self.aggregate_dimension(results, group_by_values)
+            score = self.aggregate_dimension(
+                results, group_by_values, uncertainty=uncertainties.get(group_key)
+            )
             dimension_scores.append(score)
 
         return dimension_scores
 
+    def _batch_uncertainties(
+        self,
+        grouped_results: dict[tuple, list[ScoredResult]],
+        group_by_keys: list[str],
+    ) -> dict[tuple, UncertaintyMetrics]:
+        """Bootstrap all groups eligible for SOTA aggregation in one batch."""
+        if not self.enable_sota_features:
+            return {}
+
+        group_keys = []
+        groups = []
+        for group_key, results in grouped_results.items():
+            if len(results) < 3:
+                continue
+            group_by_values = dict(zip(group_by_keys, group_key, strict=False))
+            dimension_id = group_by_values.get("dimension", "UNKNOWN")
+            group_keys.append(group_key)
+            groups.append((
+                [r.score for r in results],
+                self._resolve_dimension_weights(dimension_id, results),
+            ))
+
+        if not groups:
+            return {}
+        try:
+            return dict(zip(group_keys, self.aggregate_uncertainty_batch(groups), strict=True))
+        except Exception as e:
+            # Groups fall back to per-group computation in aggregate_dimension
+            logger.warning(f"Batched uncertainty failed, computing per group: {e}")
+            return {}
+
     @calibrated_method("farfan_core.processing.aggregation.DimensionAggregator._expected_question_count")
     def _expected_question_count(self, area_id: str, dimension_id: str) -> int | None:
         if not self.aggregation_settings.dimension_expected_counts:
@@ -0,0 +1,1030 @@
+"""
+Columnar Aggregation Engine - FASE 4-7 over NumPy structured arrays
+
+Alternative to running DimensionAggregator → AreaPolicyAggregator →
+ClusterAggregator → MacroAggregator object by object. Scored results of any
+number of documents are loaded into one ``ScoreTable`` (a NumPy structured
+array with integer-coded document / policy area / dimension / slot columns);
+dimension, area, cluster and macro scores are then computed with group-level
+array reductions, using the weights of ``AggregationSettings`` as dense
+arrays.
+
+Results are identical to the object aggregators, including floating point:
+- weighted averages and means reduce each group with Python's ``sum()``
+- Choquet scores (SOTA mode, groups of 3+) use ``np.sum`` like
+  ChoquetProcessingAdapter
+- variance → std powers are taken on Python floats
+
+``ColumnarAggregation`` keeps the per-level arrays and materializes the
+usual DimensionScore / AreaScore / ClusterScore / MacroScore objects on
+demand. Re-aggregating a table after a weight change only needs a new engine:
+
+    table = ScoreTable.from_results({"plan_a": results_a, "plan_b": results_b})
+    engine = ColumnarAggregationEngine(monolith, aggregation_settings=settings)
+    macro = engine.aggregate(table).macro_scores      # one value per document
+
+Differences from the object path: only the default group-by keys are
+supported, no AggregationDAG provenance is recorded, and per-group logging
+is replaced by one summary line.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from farfan_pipeline.core.parameters import ParameterLoaderV2
+from farfan_pipeline.processing.aggregation import (
+    AggregationSettings,
+    AreaScore,
+    ClusterAggregator,
+    ClusterScore,
+    DimensionScore,
+    MacroScore,
+    ScoredResult,
+    WeightValidationError,
+    validate_scored_results,
+)
+from farfan_pipeline.processing.uncertainty_quantification import (
+    UncertaintyMetrics,
+    aggregate_with_uncertainty_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+_DIMENSION_PARAMS = "farfan_core.processing.aggregation.DimensionAggregator.validate_weights"
+_AREA_PARAMS = "farfan_core.processing.aggregation.AreaPolicyAggregator.normalize_scores"
+_CLUSTER_PARAMS = "farfan_core.processing.aggregation.ClusterAggregator.analyze_coherence"
+
+QUALITY_LEVELS = ("EXCELENTE", "BUENO", "ACEPTABLE", "INSUFICIENTE")
+_INSUFICIENTE = 3
+
+SCORE_TABLE_DTYPE = np.dtype([
+    ("document", "<i4"),
+    ("area", "<i4"),
+    ("dimension", "<i4"),
+    ("slot", "<i4"),
+    ("question_global", "<i8"),
+    ("score", "<f8"),
+])
+
+_DEFAULT_GROUP_BY = {
+    "dimension": ["policy_area", "dimension"],
+    "area": ["area_id"],
+    "cluster": ["cluster_id"],
+}
+
+
+class _Vocabulary:
+    """String ↔ dense integer code mapping, codes in first-seen order."""
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self._codes: dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def get(self, value: Any) -> int | None:
+        return self._codes.get(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class _Groups:
+    """Rows grouped by key, groups in first-appearance order, rows stable within a group."""
+
+    order: NDArray[np.intp]    # row indices sorted by group
+    starts: NDArray[np.intp]   # group start offsets into ``order``
+    counts: NDArray[np.intp]
+    first_rows: NDArray[np.intp]  # first row of each group
+    group_of: NDArray[np.intp]    # group id of each row
+
+    @classmethod
+    def from_keys(cls, *columns: NDArray[np.integer]) -> _Groups:
+        n = len(columns[0])
+        if n == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return cls(empty, empty, empty, empty, empty)
+        codes = np.zeros(n, dtype=np.int64)
+        for column in columns:
+            column = np.asarray(column, dtype=np.int64)
+            codes = codes * (int(column.max()) + 2) + (column + 1)
+        _, first_index, inverse = np.unique(codes, return_index=True, return_inverse=True)
+        # Renumber groups by first appearance, like group_by()'s dict insertion order
+        rank = np.empty(len(first_index), dtype=np.intp)
+        rank[np.argsort(first_index, kind="stable")] = np.arange(len(first_index))
+        group_of = rank[inverse.reshape(-1)]
+        order = np.argsort(group_of, kind="stable")
+        counts = np.bincount(group_of, minlength=len(first_index))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+        return cls(order, starts, counts, order[starts], group_of)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def members(self, group: int) -> NDArray[np.intp]:
+        start = self.starts[group]
+        return self.order[start:start + self.counts[group]]
+
+    def padded(self, values: NDArray[np.float64], fill: float = 0.0) -> NDArray[np.float64]:
+        """(groups × max group size) matrix of ``values``, padded with ``fill``."""
+        width = int(self.counts.max()) if len(self.counts) else 0
+        matrix = np.full((len(self.counts), width), fill, dtype=np.float64)
+        position = np.arange(len(self.order)) - np.repeat(self.starts, self.counts)
+        matrix[self.group_of[self.order], position] = values[self.order]
+        return matrix
+
+    def builtin_sum(self, values: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Per-group builtin ``sum()`` over the row values in row order.
+
+        Python's ``sum`` compensates float rounding (CPython 3.12+), so the
+        groups are reduced with it rather than by array additions to match
+        the object aggregators bit for bit.
+        """
+        flat = values[self.order].tolist()
+        return np.array(
+            [sum(flat[start:start + count]) for start, count in zip(self.starts.tolist(), self.counts.tolist())],
+            dtype=np.float64,
+        )
+
+
+class ScoreTable:
+    """Scored micro-question results of one or more documents in columnar form."""
+
+    def __init__(
+        self,
+        rows: NDArray[np.void],
+        documents: list[str],
+        areas: list[str],
+        dimensions: list[str],
+        slots: list[str],
+    ) -> None:
+        self.rows = rows
+        self.documents = documents
+        self.areas = areas
+        self.dimensions = dimensions
+        self.slots = slots
+        self._dimension_groups: _Groups | None = None
+
+    @classmethod
+    def from_results(
+        cls,
+        results_by_document: Mapping[str, Sequence[ScoredResult | dict[str, Any]]],
+    ) -> ScoreTable:
+        """Load results per document id (dicts are validated like the object pipeline)."""
+        documents, areas, dimensions, slots = _Vocabulary(), _Vocabulary(), _Vocabulary(), _Vocabulary()
+        records = []
+        for document_id, results in results_by_document.items():
+            document = documents.code(document_id)
+            if results and isinstance(results[0], dict):
+                results = validate_scored_results(list(results))
+            for result in results:
+                records.append((
+                    document,
+                    areas.code(result.policy_area),
+                    dimensions.code(result.dimension),
+                    slots.code(result.base_slot),
+                    result.question_global,
+                    result.score,
+                ))
+        rows = np.array(records, dtype=SCORE_TABLE_DTYPE)
+        return cls(rows, documents.values, areas.values, dimensions.values, slots.values)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def dimension_groups(self) -> _Groups:
+        """Rows grouped by (document, policy area, dimension); depends only on the table."""
+        if self._dimension_groups is None:
+            self._dimension_groups = _Groups.from_keys(
+                self.rows["document"], self.rows["area"], self.rows["dimension"]
+            )
+        return self._dimension_groups
+
+
+def _quality_codes(scores: NDArray[np.float64], method: str, clamp_key: str) -> NDArray[np.intp]:
+    """Vectorized apply_rubric_thresholds (default thresholds) → index into QUALITY_LEVELS."""
+    params = ParameterLoaderV2.bind(method)
+    normalized = np.maximum(params.get(clamp_key, 0.0), np.minimum(3.0, scores)) / 3.0
+    codes = np.full(len(scores), _INSUFICIENTE, dtype=np.intp)
+    codes[normalized >= params.get("acceptable_threshold", 0.55)] = 2
+    codes[normalized >= params.get("good_threshold", 0.7)] = 1
+    codes[normalized >= params.get("excellent_threshold", 0.85)] = 0
+    return codes
+
+
+def _check_weight_sums(sums: NDArray[np.float64]) -> None:
+    """DimensionAggregator.validate_weights for every group at once."""
+    params = ParameterLoaderV2.bind(_DIMENSION_PARAMS)
+    bad = np.flatnonzero(np.abs(sums - params.get("auto_param_L603_28", 1.0)) > 1e-6)
+    if len(bad):
+        expected_weight = params.get("auto_param_L604_81", 1.0)
+        raise WeightValidationError(
+            f"Weight sum validation failed: sum={sums[bad[0]]:.6f}, expected={expected_weight}"
+        )
+
+
+def _dense_weights(
+    mapping: Mapping[str, Mapping[str, float]],
+    rows: Sequence[str | None],
+    columns: Sequence[str],
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """``mapping[row][column]`` as a dense matrix (NaN where missing) and a has-mapping mask."""
+    matrix = np.full((len(rows), len(columns)), np.nan, dtype=np.float64)
+    present = np.zeros(len(rows), dtype=bool)
+    column_index = {value: i for i, value in enumerate(columns)}
+    for i, row in enumerate(rows):
+        weights = mapping.get(row)
+        if not weights:
+            continue
+        present[i] = True
+        for key, weight in weights.items():
+            j = column_index.get(key)
+            if j is not None:
+                matrix[i, j] = weight
+    return matrix, present
+
+
+def _resolve_group_weights(
+    groups: _Groups,
+    raw: NDArray[np.float64],
+    has_mapping: NDArray[np.bool_],
+) -> tuple[NDArray[np.bool_], NDArray[np.float64]]:
+    """Vectorized _resolve_*_weights: (group uses explicit weights, normalized row weights)."""
+    missing = np.isnan(raw)
+    any_missing = np.zeros(len(groups), dtype=bool)
+    np.logical_or.at(any_missing, groups.group_of, missing)
+    totals = groups.builtin_sum(np.where(missing, 0.0, raw))
+    resolved = has_mapping & ~any_missing & (totals > 0)
+    normalized = np.where(resolved[groups.group_of], raw / np.where(resolved, totals, 1.0)[groups.group_of], np.nan)
+    return resolved, normalized
+
+
+def _weighted_average(
+    groups: _Groups,
+    scores: NDArray[np.float64],
+    resolved: NDArray[np.bool_],
+    weights: NDArray[np.float64],
+    validate: NDArray[np.bool_] | None = None,
+) -> NDArray[np.float64]:
+    """calculate_weighted_average per group (equal weights where not resolved).
+
+    Weight sums are validated for the groups in ``validate`` (all by default).
+    """
+    equal = ParameterLoaderV2.bind(_DIMENSION_PARAMS).get("auto_param_L669_23", 1.0) / groups.counts
+    row_weights = np.where(resolved[groups.group_of], weights, equal[groups.group_of])
+    sums = groups.builtin_sum(row_weights)
+    _check_weight_sums(sums if validate is None else sums[validate])
+    return groups.builtin_sum(scores * row_weights)
+
+
+@dataclass
+class _DimensionLevel:
+    groups: _Groups
+    document: NDArray[np.intp]
+    area: NDArray[np.intp]
+    dimension: NDArray[np.intp]
+    score: NDArray[np.float64]
+    quality: NDArray[np.intp]
+    coverage_ok: NDArray[np.bool_]
+    coverage_failed: NDArray[np.bool_]  # aborted on coverage → zero score
+    expected: NDArray[np.intp]
+    choquet: NDArray[np.bool_]
+    resolved: NDArray[np.bool_]
+    row_weights: NDArray[np.float64]
+    uncertainty: dict[int, UncertaintyMetrics]
+
+
+@dataclass
+class _AreaLevel:
+    groups: _Groups          # over dimension groups
+    document: NDArray[np.intp]
+    area: NDArray[np.intp]
+    score: NDArray[np.float64]
+    quality: NDArray[np.intp]
+    hermetic: list[tuple[bool, str]]
+    failed: NDArray[np.bool_]
+    cluster: list[str | None]
+
+
+@dataclass
+class _ClusterLevel:
+    groups: _Groups          # over area groups
+    document: NDArray[np.intp]
+    cluster: list[str | None]
+    score: NDArray[np.float64]
+    raw_score: NDArray[np.float64]
+    coherence: NDArray[np.float64]
+    variance: NDArray[np.float64]
+    std_dev: list[float]
+    penalty: NDArray[np.float64]
+    weakest: NDArray[np.intp]        # area group id of the weakest area
+    resolved: NDArray[np.bool_]
+    row_weights: NDArray[np.float64]
+    status: list[tuple[str, str]]    # ("ok" | "config" | "hermeticity" | "weights", message)
+    hermetic: list[tuple[bool, str]]
+
+
+@dataclass
+class _MacroLevel:
+    score: NDArray[np.float64]
+    quality: NDArray[np.intp]
+    coherence: NDArray[np.float64]
+    alignment: NDArray[np.float64]
+    has_clusters: NDArray[np.bool_]
+
+
+class ColumnarAggregationEngine:
+    """Vectorized FASE 4-7 aggregation over a ScoreTable.
+
+    Args:
+        monolith: Questionnaire monolith (policy areas, dimensions, clusters)
+        abort_on_insufficient: Same meaning as for the object aggregators
+        aggregation_settings: Resolved settings; derived from the monolith if omitted
+        enable_sota_features: Choquet aggregation (and uncertainty) for groups of 3+
+        compute_uncertainty: Bootstrap dimension uncertainty in SOTA mode. Disable
+            for fast re-weighting; scores are unaffected, uncertainty fields stay empty.
+    """
+
+    def __init__(
+        self,
+        monolith: dict[str, Any],
+        abort_on_insufficient: bool = True,
+        aggregation_settings: AggregationSettings | None = None,
+        enable_sota_features: bool = True,
+        compute_uncertainty: bool = True,
+    ) -> None:
+        self.monolith = monolith
+        self.abort_on_insufficient = abort_on_insufficient
+        self.aggregation_settings = aggregation_settings or AggregationSettings.from_monolith(monolith)
+        self.enable_sota_features = enable_sota_features
+        self.compute_uncertainty = compute_uncertainty
+
+        for level, default in _DEFAULT_GROUP_BY.items():
+            keys = getattr(self.aggregation_settings, f"{level}_group_by_keys")
+            if keys and keys != default:
+                raise ValueError(
+                    f"Columnar aggregation supports the default {level} group-by keys "
+                    f"{default} only, got {keys}"
+                )
+
+        niveles = monolith["blocks"]["niveles_abstraccion"]
+        self.policy_areas = niveles["policy_areas"]
+        self.dimensions = niveles["dimensions"]
+        self.clusters = niveles["clusters"]
+
+    # ------------------------------------------------------------------ #
+    # FASE 4: dimensions
+    # ------------------------------------------------------------------ #
+
+    def _aggregate_dimensions(self, table: ScoreTable) -> _DimensionLevel:
+        settings = self.aggregation_settings
+        rows = table.rows
+        groups = table.dimension_groups
+        first = groups.first_rows
+        document = rows["document"][first].astype(np.intp)
+        area = rows["area"][first].astype(np.intp)
+        dimension = rows["dimension"][first].astype(np.intp)
+        counts = groups.counts
+
+        # Coverage
+        expected = np.full(len(groups), 5, dtype=np.intp)
+        if settings.dimension_expected_counts:
+            for g in range(len(groups)):
+                count = settings.dimension_expected_counts.get(
+                    (table.areas[area[g]], table.dimensions[dimension[g]])
+                )
+                if count:
+                    expected[g] = count
+        coverage_ok = counts >= expected
+        coverage_failed = ~coverage_ok & self.abort_on_insufficient
+
+        # Weights: dense (dimension × slot) matrix gathered per row
+        raw, has_mapping = _dense_weights(settings.dimension_question_weights, table.dimensions, table.slots)
+        raw_rows = raw[rows["dimension"], rows["slot"]]
+        resolved, row_weights = _resolve_group_weights(groups, raw_rows, has_mapping[dimension])
+
+        scores = rows["score"]
+        choquet = (counts >= 3) & self.enable_sota_features & ~coverage_failed
+        score = np.zeros(len(groups), dtype=np.float64)
+
+        standard = ~choquet & ~coverage_failed
+        if standard.any():
+            averages = _weighted_average(groups, scores, resolved, row_weights, validate=standard)
+            score[standard] = averages[standard]
+
+        # ChoquetProcessingAdapter.aggregate without interaction pairs, bucketed by size
+        for size in np.unique(counts[choquet]):
+            members = np.flatnonzero(choquet & (counts == size))
+            index = groups.starts[members][:, None] + np.arange(size)
+            row_index = groups.order[index]
+            matrix = scores[row_index]
+            weight_matrix = np.where(
+                resolved[members][:, None], row_weights[row_index], np.ones(size) / size
+            )
+            weight_matrix = np.where(
+                resolved[members][:, None],
+                weight_matrix / np.sum(weight_matrix, axis=1, keepdims=True),
+                weight_matrix,
+            )
+            score[members] = np.sum(weight_matrix * matrix, axis=1)
+
+        score[coverage_failed] = ParameterLoaderV2.bind(_DIMENSION_PARAMS).get("auto_param_L795_22", 0.0)
+        quality = _quality_codes(score, _DIMENSION_PARAMS, "auto_param_L714_28")
+        quality[coverage_failed] = _INSUFICIENTE
+
+        uncertainty: dict[int, UncertaintyMetrics] = {}
+        if self.enable_sota_features and self.compute_uncertainty and choquet.any():
+            members = np.flatnonzero(choquet)
+            batch = [
+                (
+                    scores[groups.members(g)].tolist(),
+                    row_weights[groups.members(g)].tolist() if resolved[g] else None,
+                )
+                for g in members
+            ]
+            for g, (_, metrics) in zip(members, aggregate_with_uncertainty_batch(
+                batch, n_bootstrap=1000, random_seed=42
+            ), strict=True):
+                uncertainty[int(g)] = metrics
+
+        return _DimensionLevel(
+            groups, document, area, dimension, score, quality, coverage_ok, coverage_failed,
+            expected, choquet, resolved, row_weights, uncertainty,
+        )
+
+    # ------------------------------------------------------------------ #
+    # FASE 5: policy areas
+    # ------------------------------------------------------------------ #
+
+    def _area_hermeticity(self, area_id: str, dimension_ids: list[str]) -> tuple[bool, str]:
+        area_def = next((a for a in self.policy_areas if a["policy_area_id"] == area_id), None)
+        if area_def and "dimension_ids" in area_def:
+            expected_dimension_ids = set(area_def["dimension_ids"])
+        else:
+            expected_dimension_ids = {d["dimension_id"] for d in self.dimensions}
+        actual_dimension_ids = set(dimension_ids)
+
+        missing_dims = expected_dimension_ids - actual_dimension_ids
+        if missing_dims:
+            return False, f"Hermeticity violation for area {area_id}: missing dimensions {missing_dims}"
+        extra_dims = actual_dimension_ids - expected_dimension_ids
+        if extra_dims:
+            return False, f"Hermeticity violation for area {area_id}: unexpected dimensions {extra_dims}"
+        if len(dimension_ids) != len(actual_dimension_ids):
+            return False, f"Hermeticity violation for area {area_id}: duplicate dimensions found"
+        return True, "Hermeticity validated"
+
+    def _aggregate_areas(self, table: ScoreTable, dims: _DimensionLevel) -> _AreaLevel:
+        groups = _Groups.from_keys(dims.document, dims.area)
+        document = dims.document[groups.first_rows]
+        area = dims.area[groups.first_rows]
+
+        hermetic = [
+            self._area_hermeticity(
+                table.areas[area[g]],
+                [table.dimensions[d] for d in dims.dimension[groups.members(g)]],
+            )
+            for g in range(len(groups))
+        ]
+        failed = np.array([not ok for ok, _ in hermetic], dtype=bool) & self.abort_on_insufficient
+
+        raw, has_mapping = _dense_weights(
+            self.aggregation_settings.policy_area_dimension_weights, table.areas, table.dimensions
+        )
+        resolved, row_weights = _resolve_group_weights(groups, raw[dims.area, dims.dimension], has_mapping[area])
+        score = _weighted_average(groups, dims.score, resolved, row_weights, validate=~failed)
+        score[failed] = ParameterLoaderV2.bind(_AREA_PARAMS).get("auto_param_L1249_22", 0.0)
+        quality = _quality_codes(score, _AREA_PARAMS, "auto_param_L1170_28")
+        quality[failed] = _INSUFICIENTE
+
+        area_to_cluster = {
+            area_id: cluster["cluster_id"]
+            for cluster in self.clusters
+            for area_id in cluster["policy_area_ids"]
+        }
+        cluster = [area_to_cluster.get(table.areas[a]) for a in area]
+        return _AreaLevel(groups, document, area, score, quality, hermetic, failed, cluster)
+
+    # ------------------------------------------------------------------ #
+    # FASE 6: clusters
+    # ------------------------------------------------------------------ #
+
+    def _cluster_hermeticity(self, cluster_def: dict[str, Any], actual_areas: list[str]) -> tuple[bool, str]:
+        expected_areas = cluster_def.get("policy_area_ids", [])
+        if len(actual_areas) != len(set(actual_areas)):
+            return False, (
+                f"Cluster hermeticity violation: "
+                f"duplicate areas found for cluster {cluster_def['cluster_id']}"
+            )
+        missing_areas = set(expected_areas) - set(actual_areas)
+        if missing_areas:
+            return False, (
+                f"Cluster hermeticity violation: "
+                f"missing areas {missing_areas} for cluster {cluster_def['cluster_id']}"
+            )
+        extra_areas = set(actual_areas) - set(expected_areas)
+        if extra_areas:
+            return False, (
+                f"Cluster hermeticity violation: "
+                f"unexpected areas {extra_areas} for cluster {cluster_def['cluster_id']}"
+            )
+        return True, "Cluster hermeticity validated"
+
+    def _aggregate_clusters(self, table: ScoreTable, areas: _AreaLevel) -> _ClusterLevel:
+        cluster_vocabulary = _Vocabulary()
+        cluster_codes = np.array([cluster_vocabulary.code(c) for c in areas.cluster], dtype=np.intp)
+        groups = _Groups.from_keys(areas.document, cluster_codes)
+        document = areas.document[groups.first_rows]
+        cluster = [areas.cluster[r] for r in groups.first_rows]
+        definitions = {c["cluster_id"]: c for c in self.clusters}
+
+        status: list[tuple[str, str]] = []
+        hermetic: list[tuple[bool, str]] = []
+        for g in range(len(groups)):
+            cluster_def = definitions.get(cluster[g])
+            if cluster_def is None:
+                status.append(("config", "Definition not found"))
+                hermetic.append((False, ""))
+                continue
+            result = self._cluster_hermeticity(
+                cluster_def, [table.areas[a] for a in areas.area[groups.members(g)]]
+            )
+            hermetic.append(result)
+            if not result[0] and self.abort_on_insufficient:
+                status.append(("hermeticity", result[1]))
+            else:
+                status.append(("ok", ""))
+
+        # apply_cluster_weights
+        raw, has_mapping = _dense_weights(
+            self.aggregation_settings.cluster_policy_area_weights,
+            cluster_vocabulary.values,
+            table.areas,
+        )
+        resolved, row_weights = _resolve_group_weights(
+            groups, raw[cluster_codes, areas.area], has_mapping[cluster_codes[groups.first_rows]]
+        )
+        params = ParameterLoaderV2.bind(_AREA_PARAMS)
+        equal = params.get("auto_param_L1495_23", 1.0) / groups.counts
+        row_weights = np.where(resolved[groups.group_of], row_weights, equal[groups.group_of])
+        weight_sums = groups.builtin_sum(row_weights)
+        raw_score = groups.builtin_sum(areas.score * row_weights)
+        if self.abort_on_insufficient:
+            bad = np.abs(weight_sums - params.get("auto_param_L1510_28", 1.0)) > 1e-6
+            for g in np.flatnonzero(bad):
+                if status[g][0] == "ok":
+                    status[g] = ("weights", f"Cluster weight validation failed: sum={weight_sums[g]:.6f}")
+
+        # Coherence, variance and imbalance penalty
+        cluster_params = ParameterLoaderV2.bind(_CLUSTER_PARAMS)
+        mean = groups.builtin_sum(areas.score) / groups.counts
+        variance = groups.builtin_sum((areas.score - mean[groups.group_of]) ** 2) / groups.counts
+        exponent = cluster_params.get("auto_param_L1550_30", 0.5)
+        coherence_std = np.array([v ** exponent for v in variance.tolist()], dtype=np.float64)
+        coherence = np.maximum(
+            cluster_params.get("auto_param_L1555_24", 0.0),
+            cluster_params.get("auto_param_L1555_29", 1.0) - (coherence_std / 3.0),
+        )
+        coherence[groups.counts <= 1] = cluster_params.get("auto_param_L1543_19", 1.0)
+
+        penalty_exponent = cluster_params.get("auto_param_L1689_30", 0.5)
+        std_dev = [v ** penalty_exponent for v in variance.tolist()]
+        std_array = np.array(std_dev, dtype=np.float64)
+        normalized_std = np.where(
+            std_array > 0,
+            np.minimum(std_array / ClusterAggregator.MAX_SCORE, cluster_params.get("auto_param_L1690_55", 1.0)),
+            cluster_params.get("auto_param_L1690_80", 0.0),
+        )
+        penalty = cluster_params.get("auto_param_L1691_25", 1.0) - (normalized_std * ClusterAggregator.PENALTY_WEIGHT)
+        score = raw_score * penalty
+
+        # Weakest area: first minimum in group order
+        padded = groups.padded(areas.score, fill=np.inf)
+        weakest = groups.order[groups.starts + np.argmin(padded, axis=1)]
+
+        fail_keys = {
+            "config": ("auto_param_L1600_22", "auto_param_L1601_26", "auto_param_L1602_25"),
+            "hermeticity": ("auto_param_L1631_22", "auto_param_L1632_26", "auto_param_L1633_25"),
+            "weights": ("auto_param_L1670_22", "auto_param_L1671_26", "auto_param_L1672_25"),
+        }
+        for g, (kind, _) in enumerate(status):
+            if kind != "ok":
+                score_key, coherence_key, variance_key = fail_keys[kind]
+                score[g] = cluster_params.get(score_key, 0.0)
+                coherence[g] = cluster_params.get(coherence_key, 0.0)
+                variance[g] = cluster_params.get(variance_key, 0.0)
+
+        return _ClusterLevel(
+            groups, document, cluster, score, raw_score, coherence, variance, std_dev,
+            penalty, weakest, resolved, row_weights, status, hermetic,
+        )
+
+    # ------------------------------------------------------------------ #
+    # FASE 7: macro
+    # ------------------------------------------------------------------ #
+
+    def _aggregate_macro(
+        self,
+        n_documents: int,
+        dims: _DimensionLevel,
+        clusters: _ClusterLevel,
+    ) -> _MacroLevel:
+        params = ParameterLoaderV2.bind(_CLUSTER_PARAMS)
+        groups = _Groups.from_keys(clusters.document) if len(clusters.document) else None
+
+        score = np.full(n_documents, params.get("auto_param_L1997_22", 0.0))
+        coherence = np.zeros(n_documents, dtype=np.float64)
+        alignment = np.zeros(n_documents, dtype=np.float64)
+        has_clusters = np.zeros(n_documents, dtype=bool)
+        if groups is None:
+            return _MacroLevel(score, np.full(n_documents, _INSUFICIENTE), coherence, alignment, has_clusters)
+
+        docs = clusters.document[groups.first_rows]
+        has_clusters[docs] = True
+        counts = groups.counts
+        cluster_scores = clusters.score
+
+        # Cross-cutting coherence
+        mean = groups.builtin_sum(cluster_scores) / counts
+        variance = groups.builtin_sum((cluster_scores - mean[groups.group_of]) ** 2) / counts
+        exponent = params.get("auto_param_L1854_30", 0.5)
+        std_dev = np.array([v ** exponent for v in variance.tolist()], dtype=np.float64)
+        doc_coherence = np.maximum(
+            params.get("auto_param_L1858_24", 0.0),
+            params.get("auto_param_L1858_29", 1.0) - (std_dev / 3.0),
+        )
+        doc_coherence[counts <= 1] = params.get("auto_param_L1847_19", 1.0)
+        coherence[docs] = doc_coherence
+
+        # Strategic alignment
+        cluster_coherence = groups.builtin_sum(clusters.coherence) / counts
+        dim_groups = _Groups.from_keys(dims.document)
+        validated = dim_groups.builtin_sum((~dims.coverage_failed).astype(np.float64))
+        validation_rate = np.full(n_documents, params.get("auto_param_L1912_90", 0.0))
+        dim_docs = dims.document[dim_groups.first_rows]
+        validation_rate[dim_docs] = validated / dim_groups.counts
+        alignment[docs] = (
+            params.get("auto_param_L1915_21", 0.6) * cluster_coherence
+        ) + (params.get("auto_param_L1915_49", 0.4) * validation_rate[docs])
+
+        # _calculate_macro_score
+        macro_weights = self.aggregation_settings.macro_cluster_weights
+        equal_mean = groups.builtin_sum(cluster_scores) / counts
+        doc_score = equal_mean
+        if macro_weights:
+            raw = np.array(
+                [macro_weights.get(c, np.nan) if c is not None else np.nan for c in clusters.cluster],
+                dtype=np.float64,
+            )
+            missing = np.zeros(len(groups), dtype=bool)
+            np.logical_or.at(missing, groups.group_of, np.isnan(raw))
+            totals = groups.builtin_sum(np.where(np.isnan(raw), 0.0, raw))
+            use = ~missing & (totals > 0)
+            normalized = raw / np.where(use, totals, 1.0)[groups.group_of]
+            weighted = groups.builtin_sum(np.where(use[groups.group_of], cluster_scores * normalized, 0.0))
+            doc_score = np.where(use, weighted, equal_mean)
+        score[docs] = doc_score
+
+        quality = _quality_codes(score, _CLUSTER_PARAMS, "auto_param_L1941_28")
+        quality[~has_clusters] = _INSUFICIENTE
+        return _MacroLevel(score, quality, coherence, alignment, has_clusters)
+
+    def aggregate(self, table: ScoreTable) -> ColumnarAggregation:
+        """Aggregate every document of the table through FASE 4-7."""
+        dims = self._aggregate_dimensions(table)
+        areas = self._aggregate_areas(table, dims)
+        clusters = self._aggregate_clusters(table, areas)
+        macro = self._aggregate_macro(len(table.documents), dims, clusters)
+        logger.info(
+            f"Columnar aggregation: {len(table.documents)} documents, {len(table)} results → "
+            f"{len(dims.score)} dimensions, {len(areas.score)} areas, {len(clusters.score)} clusters"
+        )
+        return ColumnarAggregation(self, table, dims, areas, clusters, macro)
+
+
+class ColumnarAggregation:
+    """Per-level result arrays of a ColumnarAggregationEngine run, with object views."""
+
+    def __init__(
+        self,
+        engine: ColumnarAggregationEngine,
+        table: ScoreTable,
+        dims: _DimensionLevel,
+        areas: _AreaLevel,
+        clusters: _ClusterLevel,
+        macro: _MacroLevel,
+    ) -> None:
+        self.engine = engine
+        self.table = table
+        self._dims = dims
+        self._areas = areas
+        self._clusters = clusters
+        self._macro = macro
+        self._document_index = {doc: i for i, doc in enumerate(table.documents)}
+
+    @property
+    def documents(self) -> list[str]:
+        return self.table.documents
+
+    @property
+    def macro_scores(self) -> NDArray[np.float64]:
+        """Macro score per document, in table document order."""
+        return self._macro.score
+
+    @property
+    def dimension_score_array(self) -> NDArray[np.float64]:
+        return self._dims.score
+
+    @property
+    def area_score_array(self) -> NDArray[np.float64]:
+        return self._areas.score
+
+    @property
+    def cluster_score_array(self) -> NDArray[np.float64]:
+        return self._clusters.score
+
+    def _document(self, document_id: str) -> int:
+        try:
+            return self._document_index[document_id]
+        except KeyError:
+            raise KeyError(f"Unknown document: {document_id}") from None
+
+    # -- object views ----------------------------------------------------
+
+    def _dimension_object(self, g: int) -> DimensionScore:
+        dims, table = self._dims, self.table
+        dimension_id = table.dimensions[dims.dimension[g]]
+        area_id = table.areas[dims.area[g]]
+        members = dims.groups.members(g)
+        count = len(members)
+        if dims.coverage_failed[g]:
+            msg = (
+                f"Coverage validation failed: "
+                f"expected {dims.expected[g]} questions, got {count}"
+            )
+            return DimensionScore(
+                dimension_id=dimension_id,
+                area_id=area_id,
+                score=float(dims.score[g]),
+                quality_level="INSUFICIENTE",
+                contributing_questions=[],
+                validation_passed=False,
+                validation_details={"error": msg, "type": "coverage"},
+            )
+
+        score = float(dims.score[g])
+        quality_level = QUALITY_LEVELS[dims.quality[g]]
+        if dims.coverage_ok[g]:
+            coverage = {"valid": True, "message": "Coverage sufficient", "count": count}
+        else:
+            coverage = {
+                "valid": False,
+                "message": (
+                    f"Coverage validation failed: "
+                    f"expected {dims.expected[g]} questions, got {count}"
+                ),
+                "count": count,
+            }
+        uncertainty = dims.uncertainty.get(g) if dims.choquet[g] else None
+        if dims.choquet[g]:
+            aggregation = {"method": "choquet", "uncertainty": uncertainty.to_dict() if uncertainty else None}
+        else:
+            aggregation = {"method": "weighted_average"}
+        weights = dims.row_weights[members].tolist() if dims.resolved[g] else None
+        validation_details = {
+            "coverage": coverage,
+            "aggregation": aggregation,
+            "weights": {"valid": True, "weights": weights if weights else "equal", "score": score},
+            "rubric": {"score": score, "quality_level": quality_level},
+            "score_max": 3.0,
+        }
+        sota = self.engine.enable_sota_features
+        return DimensionScore(
+            dimension_id=dimension_id,
+            area_id=area_id,
+            score=score,
+            quality_level=quality_level,
+            contributing_questions=table.rows["question_global"][members].tolist(),
+            validation_passed=True,
+            validation_details=validation_details,
+            score_std=uncertainty.std if uncertainty else 0.0,
+            confidence_interval_95=uncertainty.confidence_interval_95 if uncertainty else (0.0, 0.0),
+            epistemic_uncertainty=uncertainty.epistemic_uncertainty if uncertainty else 0.0,
+            aleatoric_uncertainty=uncertainty.aleatoric_uncertainty if uncertainty else 0.0,
+            provenance_node_id=f"DIM_{dimension_id}_{area_id}" if sota else "",
+            aggregation_method="choquet" if (sota and count >= 3) else "weighted_average",
+        )
+
+    def _area_name(self, area_id: str) -> str:
+        return next(
+            (a["i18n"]["keys"]["label_es"] for a in self.engine.policy_areas
+             if a["policy_area_id"] == area_id),
+            area_id,
+        )
+
+    def _area_object(self, g: int, dimension_objects: dict[int, DimensionScore]) -> AreaScore:
+        areas, table = self._areas, self.table
+        area_id = table.areas[areas.area[g]]
+        area_name = self._area_name(area_id)
+        hermetic_valid, hermetic_msg = areas.hermetic[g]
+        if areas.failed[g]:
+            area = AreaScore(
+                area_id=area_id,
+                area_name=area_name,
+                score=float(areas.score[g]),
+                quality_level="INSUFICIENTE",
+                dimension_scores=[],
+                validation_passed=False,
+                validation_details={"error": hermetic_msg, "type": "hermeticity"},
+            )
+        else:
+            members = areas.groups.members(g)
+            dimension_scores = [dimension_objects[int(d)] for d in members]
+            original = [d.score for d in dimension_scores]
+            clamp = ParameterLoaderV2.bind(_AREA_PARAMS).get("auto_param_L1148_34", 0.0)
+            normalized = []
+            for d in dimension_scores:
+                max_expected = d.validation_details.get('score_max', 3.0) if d.validation_details else 3.0
+                normalized.append(max(clamp, min(max_expected, d.score)) / max_expected)
+            score = float(areas.score[g])
+            quality_level = QUALITY_LEVELS[areas.quality[g]]
+            area = AreaScore(
+                area_id=area_id,
+                area_name=area_name,
+                score=score,
+                quality_level=quality_level,
+                dimension_scores=dimension_scores,
+                validation_passed=True,
+                validation_details={
+                    "hermeticity": {
+                        "valid": hermetic_valid,
+                        "message": hermetic_msg,
+                        "dimension_count": len(dimension_scores),
+                    },
+                    "normalization": {"original": original, "normalized": normalized},
+                    "rubric": {"score": score, "quality_level": quality_level},
+                },
+            )
+        area.cluster_id = areas.cluster[g]
+        return area
+
+    def _cluster_object(self, g: int, area_objects: dict[int, AreaScore]) -> ClusterScore:
+        clusters = self._clusters
+        cluster_id = clusters.cluster[g]
+        kind, message = clusters.status[g]
+        members = clusters.groups.members(g)
+        if kind == "config":
+            return ClusterScore(
+                cluster_id=cluster_id,
+                cluster_name=cluster_id,
+                areas=[],
+                score=float(clusters.score[g]),
+                coherence=float(clusters.coherence[g]),
+                variance=float(clusters.variance[g]),
+                weakest_area=None,
+                area_scores=[],
+                validation_passed=False,
+                validation_details={"error": message, "type": "config"},
+            )
+
+        cluster_def = next(c for c in self.engine.clusters if c["cluster_id"] == cluster_id)
+        cluster_name = cluster_def["i18n"]["keys"]["label_es"]
+        expected_areas = cluster_def["policy_area_ids"]
+        area_scores = [area_objects[int(a)] for a in members]
+        if kind in ("hermeticity", "weights"):
+            return ClusterScore(
+                cluster_id=cluster_id,
+                cluster_name=cluster_name,
+                areas=expected_areas,
+                score=float(clusters.score[g]),
+                coherence=float(clusters.coherence[g]),
+                variance=float(clusters.variance[g]),
+                weakest_area=None,
+                area_scores=area_scores if kind == "weights" else [],
+                validation_passed=False,
+                validation_details={"error": message, "type": kind},
+            )
+
+        params = ParameterLoaderV2.bind(_CLUSTER_PARAMS)
+        coherence = float(clusters.coherence[g])
+        weighted_score = float(clusters.raw_score[g])
+        adjusted_score = float(clusters.score[g])
+        variance = float(clusters.variance[g])
+        weakest_area = area_objects[int(clusters.weakest[g])]
+        weights = clusters.row_weights[members].tolist() if clusters.resolved[g] else None
+        hermetic_valid, hermetic_msg = clusters.hermetic[g]
+        validation_details = {
+            "hermeticity": {"valid": hermetic_valid, "message": hermetic_msg},
+            "weights": {"valid": True, "weights": weights if weights else "equal", "score": weighted_score},
+            "coherence": {
+                "value": coherence,
+                "interpretation": (
+                    "high" if coherence > params.get("auto_param_L1696_52", 0.8)
+                    else "medium" if coherence > params.get("auto_param_L1696_85", 0.6)
+                    else "low"
+                ),
+            },
+            "variance": variance,
+            "weakest_area": weakest_area.area_id,
+            "imbalance_penalty": {
+                "std_dev": clusters.std_dev[g],
+                "penalty_factor": float(clusters.penalty[g]),
+                "raw_score": weighted_score,
+                "adjusted_score": adjusted_score,
+            },
+        }
+        return ClusterScore(
+            cluster_id=cluster_id,
+            cluster_name=cluster_name,
+            areas=expected_areas,
+            score=adjusted_score,
+            coherence=coherence,
+            variance=variance,
+            weakest_area=weakest_area.area_id,
+            area_scores=area_scores,
+            validation_passed=True,
+            validation_details=validation_details,
+        )
+
+    def to_objects(
+        self, document_id: str
+    ) -> tuple[list[DimensionScore], list[AreaScore], list[ClusterScore], MacroScore]:
+        """Dimension, area, cluster and macro objects of one document.
+
+        Equal to DimensionAggregator.run → AreaPolicyAggregator.run →
+        ClusterAggregator.run → MacroAggregator.evaluate_macro on that document.
+        """
+        doc = self._document(document_id)
+        dims, areas, clusters, macro = self._dims, self._areas, self._clusters, self._macro
+
+        dimension_objects = {int(g): self._dimension_object(int(g)) for g in np.flatnonzero(dims.document == doc)}
+        area_objects = {
+            int(g): self._area_object(int(g), dimension_objects)
+            for g in np.flatnonzero(areas.document == doc)
+        }
+        cluster_objects = [
+            self._cluster_object(int(g), area_objects)
+            for g in np.flatnonzero(clusters.document == doc)
+        ]
+        dimension_scores = list(dimension_objects.values())
+        area_scores = list(area_objects.values())
+
+        params = ParameterLoaderV2.bind(_CLUSTER_PARAMS)
+        if not macro.has_clusters[doc]:
+            macro_score = MacroScore(
+                score=params.get("auto_param_L1997_22", 0.0),
+                quality_level="INSUFICIENTE",
+                cross_cutting_coherence=params.get("auto_param_L1999_40", 0.0),
+                systemic_gaps=[],
+                strategic_alignment=params.get("auto_param_L2001_36", 0.0),
+                cluster_scores=[],
+                validation_passed=False,
+                validation_details={"error": "No clusters", "type": "empty"},
+            )
+            return dimension_scores, area_scores, cluster_objects, macro_score
+
+        systemic_gaps = [a.area_name for a in area_scores if a.quality_level == "INSUFICIENTE"]
+        score = float(macro.score[doc])
+        quality_level = QUALITY_LEVELS[macro.quality[doc]]
+        coherence = float(macro.coherence[doc])
+        alignment = float(macro.alignment[doc])
+        macro_score = MacroScore(
+            score=score,
+            quality_level=quality_level,
+            cross_cutting_coherence=coherence,
+            systemic_gaps=systemic_gaps,
+            strategic_alignment=alignment,
+            cluster_scores=cluster_objects,
+            validation_passed=True,
+            validation_details={
+                "coherence": {"value": coherence, "clusters": len(cluster_objects)},
+                "gaps": {"count": len(systemic_gaps), "areas": systemic_gaps},
+                "alignment": {"value": alignment},
+                "rubric": {"score": score, "quality_level": quality_level},
+            },
+        )
+        return dimension_scores, area_scores, cluster_objects, macro_score
+
+
+__all__ = [
+    "ColumnarAggregation",
+    "ColumnarAggregationEngine",
+    "QUALITY_LEVELS",
+    "SCORE_TABLE_DTYPE",
+    "ScoreTable",
+]
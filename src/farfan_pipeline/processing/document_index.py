@@ -0,0 +1,516 @@
+"""
+Query-ready Document Index over a PreprocessedDocument
+
+Executors and analyzers used to re-scan the full ``raw_text`` of a 300-page
+plan for every question. ``DocumentIndex`` is built once per document (``get_document_index``, which
+attaches it to the PreprocessedDocument) and answers passage queries instead:
+
+- positional inverted index with BM25 ranking over passages (sentence-aligned
+  windows of ~``passage_chars`` inside each chunk); multi-word query phrases
+  only match consecutive tokens
+- numeric / monetary / percentage mentions with range lookup (Colombian
+  number format: ``$ 1.234.567,89``, ``12,5 %``, ``3,2 billones``)
+- year mentions (1900-2100, including periods such as ``2024-2027``)
+- entity postings for the entities reported by ingestion
+
+Every hit maps back to the chunk id and character offsets in ``raw_text``.
+Tokens are lower-cased and accent-folded, so ``diagnóstico`` matches
+``DIAGNOSTICO``.
+
+    index = get_document_index(document)
+    passages = index.search(["línea base", "DANE"], k=8, years=(2015, 2023))
+    text = "\\n\\n".join(p.text for p in passages)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PASSAGE_CHARS = 800
+BM25_K1 = 1.2
+BM25_B = 0.75
+YEAR_RANGE = (1900, 2100)
+
+NumericKind = Literal["number", "money", "percent"]
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+_SEGMENT_RE = re.compile(r"(?<=[.!?;:])\s+|\n\s*\n")
+_YEAR_RE = re.compile(r"(?<![\d.,$])(19\d{2}|20\d{2}|2100)(?:\s*[-–/]\s*(19\d{2}|20\d{2}|2100))?(?![\d.,]\d)")
+_NUMBER_RE = re.compile(
+    r"(?P<currency>\$|COP\s?|US\$)?\s?"
+    r"(?P<number>\d{1,3}(?:[.,]\d{3})+(?:[.,]\d+)?|\d+(?:[.,]\d+)?)"
+    r"(?:\s?(?P<unit>%|por\s?ciento|mil\s+millones|millones|mill[oó]n|billones|bill[oó]n|mil\b))?"
+    r"(?:\s?(?:de\s+)?(?P<pesos>pesos|COP)\b)?",
+    re.IGNORECASE,
+)
+_MULTIPLIERS = {
+    "mil": 1e3,
+    "millon": 1e6,
+    "millones": 1e6,
+    "mil millones": 1e9,
+    "billon": 1e12,
+    "billones": 1e12,
+}
+
+# Short Spanish function words that carry no retrieval signal
+_STOPWORDS = frozenset(
+    "a al como con de del el en entre es la las lo los o para por que se su sus un una y "
+    "ya le les sin sobre este esta estos estas ese esa son ser si no se debe ej".split()
+)
+
+
+def fold(text: str) -> str:
+    """Lower-case and strip diacritics (``Política`` → ``politica``)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> list[tuple[str, int]]:
+    """Folded tokens with their character offsets in ``text``."""
+    return [(fold(m.group()), m.start()) for m in _TOKEN_RE.finditer(text)]
+
+
+def query_terms(text: str) -> list[str]:
+    """Folded tokens of ``text`` without stopwords and single letters."""
+    return [t for t, _ in tokenize(text) if len(t) > 1 and t not in _STOPWORDS]
+
+
+def parse_number(literal: str) -> float | None:
+    """Parse a number written with Colombian (or plain) separators."""
+    has_dot, has_comma = "." in literal, "," in literal
+    if has_dot and has_comma:
+        decimal = "," if literal.rfind(",") > literal.rfind(".") else "."
+        thousands = "." if decimal == "," else ","
+        literal = literal.replace(thousands, "").replace(decimal, ".")
+    elif has_dot or has_comma:
+        sep = "." if has_dot else ","
+        groups = literal.split(sep)
+        if len(groups) > 2 or len(groups[-1]) == 3:
+            literal = literal.replace(sep, "")
+        else:
+            literal = literal.replace(sep, ".")
+    try:
+        return float(literal)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class Passage:
+    """A ranked span of the document."""
+
+    passage_id: int
+    chunk_id: int | None
+    start: int
+    end: int
+    text: str
+    score: float = 0.0
+    matched_terms: tuple[str, ...] = ()
+    policy_area_id: str | None = None
+    dimension_id: str | None = None
+
+
+@dataclass(frozen=True)
+class Mention:
+    """A numeric value, year or entity found in the document."""
+
+    value: Any
+    kind: str
+    start: int
+    end: int
+    passage_id: int
+    chunk_id: int | None
+
+
+@dataclass
+class _PassageSpan:
+    start: int
+    end: int
+    chunk_id: int | None
+    policy_area_id: str | None
+    dimension_id: str | None
+    length: int = 0  # tokens
+
+
+@dataclass
+class DocumentIndex:
+    """Positional inverted index plus numeric, year and entity postings."""
+
+    text: str
+    passages: list[_PassageSpan]
+    # term → {passage_id: [token positions]}
+    postings: dict[str, dict[int, list[int]]]
+    # per passage: folded tokens and their char offsets (for phrase matching)
+    passage_tokens: list[list[str]]
+    token_offsets: list[list[int]]
+    numbers: dict[str, list[Mention]]
+    years: list[Mention]
+    entities: dict[str, list[Mention]]
+    _number_values: dict[str, list[float]] = field(default_factory=dict, repr=False)
+    _year_values: list[int] = field(default_factory=list, repr=False)
+    _avg_length: float = field(default=0.0, repr=False)
+
+    def __post_init__(self) -> None:
+        self._number_values = {kind: [m.value for m in mentions] for kind, mentions in self.numbers.items()}
+        self._year_values = [m.value for m in self.years]
+        total = sum(p.length for p in self.passages)
+        self._avg_length = total / len(self.passages) if self.passages else 0.0
+
+    # ------------------------------------------------------------------ #
+    # Construction
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def from_document(cls, document: Any, passage_chars: int = DEFAULT_PASSAGE_CHARS) -> DocumentIndex:
+        """Index a PreprocessedDocument (chunks define passage boundaries)."""
+        text = document.raw_text
+        spans = []
+        chunks = getattr(document, "chunks", None) or []
+        if chunks and all(text[c.start_pos:c.end_pos] == c.text for c in chunks):
+            for chunk in chunks:
+                spans.append((chunk.start_pos, chunk.end_pos, chunk.id, chunk.policy_area_id, chunk.dimension_id))
+        else:
+            if chunks:
+                logger.warning(
+                    f"Chunk offsets of {document.document_id} do not match raw_text; "
+                    "indexing the document as a single span"
+                )
+            spans.append((0, len(text), None, None, None))
+
+        entity_names: Iterable[str] = ()
+        indexes = getattr(document, "indexes", None) or {}
+        if isinstance(indexes, Mapping):
+            entity_names = indexes.get("entity_index", {}).keys()
+        return cls.build(text, spans, entity_names=entity_names, passage_chars=passage_chars)
+
+    @classmethod
+    def build(
+        cls,
+        text: str,
+        spans: Sequence[tuple[int, int, int | None, str | None, str | None]],
+        entity_names: Iterable[str] = (),
+        passage_chars: int = DEFAULT_PASSAGE_CHARS,
+    ) -> DocumentIndex:
+        """Index ``text`` given chunk spans ``(start, end, chunk_id, policy_area_id, dimension_id)``."""
+        passages: list[_PassageSpan] = []
+        for start, end, chunk_id, policy_area_id, dimension_id in spans:
+            for p_start, p_end in _windows(text, start, end, passage_chars):
+                passages.append(_PassageSpan(p_start, p_end, chunk_id, policy_area_id, dimension_id))
+
+        postings: dict[str, dict[int, list[int]]] = defaultdict(dict)
+        passage_tokens: list[list[str]] = []
+        token_offsets: list[list[int]] = []
+        for pid, passage in enumerate(passages):
+            tokens = tokenize(text[passage.start:passage.end])
+            terms = [t for t, _ in tokens]
+            passage.length = len(terms)
+            passage_tokens.append(terms)
+            token_offsets.append([passage.start + offset for _, offset in tokens])
+            for position, term in enumerate(terms):
+                postings[term].setdefault(pid, []).append(position)
+
+        starts = [p.start for p in passages]
+
+        def locate(offset: int) -> tuple[int, int | None]:
+            pid = max(bisect_right(starts, offset) - 1, 0)
+            return pid, passages[pid].chunk_id if passages else None
+
+        years: list[Mention] = []
+        year_spans: list[tuple[int, int]] = []
+        for match in _YEAR_RE.finditer(text):
+            year_spans.append(match.span())
+            pid, chunk_id = locate(match.start())
+            first = int(match.group(1))
+            last = int(match.group(2)) if match.group(2) else first
+            for year in range(first, last + 1) if first <= last <= first + 50 else (first, last):
+                years.append(Mention(year, "year", match.start(), match.end(), pid, chunk_id))
+        years.sort(key=lambda m: (m.value, m.start))
+
+        numbers: dict[str, list[Mention]] = defaultdict(list)
+        year_starts = [s for s, _ in year_spans]
+        for match in _NUMBER_RE.finditer(text):
+            number_start = match.start("number")
+            i = bisect_right(year_starts, number_start) - 1
+            if i >= 0 and year_spans[i][0] <= number_start < year_spans[i][1]:
+                continue
+            value = parse_number(match.group("number"))
+            if value is None:
+                continue
+            unit = fold(match.group("unit") or "").strip()
+            unit = re.sub(r"\s+", " ", unit)
+            if unit in ("%", "por ciento", "porciento"):
+                kind: NumericKind = "percent"
+            elif match.group("currency") or match.group("pesos"):
+                kind = "money"
+            else:
+                kind = "number"
+            value *= _MULTIPLIERS.get(unit, 1.0)
+            pid, chunk_id = locate(match.start())
+            mention = Mention(value, kind, match.start(), match.end(), pid, chunk_id)
+            numbers[kind].append(mention)
+        for mentions in numbers.values():
+            mentions.sort(key=lambda m: (m.value, m.start))
+
+        entities: dict[str, list[Mention]] = {}
+        folded_text = None
+        for name in entity_names:
+            if not name or not name.strip():
+                continue
+            pattern = re.compile(r"(?<!\w)" + re.escape(name) + r"(?!\w)", re.IGNORECASE)
+            found = []
+            for match in pattern.finditer(text):
+                pid, chunk_id = locate(match.start())
+                found.append(Mention(name, "entity", match.start(), match.end(), pid, chunk_id))
+            if not found:
+                # Accent-insensitive fallback; folding keeps offsets for precomposed text
+                folded_text = folded_text if folded_text is not None else fold(text)
+                if len(folded_text) == len(text):
+                    folded_pattern = re.compile(r"(?<!\w)" + re.escape(fold(name)) + r"(?!\w)")
+                    for match in folded_pattern.finditer(folded_text):
+                        pid, chunk_id = locate(match.start())
+                        found.append(Mention(name, "entity", match.start(), match.end(), pid, chunk_id))
+            entities[fold(name)] = found
+
+        logger.info(
+            f"Document index built: {len(passages)} passages, {len(postings)} terms, "
+            f"{sum(len(v) for v in numbers.values())} numbers, {len(years)} years, {len(entities)} entities"
+        )
+        return cls(
+            text=text,
+            passages=passages,
+            postings=dict(postings),
+            passage_tokens=passage_tokens,
+            token_offsets=token_offsets,
+            numbers=dict(numbers),
+            years=years,
+            entities=entities,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Lookups
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+    def passage(self, passage_id: int, score: float = 0.0, matched_terms: tuple[str, ...] = ()) -> Passage:
+        span = self.passages[passage_id]
+        return Passage(
+            passage_id=passage_id,
+            chunk_id=span.chunk_id,
+            start=span.start,
+            end=span.end,
+            text=self.text[span.start:span.end],
+            score=score,
+            matched_terms=matched_terms,
+            policy_area_id=span.policy_area_id,
+            dimension_id=span.dimension_id,
+        )
+
+    def numbers_in_range(
+        self,
+        low: float = -math.inf,
+        high: float = math.inf,
+        kind: NumericKind | None = None,
+    ) -> list[Mention]:
+        """Numeric mentions with ``low <= value <= high`` (all kinds unless ``kind``)."""
+        kinds = [kind] if kind else list(self.numbers)
+        found = []
+        for k in kinds:
+            values = self._number_values.get(k, [])
+            mentions = self.numbers.get(k, [])
+            found.extend(mentions[bisect_left(values, low):bisect_right(values, high)])
+        return sorted(found, key=lambda m: m.start)
+
+    def year_mentions(self, first: int, last: int | None = None) -> list[Mention]:
+        """Mentions of years in ``[first, last]`` (a single year if ``last`` is omitted)."""
+        last = first if last is None else last
+        found = self.years[bisect_left(self._year_values, first):bisect_right(self._year_values, last)]
+        return sorted(found, key=lambda m: m.start)
+
+    def entity_mentions(self, name: str) -> list[Mention]:
+        """Mentions of an ingestion entity (case- and accent-insensitive name)."""
+        return list(self.entities.get(fold(name), []))
+
+    def term_positions(self, term: str) -> dict[int, list[int]]:
+        """Positional postings ``{passage_id: [token positions]}`` of a single term."""
+        return self.postings.get(fold(term), {})
+
+    def _phrase_frequencies(self, phrase: Sequence[str]) -> dict[int, int]:
+        """Occurrences per passage of consecutive ``phrase`` tokens."""
+        if len(phrase) == 1:
+            return {pid: len(positions) for pid, positions in self.postings.get(phrase[0], {}).items()}
+        candidate_lists = [self.postings.get(term) for term in phrase]
+        if not all(candidate_lists):
+            return {}
+        rarest = min(range(len(phrase)), key=lambda i: len(candidate_lists[i]))
+        frequencies = {}
+        for pid in candidate_lists[rarest]:
+            if not all(pid in postings for postings in candidate_lists):
+                continue
+            following = [set(postings[pid]) for postings in candidate_lists[1:]]
+            count = sum(
+                1 for position in candidate_lists[0][pid]
+                if all(position + i + 1 in positions for i, positions in enumerate(following))
+            )
+            if count:
+                frequencies[pid] = count
+        return frequencies
+
+    def search(
+        self,
+        query: str | Sequence[str],
+        k: int = 10,
+        *,
+        years: tuple[int, int] | None = None,
+        numeric: tuple[float, float, NumericKind | None] | None = None,
+        entities: Sequence[str] = (),
+        chunk_ids: Iterable[int] | None = None,
+        policy_area_id: str | None = None,
+    ) -> list[Passage]:
+        """Top ``k`` passages by BM25.
+
+        Args:
+            query: Free text, or a sequence of terms/phrases (multi-word items
+                match consecutive tokens only)
+            k: Maximum number of passages
+            years: Keep passages mentioning a year in ``(first, last)``
+            numeric: Keep passages with a number in ``(low, high, kind)``
+            entities: Keep passages mentioning any of these entities
+            chunk_ids / policy_area_id: Restrict to passages of these chunks
+
+        Returns:
+            Passages in descending score order (document order on ties). With
+            an empty query, the filtered passages in document order.
+        """
+        if isinstance(query, str):
+            phrases = [(term,) for term in dict.fromkeys(query_terms(query))]
+        else:
+            phrases = list(dict.fromkeys(tuple(query_terms(item)) for item in query))
+            phrases = [p for p in phrases if p]
+
+        allowed: set[int] | None = None
+
+        def restrict(pids: Iterable[int]) -> None:
+            nonlocal allowed
+            pids = set(pids)
+            allowed = pids if allowed is None else allowed & pids
+
+        if years is not None:
+            restrict(m.passage_id for m in self.year_mentions(*years))
+        if numeric is not None:
+            restrict(m.passage_id for m in self.numbers_in_range(*numeric))
+        if entities:
+            restrict(m.passage_id for name in entities for m in self.entity_mentions(name))
+        if chunk_ids is not None:
+            chunk_set = set(chunk_ids)
+            restrict(pid for pid, p in enumerate(self.passages) if p.chunk_id in chunk_set)
+        if policy_area_id is not None:
+            restrict(pid for pid, p in enumerate(self.passages) if p.policy_area_id == policy_area_id)
+
+        if not phrases:
+            pids = sorted(allowed) if allowed is not None else range(len(self.passages))
+            return [self.passage(pid) for pid in list(pids)[:k]]
+
+        n = len(self.passages)
+        scores: dict[int, float] = defaultdict(float)
+        matched: dict[int, list[str]] = defaultdict(list)
+        for phrase in phrases:
+            frequencies = self._phrase_frequencies(phrase)
+            if not frequencies:
+                continue
+            df = len(frequencies)
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            label = " ".join(phrase)
+            for pid, tf in frequencies.items():
+                if allowed is not None and pid not in allowed:
+                    continue
+                length_norm = 1.0 - BM25_B + BM25_B * self.passages[pid].length / (self._avg_length or 1.0)
+                scores[pid] += idf * tf * (BM25_K1 + 1.0) / (tf + BM25_K1 * length_norm)
+                matched[pid].append(label)
+
+        ranked = sorted(scores, key=lambda pid: (-scores[pid], pid))[:k]
+        return [self.passage(pid, scores[pid], tuple(matched[pid])) for pid in ranked]
+
+
+def _windows(text: str, start: int, end: int, passage_chars: int) -> list[tuple[int, int]]:
+    """Split ``text[start:end]`` into sentence-aligned windows of about ``passage_chars``."""
+    if end - start <= passage_chars:
+        return [(start, end)] if end > start else []
+    windows = []
+    window_start = start
+    last_boundary = None
+    for match in _SEGMENT_RE.finditer(text, start, end):
+        boundary = match.start()
+        if boundary - window_start >= passage_chars and last_boundary is not None and last_boundary > window_start:
+            windows.append((window_start, last_boundary))
+            window_start = _skip_space(text, last_boundary, end)
+        last_boundary = boundary
+    # Hard-split runs without sentence boundaries
+    while end - window_start > 2 * passage_chars:
+        cut = text.rfind(" ", window_start, window_start + passage_chars)
+        cut = cut if cut > window_start else window_start + passage_chars
+        windows.append((window_start, cut))
+        window_start = _skip_space(text, cut, end)
+    if window_start < end:
+        windows.append((window_start, end))
+    return windows
+
+
+def _skip_space(text: str, offset: int, end: int) -> int:
+    while offset < end and text[offset].isspace():
+        offset += 1
+    return offset
+
+
+def get_document_index(document: Any) -> DocumentIndex:
+    """The document's DocumentIndex, built on first use and attached to it.
+
+    PreprocessedDocument guards the build with a per-instance lock
+    (``ensure_index``), so concurrent callers share one index. Other
+    document objects get a new, unattached index.
+    """
+    ensure_index = getattr(document, "ensure_index", None)
+    if ensure_index is None:
+        return DocumentIndex.from_document(document)
+    return ensure_index(DocumentIndex.from_document)
+
+
+def question_query(question_context: Mapping[str, Any]) -> list[str]:
+    """Search terms/phrases for a v3 contract ``question_context``.
+
+    Pattern alternatives (``"línea base|año base"``) become phrases; regex
+    syntax is stripped. The question text contributes its content words.
+    """
+    items: list[str] = []
+    for pattern in question_context.get("patterns", []) or []:
+        raw = pattern.get("pattern", "") if isinstance(pattern, Mapping) else str(pattern)
+        for alternative in raw.split("|"):
+            literal = re.sub(r"\\[bBdDsSwW]|[\\^$.*+?()\[\]{}]", " ", alternative).strip()
+            if literal:
+                items.append(literal)
+    items.extend(query_terms(question_context.get("question_text", "") or ""))
+    return items
+
+
+__all__ = [
+    "DEFAULT_PASSAGE_CHARS",
+    "DocumentIndex",
+    "Mention",
+    "Passage",
+    "fold",
+    "get_document_index",
+    "parse_number",
+    "question_query",
+    "tokenize",
+]
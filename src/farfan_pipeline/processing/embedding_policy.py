@@ -36,8 +36,13 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict
 
 import numpy as np
-from sentence_transformers import CrossEncoder, SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
+
+from farfan_pipeline.compat.model_pool import acquire_cross_encoder, acquire_sentence_transformer
+from farfan_pipeline.processing.embedding_store import (
+    PersistentEmbeddingStore,
+    default_embedding_cache_dir,
+)
 from farfan_pipeline.core.parameters import ParameterLoaderV2
 from farfan_pipeline.core.calibration.decorators import calibrated_method
 
@@ -830,16 +835,18 @@ class PolicyCrossEncoderReranker:
                     exceptions=(OSError, IOError, ConnectionError, RuntimeError)
                 )
                 def load_model():
-                    return CrossEncoder(model_name, max_length=max_length)
+                    return acquire_cross_encoder(model_name, max_length=max_length)
 
-                self.model = load_model()
+                self.model_handle = load_model()
                 self._logger.info(f"Cross-encoder loaded with retry protection: {model_name}")
             except Exception as e:
                 self._logger.error(f"Failed to load cross-encoder: {e}")
                 raise
         else:
-            self.model = CrossEncoder(model_name, max_length=max_length)
+            self.model_handle = acquire_cross_encoder(model_name, max_length=max_length)
             self._logger.info(f"Cross-encoder loaded: {model_name}")
+        # Shared with every reranker using the same model (compat.model_pool)
+        self.model = self.model_handle.model
 
     def rerank(
         self,
@@ -907,6 +914,10 @@ class PolicyEmbeddingConfig:
     batch_size: int = 32
     normalize_embeddings: bool = True
 
+    # Embedding cache (None: FARFAN_EMBEDDING_CACHE_DIR, unset keeps it in RAM)
+    embedding_cache_dir: str | None = None
+    embedding_cache_memory_items: int = 4096
+
 class PolicyAnalysisEmbedder:
     """
     Production-ready embedding system for Colombian PDM analysis.
@@ -948,16 +959,18 @@ class PolicyAnalysisEmbedder:
                     exceptions=(OSError, IOError, ConnectionError, RuntimeError)
                 )
                 def load_embedding_model():
-                    return SentenceTransformer(config.embedding_model)
+                    return acquire_sentence_transformer(config.embedding_model)
 
                 self._logger.info("Initializing embedding model with retry: %s", config.embedding_model)
-                self.embedding_model = load_embedding_model()
+                self.embedding_model_handle = load_embedding_model()
             except Exception as e:
                 self._logger.error(f"Failed to load embedding model: {e}")
                 raise
         else:
             self._logger.info("Initializing embedding model: %s", config.embedding_model)
-            self.embedding_model = SentenceTransformer(config.embedding_model)
+            self.embedding_model_handle = acquire_sentence_transformer(config.embedding_model)
+        # Shared with every embedder using the same model (compat.model_pool)
+        self.embedding_model = self.embedding_model_handle.model
 
         # Initialize cross-encoder with retry logic
         self._logger.info("Initializing cross-encoder: %s", config.cross_encoder_model)
@@ -978,7 +991,12 @@ class PolicyAnalysisEmbedder:
         )
 
         # Cache
-        self._embedding_cache: dict[str, NDArray[np.float32]] = {}
+        self._embedding_store = PersistentEmbeddingStore(
+            config.embedding_model,
+            normalized=config.normalize_embeddings,
+            directory=config.embedding_cache_dir or default_embedding_cache_dir(),
+            max_memory_items=config.embedding_cache_memory_items,
+        )
         self._chunk_cache: dict[str, list[SemanticChunk]] = {}
 
     def process_document(
@@ -1228,60 +1246,39 @@ class PolicyAnalysisEmbedder:
     @calibrated_method("farfan_core.processing.embedding_policy.PolicyAnalysisEmbedder._embed_texts")
     def _embed_texts(self, texts: list[str]) -> NDArray[np.float32]:
         """Generate embeddings with caching and retry logic."""
-        uncached_texts = []
-        uncached_indices = []
-
-        embeddings_list = []
-
-        for i, text in enumerate(texts):
-            text_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
-
-            if text_hash in self._embedding_cache:
-                embeddings_list.append(self._embedding_cache[text_hash])
-            else:
-                uncached_texts.append(text)
-                uncached_indices.append((i, text_hash))
-                embeddings_list.append(None)  # Placeholder
-
-        # Generate embeddings for uncached texts with retry logic
-        if uncached_texts:
-            if self.retry_handler:
-                try:
-                    from retry_handler import DependencyType
-
-                    @self.retry_handler.with_retry(
-                        DependencyType.EMBEDDING_SERVICE,
-                        operation_name="encode_texts",
-                        exceptions=(ConnectionError, TimeoutError, RuntimeError, OSError)
-                    )
-                    def encode_with_retry():
-                        return self.embedding_model.encode(
-                            uncached_texts,
-                            batch_size=self.config.batch_size,
-                            normalize_embeddings=self.config.normalize_embeddings,
-                            show_progress_bar=False,
-                            convert_to_numpy=True,
-                        )
-
-                    new_embeddings = encode_with_retry()
-                except Exception as e:
-                    self._logger.error(f"Failed to encode texts with retry: {e}")
-                    raise
-            else:
-                new_embeddings = self.embedding_model.encode(
-                    uncached_texts,
-                    batch_size=self.config.batch_size,
-                    normalize_embeddings=self.config.normalize_embeddings,
-                    show_progress_bar=False,
-                    convert_to_numpy=True,
-                )
+        return self._embedding_store.encode(texts, self._encode_uncached)
+
+    def _encode_uncached(self, uncached_texts: list[str]) -> NDArray[np.float32]:
+        """Encode texts missing from the embedding store."""
+        if self.retry_handler:
+            try:
+                from retry_handler import DependencyType
 
-            # Cache and insert
-            for (orig_idx, text_hash), emb in zip(uncached_indices, new_embeddings, strict=False):
-                self._embedding_cache[text_hash] = emb
-                embeddings_list[orig_idx] = emb
+                @self.retry_handler.with_retry(
+                    DependencyType.EMBEDDING_SERVICE,
+                    operation_name="encode_texts",
+                    exceptions=(ConnectionError, TimeoutError, RuntimeError, OSError)
+                )
+                def encode_with_retry():
+                    return self.embedding_model.encode(
+                        uncached_texts,
+                        batch_size=self.config.batch_size,
+                        normalize_embeddings=self.config.normalize_embeddings,
+                        show_progress_bar=False,
+                        convert_to_numpy=True,
+                    )
 
-        return np.vstack(embeddings_list).astype(np.float32)
+                return encode_with_retry()
+            except Exception as e:
+                self._logger.error(f"Failed to encode texts with retry: {e}")
+                raise
+        return self.embedding_model.encode(
+            uncached_texts,
+            batch_size=self.config.batch_size,
+            normalize_embeddings=self.config.normalize_embeddings,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
 
     def _filter_by_pdq(
         self, chunks: list[SemanticChunk], pdq_filter: PDQIdentifier
@@ -1536,10 +1533,10 @@ class PolicyAnalysisEmbedder:
     @calibrated_method("farfan_core.processing.embedding_policy.PolicyAnalysisEmbedder._cached_similarity")
     def _cached_similarity(self, text_hash1: str, text_hash2: str) -> float:
         """Cached similarity computation for performance.
-        Assumes embeddings are cached in self._embedding_cache using text_hash as key.
+        Assumes embeddings are in self._embedding_store, keyed by full SHA-256 hex digest.
         """
-        emb1 = self._embedding_cache[text_hash1]
-        emb2 = self._embedding_cache[text_hash2]
+        emb1 = self._embedding_store.lookup(text_hash1)
+        emb2 = self._embedding_store.lookup(text_hash2)
         return float(cosine_similarity(emb1.reshape(1, -1), emb2.reshape(1, -1))[0, 0])
 
     @calibrated_method("farfan_core.processing.embedding_policy.PolicyAnalysisEmbedder.get_diagnostics")
@@ -1547,7 +1544,8 @@ class PolicyAnalysisEmbedder:
         """Get system diagnostics and performance metrics."""
         return {
             "model": self.config.embedding_model,
-            "embedding_cache_size": len(self._embedding_cache),
+            "embedding_cache_size": len(self._embedding_store),
+            "embedding_cache": self._embedding_store.get_stats(),
             "chunk_cache_size": len(self._chunk_cache),
             "total_chunks_processed": sum(
                 len(chunks) for chunks in self._chunk_cache.values()
@@ -0,0 +1,389 @@
+"""
+Persistent Content-Addressed Embedding Store
+
+Caches embedding vectors by ``(model id, normalization flag, sha256(text))``
+so repeated text — boilerplate shared between municipal plans, or the same
+plan analysed again — is encoded only once.
+
+Storage layout (one directory per model id / normalization flag):
+- ``meta.json``: model id, normalization flag, vector dimension
+- ``vectors.f32``: append-only float32 rows, read through ``np.memmap``
+- ``index.bin``: append-only 40-byte records ``(sha256 digest, row)``
+
+Writers append vector rows first and index records second while holding an
+exclusive ``flock`` on ``.lock``, so readers in other worker processes only
+ever see index records that point at complete rows. Readers never lock;
+they pick up rows written by other processes by reading the index tail.
+
+Recently used vectors are also kept in a bounded in-RAM LRU. Without a
+directory the store is just that LRU.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_DIR_ENV = "FARFAN_EMBEDDING_CACHE_DIR"
+
+_INDEX_RECORD = np.dtype([("digest", "V32"), ("row", "<u8")])
+_VECTOR_DTYPE = np.dtype("<f4")
+_FORMAT_VERSION = 1
+
+
+def default_embedding_cache_dir() -> Path | None:
+    """Directory from ``FARFAN_EMBEDDING_CACHE_DIR``, or ``None`` (RAM only)."""
+    value = os.environ.get(EMBEDDING_CACHE_DIR_ENV)
+    return Path(value) if value else None
+
+
+def text_digest(text: str) -> bytes:
+    """Full SHA-256 digest of the UTF-8 encoded text."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class _FileLock:
+    """Exclusive inter-process lock on a file (no-op without ``fcntl``)."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._fd: int | None = None
+
+    def __enter__(self) -> _FileLock:
+        if fcntl is not None:
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class PersistentEmbeddingStore:
+    """
+    Content-addressed embedding cache with optional memory-mapped storage.
+
+    Args:
+        model_id: Identifier of the encoder (and any setting that changes its
+            output, e.g. pooling or precision)
+        normalized: Whether vectors are L2-normalized by the encoder
+        directory: Root cache directory; ``None`` keeps vectors in RAM only
+        max_memory_items: Bound of the in-RAM LRU (0 disables it)
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        *,
+        normalized: bool = False,
+        directory: str | Path | None = None,
+        max_memory_items: int = 4096,
+    ) -> None:
+        self.model_id = model_id
+        self.normalized = normalized
+        self.max_memory_items = max(0, max_memory_items)
+        self.dim: int | None = None
+
+        self._lock = threading.RLock()
+        self._memory: OrderedDict[bytes, NDArray[np.float32]] = OrderedDict()
+        self._index: dict[bytes, int] = {}
+        self._index_offset = 0
+        self._mapped: np.memmap | None = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.encoded = 0
+
+        self.path: Path | None = None
+        if directory is not None:
+            self.path = Path(directory) / self._namespace(model_id, normalized)
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._read_meta()
+
+    @staticmethod
+    def _namespace(model_id: str, normalized: bool) -> str:
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_id).strip("_")[:48]
+        fingerprint = hashlib.sha256(f"{model_id}\0{normalized}".encode()).hexdigest()[:12]
+        return f"{slug}-{'norm' if normalized else 'raw'}-{fingerprint}"
+
+    @property
+    def persistent(self) -> bool:
+        return self.path is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self.path is None:
+                return len(self._memory)
+            self._refresh_index()
+            return len(self._index)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, text: str) -> NDArray[np.float32] | None:
+        """Cached vector for ``text``, or ``None``."""
+        return self.get_many([text])[0]
+
+    def lookup(self, hexdigest: str) -> NDArray[np.float32] | None:
+        """Cached vector for a hex SHA-256 text digest, or ``None``."""
+        with self._lock:
+            return self._get_digests([bytes.fromhex(hexdigest)])[0]
+
+    def get_many(self, texts: Sequence[str]) -> list[NDArray[np.float32] | None]:
+        with self._lock:
+            return self._get_digests([text_digest(t) for t in texts])
+
+    def _get_digests(self, digests: Sequence[bytes]) -> list[NDArray[np.float32] | None]:
+        found: list[NDArray[np.float32] | None] = [None] * len(digests)
+        pending: list[int] = []
+        for i, digest in enumerate(digests):
+            vector = self._memory.get(digest)
+            if vector is not None:
+                self._memory.move_to_end(digest)
+                self.memory_hits += 1
+                found[i] = vector
+            else:
+                pending.append(i)
+
+        if pending and self.path is not None:
+            if any(digests[i] not in self._index for i in pending):
+                self._refresh_index()
+            rows = {i: self._index[digests[i]] for i in pending if digests[i] in self._index}
+            if rows:
+                vectors = self._read_rows(np.fromiter(rows.values(), dtype=np.int64, count=len(rows)))
+                for (i, _), vector in zip(rows.items(), vectors, strict=True):
+                    found[i] = vector
+                    self._remember(digests[i], vector)
+                self.disk_hits += len(rows)
+
+        self.misses += sum(1 for vector in found if vector is None)
+        return found
+
+    def _remember(self, digest: bytes, vector: NDArray[np.float32]) -> None:
+        if self.max_memory_items == 0:
+            return
+        self._memory[digest] = vector
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Encode-through
+    # ------------------------------------------------------------------
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        encoder: Callable[[list[str]], Any],
+    ) -> NDArray[np.float32]:
+        """
+        Embed ``texts``, calling ``encoder`` only for texts not yet cached.
+
+        Duplicate texts within the batch are encoded once. Returns a
+        ``(len(texts), dim)`` float32 matrix in input order.
+        """
+        with self._lock:
+            digests = [text_digest(t) for t in texts]
+            found = self._get_digests(digests)
+
+            missing: dict[bytes, str] = {}
+            for digest, text, vector in zip(digests, texts, found, strict=True):
+                if vector is None and digest not in missing:
+                    missing[digest] = text
+
+            if missing:
+                new_vectors = np.asarray(encoder(list(missing.values())), dtype=np.float32)
+                if new_vectors.ndim != 2 or new_vectors.shape[0] != len(missing):
+                    raise ValueError(
+                        f"Encoder returned shape {new_vectors.shape} for {len(missing)} texts"
+                    )
+                self.encoded += len(missing)
+                self._put(list(missing), new_vectors)
+                fresh = dict(zip(missing, new_vectors, strict=True))
+                found = [fresh[d] if v is None else v for d, v in zip(digests, found, strict=True)]
+
+            if not found:
+                return np.empty((0, self.dim or 0), dtype=np.float32)
+            return np.vstack(found).astype(np.float32, copy=False)
+
+    def put_many(self, texts: Sequence[str], vectors: Any) -> None:
+        """Store precomputed vectors for ``texts``."""
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(texts):
+            raise ValueError(f"Expected {len(texts)} vectors, got shape {matrix.shape}")
+        with self._lock:
+            self._put([text_digest(t) for t in texts], matrix)
+
+    def _put(self, digests: list[bytes], matrix: NDArray[np.float32]) -> None:
+        self._check_dim(matrix.shape[1])
+        for digest, vector in zip(digests, matrix, strict=True):
+            self._remember(digest, vector.copy())
+        if self.path is not None:
+            self._append(digests, matrix)
+
+    def _check_dim(self, dim: int) -> None:
+        if self.dim is None:
+            self.dim = dim
+        elif self.dim != dim:
+            raise ValueError(
+                f"Embedding dimension {dim} does not match cached dimension {self.dim} "
+                f"for model {self.model_id}"
+            )
+
+    # ------------------------------------------------------------------
+    # On-disk segment and index
+    # ------------------------------------------------------------------
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.path / "meta.json"
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.path / "vectors.f32"
+
+    @property
+    def _index_path(self) -> Path:
+        return self.path / "index.bin"
+
+    def _read_meta(self) -> None:
+        try:
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        if meta.get("version") != _FORMAT_VERSION or meta.get("model_id") != self.model_id:
+            raise ValueError(f"Incompatible embedding cache at {self.path}")
+        self.dim = int(meta["dim"])
+
+    def _write_meta(self) -> None:
+        if self._meta_path.exists():
+            self._read_meta()
+            return
+        meta = {
+            "version": _FORMAT_VERSION,
+            "model_id": self.model_id,
+            "normalized": self.normalized,
+            "dim": self.dim,
+            "dtype": "float32",
+        }
+        tmp = self._meta_path.with_suffix(f".tmp{os.getpid()}")
+        tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        os.replace(tmp, self._meta_path)
+
+    def _refresh_index(self) -> None:
+        """Read index records appended since the last refresh."""
+        try:
+            size = self._index_path.stat().st_size
+        except FileNotFoundError:
+            return
+        end = size - size % _INDEX_RECORD.itemsize
+        if end <= self._index_offset:
+            return
+        with open(self._index_path, "rb") as index_file:
+            index_file.seek(self._index_offset)
+            records = np.frombuffer(index_file.read(end - self._index_offset), dtype=_INDEX_RECORD)
+        self._index.update(zip(records["digest"].tolist(), records["row"].tolist(), strict=True))
+        self._index_offset = end
+        if self.dim is None:
+            self._read_meta()
+
+    def _read_rows(self, rows: NDArray[np.int64]) -> NDArray[np.float32]:
+        needed = int(rows.max()) + 1
+        if self._mapped is None or self._mapped.shape[0] < needed:
+            row_bytes = self.dim * _VECTOR_DTYPE.itemsize
+            available = self._vectors_path.stat().st_size // row_bytes
+            self._mapped = np.memmap(
+                self._vectors_path, dtype=_VECTOR_DTYPE, mode="r", shape=(available, self.dim)
+            )
+        return np.array(self._mapped[rows], dtype=np.float32)
+
+    def _append(self, digests: list[bytes], matrix: NDArray[np.float32]) -> None:
+        with _FileLock(self.path / ".lock"):
+            self._write_meta()
+            self._check_dim(matrix.shape[1])
+            self._refresh_index()
+            keep = [i for i, digest in enumerate(digests) if digest not in self._index]
+            if not keep:
+                return
+
+            row_bytes = self.dim * _VECTOR_DTYPE.itemsize
+            self._vectors_path.touch(exist_ok=True)
+            with open(self._vectors_path, "r+b") as vectors_file:
+                # Rows stay aligned; a torn row left by a crashed writer is skipped
+                first_row = -(-vectors_file.seek(0, os.SEEK_END) // row_bytes)
+                vectors_file.seek(first_row * row_bytes)
+                vectors_file.write(np.ascontiguousarray(matrix[keep], dtype=_VECTOR_DTYPE).tobytes())
+                vectors_file.flush()
+
+            records = np.empty(len(keep), dtype=_INDEX_RECORD)
+            records["digest"] = [digests[i] for i in keep]
+            records["row"] = np.arange(first_row, first_row + len(keep), dtype=np.uint64)
+            self._index_path.touch(exist_ok=True)
+            with open(self._index_path, "r+b") as index_file:
+                # Drop a torn record tail before appending
+                index_file.truncate(self._index_offset)
+                index_file.seek(self._index_offset)
+                index_file.write(records.tobytes())
+                index_file.flush()
+
+            self._index.update(zip(records["digest"].tolist(), records["row"].tolist(), strict=True))
+            self._index_offset += records.nbytes
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+
+    def clear_memory(self) -> None:
+        """Drop the in-RAM LRU (on-disk entries are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._mapped = None
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "model_id": self.model_id,
+                "normalized": self.normalized,
+                "persistent": self.persistent,
+                "path": str(self.path) if self.path else None,
+                "dim": self.dim,
+                "memory_items": len(self._memory),
+                "disk_items": len(self._index),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "encoded": self.encoded,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+
+__all__ = [
+    "EMBEDDING_CACHE_DIR_ENV",
+    "PersistentEmbeddingStore",
+    "default_embedding_cache_dir",
+    "text_digest",
+]
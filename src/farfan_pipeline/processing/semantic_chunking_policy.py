@@ -41,7 +41,11 @@ from scipy.special import rel_entr
 
 # Check dependency lockdown before importing transformers
 from farfan_pipeline.core.dependency_lockdown import get_dependency_lockdown
-from transformers import AutoModel, AutoTokenizer
+from farfan_pipeline.compat.model_pool import acquire_transformer
+from farfan_pipeline.processing.embedding_store import (
+    PersistentEmbeddingStore,
+    default_embedding_cache_dir,
+)
 from farfan_pipeline.core.parameters import ParameterLoaderV2
 from farfan_pipeline.core.calibration.decorators import calibrated_method
 
@@ -123,6 +127,8 @@ class SemanticConfig:
     device: Literal["cpu", "cuda"] | None = None
     batch_size: int = 32
     fp16: bool = True  # Memory optimization
+    embedding_cache_dir: str | None = None  # Falls back to FARFAN_EMBEDDING_CACHE_DIR
+    embedding_cache_memory_items: int = 4096
 
 # ========================
 # SEMANTIC PROCESSOR (SOTA)
@@ -140,21 +146,31 @@ class SemanticProcessor:
         self.config = config
         self._model = None
         self._tokenizer = None
+        self._model_handle = None
         self._loaded = False
+        self._device = config.device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self._dtype = "float16" if config.fp16 and self._device == "cuda" else "float32"
+        # Mean pooling, truncation and precision change the vectors: part of the cache key
+        self._embedding_store = PersistentEmbeddingStore(
+            f"{config.embedding_model}|mean|max_length={config.chunk_size}|{self._dtype}",
+            directory=config.embedding_cache_dir or default_embedding_cache_dir(),
+            max_memory_items=config.embedding_cache_memory_items,
+        )
 
     @calibrated_method("farfan_core.processing.semantic_chunking_policy.SemanticProcessor._lazy_load")
     def _lazy_load(self) -> None:
         if self._loaded:
             return
         try:
-            device = self.config.device or ("cuda" if torch.cuda.is_available() else "cpu")
+            device = self._device
             logger.info(f"Loading BGE-M3 model on {device}...")
-            self._tokenizer = AutoTokenizer.from_pretrained(self.config.embedding_model)
-            self._model = AutoModel.from_pretrained(
+            # Shared with every processor using the same checkpoint (compat.model_pool)
+            self._model_handle = acquire_transformer(
                 self.config.embedding_model,
-                torch_dtype=torch.float16 if self.config.fp16 and device == "cuda" else torch.float32
-            ).to(device)
-            self._model.eval()
+                device=device,
+                torch_dtype=self._dtype,
+            )
+            self._tokenizer, self._model = self._model_handle.model
             self._loaded = True
             logger.info("BGE-M3 loaded successfully")
         except ImportError as e:
@@ -262,7 +278,11 @@ class SemanticProcessor:
 
     @calibrated_method("farfan_core.processing.semantic_chunking_policy.SemanticProcessor._embed_batch")
     def _embed_batch(self, texts: list[str]) -> list[NDArray[np.floating[Any]]]:
-        """Batch embedding with BGE-M3"""
+        """Batch embedding with BGE-M3 (cached by content)"""
+        return list(self._embedding_store.encode(texts, self._encode_uncached))
+
+    def _encode_uncached(self, texts: list[str]) -> list[NDArray[np.floating[Any]]]:
+        """Run BGE-M3 on texts missing from the embedding store"""
         self._lazy_load()
         embeddings = []
         for i in range(0, len(texts), self.config.batch_size):
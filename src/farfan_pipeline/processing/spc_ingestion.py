@@ -10,8 +10,9 @@ import logging
 import hashlib
 import numpy as np
 import copy
+import threading
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Any, Optional, Tuple, Set, Union
+from typing import Callable, ClassVar, Dict, List, Any, Optional, Tuple, Set, Union
 from enum import Enum
 from pathlib import Path
 from scipy.spatial.distance import cosine
@@ -26,7 +27,6 @@ from sklearn.cluster import DBSCAN, AgglomerativeClustering
 # Note: cosine_similarity removed - using canonical semantic_search with cross-encoder reranking
 from sklearn.decomposition import LatentDirichletAllocation
 from sklearn.feature_extraction.text import TfidfVectorizer
-import spacy
 from nltk.tokenize import sent_tokenize
 # Note: SentenceTransformer import removed - embedding handled by canonical producers
 import warnings
@@ -38,6 +38,7 @@ warnings.filterwarnings('ignore')
 # These replace internal duplicate implementations with frontier SOTA approaches
 # =============================================================================
 
+from farfan_pipeline.compat.model_pool import acquire_spacy
 from farfan_pipeline.processing.embedding_policy import EmbeddingPolicyProducer
 from farfan_pipeline.processing.policy_processor import create_policy_processor
 from farfan_pipeline.processing.semantic_chunking_policy import SemanticChunkingProducer
@@ -1258,6 +1259,98 @@ class StrategicIntegrator:
         return min(risk_score / 3.0, 1.0) #
 
 
+# =============================================================================
+# SENTENCE EMBEDDING STORE - Embeddings por documento reutilizables
+# =============================================================================
+
+class SentenceEmbeddingStore:
+    """
+    Per-document float32 store of text embeddings keyed by exact text.
+
+    FASE 4 fills the store with one batch of sentence embeddings; later stages
+    (chunk embeddings, inter-chunk relationships, deduplication, coherence)
+    read from it and only encode texts not seen before in the document.
+
+    Attributes:
+        document_id: Identifier of the document the embeddings belong to
+        hits: Texts served from the store
+        misses: Texts that had to be encoded
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[np.ndarray]],
+        document_id: Optional[str] = None
+    ):
+        self._embed_batch = embed_batch
+        self.document_id = document_id
+        self._index: Dict[str, int] = {}
+        # Rows [0, _rows) of _buffer hold embeddings; capacity doubles on demand
+        self._buffer: Optional[np.ndarray] = None
+        self._rows = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._index
+
+    def reset(self, document_id: Optional[str] = None) -> None:
+        """Drop all embeddings and start a new document."""
+        self.document_id = document_id
+        self._index = {}
+        self._buffer = None
+        self._rows = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _append(self, vectors: np.ndarray) -> int:
+        """Copy vectors into the buffer, growing it geometrically; return the first row."""
+        offset = self._rows
+        needed = offset + vectors.shape[0]
+        if self._buffer is None:
+            self._buffer = np.empty((needed, vectors.shape[1]), dtype=np.float32)
+        elif needed > self._buffer.shape[0]:
+            grown = np.empty(
+                (max(needed, 2 * self._buffer.shape[0]), self._buffer.shape[1]),
+                dtype=np.float32,
+            )
+            grown[:offset] = self._buffer[:offset]
+            self._buffer = grown
+        self._buffer[offset:needed] = vectors
+        self._rows = needed
+        return offset
+
+    def get(self, texts: List[str]) -> np.ndarray:
+        """
+        Return embeddings for texts as a (len(texts), dim) float32 array.
+
+        Unknown texts are encoded in a single batch call and kept.
+        """
+        missing = [t for t in dict.fromkeys(texts) if t not in self._index]
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        if missing:
+            offset = self._append(np.vstack(self._embed_batch(missing)))
+            for i, text in enumerate(missing):
+                self._index[text] = offset + i
+        if self._buffer is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._buffer[[self._index[t] for t in texts]]
+
+    def get_normalized(self, texts: List[str]) -> np.ndarray:
+        """Return unit-norm embeddings (zero vectors stay zero)."""
+        return _l2_normalize_rows(self.get(texts))
+
+
+def _l2_normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Normalize rows to unit length, leaving zero rows untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
 # =============================================================================
 # POLICY AREA CHUNK CALIBRATION - Garantiza 10 chunks por policy area
 # =============================================================================
@@ -1639,6 +1732,14 @@ class PolicyAreaChunkCalibrator:
 # =============================================================================
 
 class StrategicChunkingSystem:
+    # Number of sentences retained per (PA, DIM) query
+    PA_DIM_TOP_K: ClassVar[int] = 10
+
+    # PA×DIM query embeddings depend only on keywords and model; shared
+    # across documents and instances, keyed by (embedding_model, query_text)
+    _QUERY_EMBEDDING_CACHE: ClassVar[Dict[Tuple[str, str], np.ndarray]] = {}
+    _QUERY_EMBEDDING_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, random_seed: int = 42):
         """
         Initialize the Strategic Chunking System with canonical components.
@@ -1715,6 +1816,7 @@ class StrategicChunkingSystem:
         
         # These provide unique Smart Policy Chunks innovations
         self._nlp = None  # SpaCy for NER (lazy-loaded)
+        self._nlp_handle = None  # Shared handle from the process-wide model pool
         self._kg_builder = None  # NetworkX knowledge graph
         self._topic_modeler = None  # LDA topic modeling
         self._argument_analyzer = None  # Toulmin argument structure
@@ -1730,6 +1832,7 @@ class StrategicChunkingSystem:
         self.tfidf_vectorizer = TfidfVectorizer(stop_words=self._get_stopwords(), ngram_range=(1, 2), max_df=0.85, min_df=2)
         self.chunks_for_tfidf = []
         self.corpus_embeddings = None
+        self._sentence_store = SentenceEmbeddingStore(self._spc_sem.embed_batch)
     
     # =========================================================================
     # SPECIALIZED COMPONENT PROPERTIES - Innovation layers (no canonical equivalent)
@@ -1741,14 +1844,15 @@ class StrategicChunkingSystem:
         if self._nlp is None:
             try:
                 self.logger.info("Loading SpaCy model: es_core_news_lg")
-                self._nlp = spacy.load("es_core_news_lg")
-            except:
+                self._nlp_handle = acquire_spacy("es_core_news_lg")
+            except Exception:
                 self.logger.warning("SpaCy es_core_news_lg no disponible, usando sm")
                 try:
-                    self._nlp = spacy.load("es_core_news_sm")
-                except:
+                    self._nlp_handle = acquire_spacy("es_core_news_sm")
+                except Exception:
                     self.logger.error("Ningún modelo SpaCy disponible. Funcionalidad de NER limitada.")
-                    self._nlp = None
+                    self._nlp_handle = None
+            self._nlp = self._nlp_handle.model if self._nlp_handle else None
         return self._nlp
     
     @property
@@ -1938,7 +2042,7 @@ class StrategicChunkingSystem:
         Outputs:
             np.ndarray: Embedding vector from canonical SOTA component
         """
-        return self._spc_sem.embed_text(text).astype(np.float32) 
+        return self._sentence_store.get([text])[0]
 
     def _create_smart_policy_chunk(
         self,
@@ -2981,55 +3085,65 @@ class StrategicChunkingSystem:
                 })
         return frameworks
 
-    def _extract_content_for_pa_dimension(
-        self,
-        document_text: str,
-        policy_area: str,
-        dimension: str,
-        sentences: List[str],
-        sentence_positions: List[Tuple[int, int]],
-        sentence_embeddings: Optional[np.ndarray] = None
-    ) -> Dict[str, Any]:
+    def _pa_dimension_query_text(self, policy_area: str, dimension: str) -> str:
+        """Query text for a (PA, DIM) pair built from the keyword maps."""
+        return " ".join(
+            self._pa_keywords.get(policy_area, []) + self._dim_keywords.get(dimension, [])
+        )
+
+    def _pa_dimension_query_embeddings(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
         """
-        Extract most relevant content for a specific (PA, DIM) combination.
+        Unit-norm query embeddings for (PA, DIM) pairs, shape (len(pairs), dim).
 
-        Uses embedding-based similarity to find sentences most aligned with
-        the policy area and dimension keywords.
+        Queries missing from the class-level cache are embedded in one batch.
+        """
+        model = self._spc_sem.config.embedding_model
+        keys = [(model, self._pa_dimension_query_text(pa, dim)) for pa, dim in pairs]
+        cache = StrategicChunkingSystem._QUERY_EMBEDDING_CACHE
+
+        with StrategicChunkingSystem._QUERY_EMBEDDING_LOCK:
+            missing = [key for key in dict.fromkeys(keys) if key not in cache]
+        if missing:
+            self.logger.info(f"Embedding {len(missing)} PA×DIM queries in one batch")
+            vectors = np.vstack(self._spc_sem.embed_batch([text for _, text in missing]))
+            vectors = _l2_normalize_rows(vectors.astype(np.float32))
+            with StrategicChunkingSystem._QUERY_EMBEDDING_LOCK:
+                for key, vector in zip(missing, vectors):
+                    cache.setdefault(key, vector)
+
+        return np.vstack([cache[key] for key in keys])
+
+    @staticmethod
+    def _top_k_sentences(similarities: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        Indices of the top_k most similar sentences per query column.
 
         Args:
-            document_text: Full document text
-            policy_area: Policy area code (PA01-PA10)
-            dimension: Dimension code (DIM01-DIM06)
-            sentences: List of document sentences
-            sentence_positions: List of (start, end) byte positions for each sentence
-            sentence_embeddings: Pre-computed embeddings (optional, computed if None)
+            similarities: (n_sentences, n_queries) cosine similarities
+            top_k: Sentences to keep per query (≤ n_sentences)
 
         Returns:
-            Dictionary with segment metadata and text
+            (top_k, n_queries) indices ordered by decreasing similarity
+            (ties by sentence order)
         """
-        # Generate query embedding from PA + DIM keywords
-        pa_keywords = self._pa_keywords.get(policy_area, [])
-        dim_keywords = self._dim_keywords.get(dimension, [])
-        query_text = " ".join(pa_keywords + dim_keywords)
-
-        # Get query embedding
-        query_embedding = self._spc_sem.embed_text(query_text)
-
-        # Compute sentence embeddings if not provided
-        if sentence_embeddings is None:
-            sentence_embeddings = self._spc_sem.embed_batch(sentences)
-
-        # Compute cosine similarity between query and all sentences
-        from sklearn.metrics.pairwise import cosine_similarity
-        similarities = cosine_similarity(
-            query_embedding.reshape(1, -1),
-            sentence_embeddings
-        )[0]
-
-        # Find top-K most similar sentences (K=10)
-        top_k = min(10, len(sentences))
-        top_indices = np.argsort(similarities)[-top_k:][::-1]
-
+        if top_k <= 0:
+            return np.empty((0, similarities.shape[1]), dtype=np.intp)
+        candidates = np.argpartition(-similarities, top_k - 1, axis=0)[:top_k]
+        candidate_sims = np.take_along_axis(similarities, candidates, axis=0)
+        # Decreasing similarity; ties broken by sentence order
+        order = np.lexsort((candidates, -candidate_sims), axis=0)
+        return np.take_along_axis(candidates, order, axis=0)
+
+    def _build_pa_dimension_segment(
+        self,
+        document_text: str,
+        policy_area: str,
+        dimension: str,
+        sentence_positions: List[Tuple[int, int]],
+        similarities: np.ndarray,
+        top_indices: np.ndarray
+    ) -> Dict[str, Any]:
+        """Build the segment dict for one (PA, DIM) from its top sentences."""
         # Extract contiguous region around top sentences
         if len(top_indices) == 0:
             # Fallback: return first 800 chars
@@ -3038,12 +3152,12 @@ class StrategicChunkingSystem:
             segment_end = len(segment_text)
         else:
             # Find min/max positions to create contiguous chunk
-            min_idx = min(top_indices)
-            max_idx = max(top_indices)
+            min_idx = int(top_indices.min())
+            max_idx = int(top_indices.max())
 
             # Expand window by ±2 sentences for context
             start_idx = max(0, min_idx - 2)
-            end_idx = min(len(sentences) - 1, max_idx + 2)
+            end_idx = min(len(sentence_positions) - 1, max_idx + 2)
 
             # Get byte positions
             segment_start = sentence_positions[start_idx][0]
@@ -3060,9 +3174,50 @@ class StrategicChunkingSystem:
             "dimension": dimension,
             "relevance_score": relevance_score,
             "top_sentence_indices": top_indices.tolist(),
-            "query_keywords": pa_keywords + dim_keywords
+            "query_keywords": self._pa_keywords.get(policy_area, []) + self._dim_keywords.get(dimension, [])
         }
 
+    def _extract_content_for_pa_dimension(
+        self,
+        document_text: str,
+        policy_area: str,
+        dimension: str,
+        sentences: List[str],
+        sentence_positions: List[Tuple[int, int]],
+        sentence_embeddings: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract most relevant content for a specific (PA, DIM) combination.
+
+        Uses embedding-based similarity to find sentences most aligned with
+        the policy area and dimension keywords.
+
+        Args:
+            document_text: Full document text
+            policy_area: Policy area code (PA01-PA10)
+            dimension: Dimension code (DIM01-DIM06)
+            sentences: List of document sentences
+            sentence_positions: List of (start, end) byte positions for each sentence
+            sentence_embeddings: Pre-computed embeddings (optional, read from the
+                sentence store if None)
+
+        Returns:
+            Dictionary with segment metadata and text
+        """
+        query_embedding = self._pa_dimension_query_embeddings([(policy_area, dimension)])
+
+        if sentence_embeddings is None:
+            normalized = self._sentence_store.get_normalized(sentences)
+        else:
+            normalized = _l2_normalize_rows(np.asarray(sentence_embeddings, dtype=np.float32))
+        similarities = (normalized @ query_embedding.T) if sentences else np.zeros((0, 1), dtype=np.float32)
+
+        top_indices = self._top_k_sentences(similarities, min(self.PA_DIM_TOP_K, len(sentences)))
+        return self._build_pa_dimension_segment(
+            document_text, policy_area, dimension, sentence_positions,
+            similarities[:, 0], top_indices[:, 0]
+        )
+
     def _generate_60_structured_segments(
         self,
         document_text: str,
@@ -3073,6 +3228,8 @@ class StrategicChunkingSystem:
 
         This replaces FASE 4 semantic segmentation with structured extraction.
         Each segment is explicitly aligned to one Policy Area and one Dimension.
+        All 60 queries are scored in one (sentences × 60) matrix product; the
+        sentence embeddings stay in the per-document store for later stages.
 
         Args:
             document_text: Full document text
@@ -3097,39 +3254,56 @@ class StrategicChunkingSystem:
             sentence_positions.append((start, end))
             current_pos = end
 
-        # Pre-compute sentence embeddings (once for all 60 extractions)
+        # Sentence embeddings: one batch per document, kept for later stages
+        document_id = hashlib.sha256(document_text.encode('utf-8')).hexdigest()
+        if self._sentence_store.document_id != document_id:
+            self._sentence_store.reset(document_id)
         self.logger.info(f"Computing embeddings for {len(sentences)} sentences...")
-        sentence_embeddings = self._spc_sem.embed_batch(sentences)
+        sentence_embeddings = self._sentence_store.get_normalized(sentences)
 
-        # Generate 60 segments
+        # (PA, DIM) pairs in canonical order
         policy_areas = get_all_policy_areas()  # PA01..PA10
         dimensions = get_all_dimensions()      # D1..D6
+        pairs = [
+            (pa_code, pa_info, dim_info)
+            for pa_code, pa_info in policy_areas.items()
+            for dim_info in dimensions.values()
+        ]
+        query_embeddings = self._pa_dimension_query_embeddings(
+            [(pa_code, dim_info.code) for pa_code, _, dim_info in pairs]
+        )
+
+        # (sentences × 60) cosine similarities and top-K per column
+        if sentences:
+            similarities = sentence_embeddings @ query_embeddings.T
+        else:
+            similarities = np.zeros((0, len(pairs)), dtype=np.float32)
+        top_indices = self._top_k_sentences(similarities, min(self.PA_DIM_TOP_K, len(sentences)))
 
         structured_segments = []
 
-        for pa_code, pa_info in policy_areas.items():
-            for dim_key, dim_info in dimensions.items():
-                segment = self._extract_content_for_pa_dimension(
-                    document_text=document_text,
-                    policy_area=pa_code,
-                    dimension=dim_info.code,
-                    sentences=sentences,
-                    sentence_positions=sentence_positions,
-                    sentence_embeddings=sentence_embeddings
-                )
+        for column, (pa_code, pa_info, dim_info) in enumerate(pairs):
+            segment = self._build_pa_dimension_segment(
+                document_text=document_text,
+                policy_area=pa_code,
+                dimension=dim_info.code,
+                sentence_positions=sentence_positions,
+                similarities=similarities[:, column],
+                top_indices=top_indices[:, column]
+            )
 
-                # Add PA and DIM metadata
-                segment['policy_area_id'] = pa_code
-                segment['dimension_id'] = dim_info.code
-                segment['pa_name'] = pa_info.name
-                segment['dim_label'] = dim_info.label
+            # Add PA and DIM metadata
+            segment['policy_area_id'] = pa_code
+            segment['dimension_id'] = dim_info.code
+            segment['pa_name'] = pa_info.name
+            segment['dim_label'] = dim_info.label
 
-                structured_segments.append(segment)
+            structured_segments.append(segment)
 
-                self.logger.debug(
-                    f"  Extracted segment for {pa_code} × {dim_info.code}: "
-                    f"{len(segment['text'])} chars, relevance={segment['relevance_score']:.3f}"
-                )
+            self.logger.debug(
+                f"  Extracted segment for {pa_code} × {dim_info.code}: "
+                f"{len(segment['text'])} chars, relevance={segment['relevance_score']:.3f}"
+            )
 
         assert len(structured_segments) == 60, \
             f"Expected 60 segments, got {len(structured_segments)}"
@@ -3277,9 +3451,9 @@ class StrategicChunkingSystem:
         if not texts:
             return np.array([])
         
-        # CANONICAL SOTA: Use SemanticChunkingProducer batch embedding
-        embs = self._spc_sem.embed_batch(texts)
-        return np.vstack(embs).astype(np.float32)
+        # CANONICAL SOTA: SemanticChunkingProducer batch embedding, reusing
+        # the per-document store so texts are encoded at most once
+        return self._sentence_store.get(list(texts))
 
     def _validate_strategic_integrity(self, chunks: List[SmartPolicyChunk]) -> List[SmartPolicyChunk]:
         """Validar que los chunks cumplan con umbrales mínimos de calidad y completitud"""
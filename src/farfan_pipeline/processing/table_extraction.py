@@ -0,0 +1,450 @@
+"""
+Page-Parallel, Cached Table Extraction
+
+Camelot (lattice/stream) and tabula are expensive per page, and most pages of
+a municipal development plan contain no table at all. This stage therefore:
+
+1. Triages every page cheaply with PyMuPDF: pages without a text layer are
+   skipped, pages with ruling lines are lattice candidates, and pages with
+   ruling lines or a dense numeric text layer are stream/tabula candidates.
+2. Looks up each ``(pdf sha256, page, extractor, params)`` in a cache.
+3. Fans the remaining page/extractor jobs out across a process pool that is
+   created once per process and reused by every extraction.
+
+Cached results are pickled ``RawTable`` lists, one file per key, written
+atomically (temp file + rename) so concurrent analyzers can share a cache
+directory. Each file starts with an HMAC-SHA256 of its payload, and entries
+whose HMAC does not verify are discarded without being unpickled. The key
+comes from ``FARFAN_TABLE_CACHE_KEY`` or, failing that, from an owner-only
+key file created in the cache directory. Without a directory the cache is
+in-RAM only. Either way, the most recently used entries stay in RAM, up to a
+fixed number.
+
+Without PyMuPDF every page is treated as a candidate for every extractor.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import pickle
+import re
+import secrets
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TABLE_CACHE_DIR_ENV = "FARFAN_TABLE_CACHE_DIR"
+TABLE_CACHE_KEY_ENV = "FARFAN_TABLE_CACHE_KEY"
+
+EXTRACTORS = ("camelot_lattice", "camelot_stream", "tabula")
+
+DEFAULT_EXTRACTOR_PARAMS: dict[str, dict[str, Any]] = {
+    "camelot_lattice": {"line_scale": 40, "joint_tol": 10, "edge_tol": 50},
+    "camelot_stream": {"edge_tol": 500, "row_tol": 15, "column_tol": 10},
+    "tabula": {"multiple_tables": True, "stream": True, "guess": True, "silent": True},
+}
+
+_NUMERIC_TOKEN = re.compile(r"^[$(]?[\d][\d.,%)]*$")
+_CACHE_FORMAT_VERSION = 2
+_CACHE_KEY_FILE = ".cache_key"
+_MAC_BYTES = hashlib.sha256().digest_size
+
+
+def default_table_cache_dir() -> Path | None:
+    """Directory from ``FARFAN_TABLE_CACHE_DIR``, or ``None`` (RAM only)."""
+    value = os.environ.get(TABLE_CACHE_DIR_ENV)
+    return Path(value) if value else None
+
+
+def file_digest(path: str | Path) -> str:
+    """SHA-256 hex digest of the file contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class RawTable:
+    """A table as returned by one extractor for one page (before cleaning)."""
+
+    df: Any
+    page_number: int
+    extraction_method: str
+    accuracy: float | None = None
+
+
+@dataclass(frozen=True)
+class PageTriage:
+    """Cheap per-page signals used to decide which extractors to run."""
+
+    page_number: int
+    text_chars: int
+    ruling_lines: int
+    numeric_tokens: int
+    total_tokens: int
+
+    @property
+    def numeric_ratio(self) -> float:
+        return self.numeric_tokens / self.total_tokens if self.total_tokens else 0.0
+
+
+@dataclass(frozen=True)
+class TriageThresholds:
+    """Thresholds for page triage."""
+
+    min_text_chars: int = 40
+    min_ruling_lines: int = 4
+    min_numeric_tokens: int = 12
+    min_numeric_ratio: float = 0.12
+
+    def extractors_for(self, triage: PageTriage) -> tuple[str, ...]:
+        """Extractors worth running on the page (possibly none)."""
+        if triage.text_chars < self.min_text_chars:
+            return ()
+        ruled = triage.ruling_lines >= self.min_ruling_lines
+        numeric = (
+            triage.numeric_tokens >= self.min_numeric_tokens
+            and triage.numeric_ratio >= self.min_numeric_ratio
+        )
+        if ruled:
+            return EXTRACTORS
+        if numeric:
+            return ("camelot_stream", "tabula")
+        return ()
+
+
+def _count_ruling_lines(page: Any) -> int:
+    """Horizontal/vertical line segments and rectangle edges drawn on the page."""
+    count = 0
+    for drawing in page.get_drawings():
+        for item in drawing.get("items", ()):
+            kind = item[0]
+            if kind == "l":
+                p1, p2 = item[1], item[2]
+                if abs(p1.y - p2.y) < 1.0 or abs(p1.x - p2.x) < 1.0:
+                    count += 1
+            elif kind == "re":
+                count += 4
+    return count
+
+
+def triage_pages(pdf_path: str | Path) -> list[PageTriage] | None:
+    """Triage every page with PyMuPDF; ``None`` if PyMuPDF is unavailable or fails."""
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        return None
+
+    try:
+        doc = fitz.open(str(pdf_path))
+    except Exception as e:
+        logger.warning(f"Page triage failed to open {pdf_path}: {e}")
+        return None
+
+    pages: list[PageTriage] = []
+    try:
+        for index, page in enumerate(doc):
+            words = [w[4] for w in page.get_text("words")]
+            pages.append(PageTriage(
+                page_number=index + 1,
+                text_chars=sum(len(w) for w in words),
+                ruling_lines=_count_ruling_lines(page),
+                numeric_tokens=sum(1 for w in words if _NUMERIC_TOKEN.match(w)),
+                total_tokens=len(words),
+            ))
+    finally:
+        doc.close()
+    return pages
+
+
+def _page_count(pdf_path: str | Path) -> int:
+    """Number of pages, via pypdf/PyMuPDF when available."""
+    try:
+        import fitz  # PyMuPDF
+
+        with fitz.open(str(pdf_path)) as doc:
+            return doc.page_count
+    except Exception:
+        pass
+    try:
+        from pypdf import PdfReader
+
+        return len(PdfReader(str(pdf_path)).pages)
+    except Exception:
+        return 0
+
+
+def extract_page_tables(
+    pdf_path: str, page_number: int, extractor: str, params: dict[str, Any]
+) -> list[RawTable]:
+    """Run one extractor on one page (executed inside pool workers)."""
+    if extractor in ("camelot_lattice", "camelot_stream"):
+        import camelot
+
+        flavor = "lattice" if extractor == "camelot_lattice" else "stream"
+        tables = camelot.read_pdf(pdf_path, pages=str(page_number), flavor=flavor, **params)
+        return [
+            RawTable(
+                df=table.df,
+                page_number=page_number,
+                extraction_method=extractor,
+                accuracy=table.parsing_report["accuracy"],
+            )
+            for table in tables
+        ]
+    if extractor == "tabula":
+        import tabula
+
+        frames = tabula.read_pdf(pdf_path, pages=page_number, **params)
+        return [
+            RawTable(df=df, page_number=page_number, extraction_method=extractor)
+            for df in frames
+        ]
+    raise ValueError(f"Unknown table extractor: {extractor}")
+
+
+def _extract_job(job: tuple[str, int, str, dict[str, Any]]) -> tuple[list[RawTable], str | None]:
+    """Pool entry point: never raises, returns ``(tables, error)``."""
+    pdf_path, page_number, extractor, params = job
+    try:
+        return extract_page_tables(pdf_path, page_number, extractor, params), None
+    except Exception as e:
+        return [], str(e)
+
+
+# Process-wide extraction pool, created on first use
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_table_extraction_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process-wide spawn pool for page extraction jobs.
+
+    The pool is sized by the first caller and reused afterwards, so worker
+    start-up (interpreter plus camelot/tabula imports) is paid once per
+    process rather than once per PDF.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: the parent usually holds torch/transformer threads, which fork does not survive
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+        return _pool
+
+
+def reset_table_extraction_pool() -> None:
+    """Shut down the process-wide pool; the next extraction creates a new one."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _load_cache_key(directory: Path) -> bytes:
+    """HMAC key from the environment, else the directory's owner-only key file."""
+    value = os.environ.get(TABLE_CACHE_KEY_ENV)
+    if value:
+        return value.encode("utf-8")
+    path = directory / _CACHE_KEY_FILE
+    if not path.exists():
+        # Publish a fully written key with link(), which fails if another
+        # process won the race; mkstemp files are already owner-only.
+        fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(secrets.token_bytes(32))
+            os.link(tmp_name, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp_name)
+    return path.read_bytes()
+
+
+class TableExtractionCache:
+    """
+    Cache of per-page extractor results keyed by content hash and parameters.
+
+    Args:
+        directory: Shared on-disk cache directory (None: RAM only)
+        memory_entries: Entries kept in the in-RAM LRU
+    """
+
+    def __init__(self, directory: str | Path | None = None, memory_entries: int = 256) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self._mac_key = b""
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._mac_key = _load_cache_key(self.directory)
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, list[RawTable]] = OrderedDict()
+
+    @staticmethod
+    def key(pdf_digest: str, page_number: int, extractor: str, params: dict[str, Any]) -> str:
+        payload = json.dumps(
+            [_CACHE_FORMAT_VERSION, pdf_digest, page_number, extractor, params],
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def _mac(self, key: str, payload: bytes) -> bytes:
+        # The cache key is authenticated too, so entries cannot be swapped between keys
+        return hmac.new(self._mac_key, key.encode("ascii") + payload, hashlib.sha256).digest()
+
+    def _remember(self, key: str, tables: list[RawTable]) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = tables
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> list[RawTable] | None:
+        tables = self._memory.get(key)
+        if tables is not None:
+            self._memory.move_to_end(key)
+            return tables
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Discarding unreadable table cache entry {path.name}: {e}")
+            return None
+        mac, payload = data[:_MAC_BYTES], data[_MAC_BYTES:]
+        if not hmac.compare_digest(mac, self._mac(key, payload)):
+            logger.warning(f"Discarding table cache entry {path.name}: integrity check failed")
+            return None
+        try:
+            tables = pickle.loads(payload)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable table cache entry {path.name}: {e}")
+            return None
+        self._remember(key, tables)
+        return tables
+
+    def put(self, key: str, tables: list[RawTable]) -> None:
+        self._remember(key, tables)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            payload = pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(self._mac(key, payload))
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except Exception as e:
+            logger.warning(f"Could not write table cache entry {path.name}: {e}")
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+class PageParallelTableExtractor:
+    """Triage pages, reuse cached results, and extract the rest in a process pool."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cache: TableExtractionCache | None = None,
+        thresholds: TriageThresholds | None = None,
+        extractor_params: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self.max_workers = max_workers if max_workers is not None else max(1, (os.cpu_count() or 2) - 1)
+        self.cache = cache if cache is not None else TableExtractionCache(default_table_cache_dir())
+        self.thresholds = thresholds or TriageThresholds()
+        self.extractor_params = {**DEFAULT_EXTRACTOR_PARAMS, **(extractor_params or {})}
+
+    def plan(self, pdf_path: str | Path) -> list[tuple[int, str]]:
+        """``(page, extractor)`` jobs selected by triage, in page order."""
+        triage = triage_pages(pdf_path)
+        if triage is None:
+            return [
+                (page, extractor)
+                for page in range(1, _page_count(pdf_path) + 1)
+                for extractor in EXTRACTORS
+            ]
+        return [
+            (page.page_number, extractor)
+            for page in triage
+            for extractor in self.thresholds.extractors_for(page)
+        ]
+
+    def extract(self, pdf_path: str | Path) -> list[RawTable]:
+        """All raw tables of the PDF, ordered by page then extractor."""
+        pdf_path = str(pdf_path)
+        digest = file_digest(pdf_path)
+        jobs = self.plan(pdf_path)
+
+        results: dict[tuple[int, str], list[RawTable]] = {}
+        pending: list[tuple[tuple[int, str], str]] = []
+        for page, extractor in jobs:
+            key = self.cache.key(digest, page, extractor, self.extractor_params[extractor])
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[(page, extractor)] = cached
+            else:
+                pending.append(((page, extractor), key))
+
+        logger.info(
+            f"Table extraction: {len(jobs)} page/extractor jobs, "
+            f"{len(jobs) - len(pending)} cached, {len(pending)} to run"
+        )
+
+        payloads = [
+            (pdf_path, page, extractor, self.extractor_params[extractor])
+            for (page, extractor), _ in pending
+        ]
+        if len(payloads) > 1 and self.max_workers > 1:
+            try:
+                outcomes = list(
+                    get_table_extraction_pool(self.max_workers).map(_extract_job, payloads)
+                )
+            except BrokenProcessPool as e:
+                # A worker died (e.g. a native crash); replace the pool next time
+                logger.error(f"Table extraction pool broke: {e}")
+                reset_table_extraction_pool()
+                outcomes = [([], f"process pool broken: {e}")] * len(payloads)
+        else:
+            outcomes = [_extract_job(payload) for payload in payloads]
+
+        for ((page, extractor), key), (tables, error) in zip(pending, outcomes):
+            if error is not None:
+                # Failures are not cached so a fixed environment can retry them
+                logger.warning(f"{extractor} failed on page {page}: {error[:80]}")
+            else:
+                self.cache.put(key, tables)
+            results[(page, extractor)] = tables
+
+        order = {extractor: i for i, extractor in enumerate(EXTRACTORS)}
+        return [
+            table
+            for page, extractor in sorted(results, key=lambda k: (k[0], order[k[1]]))
+            for table in results[(page, extractor)]
+        ]
@@ -19,6 +19,7 @@ References:
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -27,6 +28,9 @@ from scipy import stats
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of floats materialised per Sobol perturbation chunk
+_SOBOL_CHUNK_VALUES = 1 << 20
+
 
 @dataclass(frozen=True)
 class UncertaintyMetrics:
@@ -110,6 +114,16 @@ class BootstrapAggregator:
         self.rng = np.random.RandomState(random_seed)
         logger.info(f"BootstrapAggregator initialized (n_samples={n_samples}, seed={random_seed})")
     
+    def _draw_indices(self, n: int) -> np.ndarray:
+        """
+        Draw the full resample index matrix at once.
+
+        Equivalent to n_samples successive ``rng.choice(n, size=n, replace=True)``
+        calls: legacy RandomState.choice delegates to randint, which consumes
+        the stream in the same order for one (n_samples, n) draw.
+        """
+        return self.rng.randint(0, n, size=(self.n_samples, n))
+
     def bootstrap_weighted_average(
         self,
         scores: list[float],
@@ -128,79 +142,161 @@ class BootstrapAggregator:
         Raises:
             ValueError: If scores is empty or weights mismatch
         """
-        if not scores:
-            raise ValueError("Cannot bootstrap empty score list")
-        
-        scores_arr = np.array(scores, dtype=np.float64)
-        n = len(scores_arr)
-        
-        if weights is None:
-            weights_arr = np.ones(n) / n
-        else:
-            if len(weights) != n:
-                raise ValueError(f"Weight count {len(weights)} != score count {n}")
-            weights_arr = np.array(weights, dtype=np.float64)
-            weights_arr = weights_arr / np.sum(weights_arr)  # Normalize
-        
-        # Bootstrap resampling
-        resamples = np.zeros(self.n_samples)
-        for i in range(self.n_samples):
-            # Sample with replacement
-            indices = self.rng.choice(n, size=n, replace=True)
-            resample_scores = scores_arr[indices]
-            resample_weights = weights_arr[indices]
-            resample_weights = resample_weights / np.sum(resample_weights)
-            
-            resamples[i] = np.sum(resample_scores * resample_weights)
-        
-        # Compute statistics
-        mean = np.mean(resamples)
-        std = np.std(resamples, ddof=1)
-        variance = std ** 2
-        
-        # Confidence intervals (percentile method)
-        ci_95_lower = np.percentile(resamples, 2.5)
-        ci_95_upper = np.percentile(resamples, 97.5)
-        ci_99_lower = np.percentile(resamples, 0.5)
-        ci_99_upper = np.percentile(resamples, 99.5)
-        
-        # Uncertainty decomposition
-        # Epistemic: Uncertainty in the aggregation (reducible with more samples)
-        epistemic_uncertainty = std
-        
-        # Aleatoric: Inherent variability in data (irreducible)
-        aleatoric_uncertainty = np.std(scores_arr, ddof=1)
-        
-        # Coefficient of variation
-        cv = std / mean if mean != 0.0 else float('inf')
-        
-        # Distribution shape
-        skewness = stats.skew(resamples)
-        kurtosis = stats.kurtosis(resamples)
-        
-        logger.debug(
-            f"Bootstrap complete: mean={mean:.4f}, std={std:.4f}, "
-            f"CI95=[{ci_95_lower:.4f}, {ci_95_upper:.4f}]"
-        )
-        
-        return UncertaintyMetrics(
-            mean=float(mean),
-            std=float(std),
-            variance=float(variance),
-            confidence_interval_95=(float(ci_95_lower), float(ci_95_upper)),
-            confidence_interval_99=(float(ci_99_lower), float(ci_99_upper)),
-            epistemic_uncertainty=float(epistemic_uncertainty),
-            aleatoric_uncertainty=float(aleatoric_uncertainty),
-            coefficient_of_variation=float(cv),
-            skewness=float(skewness),
-            kurtosis=float(kurtosis),
-            metadata={
-                "n_scores": n,
-                "n_bootstrap_samples": self.n_samples,
-                "original_scores_mean": float(np.mean(scores_arr)),
-                "original_scores_std": float(np.std(scores_arr, ddof=1)),
-            },
+        scores_arr, weights_arr = _prepare_inputs(scores, weights)
+        indices = self._draw_indices(len(scores_arr))
+        resamples = _resample_weighted_means(
+            scores_arr[np.newaxis], weights_arr[np.newaxis], indices[np.newaxis]
+        )[0]
+        return _summarize_resamples(resamples, scores_arr, self.n_samples)
+
+    def bootstrap_weighted_average_batch(
+        self,
+        groups: Sequence[tuple[list[float], list[float] | None]],
+    ) -> list[UncertaintyMetrics]:
+        """
+        Bootstrap every aggregation group of a level in one call.
+
+        Groups consume the random stream in order, so the result for each
+        group is identical to calling bootstrap_weighted_average() on the
+        groups one after another. Groups of equal size are resampled together.
+
+        Args:
+            groups: Sequence of (scores, weights) pairs
+
+        Returns:
+            UncertaintyMetrics per group, in input order
+
+        Raises:
+            ValueError: If any group is empty or has mismatched weights
+        """
+        prepared = [_prepare_inputs(scores, weights) for scores, weights in groups]
+        indices = [self._draw_indices(len(scores_arr)) for scores_arr, _ in prepared]
+        return _bootstrap_groups(prepared, indices, self.n_samples)
+
+
+def _prepare_inputs(
+    scores: list[float],
+    weights: list[float] | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Validate scores/weights and return (scores, normalized weights)."""
+    if not scores:
+        raise ValueError("Cannot bootstrap empty score list")
+    
+    scores_arr = np.array(scores, dtype=np.float64)
+    n = len(scores_arr)
+    
+    if weights is None:
+        weights_arr = np.ones(n) / n
+    else:
+        if len(weights) != n:
+            raise ValueError(f"Weight count {len(weights)} != score count {n}")
+        weights_arr = np.array(weights, dtype=np.float64)
+        weights_arr = weights_arr / np.sum(weights_arr)  # Normalize
+    
+    return scores_arr, weights_arr
+
+
+def _resample_weighted_means(
+    scores: np.ndarray,
+    weights: np.ndarray,
+    indices: np.ndarray,
+) -> np.ndarray:
+    """
+    Weighted mean of every resample of every group.
+
+    Shapes: scores/weights (groups, n), indices (groups, n_samples, n);
+    returns (groups, n_samples). Each resample is renormalized and reduced
+    along the contiguous last axis, which matches the per-resample
+    ``np.sum(resample_scores * resample_weights)`` bit for bit.
+    """
+    resample_scores = np.take_along_axis(scores[:, np.newaxis, :], indices, axis=2)
+    resample_weights = np.take_along_axis(weights[:, np.newaxis, :], indices, axis=2)
+    resample_weights = resample_weights / np.sum(resample_weights, axis=2, keepdims=True)
+    return np.sum(resample_scores * resample_weights, axis=2)
+
+
+def _bootstrap_groups(
+    prepared: list[tuple[np.ndarray, np.ndarray]],
+    indices: list[np.ndarray],
+    n_samples: int,
+) -> list[UncertaintyMetrics]:
+    """Resample groups of equal size together and summarize each group."""
+    by_size: dict[int, list[int]] = {}
+    for position, (scores_arr, _) in enumerate(prepared):
+        by_size.setdefault(len(scores_arr), []).append(position)
+
+    resamples: list[np.ndarray | None] = [None] * len(prepared)
+    for positions in by_size.values():
+        means = _resample_weighted_means(
+            np.stack([prepared[p][0] for p in positions]),
+            np.stack([prepared[p][1] for p in positions]),
+            np.stack([indices[p] for p in positions]),
         )
+        for row, position in enumerate(positions):
+            resamples[position] = means[row]
+
+    return [
+        _summarize_resamples(resample, scores_arr, n_samples)
+        for resample, (scores_arr, _) in zip(resamples, prepared, strict=True)
+    ]
+
+
+def _summarize_resamples(
+    resamples: np.ndarray,
+    scores_arr: np.ndarray,
+    n_samples: int,
+) -> UncertaintyMetrics:
+    """Build UncertaintyMetrics from the bootstrap distribution of one group."""
+    n = len(scores_arr)
+    
+    # Compute statistics
+    mean = np.mean(resamples)
+    std = np.std(resamples, ddof=1)
+    variance = std ** 2
+    
+    # Confidence intervals (percentile method)
+    ci_95_lower = np.percentile(resamples, 2.5)
+    ci_95_upper = np.percentile(resamples, 97.5)
+    ci_99_lower = np.percentile(resamples, 0.5)
+    ci_99_upper = np.percentile(resamples, 99.5)
+    
+    # Uncertainty decomposition
+    # Epistemic: Uncertainty in the aggregation (reducible with more samples)
+    epistemic_uncertainty = std
+    
+    # Aleatoric: Inherent variability in data (irreducible)
+    aleatoric_uncertainty = np.std(scores_arr, ddof=1)
+    
+    # Coefficient of variation
+    cv = std / mean if mean != 0.0 else float('inf')
+    
+    # Distribution shape
+    skewness = stats.skew(resamples)
+    kurtosis = stats.kurtosis(resamples)
+    
+    logger.debug(
+        f"Bootstrap complete: mean={mean:.4f}, std={std:.4f}, "
+        f"CI95=[{ci_95_lower:.4f}, {ci_95_upper:.4f}]"
+    )
+    
+    return UncertaintyMetrics(
+        mean=float(mean),
+        std=float(std),
+        variance=float(variance),
+        confidence_interval_95=(float(ci_95_lower), float(ci_95_upper)),
+        confidence_interval_99=(float(ci_99_lower), float(ci_99_upper)),
+        epistemic_uncertainty=float(epistemic_uncertainty),
+        aleatoric_uncertainty=float(aleatoric_uncertainty),
+        coefficient_of_variation=float(cv),
+        skewness=float(skewness),
+        kurtosis=float(kurtosis),
+        metadata={
+            "n_scores": n,
+            "n_bootstrap_samples": n_samples,
+            "original_scores_mean": float(np.mean(scores_arr)),
+            "original_scores_std": float(np.std(scores_arr, ddof=1)),
+        },
+    )
 
 
 class BayesianPropagation:
@@ -301,11 +397,6 @@ class SensitivityAnalysis:
         Note:
             For weighted average, Sobol index is proportional to weight^2 * var(score_i).
         """
-        if aggregation_func is None:
-            # Default: weighted average
-            def aggregation_func(s, w):
-                return np.sum(np.array(s) * np.array(w))
-        
         n = len(scores)
         scores_arr = np.array(scores, dtype=np.float64)
         weights_arr = np.array(weights, dtype=np.float64)
@@ -313,27 +404,41 @@ class SensitivityAnalysis:
         
         rng = np.random.RandomState(random_seed)
         
-        # Baseline output variance
-        baseline_output = aggregation_func(scores_arr, weights_arr)
-        
-        # Perturb each input and measure output variance
-        sobol_indices = {}
-        for i in range(n):
-            # Monte Carlo: sample score_i from distribution, hold others fixed
-            perturbed_outputs = []
-            for _ in range(n_samples):
-                perturbed_scores = scores_arr.copy()
-                # Perturb score_i (assume ±20% noise)
-                noise = rng.normal(0, 0.2 * abs(scores_arr[i]))
-                perturbed_scores[i] = scores_arr[i] + noise
-                
-                perturbed_output = aggregation_func(perturbed_scores, weights_arr)
-                perturbed_outputs.append(perturbed_output)
+        # Monte Carlo: sample score_i from distribution, hold others fixed.
+        # All noise is drawn at once; row i holds the n_samples draws for
+        # input i, in the same stream order as per-sample draws.
+        # Perturb score_i (assume ±20% noise)
+        noise_scale = 0.2 * np.abs(scores_arr)
+        noise = rng.normal(0, noise_scale[:, np.newaxis], size=(n, n_samples))
+        
+        # perturbed[j, k] is the score vector of sample k with input
+        # start + j perturbed. Dimensions are processed in chunks so the
+        # working tensor stays bounded at ~_SOBOL_CHUNK_VALUES floats instead
+        # of n * n_samples * n.
+        perturbed_outputs = np.empty((n, n_samples), dtype=np.float64)
+        chunk = max(1, _SOBOL_CHUNK_VALUES // max(1, n_samples * n))
+        for start in range(0, n, chunk):
+            stop = min(n, start + chunk)
+            perturbed = np.broadcast_to(scores_arr, (stop - start, n_samples, n)).copy()
+            rows = np.arange(stop - start)
+            perturbed[rows, :, rows + start] = (
+                scores_arr[start:stop, np.newaxis] + noise[start:stop]
+            )
             
-            # Sobol index = Var(E[Y|X_i]) / Var(Y)
-            # Approximated by: Var of perturbed outputs
-            variance_due_to_i = np.var(perturbed_outputs, ddof=1)
-            sobol_indices[i] = float(variance_due_to_i)
+            if aggregation_func is None:
+                # Default: weighted average, evaluated for the whole chunk at once
+                perturbed_outputs[start:stop] = np.sum(perturbed * weights_arr, axis=2)
+            else:
+                perturbed_outputs[start:stop] = [
+                    [aggregation_func(sample.copy(), weights_arr) for sample in block]
+                    for block in perturbed
+                ]
+        
+        # Sobol index = Var(E[Y|X_i]) / Var(Y)
+        # Approximated by: Var of perturbed outputs
+        sobol_indices = {
+            i: float(np.var(perturbed_outputs[i], ddof=1)) for i in range(n)
+        }
         
         # Normalize so sum = 1.0
         total_variance = sum(sobol_indices.values())
@@ -371,10 +476,51 @@ def aggregate_with_uncertainty(
     return point_estimate, uncertainty
 
 
+def aggregate_with_uncertainty_batch(
+    groups: Sequence[tuple[list[float], list[float] | None]],
+    n_bootstrap: int = 1000,
+    random_seed: int = 42,
+) -> list[tuple[float, UncertaintyMetrics]]:
+    """
+    Batched aggregate_with_uncertainty for all groups of an aggregation level.
+    
+    Every group is bootstrapped with a fresh generator seeded with
+    ``random_seed``, exactly as separate aggregate_with_uncertainty() calls,
+    so groups of equal size share one resample index matrix.
+    
+    Args:
+        groups: Sequence of (scores, weights) pairs
+        n_bootstrap: Number of bootstrap samples
+        random_seed: Reproducibility seed
+    
+    Returns:
+        (point_estimate, uncertainty_metrics) per group, in input order
+    
+    Raises:
+        ValueError: If any group is empty or has mismatched weights
+    """
+    prepared = [_prepare_inputs(scores, weights) for scores, weights in groups]
+    indices_by_size: dict[int, np.ndarray] = {}
+    for scores_arr, _ in prepared:
+        n = len(scores_arr)
+        if n not in indices_by_size:
+            indices_by_size[n] = BootstrapAggregator(
+                n_samples=n_bootstrap, random_seed=random_seed
+            )._draw_indices(n)
+    
+    uncertainties = _bootstrap_groups(
+        prepared,
+        [indices_by_size[len(scores_arr)] for scores_arr, _ in prepared],
+        n_bootstrap,
+    )
+    return [(uncertainty.mean, uncertainty) for uncertainty in uncertainties]
+
+
 __all__ = [
     "UncertaintyMetrics",
     "BootstrapAggregator",
     "BayesianPropagation",
     "SensitivityAnalysis",
     "aggregate_with_uncertainty",
+    "aggregate_with_uncertainty_batch",
 ]
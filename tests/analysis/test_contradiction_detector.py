@@ -208,9 +208,9 @@ class TestPolicyContradictionDetector:
     @pytest.fixture
     def detector(self):
         """Create contradiction detector with mocked models."""
-        with patch('src.farfan_pipeline.analysis.contradiction_deteccion.SentenceTransformer'), \
+        with patch('src.farfan_pipeline.analysis.contradiction_deteccion.acquire_sentence_transformer'), \
              patch('src.farfan_pipeline.analysis.contradiction_deteccion.pipeline'), \
-             patch('src.farfan_pipeline.analysis.factory.load_spacy_model'):
+             patch('src.farfan_pipeline.analysis.contradiction_deteccion.acquire_spacy'):
 
             detector = PolicyContradictionDetector()
 
@@ -317,9 +317,9 @@ class TestContradictionDetectionIntegration:
     @pytest.fixture
     def detector_integration(self):
         """Create detector for integration tests."""
-        with patch('src.farfan_pipeline.analysis.contradiction_deteccion.SentenceTransformer'), \
+        with patch('src.farfan_pipeline.analysis.contradiction_deteccion.acquire_sentence_transformer'), \
              patch('src.farfan_pipeline.analysis.contradiction_deteccion.pipeline'), \
-             patch('src.farfan_pipeline.analysis.factory.load_spacy_model'):
+             patch('src.farfan_pipeline.analysis.contradiction_deteccion.acquire_spacy'):
 
             detector = PolicyContradictionDetector()
             detector.semantic_model = Mock()
@@ -371,3 +371,98 @@ class TestContradictionDetectionIntegration:
         result = detector_integration.detect(text, plan_name="Test")
 
         assert "recommendations" in result or "contradictions" in result
+
+
+class TestCandidatePairPruning:
+    """Tests for similarity-gated candidate generation and batched NLI."""
+
+    @pytest.fixture
+    def detector(self):
+        """Create detector with mocked models."""
+        with patch('src.farfan_pipeline.analysis.contradiction_deteccion.acquire_sentence_transformer'), \
+             patch('src.farfan_pipeline.analysis.contradiction_deteccion.pipeline'), \
+             patch('src.farfan_pipeline.analysis.contradiction_deteccion.acquire_spacy'):
+
+            detector = PolicyContradictionDetector()
+            detector.nlp = Mock()
+            return detector
+
+    @staticmethod
+    def make_statements(embeddings, claims=None):
+        claims = claims or [[] for _ in embeddings]
+        return [
+            PolicyStatement(
+                text=f"Declaración {i}",
+                dimension=PolicyDimension.FINANCIERO,
+                position=(i * 10, i * 10 + 9),
+                quantitative_claims=claims[i],
+                embedding=embedding,
+            )
+            for i, embedding in enumerate(embeddings)
+        ]
+
+    def test_similarity_pairs_match_pairwise_cosine(self, detector):
+        """Test blockwise matrix candidates equal the pairwise scan."""
+        rng = np.random.default_rng(0)
+        embeddings = [rng.normal(size=16) for _ in range(40)]
+        embeddings[7] = None
+        statements = self.make_statements(embeddings)
+        detector.SIMILARITY_BLOCK_ROWS = 7
+
+        pairs = detector._similar_statement_pairs(statements, 0.2)
+
+        expected = [
+            (i, j) for i in range(40) for j in range(i + 1, 40)
+            if detector._calculate_similarity(statements[i], statements[j]) > 0.2
+        ]
+        assert [(i, j) for i, j, _ in pairs] == expected
+        for i, j, similarity in pairs:
+            assert similarity == pytest.approx(
+                detector._calculate_similarity(statements[i], statements[j])
+            )
+
+    def test_only_gated_pairs_reach_classifier_in_batches(self, detector):
+        """Test the NLI classifier sees only survivors of the similarity gate."""
+        base = np.ones(8)
+        embeddings = [base, base + 0.01, -base, base * 2]
+        statements = self.make_statements(embeddings)
+        detector.CLASSIFIER_BATCH_SIZE = 2
+        detector.contradiction_classifier = Mock(
+            side_effect=lambda texts, batch_size: [
+                {'label': 'CONTRADICTION', 'score': 0.9} for _ in texts
+            ]
+        )
+
+        contradictions = detector._detect_semantic_contradictions(statements)
+
+        batches = [call.args[0] for call in detector.contradiction_classifier.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert len(contradictions) == 3
+        assert all(c.statement_a.position < c.statement_b.position for c in contradictions)
+        assert "Declaración 2" not in " ".join(text for batch in batches for text in batch)
+
+    def test_claim_buckets_match_pairwise_comparison(self, detector):
+        """Test type buckets yield the same comparable pairs as the full scan."""
+        def claim(kind, value, context):
+            return {'type': kind, 'value': value, 'context': context}
+
+        claims = [
+            [claim('amount', 500, 'presupuesto de educación 500 millones'),
+             claim('percentage', 10, 'cobertura del 10 por ciento')],
+            [claim('amount', 600, 'presupuesto de educación 600 millones')],
+            [claim('percentage', 30, 'cobertura del 30 por ciento'),
+             claim('amount', 700, 'presupuesto de educación 700 millones')],
+            [],
+        ]
+        statements = self.make_statements([None] * 4, claims)
+
+        pairs = detector._comparable_claim_pairs(statements)
+
+        expected = [
+            (i, j, a, b)
+            for i in range(4) for j in range(i + 1, 4)
+            for a in claims[i] for b in claims[j]
+            if detector._are_comparable_claims(a, b)
+        ]
+        assert pairs == expected
+        assert len(pairs) == 4
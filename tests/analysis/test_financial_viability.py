@@ -24,15 +24,19 @@ from src.farfan_pipeline.analysis.financiero_viabilidad_tablas import (
 @pytest.fixture
 def mock_analyzer():
     """Create mock analyzer with mocked dependencies."""
-    with patch('src.farfan_pipeline.analysis.financiero_viabilidad_tablas.SentenceTransformer'), \
-         patch('src.farfan_pipeline.analysis.factory.load_spacy_model'), \
+    def encode(texts, **kwargs):
+        return np.random.rand(len(texts), 768)
+
+    with patch('src.farfan_pipeline.analysis.financiero_viabilidad_tablas.acquire_sentence_transformer') as acquire, \
+         patch('src.farfan_pipeline.analysis.financiero_viabilidad_tablas.acquire_spacy'), \
          patch('src.farfan_pipeline.analysis.financiero_viabilidad_tablas.pipeline'):
+        acquire.return_value.model.encode = Mock(side_effect=encode)
 
         analyzer = PDETMunicipalPlanAnalyzer(use_gpu=False)
 
         # Mock the semantic model
         analyzer.semantic_model = Mock()
-        analyzer.semantic_model.encode = Mock(return_value=np.random.rand(768))
+        analyzer.semantic_model.encode = Mock(side_effect=encode)
 
         # Mock NLP model
         analyzer.nlp = Mock()
@@ -0,0 +1,172 @@
+"""
+Unit tests for the budgeted centrality engine (graph_centrality.py)
+
+Tests exact agreement with NetworkX when the budget allows, pivot-sampled
+betweenness and clustering with error bounds, sparse PageRank/eigenvector
+centrality and incremental edge updates, including edits made on the graph.
+"""
+
+import random
+
+import networkx as nx
+import pytest
+
+from farfan_pipeline.analysis.graph_centrality import CentralityEngine
+
+
+def _assert_close(actual, expected, tol):
+    assert actual.keys() == expected.keys()
+    assert max(abs(actual[k] - expected[k]) for k in expected) < tol
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_exact_within_budget_matches_networkx(directed):
+    G = nx.gnp_random_graph(60, 0.08, seed=7, directed=directed)
+    engine = CentralityEngine(G.copy(), time_budget_ms=60_000)
+
+    estimate = engine.betweenness()
+
+    assert estimate.exact and estimate.pivots == 60 and estimate.error_bound == 0.0
+    _assert_close(estimate.values, nx.betweenness_centrality(G), 1e-9)
+    _assert_close(engine.pagerank(), nx.pagerank(G), 1e-5)
+
+
+def test_eigenvector_matches_networkx_and_fails_soft_on_dags():
+    G = nx.gnp_random_graph(50, 0.1, seed=2)
+    _assert_close(CentralityEngine(G).eigenvector(), nx.eigenvector_centrality(G), 1e-4)
+
+    dag = nx.DiGraph([(i, i + 1) for i in range(30)])
+    assert CentralityEngine(dag).eigenvector() is None
+
+
+def test_sampled_betweenness_respects_budget_and_error_bound():
+    G = nx.barabasi_albert_graph(400, 3, seed=1)
+    exact = nx.betweenness_centrality(G)
+
+    estimate = CentralityEngine(G, time_budget_ms=0, min_pivots=120).betweenness()
+
+    assert not estimate.exact and estimate.pivots == 120
+    assert 0.0 < estimate.error_bound < 1.0
+    assert max(abs(estimate.values[v] - exact[v]) for v in G) <= estimate.error_bound
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_incremental_updates_match_recomputation(directed):
+    G = nx.gnp_random_graph(70, 0.05, seed=4, directed=directed)
+    engine = CentralityEngine(G.copy(), time_budget_ms=60_000)
+    engine.betweenness()
+    engine.pagerank()
+
+    rng = random.Random(0)
+    for _ in range(25):
+        u, v = rng.randrange(75), rng.randrange(75)  # may introduce new nodes
+        if u == v:
+            continue
+        if engine.graph.has_edge(u, v):
+            engine.remove_edge(u, v)
+        else:
+            engine.add_edge(u, v)
+
+    reference = engine.graph.copy()
+    estimate = engine.betweenness()
+    assert estimate.exact
+    _assert_close(estimate.values, nx.betweenness_centrality(reference), 1e-9)
+    _assert_close(engine.pagerank(), nx.pagerank(reference), 1e-5)
+
+
+def test_sampled_incremental_update_equals_fresh_pivot_sums():
+    G = nx.barabasi_albert_graph(300, 2, seed=3)
+    engine = CentralityEngine(G, time_budget_ms=0, min_pivots=40)
+    engine.betweenness()
+
+    engine.add_edge(0, 299)
+    engine.remove_edge(*next(iter(G.edges)))
+    updated = engine.betweenness()
+
+    fresh = CentralityEngine(engine.graph.copy())
+    fresh._pivots = []
+    raw = sum(fresh._single_source(p)[1] for p in engine._pivots)
+    scale = 300 / 40 / (299 * 298)
+    assert max(abs(updated.values[v] - raw[i] * scale) for i, v in enumerate(engine._nodes)) < 1e-12
+
+
+def test_average_clustering_exact_and_sampled():
+    G = nx.gnp_random_graph(80, 0.1, seed=5)
+    exact = CentralityEngine(G, time_budget_ms=60_000).average_clustering()
+    assert exact.exact and exact.sampled == 80
+    assert exact.value == pytest.approx(nx.average_clustering(G))
+
+    big = nx.powerlaw_cluster_graph(2000, 3, 0.3, seed=6)
+    sampled = CentralityEngine(big, min_pivots=200).average_clustering(time_budget_ms=0)
+    assert not sampled.exact and sampled.sampled < 2000
+    assert abs(sampled.value - nx.average_clustering(big)) <= sampled.error_bound
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_sync_applies_edits_made_on_the_graph(directed):
+    G = nx.gnp_random_graph(50, 0.08, seed=8, directed=directed)
+    engine = CentralityEngine(G, time_budget_ms=60_000)
+    engine.betweenness()
+
+    rng = random.Random(1)
+    for _ in range(15):
+        u, v = rng.randrange(55), rng.randrange(55)  # may introduce new nodes
+        if u == v:
+            continue
+        if G.has_edge(u, v):
+            G.remove_edge(u, v)
+        else:
+            G.add_edge(u, v)
+
+    assert engine.sync()
+    estimate = engine.betweenness()
+    assert estimate.exact
+    _assert_close(estimate.values, nx.betweenness_centrality(G), 1e-9)
+
+    G.remove_node(0)
+    assert not engine.sync()
+
+
+def test_sync_recomputes_each_affected_pivot_once(monkeypatch):
+    G = nx.barabasi_albert_graph(120, 2, seed=9)
+    engine = CentralityEngine(G, time_budget_ms=60_000)
+    engine.betweenness()
+    passes = []
+    single_source = engine._single_source
+    monkeypatch.setattr(engine, "_single_source", lambda s: passes.append(s) or single_source(s))
+
+    rng = random.Random(2)
+    for _ in range(30):
+        u, v = rng.sample(range(120), 2)
+        if not G.has_edge(u, v):
+            G.add_edge(u, v)
+    assert engine.sync()
+
+    assert len(passes) == len(set(passes)) <= 120
+    _assert_close(engine.betweenness().values, nx.betweenness_centrality(G), 1e-9)
+
+
+def test_sync_resamples_when_edits_exceed_the_budget():
+    G = nx.barabasi_albert_graph(200, 2, seed=10)
+    engine = CentralityEngine(G, time_budget_ms=60_000, min_pivots=5)
+    assert engine.betweenness().exact
+
+    engine.time_budget_ms = 0
+    for u in range(0, 100, 2):
+        G.add_edge(u, u + 101)
+    assert engine.sync()
+
+    estimate = engine.betweenness()
+    assert not estimate.exact and estimate.pivots == 5
+
+
+def test_pivot_buffers_grow_geometrically():
+    engine = CentralityEngine(nx.path_graph(10), time_budget_ms=60_000)
+    engine.betweenness()
+    buffers = {id(engine._dist_buffer)}
+    for node in range(10, 210):
+        engine.add_edge(node - 1, node)
+        buffers.add(id(engine._dist_buffer))
+
+    assert len(buffers) <= 12
+    _assert_close(engine.betweenness().values, nx.betweenness_centrality(nx.path_graph(210)), 1e-9)
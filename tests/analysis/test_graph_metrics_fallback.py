@@ -273,6 +273,29 @@ class TestIntegration:
             assert 'density' in metrics
             assert metrics['num_nodes'] > 0
 
+    def test_engine_is_kept_for_a_graph_between_calls(self, runtime_config):
+        """Test that a NetworkX graph keeps its centrality engine across phases."""
+        if not check_networkx_available():
+            pytest.skip("NetworkX not available")
+        import networkx as nx
+
+        from src.farfan_pipeline.analysis import graph_metrics_fallback
+
+        graph_metrics_fallback.reset_centrality_engines()
+        G = nx.path_graph(6)
+        compute_graph_metrics_with_fallback(G, runtime_config=runtime_config)
+        engine = graph_metrics_fallback._engines[id(G)]
+
+        G.add_edge(0, 5)
+        metrics, info = compute_graph_metrics_with_fallback(G, runtime_config=runtime_config)
+
+        assert info.computed
+        assert graph_metrics_fallback._engines[id(G)] is engine
+        assert metrics['betweenness_centrality'] == pytest.approx(nx.betweenness_centrality(G))
+        assert metrics['avg_clustering'] == pytest.approx(nx.average_clustering(G))
+        assert metrics['avg_clustering_approximation']['exact'] is True
+        graph_metrics_fallback.reset_centrality_engines()
+
     def test_graceful_degradation(self, sample_edge_list, runtime_config):
         """Test graceful degradation to basic stats."""
         # Even if NetworkX fails, should return valid GraphMetricsInfo
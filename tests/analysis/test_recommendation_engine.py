@@ -401,3 +401,113 @@ class TestIntegration:
 
         assert isinstance(result, RecommendationSet)
         assert result.level == 'MACRO'
+
+
+def _rule(rule_id, level, when, problem='Problema {{rule}}'):
+    return {
+        'rule_id': rule_id,
+        'level': level,
+        'when': when,
+        'template': {
+            'problem': problem,
+            'intervention': 'Intervención',
+            'indicator': {'name': '{{PAxx}} indicador', 'target': 0.8},
+            'responsible': {'entity': 'Secretaría'},
+            'horizon': {'start': 'T0'},
+            'verification': ['Acta {{cluster_id}}'],
+            'template_params': {'rule': rule_id},
+        },
+    }
+
+
+@pytest.fixture
+def compiled_engine():
+    """Engine with rules compiled directly, bypassing file loading."""
+    engine = RecommendationEngine.__new__(RecommendationEngine)
+    engine.rules_by_level = {
+        'MICRO': [
+            _rule('M-HIGH', 'MICRO', {'pa_id': 'PA01', 'dim_id': 'DIM01', 'score_lt': 2.5}),
+            _rule('M-LOW', 'MICRO', {'pa_id': 'PA01', 'dim_id': 'DIM01', 'score_lt': 1.0}),
+            _rule('M-OTHER', 'MICRO', {'pa_id': 'PA02', 'dim_id': 'DIM03', 'score_lt': 2.0}),
+        ],
+        'MESO': [
+            _rule('C-BAJO', 'MESO', {'cluster_id': 'CL01', 'score_band': 'BAJO', 'variance_level': 'ALTA',
+                                     'variance_threshold': 30.0}),
+            _rule('C-WEAK', 'MESO', {'cluster_id': 'CL02', 'weak_pa_id': 'PA05'}),
+        ],
+        'MACRO': [
+            _rule('P-BAND', 'MACRO', {'macro_band': 'BUENO', 'priority_micro_gaps': ['PA01-DIM01']}),
+        ],
+    }
+    engine._compile_rules()
+    return engine
+
+
+class TestCompiledRules:
+    """Test suite for the load-time rule index and precompiled templates."""
+
+    def test_micro_index_range_lookup_keeps_rule_order(self, compiled_engine):
+        result = compiled_engine.generate_micro_recommendations({'PA01-DIM01': 0.5, 'PA02-DIM03': 2.0})
+
+        assert [r.rule_id for r in result.recommendations] == ['M-HIGH', 'M-LOW']
+        assert result.total_rules_evaluated == 3
+
+        result = compiled_engine.generate_micro_recommendations({'PA01-DIM01': 1.0})
+        assert [r.rule_id for r in result.recommendations] == ['M-HIGH']
+        assert result.recommendations[0].metadata['gap'] == pytest.approx(1.5)
+
+    def test_templates_render_from_segments(self, compiled_engine):
+        rec = compiled_engine.generate_micro_recommendations({'PA01-DIM01': 2.0}).recommendations[0]
+
+        assert rec.problem == 'Problema M-HIGH'
+        assert rec.indicator == {'name': 'PA01 indicador', 'target': 0.8}
+        assert rec.verification == ['Acta {{cluster_id}}']
+        assert compiled_engine._substitute_variables('{{a}}-{{b}}-{{a}}', {'a': 'x'}) == 'x-{{b}}-x'
+
+    def test_meso_predicates(self, compiled_engine):
+        result = compiled_engine.generate_meso_recommendations({
+            'CL01': {'score': 40.0, 'variance': 0.35},
+            'CL02': {'score': 90.0, 'variance': 0.01, 'weak_pa': 'PA05'},
+        })
+        assert [r.rule_id for r in result.recommendations] == ['C-BAJO', 'C-WEAK']
+
+        result = compiled_engine.generate_meso_recommendations({
+            'CL01': {'score': 40.0, 'variance': 0.25},
+            'CL02': {'score': 90.0, 'variance': 0.01, 'weak_pa': 'PA04'},
+        })
+        assert result.recommendations == []
+
+    def test_macro_predicate(self, compiled_engine):
+        matched = compiled_engine.generate_macro_recommendations(
+            {'macro_band': 'BUENO', 'priority_micro_gaps': ['PA01-DIM01', 'PA02-DIM02']}
+        )
+        unmatched = compiled_engine.generate_macro_recommendations(
+            {'macro_band': 'BUENO', 'priority_micro_gaps': ['PA02-DIM02']}
+        )
+
+        assert [r.rule_id for r in matched.recommendations] == ['P-BAND']
+        assert unmatched.recommendations == []
+
+    def test_micro_batch(self, compiled_engine):
+        results = compiled_engine.generate_micro_recommendations_batch(
+            [{'PA01-DIM01': 0.5}, {'PA02-DIM03': 1.0}, {}],
+            context=[{'question_id': 'Q001'}, None, None],
+        )
+
+        assert [[r.rule_id for r in rs.recommendations] for rs in results] == [
+            ['M-HIGH', 'M-LOW'], ['M-OTHER'], [],
+        ]
+        assert len({rs.generated_at for rs in results}) == 1
+        with pytest.raises(ValueError, match="contexts"):
+            compiled_engine.generate_micro_recommendations_batch([{}, {}], context=[None])
+
+    def test_all_levels_batch(self, compiled_engine):
+        results = compiled_engine.generate_all_recommendations_batch([
+            {'micro_scores': {'PA01-DIM01': 2.0}, 'macro_data': {'macro_band': 'BUENO',
+                                                                'priority_micro_gaps': ['PA01-DIM01']}},
+            {'cluster_data': {'CL02': {'weak_pa': 'PA05'}}},
+        ])
+
+        assert [r.rule_id for r in results[0]['MICRO'].recommendations] == ['M-HIGH']
+        assert [r.rule_id for r in results[0]['MACRO'].recommendations] == ['P-BAND']
+        assert [r.rule_id for r in results[1]['MESO'].recommendations] == ['C-WEAK']
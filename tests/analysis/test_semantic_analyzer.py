@@ -7,12 +7,44 @@ policy domain mapping, and cross-cutting theme detection.
 
 import numpy as np
 import pytest
+from scipy import sparse
 
 from src.farfan_pipeline.analysis.Analyzer_one import (
+    BatchProcessor,
+    MunicipalAnalyzer,
     MunicipalOntology,
     SemanticAnalyzer,
     ValueChainLink,
 )
+from src.farfan_pipeline.core.parameters import ParameterLoaderV2
+
+
+def legacy_scores(ontology, segment, dimension):
+    """Per-keyword substring loops of the original single-segment classifiers."""
+    method, increment_key, empty_key, underscores = {
+        "value_chain_links": ("_classify_value_chain_link", "auto_param_L361_29", "auto_param_L364_87", True),
+        "policy_domains": ("_classify_policy_domain", "auto_param_L378_29", "auto_param_L380_75", False),
+        "cross_cutting_themes": ("_classify_cross_cutting_themes", "auto_param_L394_29", "auto_param_L396_73", True),
+    }[dimension]
+    key = f"farfan_core.analysis.Analyzer_one.SemanticAnalyzer.{method}"
+    if dimension == "value_chain_links":
+        groups = {
+            name: link.instruments + link.mediators + link.outputs + link.outcomes
+            for name, link in ontology.value_chain_links.items()
+        }
+    else:
+        groups = getattr(ontology, dimension)
+
+    segment_lower = segment.lower()
+    scores = {}
+    for name, keywords in groups.items():
+        score = ParameterLoaderV2.get(key, "score", 0.0)
+        for keyword in keywords:
+            keyword = keyword.lower().replace("_", " ") if underscores else keyword.lower()
+            if keyword in segment_lower:
+                score += ParameterLoaderV2.get(key, increment_key, 1.0)
+        scores[name] = score / len(keywords) if keywords else ParameterLoaderV2.get(key, empty_key, 0.0)
+    return scores
 
 
 @pytest.fixture
@@ -107,10 +139,9 @@ class TestSemanticAnalyzer:
         """Test segment vectorization."""
         vectors = semantic_analyzer._vectorize_segments(sample_segments)
 
-        assert isinstance(vectors, (np.ndarray, list))
-        if isinstance(vectors, np.ndarray):
-            assert vectors.shape[0] == len(sample_segments)
-            assert vectors.shape[1] > 0
+        assert sparse.issparse(vectors)
+        assert vectors.shape[0] == len(sample_segments)
+        assert vectors.shape[1] > 0
 
     def test_process_segment(self, semantic_analyzer):
         """Test individual segment processing."""
@@ -244,3 +275,92 @@ class TestSemanticCubeIntegration:
         # Should not crash with mixed content
         cube = semantic_analyzer.extract_semantic_cube(segments)
         assert cube["metadata"]["total_segments"] == 2
+
+
+class TestOntologyKeywordIndex:
+    """Test the sparse keyword-category matrix behind the classifiers."""
+
+    def test_index_is_compiled_once(self, ontology):
+        """The index is cached and rebuilt only when keyword sets change."""
+        index = ontology.keyword_index()
+        assert ontology.keyword_index() is index
+
+        ontology.policy_domains["security"] = ["policing", "crime_prevention"]
+        rebuilt = ontology.keyword_index()
+        assert rebuilt is not index
+        assert ("policy_domains", "security") in rebuilt.categories
+
+    def test_batch_scores_match_legacy_keyword_loops(self, semantic_analyzer, sample_segments):
+        """One scan and matrix product reproduce the original per-keyword loops."""
+        ontology = semantic_analyzer.ontology
+        # Nested and overlapping keywords must all be detected
+        ontology.policy_domains["health"] = ["salud", "salud pública", "pública", "blica sal"]
+        segments = sample_segments + [
+            "capacity building and technical assistance with stakeholder participation",
+            "land_use land use transparency gender equity",
+            "La salud pública sal",
+            "",
+        ]
+        index = ontology.keyword_index()
+        scores = index.score(segments)
+
+        assert scores.shape == (len(segments), len(index.categories))
+        for row, segment in zip(scores, segments):
+            for dimension in ("value_chain_links", "policy_domains", "cross_cutting_themes"):
+                assert index.dimension_scores(row, dimension) == pytest.approx(
+                    legacy_scores(ontology, segment, dimension), abs=1e-12
+                )
+        health = index.dimension_scores(scores[-2], "policy_domains")["health"]
+        assert health == pytest.approx(1.0)
+
+    def test_matched_keywords_equal_substring_scan(self, ontology):
+        """The alternation scan finds exactly the keywords a substring test finds."""
+        ontology.cross_cutting_themes["nested"] = ["aa", "a_a", "aaa", "ab", "b"]
+        index = ontology.keyword_index()
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            segment = "".join(rng.choice(list("aAb _"), size=rng.integers(0, 12)))
+            expected = [i for i, k in enumerate(index.keywords) if k in segment.lower()]
+            assert index.matched_keywords(segment) == expected
+
+    def test_policy_domain_keywords_keep_underscores(self, semantic_analyzer):
+        """Policy domain keywords match literally; other dimensions match spaced forms."""
+        spaced = semantic_analyzer._classify_policy_domain("land use planning")
+        literal = semantic_analyzer._classify_policy_domain("land_use planning")
+
+        assert literal["territorial_development"] > spaced["territorial_development"]
+
+    def test_semantic_cube_stores_sparse_vectors(self, semantic_analyzer, sample_segments):
+        """Segment vectors stay sparse through the semantic cube."""
+        semantic_analyzer.similarity_threshold = 0.0
+        segments = sample_segments + ["transparency and accountability in municipal budgets"]
+
+        cube = semantic_analyzer.extract_semantic_cube(segments)
+        governance = cube["dimensions"]["cross_cutting_themes"]["governance"]
+
+        assert [s["segment_id"] for s in governance] == [4]
+        vector = governance[0]["vector"]
+        assert set(vector) == {"indices", "values", "size"}
+        assert len(vector["indices"]) == len(vector["values"]) > 0
+
+
+class TestBatchProcessor:
+    """Test sequential and process-parallel batch processing."""
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Forked workers return the same results in the same order."""
+        for i in range(4):
+            (tmp_path / f"plan_{i}.txt").write_text(
+                f"Plan {i}. La estrategia incluye transparency y capacity building. "
+                "Los servicios de education y health mejoran la calidad de vida.",
+                encoding="utf-8",
+            )
+        processor = BatchProcessor(MunicipalAnalyzer())
+
+        sequential = processor.process_directory(str(tmp_path))
+        parallel = processor.process_directory(str(tmp_path), workers=2)
+
+        assert list(parallel) == list(sequential)
+        for name in sequential:
+            assert "error" not in parallel[name]
+            assert parallel[name]["semantic_cube"]["dimensions"] == sequential[name]["semantic_cube"]["dimensions"]
@@ -6,12 +6,14 @@ Monte Carlo simulation, and axiom enforcement.
 """
 
 import networkx as nx
+import numpy as np
 import pytest
 
 from farfan_pipeline.core.types import CategoriaCausal
 from src.farfan_pipeline.analysis.teoria_cambio import (
     AdvancedDAGValidator,
     AdvancedGraphNode,
+    BitsetDAGEngine,
     MonteCarloAdvancedResult,
     TeoriaCambio,
     ValidacionResultado,
@@ -305,3 +307,88 @@ class TestAdvancedDAGValidator:
         assert result.reproducible is True
         assert result.p_value == 0.95
         assert 0.0 <= result.bayesian_posterior <= 1.0
+
+
+class TestBitsetDAGEngine:
+    """Test suite for the vectorized Monte Carlo acyclicity engine."""
+
+    @pytest.fixture
+    def cyclic_validator(self):
+        """Graph with two cycles, a self-loop and an acyclic tail."""
+        validator = AdvancedDAGValidator()
+        for from_node, to_node in [
+            ('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D'),
+            ('D', 'E'), ('E', 'C'), ('E', 'F'), ('F', 'F'), ('F', 'G'),
+        ]:
+            validator.add_edge(from_node, to_node)
+        return validator
+
+    @staticmethod
+    def _as_nodes(engine, mask, adjacency):
+        names = [engine.node_names[i] for i in np.flatnonzero(mask)]
+        return {
+            name: AdvancedGraphNode(
+                name,
+                {
+                    engine.node_names[u]
+                    for u in np.flatnonzero(adjacency[:, engine.index[name]])
+                    if mask[u]
+                },
+            )
+            for name in names
+        }
+
+    def test_masks_follow_subgraph_sampling(self, cyclic_validator):
+        """Test masks consume the RNG exactly like _generate_subgraph."""
+        engine = BitsetDAGEngine.from_nodes(cyclic_validator.graph_nodes)
+        cyclic_validator._initialize_rng('plan')
+        masks = cyclic_validator._sample_node_masks(engine, 50)
+        cyclic_validator._initialize_rng('plan')
+        for mask in masks:
+            subgraph = cyclic_validator._generate_subgraph()
+            assert set(subgraph) == {engine.node_names[i] for i in np.flatnonzero(mask)}
+
+    def test_acyclic_matches_kahn(self, cyclic_validator):
+        """Test batched peeling agrees with _is_acyclic on every mask."""
+        engine = BitsetDAGEngine.from_nodes(cyclic_validator.graph_nodes)
+        masks = np.random.default_rng(0).random((400, len(engine.node_names))) < 0.6
+
+        result = engine.acyclic(masks)
+
+        expected = [
+            AdvancedDAGValidator._is_acyclic(self._as_nodes(engine, mask, engine.adjacency))
+            for mask in masks
+        ]
+        assert result.tolist() == expected
+        assert not result.all() and result.any()
+
+    def test_edge_removal_counts_match_recomputation(self, cyclic_validator):
+        """Test edge sensitivity by masking matches full recomputation."""
+        engine = BitsetDAGEngine.from_nodes(cyclic_validator.graph_nodes)
+        masks = np.random.default_rng(1).random((300, len(engine.node_names))) < 0.7
+
+        counts = engine.edge_removal_acyclic_counts(masks)
+
+        for (from_node, to_node), count in counts.items():
+            perturbed = engine.adjacency.copy()
+            perturbed[engine.index[from_node], engine.index[to_node]] = False
+            expected = sum(
+                AdvancedDAGValidator._is_acyclic(self._as_nodes(engine, mask, perturbed))
+                for mask in masks
+            )
+            assert count == expected, (from_node, to_node)
+
+    def test_pvalue_is_reproducible(self, cyclic_validator, monkeypatch):
+        """Test p-value and sensitivities are deterministic per plan."""
+        monkeypatch.setattr(AdvancedDAGValidator, 'export_nodes', lambda self, **_: [])
+        first = cyclic_validator.calculate_acyclicity_pvalue('plan', 2000)
+        second = cyclic_validator.calculate_acyclicity_pvalue('plan', 2000)
+
+        assert first.acyclic_count == second.acyclic_count
+        assert first.edge_sensitivity == second.edge_sensitivity
+        assert 0 < first.p_value < 1
+        assert set(first.edge_sensitivity) == {
+            f"{dep}->{name}"
+            for name, node in cyclic_validator.graph_nodes.items()
+            for dep in node.dependencies
+        }
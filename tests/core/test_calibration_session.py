@@ -0,0 +1,130 @@
+"""
+Tests for CalibrationSession batch calibration.
+
+The session must produce the same certificates as CalibrationEngine.calibrate
+while validating/hashing the graph once and sharing layer scores between nodes.
+"""
+
+import dataclasses
+
+import pytest
+
+from farfan_pipeline.core.calibration import engine as engine_module
+from farfan_pipeline.core.calibration.data_structures import (
+    ComputationGraph,
+    Context,
+    EvidenceStore,
+)
+from farfan_pipeline.core.calibration.engine import CalibrationEngine, CalibrationSession
+
+METHODS = {
+    "Extractor.extract_goals": {"b_theory": 0.8, "b_impl": 0.9, "b_deploy": 0.7},
+    "Scorer.score_question": {"b_theory": 0.9, "b_impl": 0.8, "b_deploy": 0.8},
+    "Reporter.format_report": {"b_theory": 0.7, "b_impl": 0.7, "b_deploy": 0.9},
+}
+
+
+def _engine():
+    """Engine over in-memory configs (the constructor loads them from disk)."""
+    engine = CalibrationEngine.__new__(CalibrationEngine)
+    engine.intrinsic_config = {
+        "_base_weights": {"w_th": 0.4, "w_imp": 0.35, "w_dep": 0.25},
+        "methods": METHODS,
+    }
+    engine.contextual_config = {
+        "interplay_definitions": {"ensemble": {"participants": ["n2", "n3"], "fusion_rule": "mean"}},
+    }
+    engine.fusion_config = {
+        "role_fusion_parameters": {
+            "SCORE_Q": {
+                "linear_weights": {"@b": 0.3, "@chain": 0.1, "@q": 0.1, "@d": 0.1, "@p": 0.1, "@u": 0.1},
+                "interaction_weights": {"(@b, @m)": 0.2},
+            },
+        },
+        "default_fallback": {"linear_weights": {"@b": 0.5, "@chain": 0.3, "@m": 0.2}},
+    }
+    engine.catalog = {
+        "layers": {
+            "analysis": [
+                {"canonical_name": name, "method_name": name.split(".")[1], "class_name": name.split(".")[0]}
+                for name in METHODS
+            ]
+        }
+    }
+    engine.monolith = {"blocks": {"micro_questions": [
+        {"question_id": "Q001", "method_sets": [{"class": "Scorer", "function": "score_question", "priority": 1}]}
+    ]}}
+    engine._build_method_index()
+    engine._validate_fusion_weights()
+    engine.config_hash = engine._compute_config_hash()
+    return engine
+
+
+@pytest.fixture
+def graph():
+    return ComputationGraph(
+        nodes={"n1", "n2", "n3", "n4"},
+        edges=[("n1", "n2"), ("n2", "n3")],
+        node_signatures={"n4": {"required_inputs": ["goals"]}},
+    )
+
+
+NODE_METHODS = {
+    "n1": "Extractor.extract_goals",
+    "n2": "Scorer.score_question",
+    "n3": "Scorer.score_question",
+    "n4": "Reporter.format_report",
+}
+
+
+def _without_timestamp(certificate):
+    return {k: v for k, v in dataclasses.asdict(certificate).items() if k != "timestamp"}
+
+
+def test_calibrate_graph_matches_per_node_calibration(graph):
+    engine = _engine()
+    context = Context(question_id="Q001", dimension_id="DIM02", policy_id="PA03", unit_quality=0.7)
+    evidence = EvidenceStore(runtime_metrics={"runtime_ms": 40})
+
+    certificates = CalibrationSession(engine).calibrate_graph(graph, NODE_METHODS, context, evidence)
+
+    assert list(certificates) == list(NODE_METHODS)
+    for node_id, method_id in NODE_METHODS.items():
+        expected = engine.calibrate(method_id, node_id, graph, context, evidence)
+        assert _without_timestamp(certificates[node_id]) == _without_timestamp(expected)
+    assert certificates["n4"].layer_scores["@chain"] == 0.0
+    assert len({c.timestamp for c in certificates.values()}) == 1
+
+
+def test_graph_is_validated_once_and_layers_are_shared(graph, monkeypatch):
+    session = CalibrationSession(_engine())
+    validations = []
+    base_calls = []
+    original_validate = ComputationGraph.validate_dag
+    original_base = engine_module.compute_base_layer
+    monkeypatch.setattr(
+        ComputationGraph, "validate_dag", lambda self: validations.append(1) or original_validate(self)
+    )
+    monkeypatch.setattr(
+        engine_module, "compute_base_layer", lambda *args: base_calls.append(args[0]) or original_base(*args)
+    )
+
+    contexts = {node_id: Context(policy_id=f"PA0{i + 1}") for i, node_id in enumerate(NODE_METHODS)}
+    session.calibrate_graph(graph, NODE_METHODS, contexts, EvidenceStore())
+    prepared = session.prepare_graph(graph)
+    session.calibrate_graph(prepared, NODE_METHODS, contexts, EvidenceStore())
+
+    assert len(validations) == 2
+    assert sorted(base_calls) == sorted(METHODS)
+
+
+def test_cyclic_graph_and_unknown_node_are_rejected(graph):
+    session = CalibrationSession(_engine())
+    context = Context()
+
+    with pytest.raises(ValueError, match="not in graph"):
+        session.calibrate_graph(graph, {"n9": "Scorer.score_question"}, context, EvidenceStore())
+
+    graph.edges.append(("n3", "n1"))
+    with pytest.raises(ValueError, match="cycles"):
+        session.calibrate_graph(graph, NODE_METHODS, context, EvidenceStore())
@@ -0,0 +1,152 @@
+"""
+Tests for the precompiled executor contract bundle.
+
+Verifies that the build validates contracts once, that unchanged contracts
+are served from the mapped bundle, and that changed contracts, tampered
+bundles and changed schemas fall back to runtime validation. Also builds a
+bundle from the shipped contracts and loads one through the executor.
+"""
+
+import json
+import os
+
+import pytest
+
+from farfan_pipeline.core.orchestrator import base_executor_with_contract
+from farfan_pipeline.core.orchestrator.base_executor_with_contract import BaseExecutorWithContract
+from farfan_pipeline.core.orchestrator.contract_bundle import (
+    CONTRACTS_DIR,
+    ContractBundle,
+    ContractValidationError,
+    build_contract_bundle,
+)
+
+SCHEMA = {
+    "type": "object",
+    "required": ["identity", "executor_binding", "method_binding", "question_context"],
+    "properties": {"identity": {"type": "object", "required": ["base_slot"]}},
+}
+
+
+def _contract(slot):
+    return {
+        "identity": {"base_slot": slot},
+        "executor_binding": {"executor_class": f"{slot}_Executor"},
+        "method_binding": {"methods": []},
+        "question_context": {},
+    }
+
+
+@pytest.fixture
+def layout(tmp_path):
+    contracts = tmp_path / "executor_contracts"
+    (contracts / "specialized").mkdir(parents=True)
+    (contracts / "D1-Q1.v3.json").write_text(json.dumps(_contract("D1-Q1")))
+    (contracts / "specialized" / "Q001.v3.json").write_text(json.dumps(_contract("D1-Q1")))
+    schema = tmp_path / "executor_contract.v3.schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    return {
+        "contracts": contracts,
+        "bundle": contracts / "contracts.bundle",
+        "schemas": {"v3": schema},
+    }
+
+
+def _build(layout):
+    return build_contract_bundle(layout["contracts"], layout["bundle"], layout["schemas"])
+
+
+def _open(layout):
+    return ContractBundle.open(layout["bundle"], layout["contracts"], layout["schemas"])
+
+
+def test_bundle_serves_validated_contracts(layout):
+    manifest = _build(layout)
+    bundle = _open(layout)
+
+    assert set(manifest["contracts"]) == {"D1-Q1.v3.json", "specialized/Q001.v3.json"}
+    contract, version = bundle.get("specialized/Q001.v3.json")
+    assert version == "v3"
+    assert contract == _contract("D1-Q1")
+
+    # Callers may mutate what they get back
+    contract["_contract_version"] = version
+    assert "_contract_version" not in bundle.get("specialized/Q001.v3.json")[0]
+
+
+def test_invalid_contract_fails_build(layout):
+    broken = _contract("D1-Q2")
+    broken["identity"] = {}
+    (layout["contracts"] / "D1-Q2.v3.json").write_text(json.dumps(broken))
+
+    with pytest.raises(ContractValidationError) as excinfo:
+        _build(layout)
+
+    assert set(excinfo.value.failures) == {"D1-Q2.v3.json"}
+    assert not layout["bundle"].exists()
+
+
+def test_changed_source_falls_back_to_runtime_validation(layout):
+    _build(layout)
+    source = layout["contracts"] / "D1-Q1.v3.json"
+    stat = source.stat()
+
+    # Touching a file without changing it keeps the bundled copy
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _open(layout).get("D1-Q1.v3.json") is not None
+
+    changed = _contract("D1-Q1")
+    changed["question_context"] = {"edited": True}
+    source.write_text(json.dumps(changed))
+    bundle = _open(layout)
+    assert bundle.get("D1-Q1.v3.json") is None
+    assert bundle.get("specialized/Q001.v3.json") is not None
+
+
+def test_tampered_bundle_or_changed_schema_is_ignored(layout):
+    _build(layout)
+    data = bytearray(layout["bundle"].read_bytes())
+    data[-2] ^= 0xFF
+    layout["bundle"].write_bytes(bytes(data))
+    assert _open(layout) is None
+
+    _build(layout)
+    layout["schemas"]["v3"].write_text(json.dumps({**SCHEMA, "title": "v3.1"}))
+    assert _open(layout) is None
+
+
+def test_missing_schema_is_an_error(layout, tmp_path):
+    layout["schemas"] = {"v3": tmp_path / "missing.schema.json"}
+
+    with pytest.raises(FileNotFoundError, match="missing.schema.json"):
+        _build(layout)
+    assert not layout["bundle"].exists()
+
+
+def test_executor_loads_shipped_contract_from_bundle(tmp_path, monkeypatch):
+    from farfan_pipeline.core.orchestrator.executors_contract import D1Q1_Executor_Contract
+
+    # The repository ships no executor contract schema; validate the real
+    # contracts against the structural test schema instead
+    schema = tmp_path / "executor_contract.v3.schema.json"
+    schema.write_text(json.dumps(SCHEMA))
+    schemas = {"v3": schema}
+    bundle_path = tmp_path / "contracts.bundle"
+
+    manifest = build_contract_bundle(CONTRACTS_DIR, bundle_path, schemas)
+    bundle = ContractBundle.open(bundle_path, CONTRACTS_DIR, schemas)
+
+    shipped = {p.relative_to(CONTRACTS_DIR).as_posix() for p in CONTRACTS_DIR.rglob("*.v3.json")}
+    assert shipped and set(manifest["contracts"]) == shipped
+    monkeypatch.setattr(base_executor_with_contract, "get_contract_bundle", lambda: bundle)
+    monkeypatch.setattr(BaseExecutorWithContract, "_contract_cache", {})
+    monkeypatch.setattr(
+        BaseExecutorWithContract, "_get_schema_validator",
+        classmethod(lambda cls, version="v2": pytest.fail("bundled contract was revalidated")),
+    )
+
+    contract = D1Q1_Executor_Contract._load_contract("Q031")
+
+    assert contract["identity"]["question_id"] == "Q031"
+    assert contract["identity"]["base_slot"] == "D1-Q1"
+    assert contract["_contract_version"] == "v3"
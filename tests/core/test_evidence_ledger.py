@@ -0,0 +1,181 @@
+"""
+Tests for the segmented, group-commit evidence ledger behind EvidenceRegistry.
+
+Verifies batched commits, segment rolling with chain checkpoints, start-up
+from checkpoints, lazy record loading, legacy single-file ledgers and
+tamper detection.
+"""
+
+import gc
+import json
+import time
+import weakref
+
+import pytest
+
+from farfan_pipeline.core.orchestrator import evidence_ledger
+from farfan_pipeline.core.orchestrator.evidence_registry import EvidenceRecord, EvidenceRegistry
+
+
+def make_registry(path, **kwargs):
+    kwargs.setdefault("commit_batch_size", 4)
+    kwargs.setdefault("segment_max_records", 5)
+    kwargs.setdefault("fsync", False)
+    return EvidenceRegistry(storage_path=path, **kwargs)
+
+
+def record_many(registry, count, start=0):
+    return [
+        registry.record_evidence(
+            "method_result",
+            {"value": i},
+            source_method="Analyzer.run",
+            question_id=f"Q{i % 3:03d}",
+            parent_evidence_ids=[],
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "evidence_registry.jsonl"
+
+
+def test_group_commit_writes_one_batch_per_fsync(path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(evidence_ledger.os, "fsync", synced.append)
+    registry = make_registry(path, commit_batch_size=3, segment_max_records=100, fsync=True)
+
+    record_many(registry, 2)
+    assert not path.exists()
+
+    record_many(registry, 1, start=2)
+    assert len(path.read_text().splitlines()) == 3
+    assert len(synced) == 1
+
+    record_many(registry, 1, start=3)
+    registry.flush()
+    assert len(path.read_text().splitlines()) == 4
+    assert len(synced) == 2
+
+
+def test_chain_runs_across_segments(path):
+    registry = make_registry(path)
+    ids = record_many(registry, 12)
+    registry.flush()
+
+    assert [p.name for p in registry._ledger.segment_paths()] == [
+        "evidence_registry.jsonl",
+        "evidence_registry.000001.jsonl",
+        "evidence_registry.000002.jsonl",
+    ]
+    assert path.with_name("evidence_registry.jsonl.idx").exists()
+
+    records = [registry.get_evidence(eid) for eid in ids]
+    assert records[0].previous_hash is None
+    for previous, current in zip(records, records[1:]):
+        assert current.previous_hash == previous.entry_hash
+    assert registry.verify_chain_integrity() == (True, [])
+
+
+def test_reload_trusts_sealed_segments(path):
+    registry = make_registry(path)
+    ids = record_many(registry, 12)
+    registry.close()
+
+    reloaded = make_registry(path, record_cache_size=2)
+    ledger = reloaded._ledger
+    assert ledger.trusted_records == 10
+    assert ledger.scanned_records == 2
+    assert len(reloaded.hash_index) == 12
+    assert reloaded.get_evidence(ids[3]).payload == {"value": 3}
+    assert [r.payload["value"] for r in reloaded.query_by_question("Q001")] == [1, 4, 7, 10]
+    assert reloaded.verify_evidence(ids[5])
+    assert reloaded.dag is not None and len(reloaded.dag.nodes) == 12
+
+    new_id = reloaded.record_evidence("method_result", {"value": 99})
+    assert reloaded.get_evidence(new_id).previous_hash == reloaded.get_evidence(ids[-1]).entry_hash
+
+
+def test_legacy_single_file_is_loaded_and_sealed(path):
+    previous = None
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(7):
+            record = EvidenceRecord.create("analysis", {"legacy": i}, previous_hash=previous)
+            previous = record.entry_hash
+            f.write(json.dumps(record.to_dict(), separators=(",", ":")) + "\n")
+
+    registry = make_registry(path)
+    assert len(registry.hash_index) == 7
+    assert registry._ledger.checkpoints[0].records == 7
+
+    new_id = registry.record_evidence("analysis", {"legacy": 7})
+    registry.flush()
+    assert registry.get_evidence(new_id).previous_hash == previous
+    assert registry._ledger.entry(new_id).segment == 1
+    assert registry.verify_chain_integrity()[0]
+
+
+def test_torn_trailing_record_is_discarded(path):
+    registry = make_registry(path, segment_max_records=100)
+    ids = record_many(registry, 3)
+    registry.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"evidence_id": "partial')
+
+    reloaded = make_registry(path, segment_max_records=100)
+    assert len(reloaded.hash_index) == 3
+    reloaded.record_evidence("method_result", {"value": 3})
+    reloaded.flush()
+    assert reloaded.verify_chain_integrity() == (True, [])
+    assert reloaded.get_evidence(ids[2]) is not None
+
+
+def test_tampered_sealed_segment_is_detected(path):
+    registry = make_registry(path)
+    record_many(registry, 7)
+    registry.close()
+
+    content = path.read_text()
+    path.write_text(content.replace('"value":1}', '"value":7}', 1))
+
+    valid, errors = make_registry(path).verify_chain_integrity()
+    assert not valid
+    assert any("Hash integrity check failed" in e for e in errors)
+    assert any("does not match its checkpoint" in e for e in errors)
+
+
+def test_tampered_sealed_segment_is_rescanned_at_load(path):
+    registry = make_registry(path)
+    record_many(registry, 7)
+    registry.close()
+    path.write_text(path.read_text().replace('"value":1}', '"value":7}', 1))
+
+    ledger = make_registry(path)._ledger
+    assert ledger.trusted_records == 0 and ledger.scanned_records == 7
+    assert any("does not match its checkpoint" in e for e in ledger.load_errors)
+
+
+def test_interval_commit_fires_without_further_appends(path):
+    registry = make_registry(path, commit_batch_size=100, commit_interval_s=0.05)
+    record_many(registry, 2)
+    assert not path.exists()
+
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(path.read_text().splitlines()) == 2
+    assert registry._ledger.commits == 1
+
+
+def test_collected_ledger_commits_buffered_records(path):
+    registry = make_registry(path, commit_batch_size=100, commit_interval_s=60)
+    record_many(registry, 3)
+    ledger_ref = weakref.ref(registry._ledger)
+
+    del registry
+    gc.collect()
+
+    assert ledger_ref() is None
+    assert len(path.read_text().splitlines()) == 3
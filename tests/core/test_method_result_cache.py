@@ -0,0 +1,185 @@
+"""
+Tests for document-scoped memoization of catalog method results.
+
+Verifies content-addressed keys, purity metadata, relevant-argument
+selection, scope lifecycle and strict-mode consistency checks.
+"""
+
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+from farfan_pipeline.core.orchestrator.method_result_cache import (
+    CacheConsistencyError,
+    MethodPurity,
+    MethodResultCache,
+)
+from farfan_pipeline.core.parameters import ParameterLoaderV2
+
+
+@dataclass
+class Segment:
+    text: str
+    page: int
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def score(self, segments, question_id=None):
+        self.calls += 1
+        return {"total": sum(len(s.text) for s in segments)}
+
+    def drifting(self, value):
+        self.calls += 1
+        return value + self.calls
+
+
+PURITY = {
+    ("Counter", "score"): MethodPurity(pure=True, relevant_args=("segments",)),
+    ("Counter", "drifting"): MethodPurity(pure=True),
+}
+
+
+@pytest.fixture
+def counter():
+    return Counter()
+
+
+@pytest.fixture
+def cache():
+    cache = MethodResultCache(purity_lookup=lambda c, m: PURITY.get((c, m), MethodPurity()))
+    cache.begin_scope("doc-1")
+    return cache
+
+
+def test_equal_content_hits_across_questions(cache, counter):
+    first = cache.call("Counter", "score", counter.score, ([Segment("abc", 1)],), {"question_id": "Q001"})
+    second = cache.call("Counter", "score", counter.score, ([Segment("abc", 1)],), {"question_id": "Q002"})
+
+    assert first == second == {"total": 3}
+    assert counter.calls == 1
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["per_method"]["Counter.score"] == {"hits": 1, "misses": 1}
+
+
+def test_different_content_misses(cache, counter):
+    cache.call("Counter", "score", counter.score, ([Segment("abc", 1)],), {})
+    cache.call("Counter", "score", counter.score, ([Segment("abc", 2)],), {})
+
+    assert counter.calls == 2
+
+
+def test_hits_return_independent_copies(cache, counter):
+    cache.call("Counter", "score", counter.score, ([Segment("x", 1)],), {})
+    hit = cache.call("Counter", "score", counter.score, ([Segment("x", 1)],), {})
+    hit["total"] = -1
+
+    again = cache.call("Counter", "score", counter.score, ([Segment("x", 1)],), {})
+    assert again == {"total": 1}
+
+
+def test_impure_and_unscoped_calls_are_not_cached(counter):
+    cache = MethodResultCache(purity_lookup=lambda c, m: MethodPurity())
+    cache.begin_scope("doc-1")
+    for _ in range(2):
+        cache.call("Counter", "score", counter.score, ([Segment("a", 1)],), {})
+    assert counter.calls == 2
+
+    unscoped = MethodResultCache(purity_lookup=lambda c, m: PURITY[(c, m)])
+    for _ in range(2):
+        unscoped.call("Counter", "score", counter.score, ([Segment("a", 1)],), {})
+    assert counter.calls == 4
+
+
+def test_unfingerprintable_arguments_bypass(cache, counter):
+    handle = lambda: None  # noqa: E731
+    cache.call("Counter", "drifting", lambda v: counter.drifting(0), (handle,), {})
+    cache.call("Counter", "drifting", lambda v: counter.drifting(0), (handle,), {})
+
+    assert counter.calls == 2
+    assert cache.get_stats()["bypassed"] == 2
+
+
+def test_scope_change_drops_results(cache, counter):
+    cache.call("Counter", "score", counter.score, ([Segment("a", 1)],), {})
+    cache.begin_scope("doc-2")
+    cache.call("Counter", "score", counter.score, ([Segment("a", 1)],), {})
+
+    assert counter.calls == 2
+    cache.end_scope()
+    assert cache.size == 0 and cache.scope is None
+
+
+def test_large_text_arguments_are_hashed_by_content(cache, counter):
+    text = "politica " * 2000
+    cache.call("Counter", "score", counter.score, ([Segment(text, 1)],), {})
+    cache.call("Counter", "score", counter.score, ([Segment("".join(text), 1)],), {})
+    cache.call("Counter", "score", counter.score, ([Segment(text + ".", 1)],), {})
+
+    assert counter.calls == 2
+
+
+def test_uncopyable_result_is_returned_but_not_cached(cache):
+    calls = []
+
+    def locked(value):
+        calls.append(value)
+        return {"lock": threading.Lock()}
+
+    first = cache.call("Counter", "drifting", locked, (1,), {})
+    second = cache.call("Counter", "drifting", locked, (1,), {})
+
+    assert "lock" in first and "lock" in second
+    assert len(calls) == 2 and cache.size == 0
+    assert cache.get_stats()["bypassed"] == 2
+
+
+def test_array_arguments_are_hashed_in_place_without_memo(cache, counter):
+    np = pytest.importorskip("numpy")
+    matrix = np.arange(4096, dtype=np.float64).reshape(64, 64)
+    score = lambda m: counter.drifting(0)  # noqa: E731
+
+    cache.call("Counter", "drifting", score, (matrix,), {})
+    cache.call("Counter", "drifting", score, (matrix.copy(),), {})
+    cache.call("Counter", "drifting", score, (matrix.T,), {})  # non-contiguous view
+    matrix[0, 0] = -1.0
+    cache.call("Counter", "drifting", score, (matrix,), {})
+
+    assert counter.calls == 3
+    assert cache._identity_memo == {}
+
+    cache.call("Counter", "drifting", score, (np.array([object()]),), {})
+    assert cache.get_stats()["bypassed"] == 1
+
+
+def test_strict_mode_detects_impure_method(counter):
+    cache = MethodResultCache(strict=True, purity_lookup=lambda c, m: PURITY[(c, m)])
+    cache.begin_scope("doc-1")
+    cache.call("Counter", "drifting", counter.drifting, (10,), {})
+
+    with pytest.raises(CacheConsistencyError):
+        cache.call("Counter", "drifting", counter.drifting, (10,), {})
+    assert cache.get_stats()["strict_mismatches"] == 1
+
+
+def test_strict_mode_accepts_pure_method(counter):
+    cache = MethodResultCache(strict=True, purity_lookup=lambda c, m: PURITY[(c, m)])
+    cache.begin_scope("doc-1")
+    for _ in range(3):
+        cache.call("Counter", "score", counter.score, ([Segment("ab", 1)],), {})
+
+    stats = cache.get_stats()
+    assert stats["strict_checks"] == 2
+    assert stats["strict_mismatches"] == 0
+
+
+def test_catalogue_declares_execution_metadata():
+    purity = MethodPurity.from_catalogue(
+        ParameterLoaderV2.get_execution_metadata("SemanticAnalyzer.extract_semantic_cube")
+    )
+    assert purity.pure
+    assert purity.relevant_args == ("document_segments",)
+    assert ParameterLoaderV2.get_execution_metadata("Unknown.method") == {}
@@ -0,0 +1,135 @@
+"""
+Tests for precomputed parameter binding in ParameterLoaderV2.
+
+Verifies frozen per-method bindings, the zero-overhead static mode of
+calibrated_method, the dynamic fallback and the profiling switch.
+"""
+
+import dataclasses
+
+import pytest
+
+from farfan_pipeline.core.calibration.decorators import calibrated_method
+from farfan_pipeline.core.parameters import MethodParameters, ParameterLoaderV2
+
+METHOD_ID = "farfan_core.analysis.derek_beach.BayesianThresholdsConfig"
+
+
+@pytest.fixture(autouse=True)
+def restore_loader_state():
+    mode = ParameterLoaderV2.binding_mode()
+    profiling = ParameterLoaderV2._profiling
+    yield
+    ParameterLoaderV2.set_binding_mode(mode)
+    ParameterLoaderV2.enable_profiling(profiling)
+    ParameterLoaderV2.reset_profile()
+
+
+class TestMethodBinding:
+    """Frozen per-method constants."""
+
+    def test_bind_matches_catalogue(self):
+        bound = ParameterLoaderV2.bind(METHOD_ID)
+
+        assert isinstance(bound, MethodParameters)
+        assert dict(bound) == ParameterLoaderV2.get_all(METHOD_ID)
+        assert bound.get("prior_alpha") == ParameterLoaderV2.get(METHOD_ID, "prior_alpha")
+        assert bound.get("missing", 42) == 42
+
+    def test_bind_is_cached_and_frozen(self):
+        bound = ParameterLoaderV2.bind(METHOD_ID)
+
+        assert ParameterLoaderV2.bind(METHOD_ID) is bound
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bound.method_id = "other"  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            bound.values["prior_alpha"] = 0.0  # type: ignore[index]
+
+    def test_unknown_method_binds_empty(self):
+        bound = ParameterLoaderV2.bind("farfan_core.unknown.Method")
+
+        assert len(bound) == 0
+        assert bound.get("x", 1.0) == 1.0
+
+    def test_bind_all_covers_catalogue(self):
+        bindings = ParameterLoaderV2.bind_all()
+
+        assert METHOD_ID in bindings
+        assert all(isinstance(b, MethodParameters) for b in bindings.values())
+
+    def test_invalid_binding_mode_rejected(self):
+        with pytest.raises(ValueError):
+            ParameterLoaderV2.set_binding_mode("lazy")
+
+    def test_invalid_binding_mode_from_environment_rejected(self, monkeypatch):
+        monkeypatch.setenv("FARFAN_PARAMETER_BINDING", "lazy")
+        monkeypatch.setattr(ParameterLoaderV2, "_binding_mode", None)
+        monkeypatch.setattr(ParameterLoaderV2, "_bindings", {})
+
+        with pytest.raises(ValueError, match="FARFAN_PARAMETER_BINDING"):
+            ParameterLoaderV2.bind(METHOD_ID)
+        with pytest.raises(ValueError, match="static, dynamic"):
+            ParameterLoaderV2.is_static()
+
+        monkeypatch.setenv("FARFAN_PARAMETER_BINDING", " Dynamic ")
+        assert ParameterLoaderV2.binding_mode() == "dynamic"
+
+
+class TestCalibratedMethodDecorator:
+    """Static passthrough versus dynamic wrapper."""
+
+    def test_static_mode_returns_original_function(self):
+        ParameterLoaderV2.set_binding_mode("static")
+
+        def compute(x):
+            return x * 2
+
+        decorated = calibrated_method(METHOD_ID)(compute)
+
+        assert decorated is compute
+        assert decorated(3) == 6
+        assert decorated.__calibration_parameters__ is ParameterLoaderV2.bind(METHOD_ID)
+
+    def test_dynamic_mode_wraps_function(self):
+        ParameterLoaderV2.set_binding_mode("dynamic")
+
+        def compute(x):
+            return x + 1
+
+        decorated = calibrated_method(METHOD_ID)(compute)
+
+        assert decorated is not compute
+        assert decorated.__wrapped__ is compute
+        assert decorated(1) == 2
+
+
+class TestResolutionProfiling:
+    """Profiling reports time spent in parameter resolution."""
+
+    def test_profile_counts_dynamic_lookups(self):
+        ParameterLoaderV2.enable_profiling(True)
+        ParameterLoaderV2.reset_profile()
+        ParameterLoaderV2.set_binding_mode("dynamic")
+
+        decorated = calibrated_method(METHOD_ID)(lambda: None)
+        for _ in range(5):
+            decorated()
+        ParameterLoaderV2.get(METHOD_ID, "prior_beta")
+
+        report = ParameterLoaderV2.profile_report()
+        assert report["binding_mode"] == "dynamic"
+        assert report["lookups"] == 6
+        assert report["lookup_seconds"] >= 0.0
+
+    def test_static_calls_do_not_resolve_parameters(self):
+        ParameterLoaderV2.enable_profiling(True)
+        ParameterLoaderV2.set_binding_mode("static")
+
+        decorated = calibrated_method(METHOD_ID)(lambda: None)
+        ParameterLoaderV2.reset_profile()
+        for _ in range(5):
+            decorated()
+
+        report = ParameterLoaderV2.profile_report()
+        assert report["lookups"] == 0
+        assert report["bindings"] == 0
@@ -0,0 +1,225 @@
+"""
+Tests for the concurrent phase 2 scheduler.
+
+Verifies plan-ordered results under concurrent execution, the worker
+budget bound, dependency handling, circuit breaker integration and abort.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from farfan_pipeline.core.orchestrator.core import AbortSignal, ResourceLimits
+from farfan_pipeline.core.orchestrator.irrigation_synchronizer import ExecutionPlan, Task
+from farfan_pipeline.core.orchestrator.phase2_scheduler import Phase2Scheduler, TaskStatus
+from farfan_pipeline.core.orchestrator.resource_manager import (
+    AdaptiveResourceManager,
+    CircuitState,
+)
+
+
+def make_plan(count):
+    tasks = tuple(
+        Task(
+            task_id=f"T{i:03d}",
+            dimension="DIM01",
+            question_id=f"Q{i:03d}",
+            policy_area="PA01",
+            chunk_id="PA01-DIM01",
+            chunk_index=0,
+            question_text=f"Pregunta {i}",
+        )
+        for i in range(count)
+    )
+    return ExecutionPlan(
+        plan_id="plan-test",
+        tasks=tasks,
+        chunk_count=1,
+        question_count=count,
+        integrity_hash="0" * 64,
+        created_at="2025-12-02T00:00:00Z",
+        correlation_id="corr",
+    )
+
+
+class ConcurrencyProbe:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, task):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        # Later tasks finish first to exercise plan ordering
+        time.sleep(self.delay * (1 + (100 - int(task.question_id[1:])) % 3))
+        with self.lock:
+            self.running -= 1
+        return task.question_id
+
+
+def test_results_are_plan_ordered_and_concurrent():
+    probe = ConcurrencyProbe()
+    limits = ResourceLimits(max_workers=8, min_workers=4)
+    report = asyncio.run(Phase2Scheduler(limits).run(make_plan(24), probe))
+
+    assert report.results() == [f"Q{i:03d}" for i in range(24)]
+    assert [o.plan_index for o in report.outcomes] == list(range(24))
+    assert report.counts["completed"] == 24
+    assert 1 < probe.peak <= 8
+    assert report.peak_concurrency <= 8
+
+
+def test_worker_budget_bounds_concurrency():
+    probe = ConcurrencyProbe()
+    limits = ResourceLimits(max_workers=4, min_workers=4)
+    asyncio.run(Phase2Scheduler(limits).run(make_plan(16), probe))
+
+    assert probe.peak <= 4
+
+
+def test_failures_are_isolated():
+    def run_task(task):
+        if task.question_id == "Q002":
+            raise ValueError("boom")
+        return task.question_id
+
+    report = asyncio.run(Phase2Scheduler(ResourceLimits()).run(make_plan(4), run_task))
+
+    assert [o.status for o in report.outcomes] == [
+        TaskStatus.COMPLETED, TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.COMPLETED
+    ]
+    assert "boom" in report.failed()[0].error
+
+
+def test_dependencies_are_respected():
+    finished = []
+
+    def run_task(task):
+        if task.task_id == "T000":
+            time.sleep(0.02)
+        if task.task_id == "T003":
+            raise RuntimeError("fails")
+        finished.append(task.task_id)
+        return task.task_id
+
+    dependencies = {"T001": ["T000"], "T002": ["T001"], "T004": ["T003"]}
+    report = asyncio.run(
+        Phase2Scheduler(ResourceLimits()).run(make_plan(5), run_task, dependencies=dependencies)
+    )
+
+    assert finished.index("T000") < finished.index("T001") < finished.index("T002")
+    assert report.outcomes[4].status == TaskStatus.SKIPPED
+
+
+def test_dependency_cycle_rejected():
+    scheduler = Phase2Scheduler(ResourceLimits())
+    with pytest.raises(ValueError, match="cycle"):
+        asyncio.run(
+            scheduler.run(make_plan(2), str, dependencies={"T000": ["T001"], "T001": ["T000"]})
+        )
+
+
+def test_open_circuit_breaker_skips_executor():
+    limits = ResourceLimits()
+    manager = AdaptiveResourceManager(limits)
+    breaker = manager.get_or_create_circuit_breaker("D1-Q1")
+    breaker.state = CircuitState.OPEN
+    breaker.last_state_change = None
+
+    def slot(task):
+        return "D1-Q1" if task.question_id == "Q000" else "D1-Q2"
+
+    report = asyncio.run(
+        Phase2Scheduler(limits, resource_manager=manager).run(
+            make_plan(3), lambda task: task.question_id, executor_id_for=slot
+        )
+    )
+
+    assert report.outcomes[0].status == TaskStatus.SKIPPED
+    assert report.counts["completed"] == 2
+    assert manager.executor_metrics["D1-Q2"].successful_executions == 2
+
+
+def test_abort_stops_dispatch():
+    signal = AbortSignal()
+    signal.abort("test")
+
+    report = asyncio.run(
+        Phase2Scheduler(ResourceLimits(), abort_signal=signal).run(make_plan(3), str)
+    )
+
+    assert report.counts["aborted"] == 3
+    assert report.results() == []
+
+
+def test_orchestrator_gates_phase2_with_injected_resource_manager(monkeypatch):
+    from types import SimpleNamespace
+
+    from farfan_pipeline.core.orchestrator import core, factory
+    from farfan_pipeline.core.orchestrator.core import Orchestrator
+    from farfan_pipeline.core.orchestrator.questionnaire import load_questionnaire
+
+    # Phase handlers and factory helpers outside phase 2 are not under test here.
+    monkeypatch.setattr(core, "validate_phase_definitions", lambda fases, cls: None)
+    monkeypatch.setattr(factory, "_validate_questionnaire_structure", lambda data: None, raising=False)
+    monkeypatch.setattr(factory, "get_questionnaire_provider", lambda: None, raising=False)
+
+    questionnaire = load_questionnaire()
+    limits = ResourceLimits()
+    manager = AdaptiveResourceManager(limits)
+    orchestrator = Orchestrator(
+        method_executor=SimpleNamespace(signal_registry=object(), instances={"A": object()}),
+        questionnaire=questionnaire,
+        executor_config={},
+        resource_manager=manager,
+    )
+    assert orchestrator.resource_manager is manager
+    assert orchestrator.resource_limits is limits
+    with pytest.raises(ValueError, match="ResourceLimits"):
+        Orchestrator(
+            method_executor=SimpleNamespace(signal_registry=object(), instances={"A": object()}),
+            questionnaire=questionnaire,
+            executor_config={},
+            resource_limits=ResourceLimits(),
+            resource_manager=manager,
+        )
+
+    questions = questionnaire.data["blocks"]["micro_questions"]
+    blocked = questions[0]
+    allowed = next(q for q in questions if q["base_slot"] != blocked["base_slot"])
+    breaker = manager.get_or_create_circuit_breaker(blocked["base_slot"])
+    breaker.state = CircuitState.OPEN
+    breaker.last_state_change = None
+
+    executed = []
+
+    class RecordingExecutor:
+        def __init__(self, **kwargs):
+            pass
+
+        def execute(self, document, method_executor, *, question_context):
+            executed.append(question_context["question_id"])
+            return {"question_id": question_context["question_id"]}
+
+    orchestrator.executors = {q["base_slot"]: RecordingExecutor for q in (blocked, allowed)}
+    plan = make_plan(2)
+    orchestrator._execution_plan = ExecutionPlan(
+        **{
+            **plan.__dict__,
+            "tasks": tuple(
+                Task(**{**task.__dict__, "question_id": q["question_id"]})
+                for task, q in zip(plan.tasks, (blocked, allowed))
+            ),
+        }
+    )
+
+    runs = asyncio.run(orchestrator._execute_micro_questions_async(None, None))
+
+    assert executed == [allowed["question_id"]]
+    assert runs[0].metadata["status"] == "skipped" and "open" in runs[0].error
+    assert runs[1].evidence is not None
@@ -0,0 +1,121 @@
+"""
+Tests for the immutable questionnaire index.
+
+Verifies the load-time index built by build_questionnaire_index, its use
+by CanonicalQuestionnaire, and that lookups agree with linear scans.
+"""
+
+from types import MappingProxyType
+
+import pytest
+
+from farfan_pipeline.core.orchestrator.questionnaire import (
+    CanonicalQuestionnaire,
+    QuestionnaireMetadata,
+)
+from farfan_pipeline.core.orchestrator.questionnaire_index import (
+    QuestionnaireIndex,
+    build_questionnaire_index,
+)
+
+
+def _question(qid, pa, dim, cluster, patterns=()):
+    return {
+        'question_id': qid,
+        'policy_area_id': pa,
+        'dimension_id': dim,
+        'cluster_id': cluster,
+        'text': f'Pregunta {qid}',
+        'patterns': list(patterns),
+    }
+
+
+@pytest.fixture
+def micro_questions():
+    return [
+        _question('Q001', 'PA01', 'DIM01', 'CL01', [
+            {'category': 'INDICADOR', 'pattern': 'tasa de violencia'},
+            {'category': 'FUENTE_OFICIAL', 'pattern': 'DANE|Medicina Legal'},
+        ]),
+        _question('Q002', 'PA01', 'DIM02', 'CL01', [
+            {'category': 'INDICADOR', 'pattern': 'tasa de violencia'},
+            {'category': 'INDICADOR', 'pattern': 'cobertura'},
+        ]),
+        _question('Q003', 'PA02', 'DIM01', 'CL02', [
+            {'category': 'FUENTE_OFICIAL', 'pattern': 'DANE | SISPRO'},
+            {'category': 'GENERAL', 'pattern': 'diagnóstico'},
+        ]),
+    ]
+
+
+@pytest.fixture
+def index(micro_questions):
+    return build_questionnaire_index(micro_questions)
+
+
+class TestQuestionnaireIndex:
+    """Lookups by question, area, dimension, cluster and category."""
+
+    def test_question_lookup(self, index, micro_questions):
+        assert index.get_question('Q002') is micro_questions[1]
+        assert index.get_question('Q999') is None
+        assert index.question_ids == ('Q001', 'Q002', 'Q003')
+        assert len(index) == 3
+
+    def test_grouped_lookups_match_linear_scan(self, index, micro_questions):
+        for key, lookup in (
+            ('policy_area_id', index.questions_by_policy_area),
+            ('dimension_id', index.questions_by_dimension),
+            ('cluster_id', index.questions_by_cluster),
+        ):
+            for value in {q[key] for q in micro_questions}:
+                expected = [q for q in micro_questions if q[key] == value]
+                assert list(lookup(value)) == expected
+
+        assert index.questions_by_policy_area('PA99') == ()
+
+    def test_pattern_category_lookups(self, index):
+        assert index.indicator_patterns('PA01') == ('tasa de violencia', 'cobertura')
+        assert index.indicator_patterns('PA02') == ()
+        assert index.patterns_by_category('GENERAL') == ('diagnóstico',)
+        assert set(index.official_sources()) == {'DANE', 'Medicina Legal', 'SISPRO'}
+        assert len(index.official_sources()) == 3
+
+    def test_index_is_immutable(self, index):
+        assert isinstance(index.by_question_id, MappingProxyType)
+        with pytest.raises(TypeError):
+            index.by_policy_area['PA03'] = ()
+        with pytest.raises(AttributeError):
+            index.by_cluster = {}
+
+    def test_duplicate_id_keeps_first(self, micro_questions):
+        duplicate = _question('Q001', 'PA09', 'DIM06', 'CL04')
+        index = build_questionnaire_index(micro_questions + [duplicate])
+
+        assert index.get_question('Q001')['policy_area_id'] == 'PA01'
+
+
+class TestCanonicalQuestionnaireUsesIndex:
+    """CanonicalQuestionnaire builds the index at construction time."""
+
+    def test_accessors_delegate_to_index(self, micro_questions):
+        metadata = QuestionnaireMetadata(
+            schema_version='1.0.0',
+            version='1.0.0',
+            generated_at='2025-12-02',
+            file_hash='0' * 64,
+            file_size=0,
+            line_count=0,
+        )
+        questionnaire = CanonicalQuestionnaire(
+            {'blocks': {'micro_questions': micro_questions}}, metadata
+        )
+
+        assert isinstance(questionnaire.index, QuestionnaireIndex)
+        assert questionnaire.get_micro_question_by_id('Q003') is micro_questions[2]
+        assert questionnaire.get_micro_question_by_id('missing') is None
+        assert questionnaire.get_questions_by_policy_area('PA01') == micro_questions[:2]
+        assert questionnaire.get_questions_by_cluster('CL02') == [micro_questions[2]]
+        assert questionnaire.get_questions_by_dimension('DIM01') == [
+            micro_questions[0], micro_questions[2]
+        ]
@@ -0,0 +1,214 @@
+"""
+Tests for the compiled single-pass pattern automaton.
+
+Verifies that CompiledPatternSet reproduces the spans of per-alternative
+re.finditer calls, memoises chunk scans, and plugs into the structured
+evidence extractor without changing its output.
+"""
+
+import random
+import re
+
+import pytest
+
+from farfan_pipeline.core.orchestrator.signal_evidence_extractor import (
+    extract_structured_evidence,
+)
+from farfan_pipeline.core.orchestrator.signal_pattern_automaton import (
+    CompiledPatternSet,
+    compile_pattern_set,
+    split_alternatives,
+)
+
+
+SAMPLE_TEXT = (
+    "Línea base 2019: 45% según DANE. Meta 2027: 30%. "
+    "La Fiscalía y Medicina Legal reportan datos; el DANE publica "
+    "series históricas. Situación inicial: año base 2018."
+)
+
+
+def _legacy_spans(text, alternative, as_regex):
+    pattern = alternative if as_regex else re.escape(alternative)
+    return [m.span() for m in re.finditer(pattern, text, re.IGNORECASE)]
+
+
+class TestCompiledPatternSet:
+    """Span equivalence with re.finditer."""
+
+    def test_literal_spans_match_finditer(self):
+        specs = [
+            {'pattern': 'línea base|año base|situación inicial', 'match_type': 'REGEX'},
+            {'pattern': 'DANE|Medicina Legal|Fiscalía', 'match_type': 'LITERAL'},
+        ]
+        compiled = compile_pattern_set(specs)
+
+        for spec in specs:
+            for alt in split_alternatives(spec['pattern']):
+                assert compiled.find_spans(SAMPLE_TEXT, alt, False) == _legacy_spans(
+                    SAMPLE_TEXT, alt, False
+                )
+
+    def test_regex_spans_match_finditer(self):
+        specs = [
+            {'pattern': r'20\d{2}', 'match_type': 'regex'},
+            {'pattern': r'\d+%', 'match_type': 'regex'},
+        ]
+        compiled = compile_pattern_set(specs)
+
+        assert compiled.regex_count == 2
+        for alt in (r'20\d{2}', r'\d+%'):
+            assert compiled.find_spans(SAMPLE_TEXT, alt, True) == _legacy_spans(
+                SAMPLE_TEXT, alt, True
+            )
+
+    def test_overlapping_literal_occurrences_are_non_overlapping(self):
+        compiled = compile_pattern_set([{'pattern': 'aa|a'}])
+
+        assert compiled.find_spans('aaaaa', 'aa', False) == [(0, 2), (2, 4)]
+        assert compiled.find_spans('aaaaa', 'a', False) == _legacy_spans('aaaaa', 'a', False)
+
+    def test_randomized_literals_match_finditer(self):
+        rng = random.Random(42)
+        alphabet = 'abcAB '
+        literals = sorted({
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip() or 'a'
+            for _ in range(30)
+        })
+        compiled = compile_pattern_set([{'pattern': '|'.join(literals)}])
+        text = ''.join(rng.choice(alphabet) for _ in range(500))
+
+        for alt in split_alternatives('|'.join(literals)):
+            assert compiled.find_spans(text, alt, False) == _legacy_spans(text, alt, False)
+
+    def test_unknown_alternative_is_compiled_on_demand(self):
+        compiled = compile_pattern_set([{'pattern': 'DANE'}])
+
+        assert compiled.find_spans(SAMPLE_TEXT, 'Fiscalía', False) == _legacy_spans(
+            SAMPLE_TEXT, 'Fiscalía', False
+        )
+        assert compiled.find_spans(SAMPLE_TEXT, r'\d{4}', True) == _legacy_spans(
+            SAMPLE_TEXT, r'\d{4}', True
+        )
+        assert r'\d{4}' in compiled._extra_regexes
+
+    def test_invalid_regex_raises_re_error(self):
+        compiled = compile_pattern_set([{'pattern': '([a-z', 'match_type': 'regex'}])
+
+        with pytest.raises(re.error):
+            compiled.find_spans(SAMPLE_TEXT, '([a-z', True)
+
+    def test_regex_gate_skips_texts_without_hits(self):
+        compiled = compile_pattern_set([{'pattern': r'\d+%', 'match_type': 'regex'}])
+
+        assert compiled.find_spans('sin cifras', r'\d+%', True) == []
+
+    def test_scan_cache_is_bounded(self):
+        compiled = CompiledPatternSet([{'pattern': 'x'}], scan_cache_size=2)
+
+        for text in ('x', 'xx', 'xxx'):
+            compiled.find_spans(text, 'x', False)
+
+        assert len(compiled._scan_cache) == 2
+        compiled.clear_scan_cache()
+        assert len(compiled._scan_cache) == 0
+
+
+class TestExtractorIntegration:
+    """Extractor output is unchanged when a shared compiled set is used."""
+
+    def test_shared_compiled_set_produces_same_evidence(self):
+        signal_node = {
+            'expected_elements': [
+                {'type': 'fuentes_oficiales', 'minimum': 2},
+                {'type': 'series_temporales', 'required': True},
+            ],
+            'patterns': [
+                {
+                    'id': 'PAT-Q001-002',
+                    'pattern': 'DANE|Medicina Legal|Fiscalía',
+                    'confidence_weight': 0.95,
+                    'category': 'GENERAL',
+                    'match_type': 'REGEX',
+                },
+                {
+                    'id': 'PAT-Q001-003',
+                    'pattern': r'20\d{2}',
+                    'confidence_weight': 0.8,
+                    'category': 'TEMPORAL',
+                    'match_type': 'regex',
+                },
+            ],
+            'validations': {},
+        }
+        shared = compile_pattern_set(signal_node['patterns'])
+
+        baseline = extract_structured_evidence(SAMPLE_TEXT, signal_node)
+        with_shared = extract_structured_evidence(
+            SAMPLE_TEXT, signal_node, compiled_patterns=shared
+        )
+
+        assert baseline.evidence == with_shared.evidence
+        assert baseline.completeness == with_shared.completeness
+        spans = [m['span'] for m in baseline.evidence['fuentes_oficiales']]
+        assert spans == sorted(spans)
+
+
+class TestProductionPath:
+    """A real monolith SignalPack is scanned through the executor path."""
+
+    @pytest.fixture
+    def executor_and_pack(self):
+        from types import SimpleNamespace
+
+        from farfan_pipeline.core.orchestrator.base_executor_with_contract import (
+            BaseExecutorWithContract,
+        )
+        from farfan_pipeline.core.orchestrator.signal_intelligence_layer import (
+            create_enriched_signal_pack,
+        )
+        from farfan_pipeline.core.orchestrator.signal_loader import (
+            build_signal_pack_from_monolith,
+        )
+
+        base_pack = build_signal_pack_from_monolith("PA01")
+        assert base_pack.patterns and all(isinstance(p, str) for p in base_pack.patterns)
+        pack = create_enriched_signal_pack(base_pack)
+
+        class _Executor(BaseExecutorWithContract):
+            @classmethod
+            def get_base_slot(cls):
+                return "D1-Q1"
+
+        executor = object.__new__(_Executor)
+        executor.method_executor = SimpleNamespace()
+        executor.signal_registry = None
+        executor.config = {}
+        executor.enriched_packs = {"PA01": pack}
+        executor._use_enriched_signals = True
+        return executor, pack, base_pack
+
+    def test_string_patterns_are_compiled_and_used_by_executor(self, executor_and_pack):
+        from types import SimpleNamespace
+
+        executor, pack, base_pack = executor_and_pack
+        literal = next(p for p in base_pack.patterns if '|' not in p and not re.search(r'[\\()\[\]?*+]', p))
+        text = f"Diagnóstico 2023. {literal.upper()} y otra vez {literal}."
+
+        result = executor._execute_v2(
+            SimpleNamespace(raw_text=text, metadata={}),
+            {
+                "question_id": "Q001",
+                "policy_area_id": "PA01",
+                "expected_elements": [{"type": "evidencia", "required": True}],
+            },
+            {"method_inputs": [], "assembly_rules": [], "validation_rules": []},
+        )
+
+        compiled = pack.compiled_patterns
+        assert compiled.pattern_count == len(pack.patterns) >= len(base_pack.patterns)
+        assert compiled.literal_count > 0
+        assert text in compiled._scan_cache
+        assert result["enriched_signals_enabled"]
+        assert result["missing_elements"] == []
+        assert [m["span"] for m in result["evidence"]["evidencia"]] == _legacy_spans(text, literal, False)
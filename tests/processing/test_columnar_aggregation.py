@@ -0,0 +1,156 @@
+"""
+Tests for the columnar FASE 4-7 aggregation engine.
+
+The engine must reproduce the object aggregators exactly (same floats, same
+validation details) for every document of a multi-document ScoreTable.
+"""
+
+import dataclasses
+import random
+
+import pytest
+
+from farfan_pipeline.processing.aggregation import (
+    AggregationSettings,
+    AreaPolicyAggregator,
+    ClusterAggregator,
+    DimensionAggregator,
+    MacroAggregator,
+    ScoredResult,
+)
+from farfan_pipeline.processing.columnar_aggregation import (
+    ColumnarAggregationEngine,
+    ScoreTable,
+)
+
+AREAS = ["PA01", "PA02", "PA03", "PA04"]
+DIMENSIONS = ["DIM01", "DIM02", "DIM03"]
+SLOTS = ["Q1", "Q2", "Q3", "Q4", "Q5"]
+
+
+def _monolith():
+    micro_questions = [
+        {
+            "question_id": f"{area}-{dim}-{slot}",
+            "dimension_id": dim,
+            "policy_area_id": area,
+            "base_slot": f"{dim}-{slot}",
+        }
+        for area in AREAS
+        for dim in DIMENSIONS
+        for slot in SLOTS
+    ]
+    return {
+        "blocks": {
+            "scoring": {},
+            "micro_questions": micro_questions,
+            "niveles_abstraccion": {
+                "dimensions": [{"dimension_id": d} for d in DIMENSIONS],
+                "policy_areas": [
+                    {
+                        "policy_area_id": area,
+                        "dimension_ids": DIMENSIONS,
+                        "i18n": {"keys": {"label_es": f"Área {area}"}},
+                    }
+                    for area in AREAS
+                ],
+                "clusters": [
+                    {
+                        "cluster_id": "CL01",
+                        "policy_area_ids": ["PA01", "PA02"],
+                        "i18n": {"keys": {"label_es": "Cluster 1"}},
+                    },
+                    {
+                        "cluster_id": "CL02",
+                        "policy_area_ids": ["PA03", "PA04"],
+                        "i18n": {"keys": {"label_es": "Cluster 2"}},
+                    },
+                ],
+            },
+        },
+        "aggregation": {
+            "dimension_question_weights": {
+                "DIM01": {f"DIM01-{slot}": i + 1 for i, slot in enumerate(SLOTS)},
+            },
+            "policy_area_dimension_weights": {"PA01": {"DIM01": 2, "DIM02": 1, "DIM03": 1}},
+            "macro_cluster_weights": {"CL01": 3, "CL02": 1},
+        },
+    }
+
+
+def _results(seed, drop=()):
+    rng = random.Random(seed)
+    results = []
+    qid = 0
+    for area in AREAS:
+        for dim in DIMENSIONS:
+            for slot in SLOTS:
+                qid += 1
+                if (area, dim, slot) in drop:
+                    continue
+                results.append(ScoredResult(
+                    question_global=qid,
+                    base_slot=f"{dim}-{slot}",
+                    policy_area=area,
+                    dimension=dim,
+                    score=rng.uniform(0.0, 3.0),
+                    quality_level="BUENO",
+                    evidence={},
+                    raw_results={},
+                ))
+    rng.shuffle(results)
+    return results
+
+
+def _object_pipeline(monolith, results, abort, sota):
+    settings = AggregationSettings.from_monolith(monolith)
+    dims = DimensionAggregator(
+        monolith, abort_on_insufficient=abort, aggregation_settings=settings, enable_sota_features=sota
+    ).run(results, settings.dimension_group_by_keys)
+    areas = AreaPolicyAggregator(monolith, abort_on_insufficient=abort, aggregation_settings=settings).run(
+        dims, settings.area_group_by_keys
+    )
+    clusters = ClusterAggregator(monolith, abort_on_insufficient=abort, aggregation_settings=settings).run(
+        areas, monolith["blocks"]["niveles_abstraccion"]["clusters"]
+    )
+    macro = MacroAggregator(monolith, abort_on_insufficient=abort, aggregation_settings=settings).evaluate_macro(
+        clusters, areas, dims
+    )
+    return dims, areas, clusters, macro
+
+
+def _as_dicts(objects):
+    return [dataclasses.asdict(o) | {"cluster_id": getattr(o, "cluster_id", None)} for o in objects]
+
+
+@pytest.mark.parametrize("sota", [True, False])
+@pytest.mark.parametrize("abort", [True, False])
+def test_columnar_matches_object_aggregators(sota, abort):
+    monolith = _monolith()
+    documents = {
+        "plan_a": _results(1),
+        # Insufficient coverage in PA02/DIM03 and a missing dimension in PA04
+        "plan_b": _results(2, drop={("PA02", "DIM03", "Q5"), ("PA02", "DIM03", "Q4")}
+                           | {("PA04", "DIM02", slot) for slot in SLOTS}),
+        "plan_c": _results(3),
+    }
+
+    engine = ColumnarAggregationEngine(monolith, abort_on_insufficient=abort, enable_sota_features=sota)
+    columnar = engine.aggregate(ScoreTable.from_results(documents))
+
+    for i, (document_id, results) in enumerate(documents.items()):
+        expected = _object_pipeline(monolith, results, abort, sota)
+        actual = columnar.to_objects(document_id)
+
+        for expected_level, actual_level in zip(expected[:3], actual[:3]):
+            assert _as_dicts(actual_level) == _as_dicts(expected_level)
+        assert dataclasses.asdict(actual[3]) == dataclasses.asdict(expected[3])
+        assert columnar.macro_scores[i] == expected[3].score
+
+
+def test_unsupported_group_by_keys_are_rejected():
+    monolith = _monolith()
+    monolith["aggregation"]["group_by_keys"] = {"dimension": ["dimension"]}
+
+    with pytest.raises(ValueError, match="group-by keys"):
+        ColumnarAggregationEngine(monolith)
@@ -0,0 +1,158 @@
+"""
+Tests for the query-ready DocumentIndex over PreprocessedDocument.
+"""
+
+import copy
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from farfan_pipeline.core.orchestrator.base_executor_with_contract import BaseExecutorWithContract
+from farfan_pipeline.core.types import ChunkData, PreprocessedDocument
+from farfan_pipeline.processing.document_index import (
+    DocumentIndex,
+    get_document_index,
+    parse_number,
+    question_query,
+)
+
+CHUNKS = [
+    (
+        "PA01", "DIM01",
+        "Diagnóstico de género. La línea base de violencia intrafamiliar es de 12,5 % en 2019, "
+        "según datos del DANE. La tasa de desempleo femenino alcanzó 15 por ciento.",
+    ),
+    (
+        "PA01", "DIM02",
+        "Presupuesto del programa de equidad: $ 1.250.000.000 para el periodo 2024-2027. "
+        "La Secretaría de la Mujer ejecutará 3,2 millones de pesos en capacitación.",
+    ),
+    (
+        "PA05", "DIM01",
+        "Víctimas del conflicto armado: se registran 4.321 personas en el municipio. "
+        "Meta de atención a víctimas para 2027 del 80%.",
+    ),
+]
+
+
+def _document():
+    chunks = []
+    parts = []
+    position = 0
+    for i, (area, dim, text) in enumerate(CHUNKS):
+        chunks.append(ChunkData(
+            id=i, text=text, chunk_type="diagnostic", sentences=[], tables=[],
+            start_pos=position, end_pos=position + len(text), confidence=0.9,
+            policy_area_id=area, dimension_id=dim,
+        ))
+        parts.append(text)
+        position += len(text) + 1
+    return PreprocessedDocument(
+        document_id="plan", raw_text=" ".join(parts), sentences=[], tables=[], metadata={},
+        chunks=chunks, indexes={"entity_index": {"DANE": [0], "Secretaría de la Mujer": [1]}},
+    )
+
+
+@pytest.mark.parametrize(
+    ("literal", "value"),
+    [("1.250.000.000", 1250000000.0), ("12,5", 12.5), ("4.321", 4321.0), ("1.234,56", 1234.56), ("3.5", 3.5)],
+)
+def test_parse_number_handles_colombian_separators(literal, value):
+    assert parse_number(literal) == value
+
+
+def test_index_is_built_once_and_outside_dataclass_fields():
+    document = _document()
+    assert document.get_index() is None
+
+    index = get_document_index(document)
+
+    assert document.get_index() is index
+    assert "_document_index" not in {f.name for f in dataclasses.fields(document)}
+    assert len(index) == 3
+
+
+def test_concurrent_first_calls_build_one_index(monkeypatch):
+    document = _document()
+    built = []
+    barrier = threading.Barrier(8)
+    from_document = DocumentIndex.from_document.__func__
+
+    def slow_build(cls, doc):
+        built.append(doc)
+        time.sleep(0.05)
+        return from_document(cls, doc)
+
+    monkeypatch.setattr(DocumentIndex, "from_document", classmethod(slow_build))
+
+    def call():
+        barrier.wait()
+        return get_document_index(document)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        indexes = list(pool.map(lambda _: call(), range(8)))
+
+    assert len(built) == 1
+    assert all(index is indexes[0] for index in indexes)
+    # The lock stays out of copies and pickles
+    assert get_document_index(copy.deepcopy(document)) is not None
+
+
+def test_bm25_phrases_are_accent_insensitive_and_mapped_to_chunks():
+    document = _document()
+    index = get_document_index(document)
+
+    passages = index.search(["linea base", "violencia"], k=2)
+
+    assert passages[0].chunk_id == 0
+    assert passages[0].matched_terms == ("linea base", "violencia")
+    assert document.raw_text[passages[0].start:passages[0].end] == passages[0].text
+    # "base" alone occurs nowhere else, but the phrase must be consecutive
+    assert index.search(["base linea"]) == []
+
+
+def test_numeric_year_and_entity_lookups():
+    index = get_document_index(_document())
+
+    money = index.numbers_in_range(1e6, 2e9, kind="money")
+    assert [m.value for m in money] == [1250000000.0, 3200000.0]
+    assert {m.chunk_id for m in money} == {1}
+    assert [m.value for m in index.numbers_in_range(10, 20, kind="percent")] == [12.5, 15.0]
+    assert [m.value for m in index.numbers_in_range(4000, 5000)] == [4321.0]
+
+    assert {m.chunk_id for m in index.year_mentions(2025)} == {1}
+    assert {m.chunk_id for m in index.year_mentions(2027)} == {1, 2}
+    assert [m.chunk_id for m in index.entity_mentions("secretaria de la mujer")] == [1]
+
+    filtered = index.search("víctimas meta", years=(2027, 2027), policy_area_id="PA05")
+    assert [p.chunk_id for p in filtered] == [2]
+
+
+def test_executor_scopes_text_to_candidate_passages():
+    document = _document()
+    question_context = {
+        "question_text": "¿El diagnóstico presenta línea base?",
+        "patterns": [{"pattern": "línea base|año base", "flags": "i", "match_type": "REGEX"}],
+    }
+    assert question_query(question_context)[:2] == ["línea base", "año base"]
+
+    kwargs = {"text": document.raw_text, "raw_text": document.raw_text}
+    BaseExecutorWithContract._scope_to_candidate_passages(
+        document, question_context, {"text_scope": "candidate_passages", "passage_limit": 1}, kwargs
+    )
+
+    assert kwargs["text"] == kwargs["raw_text"] == CHUNKS[0][2]
+    assert [p.chunk_id for p in kwargs["candidate_passages"]] == [0]
+
+
+def test_long_chunks_are_split_on_sentence_boundaries():
+    sentence = "El programa fortalece la atención integral a la primera infancia. "
+    text = sentence * 40
+    index = DocumentIndex.build(text, [(0, len(text), 7, "PA01", "DIM01")], passage_chars=300)
+
+    assert len(index) > 1
+    assert all(p.chunk_id == 7 for p in index.passages)
+    assert all(text[p.start:p.end].rstrip().endswith(".") for p in index.passages)
@@ -0,0 +1,128 @@
+"""
+Tests for the persistent content-addressed embedding store.
+
+Verifies encode-through caching, persistence across store instances,
+namespacing by model and normalization, the bounded RAM LRU and
+concurrent writers from several processes.
+"""
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from farfan_pipeline.processing.embedding_store import PersistentEmbeddingStore, text_digest
+
+
+class FakeEncoder:
+    def __init__(self, dim=8):
+        self.dim = dim
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.stack([_vector(text, self.dim) for text in texts])
+
+
+def _vector(text, dim=8):
+    rng = np.random.default_rng(int.from_bytes(text_digest(text)[:8], "little"))
+    return rng.standard_normal(dim).astype(np.float32)
+
+
+def _write_worker(directory, texts):
+    store = PersistentEmbeddingStore("fake-model", directory=directory)
+    store.encode(texts, FakeEncoder())
+
+
+def test_encoder_only_sees_uncached_unique_texts():
+    store = PersistentEmbeddingStore("fake-model")
+    encoder = FakeEncoder()
+
+    first = store.encode(["a", "b", "a"], encoder)
+    second = store.encode(["b", "c"], encoder)
+
+    assert encoder.calls == [["a", "b"], ["c"]]
+    assert first.shape == (3, 8) and first.dtype == np.float32
+    np.testing.assert_array_equal(first[0], first[2])
+    np.testing.assert_array_equal(second[0], first[1])
+    assert store.get_stats()["encoded"] == 3
+
+
+def test_vectors_persist_across_instances(tmp_path):
+    texts = ["Plan de desarrollo", "Artículo 1", "Presupuesto"]
+    expected = PersistentEmbeddingStore("fake-model", directory=tmp_path).encode(texts, FakeEncoder())
+
+    reopened = PersistentEmbeddingStore("fake-model", directory=tmp_path)
+    encoder = FakeEncoder()
+    again = reopened.encode(texts, encoder)
+
+    assert encoder.calls == []
+    np.testing.assert_array_equal(again, expected)
+    assert reopened.get_stats()["disk_hits"] == 3
+    assert len(reopened) == 3
+
+
+def test_model_and_normalization_are_separate_namespaces(tmp_path):
+    PersistentEmbeddingStore("fake-model", directory=tmp_path).encode(["x"], FakeEncoder())
+
+    assert PersistentEmbeddingStore("fake-model", directory=tmp_path).get("x") is not None
+    assert PersistentEmbeddingStore("other", directory=tmp_path).get("x") is None
+    assert PersistentEmbeddingStore("fake-model", normalized=True, directory=tmp_path).get("x") is None
+
+
+def test_reader_sees_rows_appended_by_another_instance(tmp_path):
+    reader = PersistentEmbeddingStore("fake-model", directory=tmp_path)
+    assert reader.get("late") is None
+
+    PersistentEmbeddingStore("fake-model", directory=tmp_path).encode(["late"], FakeEncoder())
+
+    np.testing.assert_array_equal(reader.get("late"), _vector("late"))
+
+
+def test_memory_lru_is_bounded(tmp_path):
+    store = PersistentEmbeddingStore("fake-model", directory=tmp_path, max_memory_items=2)
+    store.encode(["a", "b", "c"], FakeEncoder())
+
+    assert store.get_stats()["memory_items"] == 2
+    assert store.get("a") is not None
+    assert store.get_stats()["disk_hits"] == 1
+
+
+def test_dimension_mismatch_is_rejected(tmp_path):
+    PersistentEmbeddingStore("fake-model", directory=tmp_path).encode(["a"], FakeEncoder(dim=8))
+
+    with pytest.raises(ValueError, match="dimension"):
+        PersistentEmbeddingStore("fake-model", directory=tmp_path).encode(["b"], FakeEncoder(dim=4))
+
+
+def test_torn_tail_is_ignored(tmp_path):
+    store = PersistentEmbeddingStore("fake-model", directory=tmp_path)
+    store.encode(["a"], FakeEncoder())
+    with open(store.path / "vectors.f32", "ab") as vectors_file:
+        vectors_file.write(b"\x00" * 5)
+    with open(store.path / "index.bin", "ab") as index_file:
+        index_file.write(b"\x01" * 7)
+
+    fresh = PersistentEmbeddingStore("fake-model", directory=tmp_path)
+    fresh.encode(["b"], FakeEncoder())
+
+    check = PersistentEmbeddingStore("fake-model", directory=tmp_path)
+    np.testing.assert_array_equal(check.get("a"), _vector("a"))
+    np.testing.assert_array_equal(check.get("b"), _vector("b"))
+    assert len(check) == 2
+
+
+def test_concurrent_writer_processes(tmp_path):
+    batches = [[f"texto {i}" for i in range(start, start + 40)] for start in (0, 20, 40, 60)]
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_write_worker, args=(tmp_path, batch)) for batch in batches]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    store = PersistentEmbeddingStore("fake-model", directory=tmp_path)
+    assert len(store) == 100
+    for i in range(100):
+        np.testing.assert_array_equal(store.get(f"texto {i}"), _vector(f"texto {i}"))
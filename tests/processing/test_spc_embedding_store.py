@@ -0,0 +1,124 @@
+"""
+Tests for batched PA×DIM query embedding and the per-document
+sentence embedding store used by the 60-segment SPC builder.
+"""
+
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from farfan_pipeline.processing.spc_ingestion import (
+    SentenceEmbeddingStore,
+    StrategicChunkingSystem,
+)
+
+
+class FakeEmbedder:
+    """Deterministic bag-of-characters embedder that records batch calls."""
+
+    def __init__(self, dim=32):
+        self.dim = dim
+        self.config = SimpleNamespace(embedding_model=f"fake-{dim}")
+        self.batches = []
+
+    def _vector(self, text):
+        vector = np.zeros(self.dim, dtype=np.float64)
+        for char in text.lower():
+            vector[ord(char) % self.dim] += 1.0
+        return vector
+
+    def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [self._vector(t) for t in texts]
+
+    def embed_text(self, text):
+        return self._vector(text)
+
+
+@pytest.fixture
+def embedder():
+    return FakeEmbedder()
+
+
+@pytest.fixture
+def system(embedder):
+    StrategicChunkingSystem._QUERY_EMBEDDING_CACHE.clear()
+    system = StrategicChunkingSystem.__new__(StrategicChunkingSystem)
+    system.logger = logging.getLogger("SPC-test")
+    system._spc_sem = embedder
+    system._pa_keywords = {"PA01": ["mujeres", "género"], "PA02": ["violencia", "conflicto"]}
+    system._dim_keywords = {"DIM01": ["diagnóstico", "recursos"], "DIM02": ["actividades"]}
+    system._sentence_store = SentenceEmbeddingStore(embedder.embed_batch)
+    return system
+
+
+def test_store_encodes_each_text_once(embedder):
+    store = SentenceEmbeddingStore(embedder.embed_batch, document_id="doc")
+    first = store.get(["a b", "c d", "a b"])
+    second = store.get(["c d", "e f"])
+
+    assert embedder.batches == [["a b", "c d"], ["e f"]]
+    assert first.dtype == np.float32 and first.shape == (3, embedder.dim)
+    np.testing.assert_array_equal(first[1], second[0])
+    assert (store.hits, store.misses) == (2, 3)
+
+    store.reset("other")
+    assert len(store) == 0 and store.document_id == "other"
+
+
+def test_query_embeddings_are_batched_and_shared(system, embedder):
+    pairs = [(pa, dim) for pa in ("PA01", "PA02") for dim in ("DIM01", "DIM02")]
+    queries = system._pa_dimension_query_embeddings(pairs)
+
+    assert len(embedder.batches) == 1 and len(embedder.batches[0]) == 4
+    np.testing.assert_allclose(np.linalg.norm(queries, axis=1), 1.0, rtol=1e-6)
+
+    other = StrategicChunkingSystem.__new__(StrategicChunkingSystem)
+    other.__dict__.update(system.__dict__)
+    other._pa_dimension_query_embeddings(pairs)
+    assert len(embedder.batches) == 1
+
+
+def test_top_k_matches_full_sort():
+    similarities = np.random.default_rng(0).random((40, 60)).astype(np.float32)
+    top = StrategicChunkingSystem._top_k_sentences(similarities, 10)
+
+    for column in range(60):
+        expected = np.argsort(similarities[:, column])[-10:][::-1]
+        assert top[:, column].tolist() == expected.tolist()
+
+
+def test_single_extraction_matches_matrix_column(system, embedder):
+    sentences = ["Diagnóstico de recursos para mujeres.", "Actividades contra la violencia.",
+                 "Otro texto.", "Género y equidad en el presupuesto."]
+    positions, cursor = [], 0
+    text = " ".join(sentences)
+    for sentence in sentences:
+        start = text.find(sentence, cursor)
+        positions.append((start, start + len(sentence)))
+        cursor = start + len(sentence)
+
+    segment = system._extract_content_for_pa_dimension(text, "PA01", "DIM01", sentences, positions)
+
+    normalized = system._sentence_store.get_normalized(sentences)
+    query = system._pa_dimension_query_embeddings([("PA01", "DIM01")])[0]
+    expected = np.argsort(normalized @ query)[::-1]
+    assert segment["top_sentence_indices"] == expected.tolist()
+    assert segment["relevance_score"] == pytest.approx(float(np.mean(normalized @ query)))
+    assert len(embedder.batches) == 2
+
+
+def test_store_grows_buffer_geometrically(embedder):
+    store = SentenceEmbeddingStore(embedder.embed_batch)
+    texts = [f"texto {i}" for i in range(50)]
+    capacities = set()
+    for text in texts:
+        store.get([text])
+        capacities.add(store._buffer.shape[0])
+
+    assert capacities == {1, 2, 4, 8, 16, 32, 64}
+    expected = np.vstack([embedder._vector(t) for t in texts]).astype(np.float32)
+    np.testing.assert_array_equal(store.get(texts), expected)
+    assert store._rows == len(store) == 50
@@ -0,0 +1,154 @@
+"""
+Tests for page-parallel, cached table extraction.
+
+Verifies page triage, that cached (pdf, page, extractor, params) results are
+not re-extracted, that failures are not cached, result ordering, cache
+integrity and LRU bounds, and reuse of the process-wide pool.
+"""
+
+import pickle
+
+import pytest
+
+from farfan_pipeline.processing import table_extraction
+from farfan_pipeline.processing.table_extraction import (
+    PageParallelTableExtractor,
+    PageTriage,
+    RawTable,
+    TableExtractionCache,
+    TriageThresholds,
+)
+
+
+def _page(number, chars=500, rulings=0, numeric=0, tokens=100):
+    return PageTriage(number, chars, rulings, numeric, tokens)
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "plan.pdf"
+    path.write_bytes(b"%PDF-1.4 fake plan")
+    return path
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def fake_extract(pdf_path, page_number, extractor, params):
+        calls.append((page_number, extractor))
+        if page_number == 3 and extractor == "tabula":
+            raise RuntimeError("java not found")
+        return [RawTable(df=f"{extractor}@{page_number}", page_number=page_number,
+                         extraction_method=extractor, accuracy=0.9)]
+
+    monkeypatch.setattr(table_extraction, "extract_page_tables", fake_extract)
+    monkeypatch.setattr(table_extraction, "triage_pages", lambda path: [
+        _page(1),                              # prose only
+        _page(2, rulings=12),                  # ruled table
+        _page(3, numeric=40, tokens=120),      # borderless numeric table
+        _page(4, chars=0),                     # scanned, no text layer
+    ])
+    return calls
+
+
+def test_triage_selects_extractors_per_page():
+    thresholds = TriageThresholds()
+
+    assert thresholds.extractors_for(_page(1)) == ()
+    assert thresholds.extractors_for(_page(1, rulings=8)) == table_extraction.EXTRACTORS
+    assert thresholds.extractors_for(_page(1, numeric=30, tokens=100)) == ("camelot_stream", "tabula")
+    assert thresholds.extractors_for(_page(1, chars=0, rulings=8)) == ()
+
+
+def test_only_candidate_pages_are_extracted_in_order(pdf, calls):
+    extractor = PageParallelTableExtractor(max_workers=1, cache=TableExtractionCache())
+
+    tables = extractor.extract(pdf)
+
+    assert sorted(calls) == [
+        (2, "camelot_lattice"), (2, "camelot_stream"), (2, "tabula"),
+        (3, "camelot_stream"), (3, "tabula"),
+    ]
+    assert [t.df for t in tables] == [
+        "camelot_lattice@2", "camelot_stream@2", "tabula@2", "camelot_stream@3",
+    ]
+
+
+def test_cached_pages_are_not_reextracted(pdf, calls, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = PageParallelTableExtractor(max_workers=1, cache=TableExtractionCache(cache_dir)).extract(pdf)
+    calls.clear()
+
+    second = PageParallelTableExtractor(max_workers=1, cache=TableExtractionCache(cache_dir)).extract(pdf)
+
+    # Only the failed job is retried
+    assert calls == [(3, "tabula")]
+    assert [t.df for t in second] == [t.df for t in first]
+
+
+def test_cache_key_depends_on_pdf_and_params(pdf, calls, tmp_path):
+    cache = TableExtractionCache(tmp_path / "cache")
+    PageParallelTableExtractor(max_workers=1, cache=cache).extract(pdf)
+    calls.clear()
+
+    PageParallelTableExtractor(
+        max_workers=1, cache=cache,
+        extractor_params={"camelot_lattice": {"line_scale": 60}},
+    ).extract(pdf)
+    assert (2, "camelot_lattice") in calls
+    assert (2, "camelot_stream") not in calls
+
+    calls.clear()
+    pdf.write_bytes(b"%PDF-1.4 revised plan")
+    PageParallelTableExtractor(max_workers=1, cache=cache).extract(pdf)
+    assert len(calls) == 5
+
+
+def test_tampered_disk_entry_is_not_unpickled(pdf, calls, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    PageParallelTableExtractor(max_workers=1, cache=TableExtractionCache(cache_dir)).extract(pdf)
+    entry = next(p for p in cache_dir.rglob("*.pkl"))
+    data = entry.read_bytes()
+    entry.write_bytes(data[:32] + pickle.dumps([RawTable("forged", 2, "tabula")]))
+    monkeypatch.setattr(table_extraction.pickle, "loads", lambda payload: pytest.fail("unpickled"))
+
+    assert TableExtractionCache(cache_dir).get(entry.stem) is None
+
+    monkeypatch.setenv(table_extraction.TABLE_CACHE_KEY_ENV, "another-key")
+    entry.write_bytes(data)
+    assert TableExtractionCache(cache_dir).get(entry.stem) is None
+
+
+def test_memory_cache_is_lru_bounded():
+    cache = TableExtractionCache(memory_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, [])
+        cache.get("a")
+
+    assert list(cache._memory) == ["c", "a"]
+
+
+def test_process_pool_is_shared_across_extractions(pdf, calls, monkeypatch):
+    created = []
+
+    class InlinePool:
+        def __init__(self, max_workers, mp_context):
+            created.append(max_workers)
+
+        def map(self, fn, jobs):
+            return [fn(job) for job in jobs]
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+
+    monkeypatch.setattr(table_extraction, "ProcessPoolExecutor", InlinePool)
+    table_extraction.reset_table_extraction_pool()
+    try:
+        for _ in range(2):
+            PageParallelTableExtractor(max_workers=3, cache=TableExtractionCache()).extract(pdf)
+    finally:
+        table_extraction.reset_table_extraction_pool()
+
+    assert created == [3]
+    assert len(calls) == 10
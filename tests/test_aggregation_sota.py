@@ -19,6 +19,7 @@ from farfan_pipeline.processing.uncertainty_quantification import (
     BayesianPropagation,
     SensitivityAnalysis,
     aggregate_with_uncertainty,
+    aggregate_with_uncertainty_batch,
 )
 from farfan_pipeline.processing.choquet_adapter import (
     ChoquetProcessingAdapter,
@@ -421,5 +422,110 @@ class TestSensitivityAnalysis:
         assert len(sobol) == 3
 
 
+def _loop_bootstrap_means(scores, weights, n_samples, rng):
+    """Reference per-resample loop of the original implementation."""
+    scores_arr = np.array(scores, dtype=np.float64)
+    n = len(scores_arr)
+    weights_arr = np.ones(n) / n if weights is None else np.array(weights) / np.sum(weights)
+    resamples = np.zeros(n_samples)
+    for i in range(n_samples):
+        indices = rng.choice(n, size=n, replace=True)
+        resample_weights = weights_arr[indices]
+        resample_weights = resample_weights / np.sum(resample_weights)
+        resamples[i] = np.sum(scores_arr[indices] * resample_weights)
+    return resamples
+
+
+class TestVectorizedUncertainty:
+    """Vectorized bootstrap and Sobol must be bit-identical to the loops."""
+
+    GROUPS = [
+        ([2.1, 2.5, 1.8], None),
+        ([2.0, 2.9, 1.1, 0.4, 2.2], [0.1, 0.3, 0.2, 0.2, 0.2]),
+        ([1.0, 1.5, 2.5, 3.0, 0.5], None),
+        (list(np.linspace(0.1, 3.0, 40)), list(np.linspace(1.0, 2.0, 40))),
+    ]
+
+    def test_bootstrap_matches_loop(self):
+        for scores, weights in self.GROUPS:
+            metrics = BootstrapAggregator(n_samples=300, random_seed=7).bootstrap_weighted_average(
+                scores, weights
+            )
+            reference = _loop_bootstrap_means(scores, weights, 300, np.random.RandomState(7))
+
+            assert metrics.mean == float(np.mean(reference))
+            assert metrics.std == float(np.std(reference, ddof=1))
+            assert metrics.confidence_interval_95 == (
+                float(np.percentile(reference, 2.5)),
+                float(np.percentile(reference, 97.5)),
+            )
+
+    def test_batch_matches_sequential_calls(self):
+        sequential = BootstrapAggregator(n_samples=200, random_seed=3)
+        batched = BootstrapAggregator(n_samples=200, random_seed=3)
+
+        expected = [sequential.bootstrap_weighted_average(s, w).to_dict() for s, w in self.GROUPS]
+        actual = [m.to_dict() for m in batched.bootstrap_weighted_average_batch(self.GROUPS)]
+
+        assert actual == expected
+
+    def test_aggregate_batch_matches_per_group(self):
+        batch = aggregate_with_uncertainty_batch(self.GROUPS, n_bootstrap=250, random_seed=42)
+
+        for (scores, weights), (point, metrics) in zip(self.GROUPS, batch):
+            expected_point, expected = aggregate_with_uncertainty(
+                scores, weights, n_bootstrap=250, random_seed=42
+            )
+            assert point == expected_point
+            assert metrics.to_dict() == expected.to_dict()
+
+    def test_batch_rejects_invalid_group(self):
+        with pytest.raises(ValueError):
+            aggregate_with_uncertainty_batch([([1.0, 2.0], None), ([], None)])
+
+    def test_sobol_matches_loop(self):
+        scores = [7.0, 8.0, 6.5, 0.0, 7.5]
+        weights = [0.3, 0.2, 0.2, 0.1, 0.2]
+
+        rng = np.random.RandomState(11)
+        w = np.array(weights) / np.sum(weights)
+        raw = {}
+        for i in range(len(scores)):
+            outputs = []
+            for _ in range(100):
+                perturbed = np.array(scores, dtype=np.float64)
+                perturbed[i] = scores[i] + rng.normal(0, 0.2 * abs(scores[i]))
+                outputs.append(np.sum(perturbed * w))
+            raw[i] = float(np.var(outputs, ddof=1))
+        total = sum(raw.values())
+        expected = {k: v / total for k, v in raw.items()}
+
+        assert SensitivityAnalysis.compute_sobol_indices(
+            scores, weights, n_samples=100, random_seed=11
+        ) == expected
+        assert SensitivityAnalysis.compute_sobol_indices(
+            scores, weights, aggregation_func=lambda s, w: np.sum(s * w),
+            n_samples=100, random_seed=11,
+        ) == expected
+
+
+    def test_sobol_chunked_perturbation_matches_single_chunk(self, monkeypatch):
+        from farfan_pipeline.processing import uncertainty_quantification
+
+        scores = list(np.linspace(0.5, 3.0, 7))
+        weights = list(np.linspace(1.0, 2.0, 7))
+        expected = SensitivityAnalysis.compute_sobol_indices(
+            scores, weights, n_samples=50, random_seed=5
+        )
+
+        monkeypatch.setattr(uncertainty_quantification, "_SOBOL_CHUNK_VALUES", 2 * 50 * 7)
+        assert SensitivityAnalysis.compute_sobol_indices(
+            scores, weights, n_samples=50, random_seed=5
+        ) == expected
+        assert SensitivityAnalysis.compute_sobol_indices(
+            scores, weights, aggregation_func=lambda s, w: np.sum(s * w),
+            n_samples=50, random_seed=5,
+        ) == expected
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
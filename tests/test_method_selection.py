@@ -0,0 +1,157 @@
+"""
+Tests for bandit-driven method selection in multi-method v3 contracts.
+"""
+
+import json
+
+import pytest
+
+from farfan_pipeline.optimization.method_selection import (
+    MethodSelector,
+    evidence_quality,
+    method_key,
+)
+from farfan_pipeline.optimization.rl_strategy import BanditArm
+
+METHODS = [
+    {"class_name": "Extractor", "method_name": "extract", "priority": 1, "provides": "extraction"},
+    {"class_name": "Fast", "method_name": "similarity", "priority": 2, "interchangeable_group": "sim"},
+    {"class_name": "Deep", "method_name": "similarity", "priority": 3, "interchangeable_group": "sim"},
+    {"class_name": "Audit", "method_name": "check", "priority": 4, "optional": True, "expected_duration_ms": 300},
+    {"class_name": "Slow", "method_name": "crawl", "priority": 5, "optional": True, "expected_duration_ms": 5000},
+]
+CONFIG = {"strategy": "thompson_sampling", "latency_budget_ms": 1000}
+
+
+def _run(selector, question_id, durations, quality, document_id="plan"):
+    selection = selector.select("D1-Q1", METHODS, CONFIG, question_id=question_id, document_id=document_id)
+    selector.record(
+        selection,
+        {key: (True, durations[key], quality.get(key, 1.0)) for key in selection.selected_keys},
+    )
+    return selection
+
+
+def test_required_group_and_budget_constraints():
+    selection = MethodSelector().select("D1-Q1", METHODS, CONFIG, question_id="Q001", document_id="plan")
+
+    keys = selection.selected_keys
+    assert keys[0] == "Extractor.extract"
+    assert len({"Fast.similarity", "Deep.similarity"} & set(keys)) == 1
+    assert "Audit.check" in keys
+    assert selection.skipped["Slow.crawl"] == "latency_budget"
+    assert [m["priority"] for m in selection.selected] == sorted(m["priority"] for m in selection.selected)
+
+
+def test_slow_low_yield_method_loses_its_group():
+    selector = MethodSelector()
+    durations = {method_key(m): 100.0 for m in METHODS} | {"Deep.similarity": 1900.0}
+    quality = {"Deep.similarity": 0.1}
+
+    chosen = [_run(selector, f"Q{i:03d}", durations, quality).selected_keys for i in range(40)]
+
+    assert sum("Fast.similarity" in keys for keys in chosen[-10:]) >= 9
+
+
+def test_state_persists_and_replay_reproduces_decisions(tmp_path):
+    state_path = tmp_path / "selection.json"
+    selector = MethodSelector(state_path)
+    durations = {method_key(m): 50.0 for m in METHODS}
+    original = {f"Q{i:03d}": _run(selector, f"Q{i:03d}", durations, {}).selected_keys for i in range(5)}
+    selector.save()
+
+    state = json.loads(state_path.read_text())
+    arms = state["slots"]["D1-Q1"]["arms"]
+    assert arms["Extractor.extract"]["pulls"] == 5
+    assert BanditArm.from_dict(arms["Extractor.extract"]).to_dict() == arms["Extractor.extract"]
+
+    before = state_path.read_text()
+    replay = MethodSelector(state_path, replay=True)
+    for question_id, keys in original.items():
+        selection = replay.select("D1-Q1", METHODS, CONFIG, question_id=question_id, document_id="plan")
+        assert selection.replayed and selection.selected_keys == keys
+        replay.record(selection, {key: (False, 9999.0, 0.0) for key in keys})
+    assert state_path.read_text() == before
+
+    unknown = replay.select("D1-Q1", METHODS, CONFIG, question_id="Q999", document_id="plan")
+    assert unknown.selected_keys == [method_key(m) for m in METHODS]
+
+
+def test_saves_are_batched(tmp_path):
+    state_path = tmp_path / "selection.json"
+    selector = MethodSelector(state_path, save_every=3)
+    durations = {method_key(m): 50.0 for m in METHODS}
+
+    for i in range(2):
+        _run(selector, f"Q{i:03d}", durations, {})
+    assert not state_path.exists()
+
+    _run(selector, "Q002", durations, {})
+    assert json.loads(state_path.read_text())["slots"]["D1-Q1"]["arms"]["Extractor.extract"]["pulls"] == 3
+
+
+def test_concurrent_selectors_merge_their_outcomes(tmp_path):
+    state_path = tmp_path / "selection.json"
+    durations = {method_key(m): 50.0 for m in METHODS}
+    seeded = MethodSelector(state_path)
+    _run(seeded, "Q000", durations, {})
+    seeded.save()
+
+    # Two workers start from the same state and save in turn
+    first, second = MethodSelector(state_path), MethodSelector(state_path)
+    for i in range(1, 4):
+        _run(first, f"Q{i:03d}", durations, {}, document_id="plan-a")
+    for i in range(1, 3):
+        _run(second, f"Q{i:03d}", durations, {}, document_id="plan-b")
+    first.save()
+    second.save()
+
+    state = json.loads(state_path.read_text())
+    extractor = state["slots"]["D1-Q1"]["arms"]["Extractor.extract"]
+    assert extractor["pulls"] == 6
+    assert extractor["successes"] + extractor["failures"] == 6
+    assert [document for document, _ in state["decisions"]] == ["plan", "plan-a", "plan-b"]
+
+    # Saving again without new outcomes adds nothing
+    first.save()
+    assert json.loads(state_path.read_text())["slots"]["D1-Q1"]["arms"]["Extractor.extract"]["pulls"] == 6
+
+
+def test_decisions_are_pruned_per_document(tmp_path):
+    state_path = tmp_path / "selection.json"
+    selector = MethodSelector(state_path, max_documents=2)
+    durations = {method_key(m): 50.0 for m in METHODS}
+    for document_id in ("plan-1", "plan-2", "plan-3"):
+        _run(selector, "Q001", durations, {}, document_id=document_id)
+    selector.save()
+
+    state = json.loads(state_path.read_text())
+    assert [document for document, _ in state["decisions"]] == ["plan-2", "plan-3"]
+    replay = MethodSelector(state_path, replay=True)
+    pruned = replay.select("D1-Q1", METHODS, CONFIG, question_id="Q001", document_id="plan-1")
+    assert pruned.selected_keys == [method_key(m) for m in METHODS]
+
+
+def test_selection_is_deterministic_for_the_same_state():
+    durations = {method_key(m): 80.0 for m in METHODS}
+    runs = []
+    for _ in range(2):
+        selector = MethodSelector()
+        runs.append([_run(selector, f"Q{i:03d}", durations, {}).selected_keys for i in range(15)])
+    assert runs[0] == runs[1]
+
+
+@pytest.mark.parametrize(
+    ("outputs", "validation_passed", "expected"),
+    [
+        ({"extraction": {"goals": ["g1"], "amounts": []}}, True, 0.5),
+        ({"extraction": {"goals": ["g1"], "amounts": [1]}}, False, 0.5),
+        ({}, True, 0.0),
+    ],
+)
+def test_evidence_quality(outputs, validation_passed, expected):
+    rules = [
+        {"target": "elements", "sources": ["extraction.goals", "other.items"]},
+        {"target": "amounts", "sources": ["extraction.amounts"]},
+    ]
+    assert evidence_quality("extraction", outputs, rules, validation_passed) == expected
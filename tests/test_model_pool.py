@@ -0,0 +1,155 @@
+"""
+Tests for the process-wide NLP model pool.
+
+Verifies load-once sharing, keying by device and config, reference
+counting, idle eviction, concurrent first acquisition and load metrics.
+"""
+
+import threading
+import time
+
+import pytest
+
+from farfan_pipeline.compat.model_pool import ModelPool, ModelPoolError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, name, device, config):
+        time.sleep(self.delay)
+        with self.lock:
+            self.calls.append((name, device, dict(config)))
+        return object()
+
+
+@pytest.fixture
+def loader():
+    return CountingLoader()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(loader, clock):
+    pool = ModelPool(idle_ttl=60.0, clock=clock)
+    pool.register_loader("fake", loader)
+    return pool
+
+
+def test_same_key_loads_once_and_shares_model(pool, loader):
+    first = pool.acquire("fake", "es_core_news_lg")
+    second = pool.acquire("fake", "es_core_news_lg")
+
+    assert first.model is second.model
+    assert len(loader.calls) == 1
+    stats = pool.get_stats()
+    assert stats["loads"] == 1 and stats["hits"] == 1
+    assert stats["models"]["fake:es_core_news_lg"]["refcount"] == 2
+
+
+def test_device_and_config_are_part_of_the_key(pool, loader):
+    cpu = pool.acquire("fake", "encoder", device="cpu")
+    cuda = pool.acquire("fake", "encoder", device="cuda")
+    long = pool.acquire("fake", "encoder", device="cpu", max_length=512)
+
+    assert len({id(cpu.model), id(cuda.model), id(long.model)}) == 3
+    assert loader.calls[2] == ("encoder", "cpu", {"max_length": 512})
+
+
+def test_released_model_survives_until_idle_ttl(pool, loader, clock):
+    handle = pool.acquire("fake", "m")
+    handle.release()
+    handle.release()
+
+    clock.now = 30.0
+    assert pool.evict_idle() == []
+    clock.now = 61.0
+    assert [str(key) for key in pool.evict_idle()] == ["fake:m"]
+
+    pool.acquire("fake", "m")
+    assert len(loader.calls) == 2
+    assert pool.get_stats()["evictions"] == 1
+
+
+def test_referenced_models_are_never_evicted(pool, clock):
+    handle = pool.acquire("fake", "m")
+    clock.now = 1000.0
+
+    assert pool.evict_idle() == []
+    assert pool.is_loaded("fake", "m")
+    handle.release()
+    with pytest.raises(ModelPoolError, match="already released"):
+        handle.model
+
+
+def test_context_manager_releases(pool):
+    with pool.acquire("fake", "m") as model:
+        assert model is not None
+        assert pool.get_stats()["models"]["fake:m"]["refcount"] == 1
+    assert pool.get_stats()["models"]["fake:m"]["refcount"] == 0
+
+
+def test_concurrent_first_acquire_loads_once(clock):
+    slow = CountingLoader(delay=0.05)
+    pool = ModelPool(clock=clock)
+    pool.register_loader("fake", slow)
+    models = []
+
+    def worker():
+        models.append(pool.acquire("fake", "shared").model)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(slow.calls) == 1
+    assert len({id(m) for m in models}) == 1
+
+
+def test_failed_load_is_not_cached(clock):
+    attempts = []
+
+    def flaky(name, device, config):
+        attempts.append(name)
+        if len(attempts) == 1:
+            raise OSError("model not installed")
+        return "model"
+
+    pool = ModelPool(clock=clock)
+    pool.register_loader("fake", flaky)
+    with pytest.raises(OSError):
+        pool.acquire("fake", "m")
+
+    assert not pool.is_loaded("fake", "m")
+    assert pool.acquire("fake", "m").model == "model"
+
+
+def test_unknown_kind_is_rejected(pool):
+    with pytest.raises(ModelPoolError, match="No loader registered"):
+        pool.acquire("unknown", "m")
+
+
+def test_metrics_record_load_time(pool):
+    pool.acquire("fake", "m")
+    metrics = pool.get_stats()["models"]["fake:m"]
+
+    assert metrics["load_seconds"] >= 0.0
+    assert metrics["acquisitions"] == 1
+    assert set(metrics) >= {"rss_before_bytes", "rss_after_bytes", "rss_delta_bytes"}
@@ -0,0 +1,160 @@
+"""
+Tests for the pre-forked API pipeline worker pool.
+
+Verifies warm-up before forking, queue positions, back-pressure, progress
+events, status tracking and replacement of crashed workers by the fork
+server.
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from farfan_pipeline.api.pipeline_worker_pool import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PROGRESS,
+    JOB_QUEUED,
+    JOB_STARTED,
+    PipelineQueueFullError,
+    PipelineWorkerPool,
+)
+
+
+class FakeConnector:
+    def __init__(self, gate_path=None):
+        self.warm_ups = 0
+        self.warm_pid = None
+        self.gate_path = gate_path
+        self.completed_jobs = {}
+        self.progress = {}
+
+    def warm_up(self):
+        self.warm_ups += 1
+        self.warm_pid = os.getpid()
+
+    def get_job_status(self, job_id):
+        return {"progress": self.progress.get(job_id, 0)}
+
+    async def execute_pipeline(self, pdf_path, job_id, municipality, progress_callback, settings):
+        while self.gate_path and not os.path.exists(self.gate_path):
+            time.sleep(0.01)
+        if settings.get("crash"):
+            os._exit(3)
+        if settings.get("fail"):
+            raise RuntimeError("ingestion failed")
+        self.progress[job_id] = 50
+        progress_callback(1, "Ingesting document")
+        result = SimpleNamespace(
+            success=True, job_id=job_id, warm_ups=self.warm_ups, warm_pid=self.warm_pid,
+            parent_pid=os.getppid(),
+        )
+        self.completed_jobs[job_id] = result
+        return result
+
+
+class EventLog:
+    def __init__(self):
+        self.events = []
+        self.done = threading.Condition()
+
+    def __call__(self, event, job_id, payload):
+        with self.done:
+            self.events.append((event, job_id, payload))
+            self.done.notify_all()
+
+    def wait_for(self, event, job_id, timeout=10.0):
+        deadline = time.time() + timeout
+        with self.done:
+            while True:
+                for name, jid, payload in self.events:
+                    if name == event and jid == job_id:
+                        return payload
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise AssertionError(f"{event} for {job_id} not received")
+                self.done.wait(remaining)
+
+
+@pytest.fixture
+def log():
+    return EventLog()
+
+
+@pytest.fixture
+def make_pool(log):
+    pools = []
+
+    def factory(connector, **kwargs):
+        pool = PipelineWorkerPool(connector, event_handler=log, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.shutdown(timeout=5.0)
+
+
+def test_workers_run_jobs_on_state_warmed_before_fork(make_pool, log):
+    connector = FakeConnector()
+    pool = make_pool(connector, max_workers=2, max_queue_size=4)
+    pool.start()
+
+    ticket = pool.submit("plan.pdf", "Municipio")
+    result = log.wait_for(JOB_COMPLETED, ticket.job_id)["result"]
+
+    assert connector.warm_ups == 1
+    assert result.warm_ups == 1 and result.warm_pid == os.getpid()
+    assert log.wait_for(JOB_PROGRESS, ticket.job_id) == {
+        "phase_num": 1, "phase": "Ingesting document", "progress": 50,
+    }
+    assert log.wait_for(JOB_STARTED, ticket.job_id)["pid"] != os.getpid()
+    assert pool.get_job_status(ticket.job_id)["status"] == "completed"
+    assert pool.get_stats()["completed"] == 1
+
+
+def test_queue_positions_and_back_pressure(make_pool, log, tmp_path):
+    gate = tmp_path / "gate"
+    pool = make_pool(FakeConnector(gate_path=str(gate)), max_workers=1, max_queue_size=2)
+
+    first = pool.submit("a.pdf")
+    log.wait_for(JOB_STARTED, first.job_id)
+    second = pool.submit("b.pdf")
+    third = pool.submit("c.pdf")
+
+    assert (first.position, second.position, third.position) == (1, 1, 2)
+    assert log.wait_for(JOB_QUEUED, third.job_id) == {"position": 2}
+    assert pool.get_job_status(third.job_id)["position"] == 2
+    with pytest.raises(PipelineQueueFullError):
+        pool.submit("d.pdf")
+    assert pool.get_stats()["rejected"] == 1
+
+    gate.touch()
+    for ticket in (first, second, third):
+        log.wait_for(JOB_COMPLETED, ticket.job_id)
+    assert pool.get_stats()["queued_jobs"] == 0
+
+
+def test_failed_job_is_reported(make_pool, log):
+    pool = make_pool(FakeConnector(), max_workers=1)
+
+    ticket = pool.submit("bad.pdf", settings={"fail": True})
+
+    assert log.wait_for(JOB_FAILED, ticket.job_id) == {"error": "ingestion failed"}
+    assert pool.get_job_status(ticket.job_id)["status"] == "failed"
+
+
+def test_crashed_worker_fails_job_and_is_replaced(make_pool, log):
+    pool = make_pool(FakeConnector(), max_workers=1)
+
+    crashed = pool.submit("crash.pdf", settings={"crash": True})
+    assert "exited with code 3" in log.wait_for(JOB_FAILED, crashed.job_id)["error"]
+
+    after = pool.submit("ok.pdf")
+    result = log.wait_for(JOB_COMPLETED, after.job_id)["result"]
+    assert pool.get_stats()["worker_restarts"] == 1
+    # Replacements come from the single-threaded fork server, not the parent
+    assert result.parent_pid == pool._fork_server.pid != os.getpid()
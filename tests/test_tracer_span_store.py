@@ -0,0 +1,196 @@
+"""
+Tests for the bounded, sampled span store of the in-house Tracer.
+
+Verifies the ring buffer, head/tail sampling, span ID format, incremental
+statistics, active-span tracking and the OTLP JSON-lines batch exporter.
+"""
+
+import json
+import os
+import random
+import re
+import threading
+
+import pytest
+
+from farfan_pipeline.observability.opentelemetry_integration import (
+    BatchSpanExporter,
+    OpenTelemetryObservability,
+    SamplingPolicy,
+    SpanStatus,
+    Tracer,
+)
+
+
+def run_spans(tracer, count, fail_every=0):
+    for i in range(count):
+        try:
+            with tracer.start_as_current_span(f"op{i}"):
+                if fail_every and i % fail_every == 0:
+                    raise ValueError("boom")
+        except ValueError:
+            pass
+
+
+def test_ring_buffer_keeps_latest_spans():
+    tracer = Tracer("executors", max_spans=3)
+    run_spans(tracer, 10)
+
+    assert [s.name for s in tracer.get_spans()] == ["op7", "op8", "op9"]
+    stats = tracer.get_statistics()
+    assert stats["total_spans"] == 10
+    assert stats["retained_spans"] == 3
+    assert stats["evicted_spans"] == 7
+
+
+def test_span_ids_are_otlp_hex():
+    tracer = Tracer("executors")
+    with tracer.start_as_current_span("parent") as parent:
+        with tracer.start_as_current_span("child") as child:
+            pass
+
+    assert re.fullmatch(r"[0-9a-f]{32}", parent.context.trace_id)
+    assert re.fullmatch(r"[0-9a-f]{16}", parent.context.span_id)
+    assert child.context.trace_id == parent.context.trace_id
+    assert child.context.parent_span_id == parent.context.span_id
+    assert child.context.span_id != parent.context.span_id
+
+
+def test_ids_ignore_reseeding_of_the_global_random_module():
+    tracer = Tracer("executors", sampling=SamplingPolicy(head_sample_ratio=0.5))
+    ids = set()
+    for _ in range(3):
+        random.seed(42)
+        with tracer.start_as_current_span("op") as span:
+            ids.add(span.context.span_id)
+        # Tracing does not consume draws from the seeded stream
+        assert random.random() == random.Random(42).random()
+
+    assert len(ids) == 3
+
+
+def test_unsampled_traces_still_keep_errors_and_slow_spans():
+    tracer = Tracer("executors", sampling=SamplingPolicy(head_sample_ratio=0.0, slow_span_ms=None))
+    run_spans(tracer, 9, fail_every=3)
+
+    kept = tracer.get_spans()
+    assert [s.name for s in kept] == ["op0", "op3", "op6"]
+    assert all(s.status is SpanStatus.ERROR for s in kept)
+    assert tracer.get_statistics()["sampled_out_spans"] == 6
+
+    slow = Tracer("slow", sampling=SamplingPolicy(head_sample_ratio=0.0, slow_span_ms=0.0))
+    run_spans(slow, 4)
+    assert len(slow.get_spans()) == 4
+
+
+def test_children_follow_root_sampling_decision():
+    tracer = Tracer("executors", sampling=SamplingPolicy(head_sample_ratio=0.0, slow_span_ms=None))
+    with tracer.start_as_current_span("root"):
+        with tracer.start_as_current_span("child") as child:
+            pass
+
+    assert child.context.trace_flags == 0
+    assert tracer.get_spans() == []
+
+
+def test_statistics_are_incremental():
+    observability = OpenTelemetryObservability(max_spans_per_tracer=2)
+    tracer = observability.get_tracer("executors")
+    run_spans(tracer, 5, fail_every=2)
+
+    stats = observability.get_statistics()
+    tracer_stats = stats["tracers"]["executors"]
+    assert stats["total_spans"] == 5
+    assert tracer_stats["error_spans"] == 3
+    assert 0 <= tracer_stats["min_duration_ms"] <= tracer_stats["avg_duration_ms"]
+    assert tracer_stats["avg_duration_ms"] <= tracer_stats["max_duration_ms"]
+
+
+def test_batch_exporter_writes_otlp_json_lines(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    exporter = BatchSpanExporter(path, service_name="farfan-test", max_batch_size=2)
+    tracer = Tracer("executors", exporter=exporter)
+    run_spans(tracer, 3, fail_every=3)
+    exporter.shutdown()
+
+    requests = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(requests) == 2
+    spans = [
+        span
+        for request in requests
+        for resource in request["resourceSpans"]
+        for scope in resource["scopeSpans"]
+        for span in scope["spans"]
+    ]
+    assert [s["name"] for s in spans] == ["op0", "op1", "op2"]
+    assert spans[0]["status"] == {"code": 2, "message": "boom"}
+    assert spans[0]["events"][0]["name"] == "exception"
+    assert int(spans[0]["endTimeUnixNano"]) >= int(spans[0]["startTimeUnixNano"])
+    scope = requests[0]["resourceSpans"][0]["scopeSpans"][0]["scope"]
+    assert scope == {"name": "executors", "version": "1.0.0"}
+    assert exporter.get_statistics()["exported"] == 3
+
+
+def test_force_flush_and_full_queue(tmp_path):
+    exporter = BatchSpanExporter(tmp_path / "spans.jsonl", flush_interval_s=60.0)
+    tracer = Tracer("executors", exporter=exporter)
+    run_spans(tracer, 2)
+
+    assert exporter.force_flush()
+    assert len((tmp_path / "spans.jsonl").read_text().splitlines()) == 1
+    exporter.shutdown()
+
+    run_spans(tracer, 1)
+    assert exporter.get_statistics()["dropped"] == 1
+
+
+@pytest.mark.parametrize("ratio", [0.0, 1.0])
+def test_head_sampling_extremes(ratio):
+    assert SamplingPolicy(head_sample_ratio=ratio).sample_head() is bool(ratio)
+
+
+def test_direct_span_end_is_retained_and_active_spans_are_listed():
+    tracer = Tracer("executors")
+    span = tracer.start_span("manual")
+
+    assert tracer.get_spans() == [span]
+    assert tracer.get_spans(trace_id=span.context.trace_id) == [span]
+
+    span.end()
+    span.end()
+    assert tracer.get_spans() == [span]
+    assert tracer.get_statistics()["total_spans"] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_children_draw_distinct_span_ids():
+    read_fd, write_fd = os.pipe()
+    pids = []
+    for _ in range(2):
+        pid = os.fork()
+        if pid == 0:
+            span = Tracer("worker").start_span("op")
+            os.write(write_fd, f"{span.context.trace_id}:{span.context.span_id}\n".encode())
+            os._exit(0)
+        pids.append(pid)
+    for pid in pids:
+        os.waitpid(pid, 0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        ids = f.read().split()
+
+    assert len(ids) == 2 and ids[0] != ids[1]
+
+
+def test_exporter_counters_are_consistent_under_concurrency(tmp_path):
+    exporter = BatchSpanExporter(tmp_path / "spans.jsonl", max_queue_size=1)
+    exporter.shutdown()
+    tracer = Tracer("executors", exporter=exporter)
+
+    threads = [threading.Thread(target=run_spans, args=(tracer, 200)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert exporter.get_statistics()["dropped"] == 800